@@ -0,0 +1,83 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures mlrun.data_types.infer.get_df_stats (with histograms) against the stats of df.describe(include="all") with
+# a histogram per numeric column, on a wide dataframe of mostly numeric columns (and a few string columns).
+# Usage: python hack/benchmarks/df_stats_benchmark.py [num_rows] [num_columns]
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from mlrun.data_types.infer import InferOptions, get_df_stats
+
+num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+num_columns = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+
+def make_data():
+    random = np.random.default_rng(0)
+    columns = {}
+    for index in range(num_columns):
+        if index % 10 == 9:
+            columns[f"str_{index}"] = random.choice(["a", "b", "c", "d"], num_rows)
+        elif index % 2:
+            columns[f"int_{index}"] = random.integers(0, 1000, num_rows)
+        else:
+            values = random.normal(size=num_rows)
+            values[index::50] = np.nan
+            columns[f"float_{index}"] = values
+    return pd.DataFrame(columns)
+
+
+def describe_stats(df, num_bins=20):
+    stats = {}
+    for column, values in df.describe(include="all").items():
+        stats[column] = {}
+        for stat, value in values.dropna().items():
+            if isinstance(value, (float, np.floating)):
+                stats[column][stat] = float(value)
+            elif isinstance(value, (int, np.integer)):
+                stats[column][stat] = int(value)
+            else:
+                stats[column][stat] = str(value)
+        if pd.api.types.is_numeric_dtype(df[column]):
+            try:
+                hist, bins = np.histogram(df[column], bins=num_bins)
+                stats[column]["hist"] = [hist.tolist(), bins.tolist()]
+            except Exception:
+                pass
+    return stats
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    df = make_data()
+    describe_seconds, expected = timed(describe_stats, df)
+    stats_seconds, stats = timed(get_df_stats, df, InferOptions.Histogram)
+    print(
+        f"{num_rows} rows, {num_columns} columns: describe {describe_seconds * 1000:.1f}ms, "
+        f"get_df_stats {stats_seconds * 1000:.1f}ms, same stats: {stats == expected}"
+    )
+
+
+if __name__ == "__main__":
+    main()
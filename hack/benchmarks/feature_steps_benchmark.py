@@ -0,0 +1,117 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the transforms of mlrun.feature_store.steps (MapValues, OneHotEncoder, Imputer and DateExtractor) with the
+# pandas engine (a single dataframe), the storey engine (an event per row) and the spark engine (when pyspark is
+# installed).
+# Usage: python hack/benchmarks/feature_steps_benchmark.py [num_rows]
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from mlrun.feature_store.steps import DateExtractor, Imputer, MapValues, OneHotEncoder
+
+num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+categories = [f"category {index}" for index in range(20)]
+
+
+def make_data():
+    random = np.random.default_rng(0)
+    income = random.uniform(0, 10**5, num_rows)
+    income[::10] = np.nan
+    return pd.DataFrame(
+        {
+            "age": random.uniform(0, 100, num_rows),
+            "income": income,
+            "department": random.choice(["IT", "Marketing", "RD", "Sales"], num_rows),
+            "category": random.choice(categories, num_rows),
+            "gender": random.choice(["male", "female"], num_rows),
+            "timestamp": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(random.integers(0, 10**8, num_rows), unit="s"),
+        }
+    )
+
+
+def make_steps():
+    return {
+        "MapValues(ranges)": MapValues(
+            mapping={
+                "age": {
+                    "ranges": {
+                        "child": ["-inf", 18],
+                        "young": [18, 30],
+                        "adult": [30, 65],
+                        "senior": [65, "inf"],
+                    }
+                }
+            },
+            with_original_features=True,
+        ),
+        "MapValues": MapValues(
+            mapping={"department": {"IT": 1, "Marketing": 2, "RD": 3}}
+        ),
+        "OneHotEncoder": OneHotEncoder(
+            mapping={"category": categories, "gender": ["male", "female"]}
+        ),
+        "Imputer": Imputer(default_value=0, mapping={"income": 50_000}),
+        "DateExtractor": DateExtractor(
+            parts=["hour", "day_of_week", "is_month_end"], timestamp_col="timestamp"
+        ),
+    }
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def benchmark_storey(step, rows):
+    for row in rows:
+        step._do_storey(dict(row))
+
+
+def main():
+    df = make_data()
+    rows = df.to_dict(orient="records")
+    spark, spark_df = None, None
+    try:
+        from pyspark.sql import SparkSession
+
+        spark = SparkSession.builder.master("local[*]").getOrCreate()
+        spark_df = spark.createDataFrame(df).cache()
+        spark_df.count()
+    except ImportError:
+        pass
+
+    for name, step in make_steps().items():
+        timings = [
+            f"pandas {timed(step._do_pandas, df.copy()) * 1000:.1f}ms",
+            f"storey {timed(benchmark_storey, step, rows) * 1000:.1f}ms",
+        ]
+        if spark_df is not None:
+            timings.append(
+                f"spark {timed(lambda: step._do_spark(spark_df).count()) * 1000:.1f}ms"
+            )
+        print(f"{name} ({num_rows} rows): {', '.join(timings)}")
+
+    if spark:
+        spark.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the per call latency of a burst of artifact and run stores through HTTPRunDB against a local stand-in API
+# server, with the pooled sessions and with the previous flow which created a new session on every POST.
+# Usage: python hack/benchmarks/httpdb_connection_benchmark.py [num_calls]
+
+import http.server
+import statistics
+import sys
+import threading
+import time
+
+import mlrun.artifacts
+import mlrun.db.httpdb
+
+num_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+
+class StandInAPIHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_PUT = do_POST  # noqa: N815
+    do_PATCH = do_POST  # noqa: N815
+
+    def log_message(self, *args):
+        pass
+
+
+def run(url, new_session_per_post):
+    db = mlrun.db.httpdb.HTTPRunDB(url)
+    artifact = mlrun.artifacts.Artifact("artifact", body="data")
+    latencies = []
+    for index in range(num_calls):
+        start = time.perf_counter()
+        if index % 2:
+            if new_session_per_post:
+                db._sessions.clear()
+            db.store_run({"metadata": {"uid": f"uid-{index}"}}, f"uid-{index}", "bench")
+        else:
+            db.store_artifact(f"artifact-{index}", artifact.to_dict(), project="bench")
+        latencies.append(time.perf_counter() - start)
+    return latencies, db.connection_stats
+
+
+def main():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandInAPIHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    try:
+        for name, new_session_per_post in [
+            ("session per POST", True),
+            ("pooled", False),
+        ]:
+            latencies, stats = run(url, new_session_per_post)
+            latencies_ms = sorted(latency * 1000 for latency in latencies)
+            print(
+                f"{name}: {num_calls} calls in {sum(latencies):.2f}s, "
+                f"mean {statistics.mean(latencies_ms):.3f}ms, "
+                f"p50 {latencies_ms[len(latencies_ms) // 2]:.3f}ms, "
+                f"p99 {latencies_ms[int(len(latencies_ms) * 0.99)]:.3f}ms"
+            )
+            if not new_session_per_post:
+                print(f"connection stats: {stats}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Compares the as-of join of the local feature merger with the previous per feature set `pd.merge_asof` flow.
+# Usage: python hack/benchmarks/local_merger_asof_join_benchmark.py [num_entity_rows] [num_feature_sets]
+
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import mlrun.feature_store as fstore
+from mlrun.feature_store.retrieval.local_merger import LocalFeatureMerger
+
+num_entity_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+num_feature_sets = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+num_keys = 100_000
+num_feature_set_rows = num_entity_rows // 2
+num_features = 5
+
+
+def generate_data():
+    rng = np.random.default_rng(42)
+    start = pd.Timestamp("2024-01-01")
+    entity_df = pd.DataFrame(
+        {
+            "id": rng.integers(0, num_keys, num_entity_rows),
+            "time": start
+            + pd.to_timedelta(rng.integers(0, 86400, num_entity_rows), unit="s"),
+        }
+    )
+    featureset_dfs = []
+    for i in range(num_feature_sets):
+        df = pd.DataFrame(
+            {
+                "id": rng.integers(0, num_keys, num_feature_set_rows),
+                f"time_{i}": start
+                + pd.to_timedelta(
+                    rng.integers(0, 86400, num_feature_set_rows), unit="s"
+                ),
+            }
+        )
+        for j in range(num_features):
+            df[f"f{j}_{i}"] = rng.normal(size=num_feature_set_rows)
+        featureset_dfs.append(df)
+    return entity_df, featureset_dfs
+
+
+def legacy_asof_join(entity_df, featureset_dfs):
+    merged_df = entity_df
+    for i, featureset_df in enumerate(featureset_dfs):
+        merged_df.sort_values(by="time", inplace=True)
+        featureset_df.sort_values(by=f"time_{i}", inplace=True)
+        merged_df = pd.merge_asof(
+            merged_df,
+            featureset_df,
+            left_on="time",
+            right_on=f"time_{i}",
+            left_by=["id"],
+            right_by=["id"],
+            suffixes=("", f"_fs{i}_"),
+        )
+        for col in merged_df.columns:
+            re.findall(f"_fs{i}_$", col)
+    return merged_df
+
+
+def local_merger_asof_join(entity_df, featureset_dfs):
+    merger = LocalFeatureMerger(vector=None)
+    featuresets = [
+        fstore.FeatureSet(f"fs{i}", entities=["id"], timestamp_key=f"time_{i}")
+        for i in range(num_feature_sets)
+    ]
+    merger.merge(
+        entity_timestamp_column="time",
+        featuresets=[None] + featuresets,
+        featureset_dfs=[entity_df] + featureset_dfs,
+        keys=[[[], []]] + [[["id"], ["id"]]] * num_feature_sets,
+        join_types=[None] + [[merger._default_join_type, True]] * num_feature_sets,
+    )
+    return merger._result_df
+
+
+def main():
+    print(
+        f"entity rows: {num_entity_rows}, feature sets: {num_feature_sets}, "
+        f"feature set rows: {num_feature_set_rows}"
+    )
+    results = {}
+    for name, join in [
+        ("pd.merge_asof", legacy_asof_join),
+        ("local merger", local_merger_asof_join),
+    ]:
+        entity_df, featureset_dfs = generate_data()
+        start = time.monotonic()
+        results[name] = join(entity_df, featureset_dfs)
+        print(f"{name}: {time.monotonic() - start:.2f} seconds")
+
+    # entity rows with equal timestamps may be ordered differently, and ties between feature set rows with equal
+    # keys and timestamps may be resolved differently
+    legacy, local = (
+        df.sort_values(["time", "id"], kind="mergesort") for df in results.values()
+    )
+    feature_columns = [column for column in local.columns if column.startswith("f")]
+    matching = (
+        legacy[feature_columns].fillna(0).values
+        == local[feature_columns].fillna(0).values
+    ).mean()
+    print(f"matching feature values: {matching:.4%}")
+
+
+main()
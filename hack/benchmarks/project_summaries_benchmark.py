@@ -0,0 +1,99 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the calculation of the project summaries counters in the SQL DB, of all the projects (as done by the
+# reconciliation) and of a single written project (as done by the incremental refresh).
+# Usage: python hack/benchmarks/project_summaries_benchmark.py [num_projects] [runs_per_project] [dsn]
+# The DB is a temporary SQLite file by default, pass a mysql+pymysql:// dsn of an empty schema to benchmark MySQL.
+
+import asyncio
+import datetime
+import sys
+import tempfile
+import time
+
+import sqlalchemy
+
+import server.api.crud  # noqa: F401 (imported before the db modules, which import each other through it)
+from mlrun.common.db.sql_session import _init_engine
+from mlrun.config import config
+from server.api.db.session import close_session, create_session
+from server.api.db.sqldb.db import SQLDB
+from server.api.db.sqldb.models import Run
+from server.api.initial_data import init_data
+from server.api.utils.project_summaries import ProjectSummaryCounters
+from server.api.utils.singletons.db import initialize_db
+
+num_projects = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+runs_per_project = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+dsn = sys.argv[3] if len(sys.argv) > 3 else ""
+states = ["completed", "error", "running"]
+
+
+def insert_runs(session):
+    start_time = datetime.datetime.now() - datetime.timedelta(hours=48)
+    for project_index in range(num_projects):
+        project = f"bench-{project_index}"
+        rows = []
+        for index in range(runs_per_project):
+            uid = f"{project}-run-{index}"
+            rows.append(
+                {
+                    "uid": uid,
+                    "project": project,
+                    "name": f"run-{index % 100}",
+                    "iteration": 0,
+                    "state": states[index % len(states)],
+                    "start_time": start_time + datetime.timedelta(seconds=index * 60),
+                    "updated": start_time,
+                    "struct": {"metadata": {"name": "run", "uid": uid}},
+                }
+            )
+        session.execute(sqlalchemy.insert(Run.__table__), rows)
+        session.commit()
+
+
+def main():
+    db_file = None
+    if not dsn:
+        db_file = tempfile.NamedTemporaryFile(suffix="-mlrun.db")
+    config.httpdb.dsn = dsn or f"sqlite:///{db_file.name}?check_same_thread=false"
+    _init_engine()
+    session = create_session()
+    try:
+        db = SQLDB(config.httpdb.dsn)
+        db.initialize(session)
+        initialize_db(db)
+        init_data()
+        insert_runs(session)
+
+        start = time.perf_counter()
+        asyncio.run(db.get_project_resources_counters())
+        all_projects_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        db.calculate_project_summary_counters(
+            session, "bench-0", list(ProjectSummaryCounters)
+        )
+        project_seconds = time.perf_counter() - start
+        print(
+            f"{num_projects} projects of {runs_per_project} runs: all projects {all_projects_seconds * 1000:.1f}ms, "
+            f"single project {project_seconds * 1000:.1f}ms"
+        )
+    finally:
+        close_session(session)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the throughput of run status updates and run listing in the SQL DB, with the in place JSON patch of the
+# run struct and with the previous flow which locked, read and rewrote the whole run record.
+# Usage: python hack/benchmarks/run_db_update_benchmark.py [num_runs] [num_updates] [dsn]
+# The DB is a temporary SQLite file by default, pass a mysql+pymysql:// dsn of an empty schema to benchmark MySQL.
+
+import sys
+import tempfile
+import time
+
+import server.api.crud  # noqa: F401 (imported before the db modules, which import each other through it)
+from mlrun.common.db.sql_session import _init_engine
+from mlrun.config import config
+from server.api.db.session import close_session, create_session
+from server.api.db.sqldb.db import SQLDB
+from server.api.initial_data import init_data
+from server.api.utils.singletons.db import initialize_db
+
+num_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+num_updates = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+dsn = sys.argv[3] if len(sys.argv) > 3 else ""
+project = "bench"
+
+
+def store_runs(db, session, name):
+    for index in range(num_runs):
+        uid = f"{name}-{index}"
+        run = {
+            "metadata": {"name": name, "uid": uid, "project": project},
+            "spec": {"parameters": {f"p{i}": i for i in range(50)}},
+            "status": {"state": "running", "results": {}, "iterations": []},
+        }
+        db.store_run(session, run, uid, project)
+
+
+def benchmark(db, session, name, patched):
+    store_runs(db, session, name)
+    if not patched:
+        db._patch_run_struct = lambda *args, **kwargs: None
+    start = time.perf_counter()
+    for index in range(num_updates):
+        db.update_run(
+            session,
+            {
+                "status.results": {"accuracy": index / num_updates, "step": index},
+                "status.state": "running",
+            },
+            f"{name}-{index % num_runs}",
+            project,
+        )
+    updates_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    runs = db.list_runs(session, name=name, project=project)
+    list_seconds = time.perf_counter() - start
+    assert len(runs) == num_runs
+    print(
+        f"{'patched' if patched else 'record'}: {num_updates / updates_seconds:.0f} updates/s, "
+        f"list of {num_runs} runs in {list_seconds * 1000:.1f}ms"
+    )
+
+
+def main():
+    db_file = None
+    if not dsn:
+        db_file = tempfile.NamedTemporaryFile(suffix="-mlrun.db")
+    config.httpdb.dsn = dsn or f"sqlite:///{db_file.name}?check_same_thread=false"
+    _init_engine()
+    session = create_session()
+    try:
+        db = SQLDB(config.httpdb.dsn)
+        db.initialize(session)
+        initialize_db(db)
+        init_data()
+        benchmark(db, session, "record-runs", patched=False)
+        benchmark(SQLDB(config.httpdb.dsn), session, "patched-runs", patched=True)
+    finally:
+        close_session(session)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the latency of listing deep pages of the project runs in the SQL DB, with offset pagination and with keyset
+# pagination (from the last row of the previous page).
+# Usage: python hack/benchmarks/runs_pagination_benchmark.py [num_runs] [page_size] [dsn]
+# The DB is a temporary SQLite file by default, pass a mysql+pymysql:// dsn of an empty schema to benchmark MySQL.
+
+import datetime
+import sys
+import tempfile
+import time
+
+import sqlalchemy
+
+import mlrun.common.schemas
+import server.api.crud  # noqa: F401 (imported before the db modules, which import each other through it)
+from mlrun.common.db.sql_session import _init_engine
+from mlrun.config import config
+from server.api.db.session import close_session, create_session
+from server.api.db.sqldb.db import SQLDB
+from server.api.db.sqldb.models import Run
+from server.api.initial_data import init_data
+from server.api.utils.singletons.db import initialize_db
+
+num_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+page_size = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+dsn = sys.argv[3] if len(sys.argv) > 3 else ""
+project = "bench"
+pages = [page for page in [1, 10, 100, 1000] if (page - 1) * page_size < num_runs]
+
+
+def insert_runs(session):
+    start_time = datetime.datetime(2024, 1, 1)
+    batch_size = 10_000
+    for batch_start in range(0, num_runs, batch_size):
+        rows = []
+        for index in range(batch_start, min(batch_start + batch_size, num_runs)):
+            uid = f"run-{index}"
+            rows.append(
+                {
+                    "uid": uid,
+                    "project": project,
+                    "name": "bench-run",
+                    "iteration": 0,
+                    "state": "completed",
+                    # runs which started in the same second are ordered by their id
+                    "start_time": start_time + datetime.timedelta(seconds=index // 3),
+                    "updated": start_time,
+                    "struct": {
+                        "metadata": {
+                            "name": "bench-run",
+                            "uid": uid,
+                            "project": project,
+                        },
+                        "status": {"state": "completed"},
+                    },
+                }
+            )
+        session.execute(sqlalchemy.insert(Run.__table__), rows)
+        session.commit()
+
+
+def cursor_of_page(session, page):
+    """the keyset of the last run of the page before, as stored in the pagination cache"""
+    run = (
+        session.query(Run.start_time, Run.id)
+        .filter(Run.project == project)
+        .order_by(Run.start_time.desc(), Run.id.desc())
+        .offset((page - 1) * page_size - 1)
+        .limit(1)
+        .one()
+    )
+    return mlrun.common.schemas.PageCursor(after=[run.start_time.isoformat(), run.id])
+
+
+def benchmark(db, session, page):
+    start = time.perf_counter()
+    offset_runs = db.list_runs(session, project=project, page=page, page_size=page_size)
+    offset_seconds = time.perf_counter() - start
+
+    page_cursor = cursor_of_page(session, page) if page > 1 else None
+    start = time.perf_counter()
+    keyset_runs = db.list_runs(
+        session,
+        project=project,
+        page=page,
+        page_size=page_size,
+        page_cursor=page_cursor,
+    )
+    keyset_seconds = time.perf_counter() - start
+
+    assert [run["metadata"]["uid"] for run in offset_runs] == [
+        run["metadata"]["uid"] for run in keyset_runs
+    ]
+    print(
+        f"page {page}: offset {offset_seconds * 1000:.1f}ms, keyset {keyset_seconds * 1000:.1f}ms"
+    )
+
+
+def main():
+    db_file = None
+    if not dsn:
+        db_file = tempfile.NamedTemporaryFile(suffix="-mlrun.db")
+    config.httpdb.dsn = dsn or f"sqlite:///{db_file.name}?check_same_thread=false"
+    _init_engine()
+    session = create_session()
+    try:
+        db = SQLDB(config.httpdb.dsn)
+        db.initialize(session)
+        initialize_db(db)
+        init_data()
+        start = time.perf_counter()
+        insert_runs(session)
+        print(f"inserted {num_runs} runs in {time.perf_counter() - start:.1f}s")
+        for page in pages:
+            benchmark(db, session, page)
+    finally:
+        close_session(session)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import concurrent.futures
 import hashlib
 import os
 import pathlib
@@ -32,6 +33,7 @@ from ..utils import (
     calculate_local_file_hash,
     generate_artifact_uri,
     is_relative_path,
+    logger,
 )
 
 
@@ -400,9 +402,17 @@ class Artifact(ModelObj):
         )
 
     def _upload_file(
-        self, source_path: str, target_path: str = None, artifact_path: str = None
+        self,
+        source_path: str,
+        target_path: str = None,
+        artifact_path: str = None,
+        file_hash: str = None,
     ):
-        file_hash = None
+        """
+        upload the source file to the target path
+        :param file_hash: the (already calculated) hash of the file, when the target path was resolved from it
+        """
+        hash_addressed = bool(file_hash)
         if not target_path and not self.spec.target_path:
             if not mlrun.mlconf.artifacts.generate_target_path_from_artifact_hash:
                 raise mlrun.errors.MLRunInvalidArgumentError(
@@ -412,13 +422,18 @@ class Artifact(ModelObj):
             file_hash, self.spec.target_path = self.resolve_file_target_hash_path(
                 source_path, artifact_path
             )
+            hash_addressed = True
         if mlrun.mlconf.artifacts.calculate_hash:
             self.metadata.hash = file_hash or calculate_local_file_hash(source_path)
         self.spec.size = os.stat(source_path).st_size
 
-        mlrun.datastore.store_manager.object(
-            url=target_path or self.spec.target_path
-        ).upload(source_path)
+        _upload_file_to_target(
+            source_path,
+            mlrun.datastore.store_manager.object(
+                url=target_path or self.spec.target_path
+            ),
+            hash_addressed=hash_addressed,
+        )
 
     def resolve_body_target_hash_path(
         self, body: typing.Union[bytes, str], artifact_path: str
@@ -668,20 +683,34 @@ class DirArtifact(Artifact):
                 raise mlrun.errors.MLRunNotFoundError(
                     f"file {file_path} not found, cant upload"
                 )
+        if (
+            not self.spec.target_path
+            and not mlrun.mlconf.artifacts.generate_target_path_from_artifact_hash
+        ):
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "target path is not specified and mlrun.mlconf.artifacts.generate_target_path_from_artifact_hash "
+                "set to False"
+            )
 
+        def resolve_target_path(file_name):
             if self.spec.target_path:
-                target_path = os.path.join(self.spec.target_path, file_name)
-            elif mlrun.mlconf.artifacts.generate_target_path_from_artifact_hash:
-                _, target_path = self.resolve_file_target_hash_path(
-                    source_path=file_path, artifact_path=artifact_path
-                )
-            else:
-                raise mlrun.errors.MLRunInvalidArgumentError(
-                    "target path is not specified and mlrun.mlconf.artifacts.generate_target_path_from_artifact_hash "
-                    "set to False"
-                )
-
-            mlrun.datastore.store_manager.object(url=target_path).upload(file_path)
+                return os.path.join(self.spec.target_path, file_name)
+            _, target_path = self.resolve_file_target_hash_path(
+                source_path=os.path.join(self.spec.src_path, file_name),
+                artifact_path=artifact_path,
+            )
+            return target_path
+
+        # the files are hashed and uploaded concurrently, see mlrun.mlconf.artifacts.upload
+        target_paths = _map_concurrently(resolve_target_path, files)
+        _upload_to_targets(
+            [
+                (os.path.join(self.spec.src_path, file_name), target_path)
+                for file_name, target_path in zip(files, target_paths)
+            ],
+            hash_addressed=not self.spec.target_path,
+        )
+        for file_name, target_path in zip(files, target_paths):
             # add files of the directory to the extra data of the artifact with value of the target path
             self.spec.extra_data[file_name] = target_path
 
@@ -760,44 +789,114 @@ def upload_extra_data(
     update_spec=False,
     artifact_path: str = None,
 ):
-    """upload extra data to the artifact store"""
+    """upload extra data to the artifact store, the items are uploaded concurrently (see
+    mlrun.mlconf.artifacts.upload)"""
     if not extra_data:
         return
     target_path = artifact.target_path
+
+    # the bodies and the source files of the items, all the source files are verified before any upload starts
+    sources = {}
     for key, item in extra_data.items():
         if isinstance(item, bytes):
-            if target_path:
-                target = os.path.join(target_path, prefix + key)
-            else:
-                _, target = artifact.resolve_body_target_hash_path(
-                    item, artifact_path=artifact_path
-                )
-
-            mlrun.datastore.store_manager.object(url=target).put(item)
-            artifact.extra_data[prefix + key] = target
-            continue
-
-        if is_relative_path(item):
+            sources[key] = item
+        elif is_relative_path(item):
             src_path = (
                 os.path.join(artifact.src_path, item) if artifact.src_path else item
             )
             if not os.path.isfile(src_path):
                 raise ValueError(f"Extra data file {src_path} not found")
+            sources[key] = src_path
 
+    def resolve_target_path(key):
+        source = sources[key]
+        if isinstance(source, bytes):
             if target_path:
-                target = os.path.join(target_path, item)
-            else:
-                _, target = artifact.resolve_file_target_hash_path(
-                    src_path, artifact_path=artifact_path
-                )
-            mlrun.datastore.store_manager.object(url=target).upload(src_path)
-            artifact.extra_data[prefix + key] = target
-            continue
+                return os.path.join(target_path, prefix + key)
+            _, target = artifact.resolve_body_target_hash_path(
+                source, artifact_path=artifact_path
+            )
+            return target
+        if target_path:
+            return os.path.join(target_path, extra_data[key])
+        _, target = artifact.resolve_file_target_hash_path(
+            source, artifact_path=artifact_path
+        )
+        return target
 
-        if update_spec:
+    # the items are hashed and uploaded concurrently, see mlrun.mlconf.artifacts.upload
+    keys = list(sources.keys())
+    targets = dict(zip(keys, _map_concurrently(resolve_target_path, keys)))
+    _upload_to_targets(
+        [(sources[key], targets[key]) for key in keys], hash_addressed=not target_path
+    )
+    for key, item in extra_data.items():
+        if key in targets:
+            artifact.extra_data[prefix + key] = targets[key]
+        elif update_spec:
             artifact.extra_data[prefix + key] = item
 
 
+def _map_concurrently(function: typing.Callable, items: list) -> list:
+    """apply the function to the items with a pool of mlrun.mlconf.artifacts.upload.workers threads, the results
+    are returned in the order of the items"""
+    workers = min(int(mlrun.mlconf.artifacts.upload.workers or 1), len(items))
+    if workers <= 1:
+        return [function(item) for item in items]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, items))
+
+
+def _upload_to_targets(
+    uploads: list[tuple[typing.Union[bytes, str], str]], hash_addressed=False
+):
+    """upload the (body or source file path, target path) items concurrently, see mlrun.mlconf.artifacts.upload
+
+    the store objects of the targets are resolved on the calling thread before the uploads start, as the store
+    manager and the store clients (e.g. boto3) don't support being created concurrently
+    """
+    store_objects = [
+        mlrun.datastore.store_manager.object(url=target) for _, target in uploads
+    ]
+
+    def upload(index):
+        source = uploads[index][0]
+        if isinstance(source, bytes):
+            store_objects[index].put(source)
+        else:
+            _upload_file_to_target(source, store_objects[index], hash_addressed)
+
+    _map_concurrently(upload, list(range(len(uploads))))
+
+
+def _upload_file_to_target(
+    source_path: str, store_object: "mlrun.datastore.DataItem", hash_addressed=False
+):
+    """upload the file to the target store object. a target path which was generated from the hash of the file
+    addresses its content, so when such a target already exists (with the size of the file) it is not uploaded again,
+    e.g. when logging the same files again or retrying an interrupted upload of a directory"""
+    if (
+        hash_addressed
+        and mlrun.mlconf.artifacts.upload.skip_existing_hash_targets
+        and _get_target_size(store_object) == os.path.getsize(source_path)
+    ):
+        logger.debug(
+            "Target of the file hash already exists, skipping upload",
+            source_path=source_path,
+            target_path=store_object.url,
+        )
+        return
+    store_object.upload(source_path)
+
+
+def _get_target_size(store_object) -> typing.Optional[int]:
+    try:
+        return store_object.stat().size
+    except Exception:
+        # the target doesn't exist (or can't be accessed), so it is uploaded
+        return None
+
+
 def get_artifact_meta(artifact):
     """return artifact object, and list of extra data items
 
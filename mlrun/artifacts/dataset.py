@@ -17,7 +17,6 @@ import warnings
 from io import StringIO
 from typing import Optional
 
-import numpy as np
 import pandas as pd
 from pandas.io.json import build_table_schema
 
@@ -27,6 +26,7 @@ import mlrun.datastore
 import mlrun.utils.helpers
 from mlrun.config import config as mlconf
 
+from ..data_types import InferOptions, infer
 from .base import Artifact, ArtifactSpec, StorePrefix
 
 default_preview_rows_length = 20
@@ -370,27 +370,7 @@ class DatasetArtifact(Artifact):
 def get_df_stats(df):
     if hasattr(df, "dask"):
         df = df.sample(frac=ddf_sample_pct).compute()
-    d = {}
-    for col, values in df.describe(include="all").items():
-        stats_dict = {}
-        for stat, val in values.dropna().items():
-            if isinstance(val, (float, np.floating, np.float64)):
-                stats_dict[stat] = float(val)
-            elif isinstance(val, (int, np.integer, np.int64)):
-                stats_dict[stat] = int(val)
-            else:
-                stats_dict[stat] = str(val)
-
-        if pd.api.types.is_numeric_dtype(df[col]):
-            # store histogram
-            try:
-                hist, bins = np.histogram(df[col], bins=20)
-                stats_dict["hist"] = [hist.tolist(), bins.tolist()]
-            except Exception:
-                pass
-
-        d[col] = stats_dict
-    return d
+    return infer.get_df_stats(df, InferOptions.Histogram)
 
 
 def update_dataset_meta(
@@ -156,7 +156,8 @@ class ArtifactManager:
 
     def artifact_list(self, full=False):
         artifacts = []
-        for artifact in self.artifacts.values():
+        # a copy of the values, as the artifacts may be logged by another thread
+        for artifact in list(self.artifacts.values()):
             if isinstance(artifact, dict):
                 artifacts.append(artifact)
             else:
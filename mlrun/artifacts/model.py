@@ -375,6 +375,7 @@ class ModelArtifact(Artifact):
             if not path.isfile(src_model_path):
                 raise ValueError(f"Model file {src_model_path} not found")
 
+            file_hash = None
             if not target_model_path:
                 (
                     self.metadata.hash,
@@ -382,11 +383,14 @@ class ModelArtifact(Artifact):
                 ) = self.resolve_file_target_hash_path(
                     source_path=src_model_path, artifact_path=artifact_path
                 )
+                file_hash = self.metadata.hash
 
+            # the hash is passed on, so the file is not hashed again
             self._upload_file(
                 src_model_path,
                 target_path=target_model_path,
                 artifact_path=artifact_path,
+                file_hash=file_hash,
             )
 
         return target_model_path
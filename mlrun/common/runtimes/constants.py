@@ -183,6 +183,16 @@ class RunStates:
     def error_and_abortion_states():
         return list(set(RunStates.error_states()) | set(RunStates.abortion_states()))
 
+    @staticmethod
+    def watched_log_states():
+        """The states in which the log of the run may still be written, so it is watched for new logs"""
+        return [
+            RunStates.pending,
+            RunStates.running,
+            RunStates.created,
+            RunStates.aborting,
+        ]
+
     @staticmethod
     def non_terminal_states():
         return list(set(RunStates.all()) - set(RunStates.terminal_states()))
@@ -163,7 +163,7 @@ from .notification import (
     SetNotificationRequest,
 )
 from .object import ObjectKind, ObjectMetadata, ObjectSpec, ObjectStatus
-from .pagination import PaginationInfo
+from .pagination import PageCursor, PaginationInfo
 from .pipeline import PipelinesOutput, PipelinesPagination
 from .project import (
     IguazioProject,
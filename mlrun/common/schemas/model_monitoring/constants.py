@@ -61,6 +61,7 @@ class EventFieldType:
     LAST_REQUEST_TIMESTAMP = "last_request_timestamp"
     METRIC = "metric"
     METRICS = "metrics"
+    BATCH = "batch"
     BATCH_INTERVALS_DICT = "batch_intervals_dict"
     DEFAULT_BATCH_INTERVALS = "default_batch_intervals"
     MINUTES = "minutes"
@@ -214,6 +215,7 @@ class FileTargetKind:
     MONITORING_SCHEDULES = "monitoring_schedules"
     MONITORING_APPLICATION = "monitoring_application"
     ERRORS = "errors"
+    SKETCHES = "sketches"
 
 
 class ModelMonitoringMode(str, Enum):
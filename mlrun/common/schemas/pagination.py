@@ -24,3 +24,14 @@ class PaginationInfo(pydantic.BaseModel):
     page: typing.Optional[int]
     page_size: typing.Optional[int] = pydantic.Field(alias="page-size")
     page_token: typing.Optional[str] = pydantic.Field(alias="page-token")
+
+
+class PageCursor(pydantic.BaseModel):
+    """
+    The keyset cursor of a paginated listing. `after` is the sort key of the last row of the previous page, which the
+    page is read from (instead of skipping the previous rows with an offset). The listing sets `last` to the sort key
+    of the last row of the page, for the next page to be read from it.
+    """
+
+    after: typing.Optional[list] = None
+    last: typing.Optional[list] = None
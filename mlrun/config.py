@@ -115,10 +115,28 @@ default_config = {
             # max number of parallel abort run jobs in runs monitoring
             "concurrent_abort_stale_runs_workers": 10,
             "list_runs_time_period_in_days": 7,  # days
+            "watch": {
+                # Keep the runtime resources in memory, fed by k8s watch streams, and the non-terminal runs by the
+                # runs updated since the previous cycle, so each cycle processes only the resources which changed.
+                # When disabled, each cycle lists all the runtime resources and non-terminal runs
+                "enabled": False,
+                # interval in seconds to list all the runtime resources and non-terminal runs again, in case of missed
+                # events and to re-evaluate the state thresholds of unchanged resources
+                "resync_interval": 600,
+            },
         },
         "projects": {
             "summaries": {
                 "cache_interval": "30",
+                "incremental": {
+                    # when enabled, the writes of runs, artifacts, schedules and feature sets mark their project, and
+                    # each cache interval refreshes only the counters of the marked projects (and the pipelines
+                    # counters) instead of recalculating the counters of all the projects
+                    "enabled": True,
+                    # interval in seconds to recalculate the counters of all the projects, to fix the drift of the
+                    # incremental refreshes (e.g. of the recent runs counters, which change with time)
+                    "reconciliation_interval": 600,
+                },
             },
         },
     },
@@ -154,6 +172,14 @@ default_config = {
         "datasets": {
             "max_preview_columns": 100,
         },
+        "upload": {
+            # number of the files of a directory artifact (or of the extra data of a model) which are uploaded
+            # concurrently, 1 uploads them one at a time
+            "workers": 8,
+            # don't upload files again to existing targets which were generated from the file hash (with the same
+            # size), so logging the same files again (or retrying an interrupted upload) skips them
+            "skip_existing_hash_targets": True,
+        },
         "limits": {
             "max_chunk_size": 1024 * 1024 * 1,  # 1MB
             "max_preview_size": 1024 * 1024 * 10,  # 10MB
@@ -344,6 +370,8 @@ default_config = {
             "data_migrations_mode": "enabled",
             # Whether to perform database migration from sqlite to mysql on initialization
             "database_migration_mode": "enabled",
+            # the pickled run bodies are migrated to the runs struct column in batches
+            "runs_struct_migration_batch_size": 500,
             "backup": {
                 # Whether to use db backups on initialization
                 "mode": "enabled",
@@ -436,6 +464,16 @@ default_config = {
             "pull_logs_default_interval": 3,  # seconds
             "pull_logs_backoff_no_logs_default_interval": 10,  # seconds
             "pull_logs_default_size_limit": 1024 * 1024,  # 1 MB
+            # the logs of watched runs are streamed by the API as they are written, instead of being pulled
+            "follow": {
+                "enabled": True,
+                # the interval of checking for new logs while the log is idle
+                "interval": 0.5,  # seconds
+                # the interval of re-reading the run state (from the DB) while the log is idle
+                "state_interval": 5,  # seconds
+                # the duration of a single follow request, the client then follows again from its offset
+                "timeout": 60,  # seconds
+            },
         },
         "authorization": {
             "mode": "none",  # one of none, opa
@@ -522,6 +560,15 @@ default_config = {
             # if set to true, will log a warning for trying to use run db functionality while in nop db mode
             "verbose": True,
         },
+        "async_client": {
+            # send the bulk calls (store_artifacts, update_runs) and fetch the pages of the paginated listings of
+            # the http db concurrently, with the asyncio client
+            "enabled": False,
+            # maximal number of concurrent requests of a bulk call
+            "max_concurrency": 16,
+            # number of pages which are fetched concurrently when listing
+            "prefetch_pages": 4,
+        },
         "pagination": {
             "default_page_size": 20,
             "pagination_cache": {
@@ -530,6 +577,16 @@ default_config = {
                 "max_size": 10000,
             },
         },
+        # in-process cache of hot read endpoints (get/list functions, list feature sets, project summaries), the
+        # entries are invalidated by the writes of this API instance, the ttl (seconds) bounds the staleness of writes
+        # made by other API instances (chief/workers). disabled by default, as a client whose write was handled by
+        # one instance may not see it in a read which is handled by another instance until the ttl elapses
+        "response_cache": {
+            "enabled": False,
+            "ttl": 30,
+            # maximal number of cached entries per resource type
+            "max_size": 256,
+        },
     },
     "model_endpoint_monitoring": {
         "serving_stream_args": {"shard_count": 1, "retention_period_hours": 24},
@@ -550,6 +607,12 @@ default_config = {
         "default_http_sink_app": "http://nuclio-{project}-{application_name}.{namespace}.svc.cluster.local:8080",
         "parquet_batching_max_events": 10_000,
         "parquet_batching_timeout_secs": timedelta(minutes=1).total_seconds(),
+        # Maximal number of concurrent tasks (endpoint and application batch windows, TSDB queries) of the monitoring
+        # controller
+        "controller_max_workers": 50,
+        # Length (seconds) of the time buckets of the feature sketches which are maintained by the monitoring stream,
+        # the monitoring applications merge them to get the window statistics. 0 to disable
+        "sketches_bucket_secs": 60,
         # See mlrun.model_monitoring.db.stores.ObjectStoreFactory for available options
         "endpoint_store_connection": "",
         # See mlrun.model_monitoring.db.tsdb.ObjectTSDBFactory for available options
@@ -599,6 +662,19 @@ default_config = {
         "default_targets": "parquet,nosql",
         "default_job_image": "mlrun/mlrun",
         "flush_interval": None,
+        # the online feature service queries the features of all the entity rows of a get() call together (a single
+        # multi-get per feature set) instead of row by row, when the vector has no graph and no aggregations
+        "online_batch_retrieval": True,
+        # in-process read-through cache of the features read by the online feature service (e.g. for the enrichment
+        # of serving events), shared by the services of the process. entries are addressed by the feature set version
+        "online_cache": {
+            # seconds to keep the cached features, 0 disables the cache
+            "ttl": 0,
+            # seconds to keep the keys which were not found, defaults to the ttl
+            "negative_ttl": None,
+            # max number of cached entries (feature set and entity key), least recently used entries are evicted first
+            "max_size": 100000,
+        },
     },
     "ui": {
         "projects_prefix": "projects",  # The UI link prefix for projects
@@ -630,6 +706,24 @@ default_config = {
         # e.g. Windows client (on host) and Linux container (Jupyter, Nuclio..) need to access the same files/artifacts
         # need to map container path to host windows paths, e.g. "\data::c:\\mlrun_data" ("::" used as splitter)
         "item_to_real_path": "",
+        # the maximal number of files which are read concurrently when reading a directory of csv/parquet files
+        "max_concurrent_file_reads": 8,
+        # local on-disk cache of remote (s3, gcs, azure, v3io, oss) objects which are read by DataItem get(), local()
+        # and as_df(), entries are versioned by the object stat so modified objects are downloaded again.
+        # note that local() returns the path of the cached file, which must not be modified
+        "cache": {
+            "enabled": False,
+            # defaults to <temp dir>/mlrun-data-cache
+            "path": "",
+            # the maximal total size (bytes) of the cached files in the cache directory (including the files of other
+            # processes which share it), least recently used files are evicted first
+            "max_size": 5 * 1024**3,
+            # ranged reads (get with size/offset) are cached in blocks of this size (bytes)
+            "block_size": 4 * 1024**2,
+            # interval (seconds) to re-index the cache directory for the files of other processes which share it,
+            # it is also re-indexed whenever the files known to the process exceed max_size
+            "sync_interval": 10,
+        },
     },
     "default_function_pod_resources": {
         "requests": {"cpu": None, "memory": None, "gpu": None},
@@ -703,6 +797,13 @@ default_config = {
         # interval for stopping log collection for runs which are in a terminal state
         "stop_logs_interval": 3600,
     },
+    "execution_context": {
+        # The run updates of an execution context (results, artifacts, parameters, ..) are coalesced and flushed to
+        # the run tmpfile and the DB at most once per interval (in seconds), and on commit, completion and exit.
+        # 0 (default) flushes every update immediately, a longer interval (e.g. 5) saves the DB updates of runs which
+        # log many results, at the cost of their progress being seen later
+        "updates_flush_interval": 0,
+    },
     # Configurations for the `mlrun.package` sub-package involving packagers - logging returned outputs and parsing
     # inputs data items:
     "packagers": {
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import concurrent.futures
+import os
+
 import numpy as np
 import packaging.version
 import pandas as pd
@@ -23,6 +26,10 @@ from mlrun.utils import logger
 from .data_types import InferOptions, pa_type_to_value_type, pd_schema_to_value_type
 
 default_num_bins = 20
+# max number of threads which compute the stats of the numeric columns of a dataframe, the threads are used when the
+# dataframe has at least parallel_stats_min_values numeric values
+stats_max_workers = 8
+parallel_stats_min_values = 1_000_000
 
 
 def infer_schema_from_df(
@@ -102,7 +109,13 @@ def infer_schema_from_df(
 
 
 def get_df_stats(df, options, num_bins=None, sample_size=None):
-    """get per column data stats from dataframe"""
+    """get per column data stats from dataframe
+
+    the stats of the numeric (numpy dtype) columns are computed directly from their values, min/max, quantiles,
+    moments and histogram together, and the columns are processed by a pool of threads on large frames (numpy
+    releases the GIL). the other columns (e.g. strings, categories, booleans, datetimes) are described together by
+    pandas. the stats are the same as the ones of df.describe(include="all").
+    """
 
     results_dict = {}
     if df.empty:
@@ -113,6 +126,105 @@ def get_df_stats(df, options, num_bins=None, sample_size=None):
     num_bins = num_bins or default_num_bins
     if InferOptions.get_common_options(options, InferOptions.Index) and df.index.names:
         df = df.reset_index()
+    with_histogram = InferOptions.get_common_options(options, InferOptions.Histogram)
+
+    numeric_columns, other_columns = [], []
+    for position, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, np.dtype) and dtype.kind in "iuf":
+            numeric_columns.append(position)
+        else:
+            other_columns.append(position)
+
+    def numeric_column_stats(position):
+        return _get_numeric_column_stats(
+            df.iloc[:, position].to_numpy(), num_bins, with_histogram
+        )
+
+    workers = min(stats_max_workers, os.cpu_count() or 1, len(numeric_columns))
+    if workers > 1 and df.shape[0] * len(numeric_columns) >= parallel_stats_min_values:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            numeric_stats = list(executor.map(numeric_column_stats, numeric_columns))
+    else:
+        numeric_stats = [numeric_column_stats(position) for position in numeric_columns]
+    columns_stats = dict(zip(numeric_columns, numeric_stats))
+    if other_columns:
+        columns_stats.update(
+            _describe_columns_stats(df, other_columns, num_bins, with_histogram)
+        )
+
+    for position, col in enumerate(df.columns):
+        results_dict[col] = columns_stats[position]
+    return results_dict
+
+
+def _get_numeric_column_stats(values: np.ndarray, num_bins: int, with_histogram):
+    """the describe stats (and histogram) of the values of a numeric column, computed the same way as pandas does"""
+    # the sums are of the values with zeros instead of the nulls, and in the dtypes which pandas (nanops) uses, so
+    # the moments are the same as the ones of pandas
+    nulls = None
+    filled_values = non_null_values = values
+    if values.dtype.kind == "f":
+        nulls = np.isnan(values)
+        if nulls.any():
+            filled_values = np.where(nulls, values.dtype.type(0), values)
+            non_null_values = values[~nulls]
+        else:
+            nulls = None
+    count = len(non_null_values)
+    stats_dict = {"count": float(count)}
+    if not count:
+        return stats_dict
+
+    if values.dtype.kind == "f":
+        sum_dtype = count_dtype = values.dtype
+    else:
+        sum_dtype, count_dtype = np.dtype(np.float64), np.dtype(np.float64)
+        filled_values = values.astype(np.float64)
+    mean = filled_values.sum(dtype=sum_dtype) / count_dtype.type(count)
+    min_value, max_value = non_null_values.min(), non_null_values.max()
+    stats = [("mean", mean)]
+    if count > 1:
+        # the sample standard deviation (two-pass algorithm)
+        average = filled_values.sum(dtype=np.float64) / count_dtype.type(count)
+        squares = (average - filled_values) ** 2
+        if nulls is not None:
+            np.putmask(squares, nulls, 0)
+        variance = squares.sum(dtype=np.float64) / count_dtype.type(count - 1)
+        stats.append(("std", np.sqrt(variance.astype(count_dtype))))
+    stats.append(("min", min_value))
+    quantiles = np.percentile(non_null_values, [25.0, 50.0, 75.0])
+    if nulls is not None:
+        # pandas casts the quantiles of the values with nulls back to the float dtype
+        quantiles = quantiles.astype(values.dtype)
+    stats.extend(zip(["25%", "50%", "75%"], quantiles))
+    stats.append(("max", max_value))
+    for stat, value in stats:
+        value = float(value)
+        if not np.isnan(value):
+            stats_dict[stat] = value
+
+    # like np.histogram of the whole column, which fails on null or infinite values
+    if (
+        with_histogram
+        and nulls is None
+        and np.isfinite(min_value)
+        and np.isfinite(max_value)
+    ):
+        # store histogram
+        try:
+            hist, bins = np.histogram(
+                values, bins=num_bins, range=(min_value, max_value)
+            )
+            stats_dict["hist"] = [hist.tolist(), bins.tolist()]
+        except Exception:
+            # e.g. the range of the values overflows the bins computation
+            pass
+    return stats_dict
+
+
+def _describe_columns_stats(df, positions: list[int], num_bins: int, with_histogram):
+    """the describe stats (and histogram) of the columns in the positions, by their position"""
+    df = df.iloc[:, positions]
     # pandas 2 removes datetime_is_numeric
     # See https://github.com/mlflow/mlflow/pull/7898 for more information
     kwargs = (
@@ -121,7 +233,10 @@ def get_df_stats(df, options, num_bins=None, sample_size=None):
         >= packaging.version.Version("2.0.0rc0")
         else {"datetime_is_numeric": True}
     )
-    for col, values in df.describe(include="all", **kwargs).items():
+    described = df.describe(include="all", **kwargs)
+    columns_stats = {}
+    for index, position in enumerate(positions):
+        values = described.iloc[:, index]
         stats_dict = {}
         for stat, val in values.dropna().items():
             if isinstance(val, (float, np.floating, np.float64)):
@@ -135,18 +250,17 @@ def get_df_stats(df, options, num_bins=None, sample_size=None):
             else:
                 stats_dict[stat] = str(val)
 
-        if InferOptions.get_common_options(
-            options, InferOptions.Histogram
-        ) and pd.api.types.is_numeric_dtype(df[col]):
+        column = df.iloc[:, index]
+        if with_histogram and pd.api.types.is_numeric_dtype(column):
             # store histogram
             try:
-                hist, bins = np.histogram(df[col], bins=num_bins)
+                hist, bins = np.histogram(column, bins=num_bins)
                 stats_dict["hist"] = [hist.tolist(), bins.tolist()]
             except Exception:
                 pass
 
-        results_dict[col] = stats_dict
-    return results_dict
+        columns_stats[position] = stats_dict
+    return columns_stats
 
 
 def get_df_preview(df, preview_lines=20):
@@ -27,6 +27,7 @@ from .base import DataStore, FileStats, make_datastore_schema_sanitizer
 
 class OSSStore(DataStore):
     using_bucket = True
+    cacheable = True
 
     def __init__(self, parent, schema, name, endpoint="", secrets: dict = None):
         super().__init__(parent, name, schema, endpoint, secrets)
@@ -96,7 +97,7 @@ class OSSStore(DataStore):
         obj = oss.get_object_meta(key)
         size = obj.content_length
         modified = datetime.fromtimestamp(obj.last_modified)
-        return FileStats(size, time.mktime(modified.timetuple()))
+        return FileStats(size, time.mktime(modified.timetuple()), etag=obj.etag)
 
     def listdir(self, key):
         remote_path = self._convert_key_to_remote_path(key)
@@ -30,6 +30,7 @@ from .base import DataStore, FileStats, make_datastore_schema_sanitizer
 
 class AzureBlobStore(DataStore):
     using_bucket = True
+    cacheable = True
     max_concurrency = 100
     max_blocksize = 1024 * 1024 * 4
     max_single_put_size = (
@@ -199,11 +200,12 @@ class AzureBlobStore(DataStore):
         if len(files) == 1 and files[0]["type"] == "file":
             size = files[0]["size"]
             modified = files[0]["last_modified"]
+            etag = files[0].get("etag")
         elif len(files) == 1 and files[0]["type"] == "directory":
             raise FileNotFoundError("Operation expects a file not a directory!")
         else:
             raise ValueError("Operation expects to receive a single file!")
-        return FileStats(size, time.mktime(modified.timetuple()))
+        return FileStats(size, time.mktime(modified.timetuple()), etag=etag)
 
     def listdir(self, key):
         remote_path = self._convert_key_to_remote_path(key)
@@ -14,6 +14,7 @@
 import tempfile
 import urllib.parse
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
 from os import path, remove
 from typing import Optional, Union
 from urllib.parse import urlparse
@@ -22,6 +23,8 @@ import fsspec
 import orjson
 import pandas as pd
 import pyarrow
+import pyarrow.dataset
+import pyarrow.parquet
 import pytz
 import requests
 from deprecated import deprecated
@@ -35,11 +38,24 @@ from .store_resources import is_store_uri, parse_store_uri
 from .utils import filter_df_start_end_time, select_columns_from_df
 
 
+def _is_timezone_mismatch_error(ex: Exception) -> bool:
+    message = str(ex)
+    # the message depends on the pyarrow version
+    return message.startswith(
+        "Cannot compare timestamp with timezone to timestamp without timezone"
+    ) or (
+        "no kernel matching input types" in message
+        and "timestamp" in message
+        and "tz=" in message
+    )
+
+
 class FileStats:
-    def __init__(self, size, modified, content_type=None):
+    def __init__(self, size, modified, content_type=None, etag=None):
         self.size = size
         self.modified = modified
         self.content_type = content_type
+        self.etag = etag
 
     def __repr__(self):
         return f"FileStats(size={self.size}, modified={self.modified}, type={self.content_type})"
@@ -47,6 +63,8 @@ class FileStats:
 
 class DataStore:
     using_bucket = False
+    # whether object reads can be served from the local data cache, requires a stat() which versions the object
+    cacheable = False
 
     def __init__(self, parent, name, kind, endpoint="", secrets: dict = None):
         self._parent = parent
@@ -186,6 +204,70 @@ class DataStore:
     def upload(self, key, src_path):
         pass
 
+    def _get_data_cache(self):
+        if not self.cacheable:
+            return None
+        return getattr(self._parent, "cache", None)
+
+    def _stat_for_cache(self, key):
+        """return the object stats which version its cache entries, None if the object can't be cached"""
+        try:
+            stats = self.stat(key)
+        except Exception as exc:
+            logger.debug(
+                "Failed to stat the object, reading it without the data cache",
+                key=key,
+                error=err_to_str(exc),
+            )
+            return None
+        if not stats or stats.size is None or stats.modified is None:
+            return None
+        return stats
+
+    def _cached_get(self, key, size=None, offset=0):
+        """get() through the local data cache, when it is enabled"""
+        cache = self._get_data_cache()
+        stats = self._stat_for_cache(key) if cache else None
+        if not stats:
+            return self.get(key, size=size, offset=offset)
+
+        url = f"{self.url}{self._join(key)}"
+        if not size and not offset:
+            path = cache.get_path(
+                url, stats, lambda target_path: self.download(key, target_path)
+            )
+            if not path:
+                # larger than the cache
+                return self.get(key)
+            try:
+                with open(path, "rb") as fp:
+                    return fp.read()
+            except FileNotFoundError:
+                # evicted by another process
+                return self.get(key)
+
+        return cache.read(
+            url,
+            stats,
+            lambda block_offset, block_size: self.get(
+                key, size=block_size, offset=block_offset
+            ),
+            size=size or None,
+            offset=offset,
+        )
+
+    def _get_cached_path(self, key) -> Optional[str]:
+        """return the path of the object copy in the local data cache, None if the object isn't cached"""
+        cache = self._get_data_cache()
+        stats = self._stat_for_cache(key) if cache else None
+        if not stats:
+            return None
+        return cache.get_path(
+            f"{self.url}{self._join(key)}",
+            stats,
+            lambda target_path: self.download(key, target_path),
+        )
+
     def get_spark_options(self):
         return {}
 
@@ -216,10 +298,14 @@ class DataStore:
                 filters,
                 time_column,
             )
-            if filters and filters_inner:
-                filters[0] += filters_inner
+            # the filters are in disjunctive normal form, the additional filters apply to every time range
+            filters = [
+                time_filters + (filters_inner or [])
+                for time_filters in filters
+                if time_filters or filters_inner
+            ]
 
-            kwargs["filters"] = filters
+            kwargs["filters"] = filters or None
 
         def reader(*args, **kwargs):
             if time_column is None and (start_time or end_time):
@@ -245,11 +331,12 @@ class DataStore:
                     kwargs,
                 )
                 try:
-                    return df_module.read_parquet(*args, **kwargs)
-                except pyarrow.lib.ArrowInvalid as ex:
-                    if not str(ex).startswith(
-                        "Cannot compare timestamp with timezone to timestamp without timezone"
-                    ):
+                    return read_filtered(*args, **kwargs)
+                except (
+                    pyarrow.lib.ArrowInvalid,
+                    pyarrow.lib.ArrowNotImplementedError,
+                ) as ex:
+                    if not _is_timezone_mismatch_error(ex):
                         raise ex
 
                     start_time_inner = None
@@ -271,12 +358,116 @@ class DataStore:
                         additional_filters,
                         kwargs,
                     )
-                    return df_module.read_parquet(*args, **kwargs)
+                    return read_filtered(*args, **kwargs)
             else:
                 return df_module.read_parquet(*args, **kwargs)
 
+        def read_filtered(*args, **kwargs):
+            if df_module is not pd:
+                return df_module.read_parquet(*args, **kwargs)
+            if file_system and "filesystem" not in kwargs:
+                # the store file system is already configured with the storage options
+                kwargs.pop("storage_options", None)
+                kwargs["filesystem"] = file_system
+            return DataStore._read_parquet_dataset(*args, **kwargs)
+
         return reader
 
+    @staticmethod
+    def _read_parquet_dataset(
+        path,
+        columns=None,
+        filters=None,
+        filesystem=None,
+        **kwargs,
+    ):
+        """
+        read a filtered parquet file/directory with pyarrow dataset scanning, files are pruned by their partitions and
+        row groups by their min/max statistics before any data is read, and the remaining files are read concurrently.
+        the number of scanned and pruned files, row groups and bytes is reported in df.attrs["parquet_scan"]
+        """
+        if kwargs:
+            # reader options which only pandas knows how to handle
+            return pd.read_parquet(
+                path,
+                columns=columns,
+                filters=filters,
+                filesystem=filesystem,
+                **kwargs,
+            )
+
+        if isinstance(filesystem, fsspec.AbstractFileSystem):
+            path = filesystem._strip_protocol(path)
+        dataset = pyarrow.dataset.dataset(
+            path,
+            filesystem=filesystem,
+            format="parquet",
+            partitioning=pyarrow.dataset.HivePartitioning.discover(
+                infer_dictionary=True
+            ),
+        )
+        expression = pyarrow.parquet.filters_to_expression(filters) if filters else None
+        if columns is not None:
+            # like pandas, restore the index even if it wasn't selected
+            pandas_metadata = dataset.schema.pandas_metadata or {}
+            columns = list(columns) + [
+                column
+                for column in pandas_metadata.get("index_columns", [])
+                if isinstance(column, str) and column not in columns
+            ]
+
+        fragments = []
+        scanned_row_groups = pruned_row_groups = scanned_bytes = pruned_bytes = 0
+        for fragment in dataset.get_fragments(filter=expression):
+            row_groups = fragment.split_by_row_group(
+                filter=expression, schema=dataset.schema
+            )
+            row_group_ids = set()
+            for row_group_fragment in row_groups:
+                for row_group in row_group_fragment.row_groups:
+                    row_group_ids.add(row_group.id)
+            for i in range(fragment.metadata.num_row_groups):
+                size = fragment.metadata.row_group(i).total_byte_size
+                if i in row_group_ids:
+                    scanned_row_groups += 1
+                    scanned_bytes += size
+                else:
+                    pruned_row_groups += 1
+                    pruned_bytes += size
+            if row_group_ids:
+                fragments.append(fragment.subset(row_group_ids=sorted(row_group_ids)))
+        scan_report = {
+            "files": len(fragments),
+            "scanned_row_groups": scanned_row_groups,
+            "pruned_row_groups": pruned_row_groups,
+            "scanned_bytes": scanned_bytes,
+            "pruned_bytes": pruned_bytes,
+        }
+        logger.debug("Scanned parquet dataset", path=path, **scan_report)
+
+        def read_fragment(fragment):
+            return fragment.to_table(
+                schema=dataset.schema, columns=columns, filter=expression
+            )
+
+        if not fragments:
+            table = dataset.schema.empty_table()
+            if columns is not None:
+                table = table.select(columns)
+        elif len(fragments) == 1:
+            table = read_fragment(fragments[0])
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(
+                    len(fragments), mlrun.mlconf.storage.max_concurrent_file_reads
+                )
+            ) as executor:
+                table = pyarrow.concat_tables(executor.map(read_fragment, fragments))
+        df = table.to_pandas()
+        # tells the caller how effective the filters were
+        df.attrs["parquet_scan"] = scan_report
+        return df
+
     def as_df(
         self,
         url,
@@ -291,9 +482,13 @@ class DataStore:
         **kwargs,
     ):
         df_module = df_module or pd
+        # single (non directory) remote files are read from their copy in the local data cache, when it is enabled
+        cached_path = self._get_cached_path(subpath) if df_module is pd else None
+        if cached_path:
+            url = cached_path
         file_url = self._sanitize_url(url)
         is_csv, is_json, drop_time_column = False, False, False
-        file_system = self.filesystem
+        file_system = fsspec.filesystem("file") if cached_path else self.filesystem
         if file_url.endswith(".csv") or format == "csv":
             is_csv = True
             drop_time_column = False
@@ -328,14 +523,25 @@ class DataStore:
                         if df_module is pd:
                             kwargs.pop("filesystem", None)
                             kwargs.pop("storage_options", None)
-                            for filename in filenames:
+
+                            def read_file(filename):
                                 fullpath = f"{base_path}/{filename}"
                                 with file_system.open(fullpath) as fhandle:
                                     updated_args = [fhandle]
                                     updated_args.extend(args[1:])
-                                    dfs.append(
-                                        df_module.read_csv(*updated_args, **kwargs)
-                                    )
+                                    return df_module.read_csv(*updated_args, **kwargs)
+
+                            max_workers = min(
+                                len(filenames),
+                                mlrun.mlconf.storage.max_concurrent_file_reads,
+                            )
+                            if max_workers > 1:
+                                with ThreadPoolExecutor(
+                                    max_workers=max_workers
+                                ) as executor:
+                                    dfs = list(executor.map(read_file, filenames))
+                            else:
+                                dfs = [read_file(filename) for filename in filenames]
                         else:
                             for filename in filenames:
                                 updated_args = [f"{base_path}/{filename}"]
@@ -364,7 +570,9 @@ class DataStore:
         else:
             raise Exception(f"File type unhandled {url}")
 
-        if file_system:
+        if cached_path:
+            df = reader(url, **kwargs)
+        elif file_system:
             storage_options = self.get_storage_options()
             if url.startswith("ds://"):
                 parsed_url = urllib.parse.urlparse(url)
@@ -463,6 +671,7 @@ class DataItem:
         self._meta = meta
         self._artifact_url = artifact_url
         self._local_path = ""
+        self._local_path_is_cached = False
 
     @property
     def key(self):
@@ -507,7 +716,7 @@ class DataItem:
         :param offset:   fetch from offset (in bytes)
         :param encoding: encoding (e.g. "utf-8") for converting bytes to str
         """
-        body = self._store.get(self._path, size=size, offset=offset)
+        body = self._store._cached_get(self._path, size=size, offset=offset)
         if encoding and isinstance(body, bytes):
             body = body.decode(encoding)
         return body
@@ -555,12 +764,22 @@ class DataItem:
         return self._store.listdir(self._path)
 
     def local(self):
-        """get the local path of the file, download to tmp first if it's a remote object"""
+        """get the local path of the file, download to tmp first if it's a remote object
+
+        when the data cache is enabled (see the storage.cache config) remote objects are downloaded to the cache
+        and the returned path is shared by all the reads of the same object version, it must not be modified
+        """
         if self.kind == "file":
             return self._path
         if self._local_path:
             return self._local_path
 
+        cached_path = self._store._get_cached_path(self._path)
+        if cached_path:
+            self._local_path = cached_path
+            self._local_path_is_cached = True
+            return self._local_path
+
         dot = self._path.rfind(".")
         suffix = "" if dot == -1 else self._path[dot:]
         temp_file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
@@ -575,8 +794,11 @@ class DataItem:
             return
 
         if self._local_path:
-            remove(self._local_path)
+            # files in the data cache are removed by its eviction
+            if not self._local_path_is_cached:
+                remove(self._local_path)
             self._local_path = ""
+            self._local_path_is_cached = False
 
     def as_df(
         self,
@@ -0,0 +1,315 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import collections
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import typing
+import urllib.parse
+
+import mlrun.config
+from mlrun.utils import logger
+
+_tmp_prefix = ".tmp-"
+_block_separator = ".block-"
+_data_caches = {}
+_data_caches_lock = threading.Lock()
+
+
+class DataCache:
+    """Size bounded on-disk LRU cache of remote objects
+
+    Entries are addressed by the object url and version (size, modification time and etag from the store stat), so a
+    modified object is never served from the cache and its stale entries are evicted over time. Whole objects are
+    cached for local paths and full reads, ranged reads are cached in fixed size blocks.
+
+    The size bound applies to the whole cache directory, which can be shared by the processes of a pod: the directory
+    is re-indexed when the entries known to this process exceed the bound or every sync_interval seconds, and the least
+    recently used entries of all the processes (by the modification time of their files) are evicted. between the
+    re-indexes the directory may exceed the bound by the entries which other processes added meanwhile.
+    """
+
+    def __init__(
+        self, path: str, max_size: int, block_size: int, sync_interval: float = 10
+    ):
+        self.path = path
+        self.max_size = max_size
+        self.block_size = block_size
+        self.sync_interval = sync_interval
+        self._synced_at = 0.0
+        self._lock = threading.Lock()
+        # file name -> size, in least recently used order
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._loaded = False
+        self._stats = collections.Counter()
+
+    @property
+    def stats(self) -> dict:
+        """cache metrics: hits, misses, hit_bytes, miss_bytes, evictions, the number of entries and their size"""
+        with self._lock:
+            stats = {
+                key: self._stats[key]
+                for key in ["hits", "misses", "hit_bytes", "miss_bytes", "evictions"]
+            }
+            stats["entries"] = len(self._entries)
+            stats["size"] = self._size
+        return stats
+
+    def get_path(
+        self, url: str, stats, download: typing.Callable[[str], None]
+    ) -> typing.Optional[str]:
+        """return the local path of a cached copy of the whole object, download it on a miss
+
+        :param url:      object url
+        :param stats:    object FileStats, used for versioning the cache entry
+        :param download: function which downloads the object to a given local path
+        :return: the local path, or None when the object is larger than the cache
+        """
+        if stats.size > self.max_size:
+            return None
+        name = self._object_key(url, stats) + _suffix(url)
+        path = self._lookup(name)
+        if path:
+            self._count("hit_bytes", stats.size)
+            return path
+
+        def fetch(target_path):
+            download(target_path)
+            return os.path.getsize(target_path)
+
+        return self._add(name, fetch)
+
+    def read(
+        self,
+        url: str,
+        stats,
+        get_range: typing.Callable[[int, int], bytes],
+        size: typing.Optional[int] = None,
+        offset: int = 0,
+    ) -> bytes:
+        """read a byte range of the object through the block cache
+
+        :param url:       object url
+        :param stats:     object FileStats, used for versioning the cache entries
+        :param get_range: function which reads (offset, size) bytes of the object from the store
+        :param size:      number of bytes to read, read until the end of the object if not specified
+        :param offset:    offset to read from
+        """
+        end = stats.size if size is None else min(offset + size, stats.size)
+        if offset >= end:
+            return b""
+
+        object_key = self._object_key(url, stats)
+        # serve from the whole object when it is already cached
+        path = self._lookup(object_key + _suffix(url), count_miss=False)
+        if path:
+            data = _read_file(path, offset, end - offset)
+            if data is not None:
+                self._count("hit_bytes", len(data))
+                return data
+
+        first_block, last_block = (
+            offset // self.block_size,
+            (end - 1) // self.block_size,
+        )
+        blocks = []
+        for index in range(first_block, last_block + 1):
+            block_offset = index * self.block_size
+            block_size = min(self.block_size, stats.size - block_offset)
+            blocks.append(
+                self._read_block(
+                    f"{object_key}{_block_separator}{index}",
+                    lambda block_offset=block_offset, block_size=block_size: get_range(
+                        block_offset, block_size
+                    ),
+                    block_size,
+                )
+            )
+        start = offset - first_block * self.block_size
+        return b"".join(blocks)[start : start + end - offset]
+
+    def clear(self):
+        """remove all the cache entries"""
+        with self._lock:
+            self._load()
+            for name in list(self._entries.keys()):
+                self._remove(name)
+
+    def _read_block(self, name, get_block, block_size):
+        path = self._lookup(name)
+        if path:
+            data = _read_file(path)
+            if data is not None and len(data) == block_size:
+                self._count("hit_bytes", block_size)
+                return data
+
+        data = get_block()[:block_size]
+        if len(data) != block_size:
+            # the object was modified since it was stat-ed, don't cache a partial block
+            return data
+
+        def fetch(target_path):
+            with open(target_path, "wb") as fp:
+                fp.write(data)
+            return len(data)
+
+        self._add(name, fetch)
+        return data
+
+    @staticmethod
+    def _object_key(url, stats):
+        version = f"{url}|{stats.size}|{stats.modified}|{getattr(stats, 'etag', '')}"
+        return hashlib.sha256(version.encode()).hexdigest()
+
+    def _count(self, key, value=1):
+        with self._lock:
+            self._stats[key] += value
+
+    def _lookup(self, name, count_miss=True):
+        with self._lock:
+            self._load()
+            if name not in self._entries:
+                self._stats["misses"] += count_miss
+                return None
+            path = os.path.join(self.path, name)
+            try:
+                # the modification time keeps the lru order for other processes which share the cache directory
+                os.utime(path)
+            except FileNotFoundError:
+                # evicted by another process
+                self._size -= self._entries.pop(name)
+                self._stats["misses"] += count_miss
+                return None
+            self._entries.move_to_end(name)
+            self._stats["hits"] += 1
+            return path
+
+    def _add(self, name, fetch):
+        os.makedirs(self.path, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=_tmp_prefix)
+        os.close(fd)
+        try:
+            size = fetch(tmp_path)
+            os.replace(tmp_path, os.path.join(self.path, name))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._load()
+            self._size -= self._entries.pop(name, 0)
+            self._entries[name] = size
+            self._size += size
+            self._stats["miss_bytes"] += size
+            if (
+                self._size > self.max_size
+                or time.monotonic() - self._synced_at >= self.sync_interval
+            ):
+                # other processes may have added or evicted entries since the last time
+                self._sync()
+                if name in self._entries:
+                    self._entries.move_to_end(name)
+                else:
+                    # already evicted by another process, still keep it until the next eviction
+                    self._entries[name] = size
+                    self._size += size
+            # never evict the entry which was just added
+            while self._size > self.max_size and len(self._entries) > 1:
+                self._remove(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+        return os.path.join(self.path, name)
+
+    def _remove(self, name):
+        self._size -= self._entries.pop(name)
+        try:
+            os.remove(os.path.join(self.path, name))
+        except FileNotFoundError:
+            pass
+
+    def _sync(self):
+        """re-index the entries of the cache directory in lru order (must be called under the lock)"""
+        # the modification times are coarse, entries which were accessed at the same time keep their order in this
+        # process, after the entries of the other processes
+        ranks = {name: rank for rank, name in enumerate(self._entries)}
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.name.startswith(_tmp_prefix):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except FileNotFoundError:
+                # evicted by another process
+                continue
+            entries.append(
+                (stat.st_mtime, ranks.get(entry.name, -1), entry.name, stat.st_size)
+            )
+        self._synced_at = time.monotonic()
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        for _, _, name, size in sorted(entries):
+            self._entries[name] = size
+            self._size += size
+
+    def _load(self):
+        """index the entries which were cached by previous processes (must be called under the lock)"""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.isdir(self.path):
+            return
+        self._sync()
+        logger.debug(
+            "Loaded the data cache",
+            path=self.path,
+            entries=len(self._entries),
+            size=self._size,
+        )
+
+
+def get_data_cache() -> typing.Optional[DataCache]:
+    """return the process wide data cache, None when caching is disabled (see the storage.cache config)"""
+    config = mlrun.mlconf.storage.cache
+    # the api serves multiple users with different credentials, it must not share their objects
+    if not config.enabled or mlrun.config.is_running_as_api():
+        return None
+    path = config.path or os.path.join(tempfile.gettempdir(), "mlrun-data-cache")
+    key = (
+        path,
+        int(config.max_size),
+        int(config.block_size),
+        float(config.sync_interval),
+    )
+    with _data_caches_lock:
+        if key not in _data_caches:
+            _data_caches[key] = DataCache(*key)
+        return _data_caches[key]
+
+
+def _suffix(url):
+    return os.path.splitext(urllib.parse.urlparse(url).path)[1]
+
+
+def _read_file(path, offset=0, size=None):
+    try:
+        with open(path, "rb") as fp:
+            fp.seek(offset)
+            return fp.read() if size is None else fp.read(size)
+    except FileNotFoundError:
+        return None
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from typing import Optional
 from urllib.parse import urlparse
 
 from mergedeep import merge
@@ -23,6 +24,7 @@ from mlrun.utils.helpers import get_local_file_schema
 
 from ..utils import DB_SCHEMA, RunKeys
 from .base import DataItem, DataStore, HttpStore
+from .cache import DataCache, get_data_cache
 from .filestore import FileStore
 from .inmem import InMemoryStore
 from .store_resources import get_store_resource, is_store_uri
@@ -129,6 +131,11 @@ class StoreManager:
                 self._secrets[key] = val
         return self
 
+    @property
+    def cache(self) -> Optional[DataCache]:
+        """the local data cache of remote objects, None when it is disabled (see the storage.cache config)"""
+        return get_data_cache()
+
     def _get_db(self):
         if not self._db:
             self._db = mlrun.get_run_db(secrets=self._secrets)
@@ -30,6 +30,7 @@ from .base import DataStore, FileStats, make_datastore_schema_sanitizer
 
 class GoogleCloudStorageStore(DataStore):
     using_bucket = True
+    cacheable = True
     workers = 8
     chunk_size = 32 * 1024 * 1024
 
@@ -167,11 +168,12 @@ class GoogleCloudStorageStore(DataStore):
         if len(files) == 1 and files[0]["type"] == "file":
             size = files[0]["size"]
             modified = files[0]["updated"]
+            etag = files[0].get("etag")
         elif len(files) == 1 and files[0]["type"] == "directory":
             raise FileNotFoundError("Operation expects a file not a directory!")
         else:
             raise ValueError("Operation expects to receive a single file!")
-        return FileStats(size, modified)
+        return FileStats(size, modified, etag=etag)
 
     def listdir(self, key):
         path = self._make_path(key)
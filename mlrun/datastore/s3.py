@@ -25,6 +25,7 @@ from .base import DataStore, FileStats, get_range, make_datastore_schema_sanitiz
 
 class S3Store(DataStore):
     using_bucket = True
+    cacheable = True
 
     def __init__(self, parent, schema, name, endpoint="", secrets: dict = None):
         super().__init__(parent, name, schema, endpoint, secrets)
@@ -195,7 +196,7 @@ class S3Store(DataStore):
         obj = self.s3.Object(bucket, key)
         size = obj.content_length
         modified = obj.last_modified
-        return FileStats(size, time.mktime(modified.timetuple()))
+        return FileStats(size, time.mktime(modified.timetuple()), etag=obj.e_tag)
 
     def listdir(self, key):
         bucket, key = self.get_bucket_and_key(key)
@@ -33,6 +33,8 @@ V3IO_DEFAULT_UPLOAD_CHUNK_SIZE = 1024 * 1024 * 10
 
 
 class V3ioStore(DataStore):
+    cacheable = True
+
     def __init__(self, parent, schema, name, endpoint="", secrets: dict = None):
         super().__init__(parent, name, schema, endpoint, secrets=secrets)
         self.endpoint = self.endpoint or mlrun.mlconf.v3io_api
@@ -175,7 +177,7 @@ class V3ioStore(DataStore):
         modified = time.mktime(
             datetime.strptime(datestr, "%a, %d %b %Y %H:%M:%S %Z").timetuple()
         )
-        return FileStats(size, modified)
+        return FileStats(size, modified, etag=head.get("ETag"))
 
     def listdir(self, key):
         container, subpath = split_path(self._join(key))
@@ -0,0 +1,456 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import enum
+import json
+import threading
+import typing
+from copy import deepcopy
+from typing import Optional, Union
+
+import aiohttp
+
+import mlrun.common.formatters
+import mlrun.common.schemas
+import mlrun.db.httpdb
+import mlrun.errors
+import mlrun.utils
+from mlrun.config import config
+from mlrun.errors import err_to_str
+from mlrun.lists import RunList
+from mlrun.utils import datetime_to_iso, logger
+
+
+class AsyncHTTPRunDB:
+    """asyncio client of the MLRun API server, the counterpart of :py:class:`~mlrun.db.httpdb.HTTPRunDB` for
+    concurrent operations: the pages of the paginated listings are prefetched concurrently, and the bulk calls
+    (:py:meth:`store_artifacts`, :py:meth:`update_runs`) send their requests concurrently.
+
+    The url, credentials and client headers are resolved like in :py:class:`~mlrun.db.httpdb.HTTPRunDB`.
+    A client (and its connections) belongs to the event loop it was first used in. Example::
+
+        async with AsyncHTTPRunDB(mlrun.mlconf.dbpath) as db:
+            runs = await db.list_runs(project="iris", states=["completed"])
+            await db.update_runs(
+                {run["metadata"]["uid"]: {"status.archived": True} for run in runs}
+            )
+    """
+
+    def __init__(
+        self,
+        url: str = "",
+        db: Optional["mlrun.db.httpdb.HTTPRunDB"] = None,
+        max_concurrency: Optional[int] = None,
+        prefetch_pages: Optional[int] = None,
+    ):
+        """
+        :param url:             The API server url, defaults to the configured dbpath.
+        :param db:              A sync db client to take the url and credentials from, instead of the url.
+        :param max_concurrency: Maximal number of concurrent requests of a bulk call, defaults to
+                                ``httpdb.async_client.max_concurrency``.
+        :param prefetch_pages:  Number of pages which are fetched concurrently when listing, defaults to
+                                ``httpdb.async_client.prefetch_pages``.
+        """
+        self._db = db or mlrun.db.httpdb.HTTPRunDB(url or config.dbpath)
+        self.max_concurrency = int(
+            max_concurrency or config.httpdb.async_client.max_concurrency
+        )
+        self.prefetch_pages = int(
+            prefetch_pages or config.httpdb.async_client.prefetch_pages
+        )
+        self._client: Optional[mlrun.utils.AsyncClientWithRetry] = None
+
+    def __repr__(self):
+        cls = self.__class__.__name__
+        return f"{cls}({self._db.base_url!r})"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Close the client connections"""
+        if self._client:
+            await self._client.close()
+            self._client = None
+
+    async def api_call(
+        self,
+        method,
+        path,
+        error=None,
+        params=None,
+        body=None,
+        json=None,
+        headers=None,
+        timeout=45,
+        version=None,
+    ) -> typing.Any:
+        """Perform a direct REST API call on the :py:mod:`mlrun` API server.
+
+        The parameters are those of :py:meth:`~mlrun.db.httpdb.HTTPRunDB.api_call`.
+
+        :returns: The JSON body of the response, None when the response has no body.
+        """
+        url = self._db.get_base_api_url(path, version)
+        kw = self._db._prepare_request_kwargs(params, body, json, headers)
+        if "auth" in kw:
+            kw["auth"] = aiohttp.BasicAuth(*kw["auth"])
+        if "params" in kw:
+            kw["params"] = _to_query_params(kw["params"])
+        if not config.httpdb.http.verify:
+            kw["ssl"] = False
+
+        self._ensure_client()
+        try:
+            async with self._client.request(
+                method, url, timeout=aiohttp.ClientTimeout(total=timeout), **kw
+            ) as response:
+                content = await response.read()
+                if not response.ok:
+                    _raise_for_status(response, content, error)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            error = f"{err_to_str(exc)}: {error}" if error else err_to_str(exc)
+            raise mlrun.errors.MLRunRuntimeError(error) from exc
+        return _json_loads(content) if content else None
+
+    async def paginated_api_call(
+        self,
+        method,
+        path,
+        error=None,
+        params=None,
+        body=None,
+        json=None,
+        headers=None,
+        timeout=45,
+        version=None,
+    ) -> typing.AsyncGenerator[dict, None]:
+        """
+        Calls the api with pagination, yielding the JSON body of each page in order. After the first page, the
+        following pages are requested concurrently (by their number, with the pagination token), ``prefetch_pages``
+        at a time.
+        """
+
+        async def _api_call(_params):
+            return await self.api_call(
+                method=method,
+                path=path,
+                error=error,
+                params=_params,
+                body=body,
+                json=json,
+                headers=headers,
+                timeout=timeout,
+                version=version,
+            )
+
+        first_page_params = deepcopy(params) or {}
+        first_page_params["page"] = 1
+        first_page_params["page-size"] = config.httpdb.pagination.default_page_size
+        response = await _api_call(first_page_params)
+        yield response
+
+        pagination = (response or {}).get("pagination") or {}
+        page_token = pagination.get("page-token")
+        last_page = pagination.get("page") or 1
+        while page_token:
+            pages = range(last_page + 1, last_page + 1 + max(self.prefetch_pages, 1))
+            tasks = [
+                asyncio.create_task(_api_call({"page-token": page_token, "page": page}))
+                for page in pages
+            ]
+            try:
+                for page, task in zip(pages, tasks):
+                    try:
+                        response = await task
+                    except mlrun.errors.MLRunNotFoundError:
+                        # pagination token expired
+                        page_token = None
+                        break
+
+                    # a page of permission filtered results may overflow into the next pages, which were then
+                    # already returned
+                    if page <= last_page:
+                        continue
+                    yield response
+                    pagination = (response or {}).get("pagination") or {}
+                    last_page = pagination.get("page") or page
+                    page_token = pagination.get("page-token")
+                    if not page_token:
+                        # the last page
+                        break
+            finally:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+                    elif not task.cancelled():
+                        # retrieve the errors of the skipped pages
+                        task.exception()
+
+    async def list_paginated(
+        self, path: str, key: str, error: Optional[str] = None, params=None
+    ) -> list[typing.Any]:
+        """List all the items of a paginated GET request, the items are under the key of each page"""
+        items = []
+        async for page in self.paginated_api_call("GET", path, error, params=params):
+            items.extend((page or {}).get(key, []))
+        return items
+
+    async def read_run(
+        self,
+        uid: str,
+        project: str = "",
+        iter: int = 0,
+        format_: mlrun.common.formatters.RunFormat = mlrun.common.formatters.RunFormat.full,
+    ) -> dict:
+        """Read the details of a stored run from the DB, see :py:meth:`~mlrun.db.httpdb.HTTPRunDB.read_run`"""
+        path = self._db._path_of("runs", project, uid)
+        params = {"iter": iter, "format": format_.value}
+        response = await self.api_call(
+            "GET", path, f"get run {project}/{uid}", params=params
+        )
+        return response["data"]
+
+    async def list_runs(self, project: Optional[str] = None, **filters) -> RunList:
+        """
+        Retrieve a list of runs, the pages are fetched concurrently.
+
+        :param project: Project that the runs belongs to.
+        :param filters: The filters of :py:meth:`~mlrun.db.httpdb.HTTPRunDB.list_runs`.
+        """
+        arguments = {
+            "name": None,
+            "uid": None,
+            "labels": None,
+            "state": None,
+            "states": None,
+            "sort": True,
+            "last": 0,
+            "iter": False,
+            "start_time_from": None,
+            "start_time_to": None,
+            "last_update_time_from": None,
+            "last_update_time_to": None,
+            "partition_by": None,
+            "rows_per_partition": 1,
+            "partition_sort_by": None,
+            "partition_order": mlrun.common.schemas.OrderType.desc,
+            "max_partitions": 0,
+            "with_notifications": False,
+            "fields": None,
+        }
+        unknown_filters = set(filters).difference(arguments)
+        if unknown_filters:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"Unknown list runs filters: {sorted(unknown_filters)}"
+            )
+        arguments.update(filters)
+        path, error, params = self._db._list_runs_request(project=project, **arguments)
+        return RunList(await self.list_paginated(path, "runs", error, params=params))
+
+    async def list_functions(
+        self, name=None, project=None, tag=None, labels=None, since=None, until=None
+    ) -> list[dict]:
+        """Retrieve a list of functions, see :py:meth:`~mlrun.db.httpdb.HTTPRunDB.list_functions`"""
+        project = project or config.default_project
+        params = {
+            "name": name,
+            "tag": tag,
+            "label": labels or [],
+            "since": datetime_to_iso(since),
+            "until": datetime_to_iso(until),
+        }
+        return await self.list_paginated(
+            f"projects/{project}/functions", "funcs", "list functions", params=params
+        )
+
+    async def update_run(self, updates: dict, uid, project="", iter=0, timeout=45):
+        """Update the details of a stored run in the DB"""
+        path = self._db._path_of("runs", project, uid)
+        await self.api_call(
+            "PATCH",
+            path,
+            f"update run {project}/{uid}",
+            params={"iter": iter},
+            body=mlrun.db.httpdb._as_json(updates),
+            timeout=timeout,
+        )
+
+    async def update_runs(
+        self, updates: dict[str, dict], project="", iter=0, timeout=45
+    ):
+        """
+        Update the details of multiple stored runs in the DB, concurrently.
+
+        :param updates: Run uid to its updates (see :py:meth:`~mlrun.db.httpdb.HTTPRunDB.update_run`).
+        :param project: Project that the runs belong to.
+        :param iter:    Iteration of the runs.
+        :param timeout: Timeout of each update request.
+        """
+        await self._gather(
+            "update runs",
+            [
+                self.update_run(run_updates, uid, project, iter, timeout)
+                for uid, run_updates in updates.items()
+            ],
+        )
+
+    async def store_artifact(
+        self, key, artifact, iter=None, tag=None, project="", tree=None
+    ):
+        """Store an artifact in the DB, see :py:meth:`~mlrun.db.httpdb.HTTPRunDB.store_artifact`"""
+        project = project or config.default_project
+        params = {}
+        if iter:
+            params["iter"] = str(iter)
+        if tag:
+            params["tag"] = tag
+        if tree:
+            params["tree"] = tree
+        await self.api_call(
+            "PUT",
+            f"projects/{project}/artifacts/{key}",
+            f"store artifact {project}/{key}",
+            body=mlrun.db.httpdb._as_json(artifact),
+            params=params,
+            version="v2",
+        )
+
+    async def store_artifacts(
+        self,
+        artifacts: dict[str, Union[dict, "mlrun.artifacts.Artifact"]],
+        iter=None,
+        tag=None,
+        project="",
+        tree=None,
+    ):
+        """
+        Store multiple artifacts in the DB, concurrently.
+
+        :param artifacts: Artifact key to the artifact to store (see
+                          :py:meth:`~mlrun.db.httpdb.HTTPRunDB.store_artifact`).
+        :param iter:      The task iteration which generated the artifacts.
+        :param tag:       Tag of the artifacts.
+        :param project:   Project that the artifacts belong to.
+        :param tree:      The tree (producer id) which generated the artifacts.
+        """
+        await self._gather(
+            "store artifacts",
+            [
+                self.store_artifact(key, artifact, iter, tag, project, tree)
+                for key, artifact in artifacts.items()
+            ],
+        )
+
+    async def _gather(self, operation: str, coroutines: list[typing.Awaitable]):
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+
+        async def _limited(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        results = await asyncio.gather(
+            *[_limited(coroutine) for coroutine in coroutines], return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            logger.warning(
+                "Bulk operation failed",
+                operation=operation,
+                failed=len(errors),
+                total=len(results),
+            )
+            raise mlrun.errors.MLRunRuntimeError(
+                f"Failed to {operation}, {len(errors)} of {len(results)} requests failed: {err_to_str(errors[0])}"
+            ) from errors[0]
+        return results
+
+    def _ensure_client(self):
+        if not self._client:
+            self._client = mlrun.utils.AsyncClientWithRetry(
+                retry_on_exception=config.httpdb.retry_api_call_on_exception
+                == mlrun.common.schemas.HTTPSessionRetryMode.enabled.value,
+                # the errors are raised with the details from the response body
+                raise_for_status=False,
+                connector=aiohttp.TCPConnector(
+                    limit=max(self.max_concurrency, self.prefetch_pages)
+                ),
+            )
+
+
+class _AsyncRunner:
+    """Runs coroutines from sync code on an event loop in a background thread"""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def run(self, coroutine: typing.Coroutine) -> typing.Any:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop()).result()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="mlrun-async-httpdb",
+                    daemon=True,
+                ).start()
+            return self._loop
+
+
+_runner = _AsyncRunner()
+
+
+def run_sync(coroutine: typing.Coroutine) -> typing.Any:
+    """Run a coroutine of an :py:class:`AsyncHTTPRunDB` from sync code (also when an event loop is running in the
+    current thread), on a shared background event loop"""
+    return _runner.run(coroutine)
+
+
+def _to_query_params(params: dict) -> list[tuple[str, str]]:
+    # the query params in the format of aiohttp, like requests: skip None values and repeat the key of list values
+    query_params = []
+    for key, value in params.items():
+        for item in value if isinstance(value, (list, tuple)) else [value]:
+            if item is None:
+                continue
+            if isinstance(item, enum.Enum):
+                item = item.value
+            query_params.append((key, str(item)))
+    return query_params
+
+
+def _json_loads(content: bytes) -> typing.Any:
+    try:
+        return json.loads(content)
+    except ValueError:
+        return content
+
+
+def _raise_for_status(response: aiohttp.ClientResponse, content: bytes, error):
+    if content:
+        try:
+            error_details = json.loads(content).get("detail", {})
+        except Exception:
+            error_details = ""
+        if error_details:
+            error_details = f"details: {error_details}"
+            error = f"{error} {error_details}" if error else error_details
+    mlrun.errors.raise_for_status(response, error)
@@ -53,6 +53,10 @@ class RunDBInterface(ABC):
     def update_run(self, updates: dict, uid, project="", iter=0):
         pass
 
+    def update_runs(self, updates: dict[str, dict], project="", iter=0):
+        for uid, run_updates in updates.items():
+            self.update_run(run_updates, uid, project=project, iter=iter)
+
     @abstractmethod
     def abort_run(self, uid, project="", iter=0, timeout=45, status_text=""):
         pass
@@ -93,6 +97,7 @@ class RunDBInterface(ABC):
         ] = mlrun.common.schemas.OrderType.desc,
         max_partitions: int = 0,
         with_notifications: bool = False,
+        fields: Optional[list[str]] = None,
     ):
         pass
 
@@ -110,6 +115,14 @@ class RunDBInterface(ABC):
     ):
         pass
 
+    def store_artifacts(
+        self, artifacts: dict, iter=None, tag="", project="", tree=None
+    ):
+        for key, artifact in artifacts.items():
+            self.store_artifact(
+                key, artifact, iter=iter, tag=tag, project=project, tree=tree
+            )
+
     @abstractmethod
     def read_artifact(
         self,
@@ -139,6 +152,7 @@ class RunDBInterface(ABC):
         tree: str = None,
         format_: mlrun.common.formatters.ArtifactFormat = mlrun.common.formatters.ArtifactFormat.full,
         limit: int = None,
+        fields: Optional[list[str]] = None,
     ):
         pass
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import codecs
 import enum
 import http
 import re
@@ -34,6 +35,7 @@ import mlrun.common.formatters
 import mlrun.common.runtimes
 import mlrun.common.schemas
 import mlrun.common.types
+import mlrun.db.async_httpdb
 import mlrun.model_monitoring.model_endpoint
 import mlrun.platforms
 import mlrun.projects
@@ -119,7 +121,11 @@ class HTTPRunDB(RunDBInterface):
 
     def __init__(self, url):
         self.server_version = ""
-        self.session = None
+        # one pooled session per retry policy (whether POST requests are retried), kept for the lifetime of the db so
+        # the connections are reused across calls
+        self._sessions: dict[bool, requests.Session] = {}
+        # the async client of the bulk calls and the concurrent listings, see httpdb.async_client
+        self._async_db = None
         self._wait_for_project_terminal_state_retry_interval = 3
         self._wait_for_background_task_terminal_state_retry_interval = 3
         self._wait_for_project_deletion_interval = 3
@@ -168,6 +174,45 @@ class HTTPRunDB(RunDBInterface):
         cls = self.__class__.__name__
         return f"{cls}({self.base_url!r})"
 
+    @property
+    def session(self) -> Optional[requests.Session]:
+        """The session of the requests which are not retried on POST"""
+        return self._sessions.get(False)
+
+    @session.setter
+    def session(self, session: Optional[requests.Session]):
+        if session is None:
+            self._sessions.pop(False, None)
+        else:
+            self._sessions[False] = session
+
+    @property
+    def connection_stats(self) -> dict:
+        """
+        Connection pool statistics of the db client, summed over its sessions.
+
+        :returns: A dictionary with the number of sessions, the pool size (maximal number of connections kept per
+                  host), the number of connections which were opened, the number of requests which were sent and the
+                  number of requests which reused an open connection.
+        """
+        stats = {
+            "sessions": len(self._sessions),
+            "pool_maxsize": 0,
+            "connections": 0,
+            "requests": 0,
+            "reused": 0,
+        }
+        for session in list(self._sessions.values()):
+            if not isinstance(session, mlrun.utils.HTTPSessionWithRetry):
+                continue
+            session_stats = session.connection_stats()
+            stats["pool_maxsize"] = max(
+                stats["pool_maxsize"], session_stats["pool_maxsize"]
+            )
+            for key in ["connections", "requests", "reused"]:
+                stats[key] += session_stats[key]
+        return stats
+
     @staticmethod
     def get_api_path_prefix(version: str = None) -> str:
         """
@@ -198,6 +243,7 @@ class HTTPRunDB(RunDBInterface):
         headers=None,
         timeout=45,
         version=None,
+        stream: bool = False,
     ) -> requests.Response:
         """Perform a direct REST API call on the :py:mod:`mlrun` API server.
 
@@ -215,10 +261,49 @@ class HTTPRunDB(RunDBInterface):
         :param timeout: API call timeout
         :param version: API version to use, None (the default) will mean to use the default value from config,
          for un-versioned api set an empty string.
+        :param stream: Whether to read the response content as it arrives (with `iter_content`), instead of reading
+         it before returning. The response should then be closed by the caller.
 
         :returns: `requests.Response` HTTP response object
         """
         url = self.get_base_api_url(path, version)
+        kw = self._prepare_request_kwargs(params, body, json, headers)
+        session = self._get_session(self._is_retry_on_post_allowed(method, path))
+        try:
+            response = session.request(
+                method,
+                url,
+                timeout=timeout,
+                verify=config.httpdb.http.verify,
+                stream=stream,
+                **kw,
+            )
+        except requests.RequestException as exc:
+            error = f"{err_to_str(exc)}: {error}" if error else err_to_str(exc)
+            raise mlrun.errors.MLRunRuntimeError(error) from exc
+
+        if not response.ok:
+            if response.content:
+                try:
+                    data = response.json()
+                    error_details = data.get("detail", {})
+                    if not error_details:
+                        logger.warning("Failed parsing error response body", data=data)
+                except Exception:
+                    error_details = ""
+                if error_details:
+                    error_details = f"details: {error_details}"
+                    error = f"{error} {error_details}" if error else error_details
+                    mlrun.errors.raise_for_status(response, error)
+
+            mlrun.errors.raise_for_status(response, error)
+
+        return response
+
+    def _prepare_request_kwargs(
+        self, params=None, body=None, json=None, headers=None
+    ) -> dict:
+        """The request keyword arguments (in the `requests` format) with the auth and the client headers"""
         kw = {
             key: value
             for key, value in (
@@ -263,41 +348,7 @@ class HTTPRunDB(RunDBInterface):
                 for key in dict_.keys():
                     if isinstance(dict_[key], enum.Enum):
                         dict_[key] = dict_[key].value
-
-        # if the method is POST, we need to update the session with the appropriate retry policy
-        if not self.session or method == "POST":
-            retry_on_post = self._is_retry_on_post_allowed(method, path)
-            self.session = self._init_session(retry_on_post)
-
-        try:
-            response = self.session.request(
-                method,
-                url,
-                timeout=timeout,
-                verify=config.httpdb.http.verify,
-                **kw,
-            )
-        except requests.RequestException as exc:
-            error = f"{err_to_str(exc)}: {error}" if error else err_to_str(exc)
-            raise mlrun.errors.MLRunRuntimeError(error) from exc
-
-        if not response.ok:
-            if response.content:
-                try:
-                    data = response.json()
-                    error_details = data.get("detail", {})
-                    if not error_details:
-                        logger.warning("Failed parsing error response body", data=data)
-                except Exception:
-                    error_details = ""
-                if error_details:
-                    error_details = f"details: {error_details}"
-                    error = f"{error} {error_details}" if error else error_details
-                    mlrun.errors.raise_for_status(response, error)
-
-            mlrun.errors.raise_for_status(response, error)
-
-        return response
+        return kw
 
     def paginated_api_call(
         self,
@@ -349,6 +400,17 @@ class HTTPRunDB(RunDBInterface):
             yield response
             page_token = response.json().get("pagination", {}).get("page-token", None)
 
+    def _list_paginated(
+        self, path: str, error: str, params: dict, key: str
+    ) -> list[typing.Any]:
+        if config.httpdb.async_client.enabled:
+            # the pages are prefetched concurrently by the async client
+            return self._run_async(
+                self._get_async_db().list_paginated(path, key, error, params=params)
+            )
+        responses = self.paginated_api_call("GET", path, error, params=params)
+        return self.process_paginated_responses(responses, key)
+
     @staticmethod
     def process_paginated_responses(
         responses: typing.Generator[requests.Response, None, None], key: str = "data"
@@ -361,6 +423,25 @@ class HTTPRunDB(RunDBInterface):
             data.extend(response.json().get(key, []))
         return data
 
+    def _get_async_db(self):
+        # the client runs on the shared background event loop of mlrun.db.async_httpdb.run_sync
+        if self._async_db is None:
+            self._async_db = mlrun.db.async_httpdb.AsyncHTTPRunDB(db=self)
+        return self._async_db
+
+    @staticmethod
+    def _run_async(coroutine):
+        return mlrun.db.async_httpdb.run_sync(coroutine)
+
+    def _get_session(self, retry_on_post: bool = False) -> requests.Session:
+        session = self._sessions.get(retry_on_post)
+        if session is None:
+            # setdefault keeps a single session when threads race on the first call
+            session = self._sessions.setdefault(
+                retry_on_post, self._init_session(retry_on_post)
+            )
+        return session
+
     def _init_session(self, retry_on_post: bool = False):
         return mlrun.utils.HTTPSessionWithRetry(
             retry_on_exception=config.httpdb.retry_api_call_on_exception
@@ -631,6 +712,8 @@ class HTTPRunDB(RunDBInterface):
         """Retrieve logs of a running process by chunks of 1MB, and watch the progress of the execution until it
         completes. This method will print out the logs and continue to periodically poll for, and print,
         new logs as long as the state of the runtime which generates this log is either ``pending`` or ``running``.
+        When the API supports it (and ``httpdb.logs.follow.enabled`` is set), the new logs are streamed by the API as
+        they are written instead of being polled.
 
         :param uid: The uid of the log object to watch.
         :param project: Project that the log belongs to.
@@ -639,8 +722,15 @@ class HTTPRunDB(RunDBInterface):
         :param offset: Minimal offset in the log to watch.
         :returns: The final state of the log being watched and the final offset.
         """
-
-        state, text = self.get_log(uid, project, offset=offset)
+        # the logs config may be replaced by the logs config of older APIs (see connect), which have no follow config
+        follow_config = getattr(config.httpdb.logs, "follow", None)
+        if watch and follow_config and follow_config.enabled:
+            state, offset, text = self._follow_log(uid, project, offset)
+            if text is None:
+                return state, offset
+            # older APIs return the log without following it, it is polled from the end of the returned log
+        else:
+            state, text = self.get_log(uid, project, offset=offset)
         if text:
             print(text.decode(errors=mlrun.mlconf.httpdb.logs.decode.errors))
         nil_resp = 0
@@ -666,12 +756,11 @@ class HTTPRunDB(RunDBInterface):
             else:
                 nil_resp += 1
 
-            if watch and state in [
-                mlrun.common.runtimes.constants.RunStates.pending,
-                mlrun.common.runtimes.constants.RunStates.running,
-                mlrun.common.runtimes.constants.RunStates.created,
-                mlrun.common.runtimes.constants.RunStates.aborting,
-            ]:
+            if (
+                watch
+                and state
+                in mlrun.common.runtimes.constants.RunStates.watched_log_states()
+            ):
                 continue
             else:
                 # the whole log was retrieved
@@ -680,6 +769,63 @@ class HTTPRunDB(RunDBInterface):
 
         return state, offset
 
+    def _follow_log(self, uid, project, offset) -> tuple[str, int, Optional[bytes]]:
+        """
+        Print the log as it is streamed by the API. A follow request ends when the run is done and its whole log was
+        streamed, or when the follow timeout elapsed, then the log is followed again from the offset until the run is
+        done.
+
+        :returns: The final state of the run and the final offset, and None if the API followed the log. APIs which
+                  do not follow logs return a chunk of the log (like :py:meth:`get_log`), which is returned instead
+                  of being printed.
+        """
+        path = self._path_of("logs", project, uid)
+        error = f"follow log {project}/{uid}"
+        params = {
+            "size": int(config.httpdb.logs.pull_logs_default_size_limit),
+            "follow": True,
+        }
+        # the API is silent while the log is idle, until the follow timeout
+        timeout = float(config.httpdb.logs.follow.timeout) + 45
+        # the chunks may split multibyte characters
+        decoder = codecs.getincrementaldecoder("utf-8")(
+            errors=config.httpdb.logs.decode.errors
+        )
+        while True:
+            params["offset"] = offset
+            with self.api_call(
+                "GET", path, error, params=params, timeout=timeout, stream=True
+            ) as response:
+                state = response.headers.get("x-mlrun-run-state", "").lower()
+                if response.headers.get("x-mlrun-log-follow") != "true":
+                    return state, offset, response.content
+                try:
+                    for chunk in response.iter_content(chunk_size=None):
+                        offset += len(chunk)
+                        print(decoder.decode(chunk), end="", flush=True)
+                except requests.RequestException as exc:
+                    # the stream was cut (e.g. by a proxy), the log is followed again from the offset
+                    logger.debug(
+                        "Log stream was interrupted, following again",
+                        uid=uid,
+                        offset=offset,
+                        exc=err_to_str(exc),
+                    )
+                    time.sleep(int(config.httpdb.logs.pull_logs_default_interval))
+                    continue
+
+            # the stream ended, check whether the run is done (the rest of the log, if any, is followed)
+            state, text = self.get_log(uid, project, offset=offset)
+            if text:
+                offset += len(text)
+                print(decoder.decode(text), end="", flush=True)
+            elif (
+                state
+                not in mlrun.common.runtimes.constants.RunStates.watched_log_states()
+            ):
+                print(decoder.decode(b"", final=True), end="")
+                return state, offset, None
+
     def store_run(self, struct, uid, project="", iter=0):
         """Store run details in the DB. This method is usually called from within other :py:mod:`mlrun` flows
         and not called directly by the user."""
@@ -699,6 +845,22 @@ class HTTPRunDB(RunDBInterface):
         body = _as_json(updates)
         self.api_call("PATCH", path, error, params=params, body=body, timeout=timeout)
 
+    def update_runs(self, updates: dict[str, dict], project="", iter=0, timeout=45):
+        """Update the details of multiple stored runs in the DB. The requests are sent concurrently when the
+        ``httpdb.async_client.enabled`` config is set.
+
+        :param updates: Run uid to its updates (see :py:meth:`update_run`).
+        :param project: Project that the runs belong to.
+        :param iter: Iteration of the runs.
+        :param timeout: Timeout of each update request.
+        """
+        if config.httpdb.async_client.enabled:
+            return self._run_async(
+                self._get_async_db().update_runs(updates, project, iter, timeout)
+            )
+        for uid, run_updates in updates.items():
+            self.update_run(run_updates, uid, project, iter, timeout)
+
     def abort_run(self, uid, project="", iter=0, timeout=45, status_text=""):
         """
         Abort a running run - will remove the run's runtime resources and mark its state as aborted.
@@ -790,6 +952,7 @@ class HTTPRunDB(RunDBInterface):
         ] = mlrun.common.schemas.OrderType.desc,
         max_partitions: int = 0,
         with_notifications: bool = False,
+        fields: Optional[list[str]] = None,
     ) -> RunList:
         """
         Retrieve a list of runs, filtered by various options.
@@ -831,8 +994,58 @@ class HTTPRunDB(RunDBInterface):
         :param max_partitions: Maximal number of partitions to include in the result. Default is `0` which means no
             limit.
         :param with_notifications: Return runs with notifications, and join them to the response. Default is `False`.
-        """
+        :param fields: Return only these fields of the runs, as dot separated paths (e.g.
+            ``["metadata.name", "status.state", "status.results"]``), instead of the full runs. The uid and project of
+            the runs are always returned. Cannot be used together with ``with_notifications``.
+        """
+        path, error, params = self._list_runs_request(
+            name=name,
+            uid=uid,
+            project=project,
+            labels=labels,
+            state=state,
+            states=states,
+            sort=sort,
+            last=last,
+            iter=iter,
+            start_time_from=start_time_from,
+            start_time_to=start_time_to,
+            last_update_time_from=last_update_time_from,
+            last_update_time_to=last_update_time_to,
+            partition_by=partition_by,
+            rows_per_partition=rows_per_partition,
+            partition_sort_by=partition_sort_by,
+            partition_order=partition_order,
+            max_partitions=max_partitions,
+            with_notifications=with_notifications,
+            fields=fields,
+        )
+        return RunList(self._list_paginated(path, error, params, "runs"))
 
+    def _list_runs_request(
+        self,
+        name,
+        uid,
+        project,
+        labels,
+        state,
+        states,
+        sort,
+        last,
+        iter,
+        start_time_from,
+        start_time_to,
+        last_update_time_from,
+        last_update_time_to,
+        partition_by,
+        rows_per_partition,
+        partition_sort_by,
+        partition_order,
+        max_partitions,
+        with_notifications,
+        fields=None,
+    ) -> tuple[str, str, dict]:
+        """The path, error message and query params of a list runs request"""
         project = project or config.default_project
         if with_notifications:
             logger.warning(
@@ -888,6 +1101,7 @@ class HTTPRunDB(RunDBInterface):
             "last_update_time_from": datetime_to_iso(last_update_time_from),
             "last_update_time_to": datetime_to_iso(last_update_time_to),
             "with-notifications": with_notifications,
+            "field": fields or [],
         }
 
         if partition_by:
@@ -901,10 +1115,7 @@ class HTTPRunDB(RunDBInterface):
                     max_partitions,
                 )
             )
-        error = "list runs"
-        _path = self._path_of("runs", project)
-        responses = self.paginated_api_call("GET", _path, error, params=params)
-        return RunList(self.process_paginated_responses(responses, "runs"))
+        return self._path_of("runs", project), "list runs", params
 
     def del_runs(self, name=None, project=None, labels=None, state=None, days_ago=0):
         """Delete a group of runs identified by the parameters of the function.
@@ -982,6 +1193,34 @@ class HTTPRunDB(RunDBInterface):
             "PUT", endpoint_path, error, body=body, params=params, version="v2"
         )
 
+    def store_artifacts(
+        self,
+        artifacts: dict[str, Union[dict, Artifact]],
+        iter=None,
+        tag=None,
+        project="",
+        tree=None,
+    ):
+        """Store multiple artifacts in the DB. The requests are sent concurrently when the
+        ``httpdb.async_client.enabled`` config is set.
+
+        :param artifacts: Artifact key to the :py:class:`~mlrun.artifacts.Artifact` to store.
+        :param iter: The task iteration which generated the artifacts.
+        :param tag: Tag of the artifacts.
+        :param project: Project that the artifacts belong to.
+        :param tree: The tree (producer id) which generated the artifacts.
+        """
+        if config.httpdb.async_client.enabled:
+            return self._run_async(
+                self._get_async_db().store_artifacts(
+                    artifacts, iter=iter, tag=tag, project=project, tree=tree
+                )
+            )
+        for key, artifact in artifacts.items():
+            self.store_artifact(
+                key, artifact, iter=iter, tag=tag, project=project, tree=tree
+            )
+
     def read_artifact(
         self,
         key,
@@ -1077,6 +1316,7 @@ class HTTPRunDB(RunDBInterface):
         producer_uri: str = None,
         format_: mlrun.common.formatters.ArtifactFormat = mlrun.common.formatters.ArtifactFormat.full,
         limit: int = None,
+        fields: Optional[list[str]] = None,
     ) -> ArtifactList:
         """List artifacts filtered by various parameters.
 
@@ -1113,6 +1353,9 @@ class HTTPRunDB(RunDBInterface):
             is a workflow id (artifact was created as part of a workflow).
         :param format_:         The format in which to return the artifacts. Default is 'full'.
         :param limit:           Maximum number of artifacts to return.
+        :param fields:          Return only these fields of the artifacts, as dot separated paths (e.g.
+            ``["metadata.key", "spec.target_path"]``), instead of the full artifacts. The project and db key of the
+            artifacts are always returned. Cannot be used together with a ``format_`` other than 'full'.
         """
 
         project = project or config.default_project
@@ -1135,6 +1378,7 @@ class HTTPRunDB(RunDBInterface):
             "limit": limit,
             "since": datetime_to_iso(since),
             "until": datetime_to_iso(until),
+            "field": fields or [],
         }
         error = "list artifacts"
         endpoint_path = f"projects/{project}/artifacts"
@@ -1274,8 +1518,7 @@ class HTTPRunDB(RunDBInterface):
         }
         error = "list functions"
         path = f"projects/{project}/functions"
-        responses = self.paginated_api_call("GET", path, error, params=params)
-        return self.process_paginated_responses(responses, "funcs")
+        return self._list_paginated(path, error, params, "funcs")
 
     def list_runtime_resources(
         self,
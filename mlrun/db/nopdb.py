@@ -124,6 +124,7 @@ class NopDB(RunDBInterface):
         ] = mlrun.common.schemas.OrderType.desc,
         max_partitions: int = 0,
         with_notifications: bool = False,
+        fields: Optional[list[str]] = None,
     ):
         return mlrun.lists.RunList()
 
@@ -165,6 +166,7 @@ class NopDB(RunDBInterface):
         tree: str = None,
         format_: mlrun.common.formatters.ArtifactFormat = mlrun.common.formatters.ArtifactFormat.full,
         limit: int = None,
+        fields: Optional[list[str]] = None,
     ):
         return mlrun.lists.ArtifactList()
 
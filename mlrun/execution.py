@@ -12,9 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
+import collections
 import logging
 import os
+import threading
+import time
 import uuid
+import weakref
 from copy import deepcopy
 from typing import Union
 
@@ -47,6 +52,9 @@ from .utils import (
     update_in,
 )
 
+# contexts with run updates which were not flushed yet, flushed at exit
+_contexts_with_pending_updates = weakref.WeakSet()
+
 
 class MLClientCtx:
     """ML Execution Client Context
@@ -114,6 +122,16 @@ class MLClientCtx:
         self._allow_empty_resources = None
         self._reset_on_run = None
 
+        # coalesced run updates, see _update_run
+        self._updates_lock = threading.RLock()
+        self._pending_update = False
+        self._pending_db_update = False
+        self._pending_db_requests = 0
+        self._flushed_updates = {}
+        self._last_flush = None
+        self._flush_timer = None
+        self._updates_stats = collections.Counter()
+
     def __enter__(self):
         return self
 
@@ -129,6 +147,23 @@ class MLClientCtx:
             return f"{self._uid}-{self._iteration}"
         return self._uid
 
+    @property
+    def updates_stats(self) -> dict:
+        """Counters of the coalesced run updates: the requested DB updates, the sent DB updates (calls), the DB
+        updates saved by coalescing, the sent bytes and the (estimated) bytes saved by coalescing and sending only the
+        changed fields"""
+        with self._updates_lock:
+            return {
+                key: self._updates_stats[key]
+                for key in [
+                    "requests",
+                    "calls",
+                    "calls_saved",
+                    "bytes_sent",
+                    "bytes_saved",
+                ]
+            }
+
     @property
     def tag(self):
         """Run tag (uid or workflow id if exists)"""
@@ -458,8 +493,9 @@ class MLClientCtx:
             )
             return
 
-        if replace or not self._labels.get(key):
-            self._labels[key] = str(value)
+        with self._updates_lock:
+            if replace or not self._labels.get(key):
+                self._labels[key] = str(value)
 
     def set_annotation(self, key: str, value, replace: bool = True):
         """Set/record a specific annotation
@@ -469,8 +505,9 @@ class MLClientCtx:
             context.set_annotation("comment", "some text")
 
         """
-        if replace or not self._annotations.get(key):
-            self._annotations[key] = str(value)
+        with self._updates_lock:
+            if replace or not self._annotations.get(key):
+                self._annotations[key] = str(value)
 
     def get_param(self, key: str, default=None):
         """Get a run parameter, or use the provided default if not set
@@ -480,7 +517,8 @@ class MLClientCtx:
             p1 = context.get_param("p1", 0)
         """
         if key not in self._parameters:
-            self._parameters[key] = default
+            with self._updates_lock:
+                self._parameters[key] = default
             if default:
                 self._update_run()
             return default
@@ -549,7 +587,10 @@ class MLClientCtx:
         :param value:  Result value
         :param commit: Commit (write to DB now vs wait for the end of the run)
         """
-        self._results[str(key)] = _cast_result(value)
+        value = _cast_result(value)
+        # the results may be read by a background flush of the run updates
+        with self._updates_lock:
+            self._results[str(key)] = value
         self._update_run(commit=commit)
 
     def log_results(self, results: dict, commit=False):
@@ -565,17 +606,19 @@ class MLClientCtx:
         if not isinstance(results, dict):
             raise MLRunInvalidArgumentError("Results must be in the form of dict")
 
-        for p in results.keys():
-            self._results[str(p)] = _cast_result(results[p])
+        results = {str(key): _cast_result(value) for key, value in results.items()}
+        with self._updates_lock:
+            self._results.update(results)
         self._update_run(commit=commit)
 
     def log_iteration_results(self, best, summary: list, task: dict, commit=False):
         """Reserved for internal use"""
 
         if best:
-            self._results["best_iteration"] = best
-            for k, v in get_in(task, ["status", "results"], {}).items():
-                self._results[k] = v
+            with self._updates_lock:
+                self._results["best_iteration"] = best
+                for k, v in get_in(task, ["status", "results"], {}).items():
+                    self._results[k] = v
             for artifact in get_in(task, ["status", RunKeys.artifacts], []):
                 self._artifacts_manager.artifacts[artifact["metadata"]["key"]] = (
                     artifact
@@ -592,7 +635,8 @@ class MLClientCtx:
                 )
 
         if summary is not None:
-            self._iteration_results = summary
+            with self._updates_lock:
+                self._iteration_results = summary
         if commit:
             self._update_run(commit=True)
 
@@ -868,10 +912,11 @@ class MLClientCtx:
         if self._state != "running":
             completed = False
 
-        if message:
-            self._annotations["message"] = message
-        if completed:
-            self._state = "completed"
+        with self._updates_lock:
+            if message:
+                self._annotations["message"] = message
+            if completed:
+                self._state = "completed"
 
         if self._parent:
             self._parent.update_child_iterations()
@@ -893,33 +938,35 @@ class MLClientCtx:
 
         :param execution_state:     set execution state
         :param error:               error message (if exist will set the state to error)
-        :param commit:              will immediately update the state in the DB
+        :param commit:              will immediately update the state in the DB, the state updates are not coalesced
+                                    with the other run updates (see `execution_context.updates_flush_interval`)
         """
         # TODO: The execution context should not set the run state to completed.
         #  Create a separate state for the execution in the run object.
         updates = {"status.last_update": now_date().isoformat()}
 
-        if error is not None:
-            self._state = "error"
-            self._error = str(error)
-            updates["status.state"] = "error"
-            updates["status.error"] = error
-        elif (
-            execution_state
-            and execution_state != self._state
-            and self._state != "error"
-        ):
-            self._state = execution_state
-            updates["status.state"] = execution_state
-        self._last_update = now_date()
-
-        if self._rundb and commit:
-            self._rundb.update_run(
-                updates, self._uid, self.project, iter=self._iteration
-            )
+        with self._updates_lock:
+            if error is not None:
+                self._state = "error"
+                self._error = str(error)
+                updates["status.state"] = "error"
+                updates["status.error"] = error
+            elif (
+                execution_state
+                and execution_state != self._state
+                and self._state != "error"
+            ):
+                self._state = execution_state
+                updates["status.state"] = execution_state
+            self._last_update = now_date()
+
+            if self._rundb and commit:
+                self._rundb.update_run(
+                    updates, self._uid, self.project, iter=self._iteration
+                )
 
     def set_hostname(self, host: str):
-        """Update the hostname, for internal use"""
+        """Update the hostname (immediately in the DB, not coalesced with the other run updates), for internal use"""
         self._host = host
         if self._rundb:
             updates = {"status.host": host}
@@ -1036,6 +1083,8 @@ class MLClientCtx:
             self._rundb.store_run(
                 self.to_dict(), self._uid, self.project, iter=self._iteration
             )
+            with self._updates_lock:
+                self._flushed_updates = deepcopy(self._get_updates())
 
     def is_logging_worker(self):
         """
@@ -1062,19 +1111,93 @@ class MLClientCtx:
 
     def _update_run(self, commit=False, message=""):
         """
-        Update the required fields in the run object instead of overwriting existing values with empty ones
+        Update the required fields in the run object instead of overwriting existing values with empty ones.
+        The updates are coalesced, they are flushed at most once per `execution_context.updates_flush_interval`
+        (by a background timer for the trailing updates), and immediately on commit. Only the fields which changed
+        since the previous flush are sent to the DB.
 
         :param commit:  Commit the changes to the DB if autocommit is not set or update the tmpfile alone
         :param message: Commit message
         """
-        self._merge_tmpfile()
-        if commit or self._autocommit:
-            self._commit = message
-            if self._rundb:
-                self._rundb.update_run(
-                    self._get_updates(), self._uid, self.project, iter=self._iteration
+        with self._updates_lock:
+            self._pending_update = True
+            if commit or self._autocommit:
+                self._commit = message
+                self._pending_db_update = True
+                self._pending_db_requests += 1
+                self._updates_stats["requests"] += 1
+
+            interval = float(mlrun.mlconf.execution_context.updates_flush_interval)
+            elapsed = (
+                time.monotonic() - self._last_flush
+                if self._last_flush is not None
+                else interval
+            )
+            if commit or elapsed >= interval:
+                self._flush_updates()
+            else:
+                _contexts_with_pending_updates.add(self)
+                if not self._flush_timer:
+                    self._flush_timer = threading.Timer(
+                        interval - elapsed, self._flush_updates_in_background
+                    )
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+
+    def _flush_updates(self):
+        """Write the pending run updates to the tmpfile and send their changed fields to the DB"""
+        with self._updates_lock:
+            if self._flush_timer:
+                if self._flush_timer is not threading.current_thread():
+                    self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending_update:
+                return
+
+            self._merge_tmpfile()
+            if self._pending_db_update and self._rundb:
+                updates = self._get_updates()
+                changed_updates = {
+                    key: value
+                    for key, value in updates.items()
+                    if key not in self._flushed_updates
+                    or self._flushed_updates[key] != value
+                }
+                updates_size = len(dict_to_json(updates))
+                changed_updates_size = (
+                    len(dict_to_json(changed_updates)) if changed_updates else 0
+                )
+                if changed_updates:
+                    self._rundb.update_run(
+                        changed_updates, self._uid, self.project, iter=self._iteration
+                    )
+                    self._flushed_updates.update(deepcopy(changed_updates))
+                sent_calls = 1 if changed_updates else 0
+                self._updates_stats["calls"] += sent_calls
+                self._updates_stats["calls_saved"] += (
+                    self._pending_db_requests - sent_calls
+                )
+                self._updates_stats["bytes_sent"] += changed_updates_size
+                self._updates_stats["bytes_saved"] += (
+                    updates_size * self._pending_db_requests - changed_updates_size
                 )
 
+            self._pending_update = self._pending_db_update = False
+            self._pending_db_requests = 0
+            self._last_flush = time.monotonic()
+            _contexts_with_pending_updates.discard(self)
+
+    def _flush_updates_in_background(self):
+        try:
+            self._flush_updates()
+        except Exception as exc:
+            # the updates are still pending, they are flushed on the next update, commit or exit
+            self._logger.warning(
+                "Failed to flush the run updates, will retry",
+                uid=self._uid,
+                exc=mlrun.errors.err_to_str(exc),
+            )
+
     def _get_updates(self):
         def set_if_not_none(_struct, key, val):
             if val:
@@ -1143,7 +1266,8 @@ class MLClientCtx:
             url = key
         if self.in_path and is_relative_path(url):
             url = os.path.join(self._in_path, url)
-        self._inputs[key] = url
+        with self._updates_lock:
+            self._inputs[key] = url
 
     def _merge_tmpfile(self):
         if not self._tmpfile:
@@ -1175,6 +1299,19 @@ class MLClientCtx:
                 fp.close()
 
 
+@atexit.register
+def _flush_pending_updates():
+    for context in list(_contexts_with_pending_updates):
+        try:
+            context._flush_updates()
+        except Exception as exc:
+            logger.warning(
+                "Failed to flush the run updates at exit",
+                uid=context.uid,
+                exc=mlrun.errors.err_to_str(exc),
+            )
+
+
 def _cast_result(value):
     if isinstance(value, (int, str, float)):
         return value
@@ -165,7 +165,10 @@ def get_offline_features(
     :param update_stats:            update features statistics from the requested feature sets on the vector.
                                     (default False).
     :param engine:                  processing engine kind ("local", "dask", or "spark")
-    :param engine_args:             kwargs for the processing engine
+    :param engine_args:             kwargs for the processing engine.
+                                    With the local engine, set `memory_budget` (bytes) or `num_partitions` to merge
+                                    the vector in entity key ranges which are written to a ParquetTarget one by one
+                                    (to a merged-chunks directory under the target path)
     :param query:                   The query string used to filter rows on the output
     :param spark_service:           Name of the spark service to be used (when using a remote-spark runtime)
     :param order_by:                Name or list of names to order by. The name or the names in the list can be the
@@ -13,13 +13,13 @@
 # limitations under the License.
 import collections
 import logging
+import math
 import typing
 from copy import copy
 from datetime import datetime
 from enum import Enum
 from typing import Union
 
-import numpy as np
 import pandas as pd
 
 import mlrun
@@ -787,7 +787,10 @@ class FeatureVector(ModelObj):
         :param update_stats:            update features statistics from the requested feature sets on the vector.
                                         (default False).
         :param engine:                  processing engine kind ("local", "dask", or "spark")
-        :param engine_args:             kwargs for the processing engine
+        :param engine_args:             kwargs for the processing engine.
+                                        With the local engine, set `memory_budget` (bytes) or `num_partitions` to merge
+                                        the vector in entity key ranges which are written to a ParquetTarget one by one
+                                        (to a merged-chunks directory under the target path)
         :param query:                   The query string used to filter rows on the output
         :param spark_service:           Name of the spark service to be used (when using a remote-spark runtime)
         :param order_by:                Name or list of names to order by. The name or the names in the list can be the
@@ -917,6 +920,8 @@ class OnlineVectorService:
         index_columns,
         impute_policy: dict = None,
         requested_columns: list[str] = None,
+        batched: bool = False,
+        features_cache=None,
     ):
         self.vector = vector
         self.impute_policy = impute_policy or {}
@@ -925,6 +930,9 @@ class OnlineVectorService:
         self._index_columns = index_columns
         self._impute_values = {}
         self._requested_columns = requested_columns
+        # the graph gets all the entity rows of a get() call as a single event
+        self._batched = batched
+        self._features_cache = features_cache
 
     def __enter__(self):
         return self
@@ -972,6 +980,12 @@ class OnlineVectorService:
         """vector merger function status (ready, running, error)"""
         return "ready"
 
+    @property
+    def cache_stats(self) -> typing.Optional[dict]:
+        """metrics of the (process wide) online features cache, None when caching is disabled (see the
+        feature_store.online_cache config)"""
+        return self._features_cache.stats if self._features_cache else None
+
     def get(self, entity_rows: list[Union[dict, list]], as_list=False):
         """get feature vector given the provided entity inputs
 
@@ -1024,44 +1038,49 @@ class OnlineVectorService:
                 for item in entity_rows
             ]
 
-        for row in entity_rows:
-            futures.append(self._controller.emit(row, return_awaitable_result=True))
-
-        for future in futures:
-            result = future.await_result()
-            data = result.body
+        if self._batched:
+            # the rows are copied as the graph enriches them in place
+            rows = [dict(row) for row in entity_rows]
+            result = self._controller.emit(rows, return_awaitable_result=True)
+            rows = result.await_result().body
+        else:
+            for row in entity_rows:
+                futures.append(self._controller.emit(row, return_awaitable_result=True))
+            rows = [future.await_result().body for future in futures]
+
+        label_column = self.vector.status.label_column
+        feature_columns = [
+            column for column in self._requested_columns if column != label_column
+        ]
+        index_columns = set(self._index_columns)
+        dropped_columns = (
+            [] if self.vector.spec.with_indexes else self.vector.status.index_keys
+        )
+        for data in rows:
             if data:
-                actual_columns = data.keys()
-                if all([col in self._index_columns for col in actual_columns]):
+                if all(col in index_columns for col in data.keys()):
                     # didn't get any data from the graph
                     results.append(None)
                     continue
-                for column in self._requested_columns:
-                    if (
-                        column not in actual_columns
-                        and column != self.vector.status.label_column
-                    ):
+                for column in feature_columns:
+                    if column not in data:
                         data[column] = None
 
-                if self._impute_values:
-                    for name in data.keys():
-                        v = data[name]
-                        if v is None or (
-                            isinstance(v, float) and (np.isinf(v) or np.isnan(v))
-                        ):
-                            data[name] = self._impute_values.get(name, v)
-                if not self.vector.spec.with_indexes:
-                    for name in self.vector.status.index_keys:
-                        data.pop(name, None)
+                for name, value in self._impute_values.items():
+                    if name not in data:
+                        continue
+                    v = data[name]
+                    if v is None or (
+                        isinstance(v, float) and (math.isinf(v) or math.isnan(v))
+                    ):
+                        data[name] = value
+                for name in dropped_columns:
+                    data.pop(name, None)
                 if not any(data.values()):
                     data = None
 
             if as_list and data:
-                data = [
-                    data.get(key, None)
-                    for key in self._requested_columns
-                    if key != self.vector.status.label_column
-                ]
+                data = [data.get(key, None) for key in feature_columns]
             results.append(data)
 
         return results
@@ -0,0 +1,219 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import time
+import typing
+
+import storey
+from storey.dtypes import _termination_obj
+from storey.utils import stringify_key
+
+from .online_cache import OnlineFeaturesCache
+
+
+class _BatchFlow(storey.Flow):
+    """base of the steps which process a batch of rows, the event body is a list of row dicts (None for dropped rows)
+    or a single row dict"""
+
+    async def _do(self, event):
+        if event is _termination_obj:
+            return await self._do_downstream(_termination_obj)
+        if isinstance(event.body, dict):
+            rows = [event.body]
+            await self._process_rows(rows)
+            event.body = rows[0]
+        else:
+            await self._process_rows(event.body)
+        await self._do_downstream(event)
+
+    async def _process_rows(self, rows: list[typing.Optional[dict]]):
+        raise NotImplementedError()
+
+
+class BatchRename(_BatchFlow):
+    """Rename fields of a batch of rows (the batch version of storey.Rename)
+
+    :param mapping: dictionary of {"old_name": "new_name"}
+    """
+
+    def __init__(self, mapping: dict[str, str], **kwargs):
+        super().__init__(**kwargs)
+        self._mapping = mapping
+
+    async def _process_rows(self, rows: list[typing.Optional[dict]]):
+        for row in rows:
+            if row is None:
+                continue
+            for old_name, new_name in self._mapping.items():
+                if old_name in row:
+                    row[new_name] = row.pop(old_name)
+
+
+class BatchDropColumns(_BatchFlow):
+    """Drop fields of a batch of rows (the batch version of storey.flow.DropColumns)
+
+    :param columns: list of the fields to drop
+    """
+
+    def __init__(self, columns: list[str], **kwargs):
+        super().__init__(**kwargs)
+        self._columns = columns
+
+    async def _process_rows(self, rows: list[typing.Optional[dict]]):
+        for row in rows:
+            if row is None:
+                continue
+            for column in self._columns:
+                row.pop(column, None)
+
+
+class BatchQueryByKey(_BatchFlow):
+    """Query features of a batch of rows by their keys (the batch version of storey.QueryByKey, without aggregations)
+
+    the features of the distinct keys of the batch are loaded together, with a single pipeline for Redis tables and
+    with concurrent requests for the other tables (e.g. v3io KV, which has no multi-key get), instead of one request
+    per row. rows without a key are dropped (set to None), like in storey.QueryByKey.
+
+    :param features:      list of features to get
+    :param table:         table object or name (looked up in the context)
+    :param key_field:     list of the key fields of the rows
+    :param aliases:       dictionary of aliases for the features, {"feature": "alias"}
+    :param max_in_flight: max number of concurrent requests to the table (when not pipelined)
+    :param cache:         read-through cache of the loaded features (optional)
+    :param cache_version: the version of the feature set, which addresses its cache entries
+    """
+
+    def __init__(
+        self,
+        features: list[str],
+        table: typing.Union[storey.Table, str],
+        key_field: list[str],
+        aliases: dict[str, str] = None,
+        max_in_flight: int = 32,
+        cache: OnlineFeaturesCache = None,
+        cache_version: str = "",
+        **kwargs,
+    ):
+        self._cache = cache
+        self._cache_uri = table if isinstance(table, str) else table._table_path
+        self._cache_version = cache_version
+        if cache:
+            cache.register_version(self._cache_uri, cache_version)
+        if isinstance(table, str):
+            if "context" not in kwargs:
+                raise TypeError(
+                    "Table can not be string if no context was provided to the step"
+                )
+            table = kwargs["context"].get_table(table)
+        super().__init__(**kwargs)
+        self._features = features
+        self._table = table
+        self._key_field = key_field
+        self._aliases = aliases or {}
+        self._max_in_flight = max_in_flight
+
+    def _init(self):
+        super()._init()
+        self._closeables = [self._table]
+
+    async def _process_rows(self, rows: list[typing.Optional[dict]]):
+        # the indexes of the rows of each key
+        keys = {}
+        for index, row in enumerate(rows):
+            if row is None:
+                continue
+            key = [row.get(field) for field in self._key_field]
+            if key == [None]:
+                rows[index] = None
+                continue
+            keys.setdefault(stringify_key(key), []).append(index)
+        if not keys:
+            return
+
+        features_by_key = await self._cached_load(list(keys.keys()))
+        for key, indexes in keys.items():
+            features = features_by_key.get(key)
+            if not features:
+                continue
+            for index in indexes:
+                row = rows[index]
+                for feature in self._features:
+                    if feature in features:
+                        row[self._aliases.get(feature) or feature] = features[feature]
+
+    async def _cached_load(self, keys: list[str]) -> dict[str, typing.Optional[dict]]:
+        if not self._cache:
+            return await self._load(keys)
+        features_by_key, missing_keys = self._cache.get_many(
+            self._cache_uri, self._cache_version, keys, self._features
+        )
+        if missing_keys:
+            start = time.monotonic()
+            loaded = await self._load(missing_keys)
+            self._cache.set_many(
+                self._cache_uri,
+                self._cache_version,
+                loaded,
+                self._features,
+                load_seconds=time.monotonic() - start,
+            )
+            features_by_key.update(loaded)
+        return features_by_key
+
+    async def _load(self, keys: list[str]) -> dict[str, typing.Optional[dict]]:
+        storage = self._table._storage
+        if _is_redis_driver(storage):
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._load_with_redis_pipeline, storage, keys
+            )
+
+        semaphore = asyncio.Semaphore(self._max_in_flight)
+
+        async def load(key):
+            async with semaphore:
+                return await storage._load_by_key(
+                    self._table._container,
+                    self._table._table_path,
+                    key,
+                    self._features,
+                )
+
+        results = await asyncio.gather(*[load(key) for key in keys])
+        return dict(zip(keys, results))
+
+    def _load_with_redis_pipeline(self, storage, keys: list[str]) -> dict[str, dict]:
+        pipeline = storage.redis.pipeline(transaction=False)
+        for key in keys:
+            redis_key = storage._static_data_key(
+                storage._make_key(self._table._container, self._table._table_path, key)
+            )
+            pipeline.hmget(redis_key, self._features)
+        features_by_key = {}
+        for key, values in zip(keys, pipeline.execute()):
+            features_by_key[key] = {
+                feature: storage.convert_redis_value_to_python_obj(value)
+                for feature, value in zip(self._features, values)
+                if value is not None
+            }
+        return features_by_key
+
+
+def _is_redis_driver(storage) -> bool:
+    try:
+        from storey.redis_driver import RedisDriver
+    except ImportError:
+        # the redis package is not installed, so the table can't be a redis table
+        return False
+    return isinstance(storage, RedisDriver)
@@ -12,12 +12,200 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import re
+import copy
+import math
+import os
+import typing
 
+import numpy as np
 import pandas as pd
+import pyarrow.dataset
+from pandas.api.types import is_datetime64_any_dtype
 
+import mlrun
+from mlrun.datastore.targets import TargetTypes, get_offline_target
+
+from ...utils import logger
+from ..feature_vector import OfflineVectorResponse
 from .base import BaseMerger
 
+# the merged partitions (chunks) are written to a dedicated directory under the target path, which is purged before
+# every partitioned merge
+_CHUNKS_DIR = "merged-chunks"
+
+
+def _to_int64_times(series: pd.Series) -> np.ndarray:
+    """return the timestamps of a datetime series as int64 (NaT is returned as the int64 minimum)"""
+    return pd.DatetimeIndex(series).asi8
+
+
+def _key_index(df: pd.DataFrame, keys: list) -> pd.Index:
+    if len(keys) == 1:
+        return pd.Index(df[keys[0]])
+    return pd.MultiIndex.from_arrays([df[key] for key in keys])
+
+
+def _asof_join_positions(
+    num_left_rows: int,
+    left_combined: np.ndarray,
+    left_positions: np.ndarray,
+    left_unique_times: np.ndarray,
+    right_times: np.ndarray,
+    right_codes: np.ndarray,
+) -> np.ndarray:
+    """
+    vectorized backward as-of lookup, for each left row return the position of the latest right row with the same
+    key code and a timestamp lower or equal to the left timestamp, or -1 if there is no such row
+
+    :param num_left_rows:     the number of left rows
+    :param left_combined:     the sorted (key code, timestamp rank) values of the left rows which can be matched,
+                              encoded as `code * (len(left_unique_times) + 1) + rank`
+    :param left_positions:    the position of each `left_combined` value in the left rows
+    :param left_unique_times: the sorted unique left timestamps (int64) the ranks refer to
+    :param right_times:       the right timestamps (int64)
+    :param right_codes:       the key code of each right row, encoded like the left codes (-1 for unknown keys)
+    """
+    positions = np.full(num_left_rows, -1, dtype=np.int64)
+    valid_right = (right_codes >= 0) & (right_times != pd.NaT.value)
+    if not valid_right.any() or len(left_combined) == 0:
+        return positions
+    right_positions = np.flatnonzero(valid_right)
+    right_times = right_times[right_positions]
+    right_codes = right_codes[right_positions].astype(np.int64)
+
+    # a right row can match a left row iff the number of unique left timestamps which are lower than the right
+    # timestamp is at most the rank of the left timestamp, this lets us encode (key, time) as a single int64
+    stride = np.int64(len(left_unique_times) + 1)
+    right_combined = right_codes * stride + np.searchsorted(
+        left_unique_times, right_times, side="left"
+    )
+    # among rows with the same combined value the latest timestamp (and then the last row) wins
+    order = np.lexsort((right_times, right_combined))
+    right_combined = right_combined[order]
+
+    # the left values are sorted, which keeps the binary search cache friendly
+    found = np.searchsorted(right_combined, left_combined, side="right") - 1
+    matched = (found >= 0) & (
+        right_combined[np.maximum(found, 0)] // stride == left_combined // stride
+    )
+    positions[left_positions[matched]] = right_positions[order[found[matched]]]
+    return positions
+
+
+def _key_ranges(keys: pd.Series, num_partitions: int) -> list[tuple]:
+    """
+    split the sorted unique values of `keys` to (at most) `num_partitions` contiguous inclusive
+    (low, high) ranges, so that each range holds about the same number of rows
+    """
+    counts = keys.dropna().value_counts().sort_index()
+    if counts.empty:
+        return []
+    num_partitions = max(1, min(num_partitions, len(counts)))
+    cumulative = counts.to_numpy().cumsum()
+    ends = np.unique(
+        np.searchsorted(
+            cumulative,
+            cumulative[-1] * np.arange(1, num_partitions + 1) / num_partitions,
+            side="left",
+        )
+    )
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    values = counts.index
+    return [(values[start], values[end]) for start, end in zip(starts, ends)]
+
+
+def _estimate_parquet_size(path: str, columns: list[str]) -> typing.Optional[int]:
+    """
+    estimate the in-memory size of `columns` of a parquet file/directory from the uncompressed sizes recorded in
+    the row group metadata of its files (only the footers are read), return None if it can't be estimated
+    """
+    try:
+        store, _, url = mlrun.store_manager.get_or_create_store(path)
+        dataset = pyarrow.dataset.dataset(
+            url, filesystem=store.filesystem, format="parquet", partitioning="hive"
+        )
+        size = 0
+        for fragment in dataset.get_fragments():
+            metadata = fragment.metadata
+            for i in range(metadata.num_row_groups):
+                row_group = metadata.row_group(i)
+                for j in range(row_group.num_columns):
+                    column = row_group.column(j)
+                    if column.path_in_schema in columns:
+                        size += column.total_uncompressed_size
+        return size
+    except Exception as exc:
+        logger.warning(
+            "Failed to estimate the size of parquet data", path=path, exc=str(exc)
+        )
+        return None
+
+
+class _AsofJoinState:
+    """entity rows state shared by all the as-of joins of a single merge"""
+
+    def __init__(self, timestamp_column: str, times: np.ndarray):
+        self.timestamp_column = timestamp_column
+        self.unique_times = np.unique(times)
+        self.ranks = np.searchsorted(self.unique_times, times, side="left")
+        # entity rows without a timestamp never match
+        self._valid_times = times != pd.NaT.value
+        self._left_lookups = {}
+        self.pending_dfs = []
+        self.pending_columns = set()
+
+    def asof_positions(
+        self,
+        entity_df: pd.DataFrame,
+        featureset_df: pd.DataFrame,
+        featureset_timestamp: str,
+        left_keys: list,
+        right_keys: list,
+    ) -> np.ndarray:
+        """return the position of the feature set row matching each entity row (-1 where there is no match)"""
+        uniques, left_combined, left_positions = self._left_lookup(entity_df, left_keys)
+        if left_keys:
+            right_codes = uniques.get_indexer(_key_index(featureset_df, right_keys))
+        else:
+            right_codes = np.zeros(len(featureset_df), dtype=np.int64)
+        return _asof_join_positions(
+            len(self.ranks),
+            left_combined,
+            left_positions,
+            self.unique_times,
+            _to_int64_times(featureset_df[featureset_timestamp]),
+            right_codes,
+        )
+
+    def _left_lookup(self, entity_df, left_keys: list):
+        cache_key = tuple(left_keys)
+        if cache_key not in self._left_lookups:
+            if left_keys:
+                codes, uniques = _key_index(entity_df, left_keys).factorize()
+            else:
+                codes, uniques = np.zeros(len(self.ranks), dtype=np.int64), None
+            left_positions = np.flatnonzero((codes >= 0) & self._valid_times)
+            left_combined = (
+                codes[left_positions].astype(np.int64)
+                * np.int64(len(self.unique_times) + 1)
+                + self.ranks[left_positions]
+            )
+            order = np.argsort(left_combined, kind="stable")
+            self._left_lookups[cache_key] = (
+                uniques,
+                left_combined[order],
+                left_positions[order],
+            )
+        return self._left_lookups[cache_key]
+
+    def add_pending(self, features_df: pd.DataFrame):
+        self.pending_dfs.append(features_df)
+        self.pending_columns.update(features_df.columns)
+
+    def clear_pending(self):
+        self.pending_dfs = []
+        self.pending_columns = set()
+
 
 class LocalFeatureMerger(BaseMerger):
     engine = "local"
@@ -25,6 +213,313 @@ class LocalFeatureMerger(BaseMerger):
 
     def __init__(self, vector, **engine_args):
         super().__init__(vector, **engine_args)
+        self._asof_state = None
+
+        # partitioned (out of core) merge, enabled by setting the memory budget or the number of partitions
+        self._memory_budget = engine_args.get("memory_budget")
+        self._num_partitions = engine_args.get("num_partitions")
+        # (key column, low, high) of the partition being merged, low and high are None in the partition of the rows
+        # with null keys
+        self._partition = None
+        self._chunk_id = 0
+        self._written_size = 0
+        self._partitioned_result_path = None
+
+    @property
+    def _is_partitioned(self):
+        return bool(self._memory_budget or self._num_partitions)
+
+    def _generate_offline_vector(
+        self,
+        entity_rows,
+        entity_timestamp_column,
+        feature_set_objects,
+        feature_set_fields,
+        start_time=None,
+        end_time=None,
+        timestamp_for_filtering=None,
+        query=None,
+        order_by=None,
+        additional_filters=None,
+    ):
+        if not self._is_partitioned:
+            return super()._generate_offline_vector(
+                entity_rows,
+                entity_timestamp_column,
+                feature_set_objects=feature_set_objects,
+                feature_set_fields=feature_set_fields,
+                start_time=start_time,
+                end_time=end_time,
+                timestamp_for_filtering=timestamp_for_filtering,
+                query=query,
+                order_by=order_by,
+                additional_filters=additional_filters,
+            )
+
+        self._validate_partitioned_merge(order_by)
+        if entity_rows is not None and entity_rows.index.names[0]:
+            entity_rows = entity_rows.reset_index()
+        entity_rows_keys = (
+            list(entity_rows.columns) if entity_rows is not None else None
+        )
+        join_graph = self._get_graph(
+            feature_set_objects, feature_set_fields, entity_rows_keys
+        )
+        partition_key = self._get_partition_key(
+            join_graph, feature_set_objects, entity_rows_keys
+        )
+        key_ranges, has_null_keys = self._get_key_ranges(
+            partition_key,
+            entity_rows,
+            join_graph,
+            feature_set_objects,
+            feature_set_fields,
+            additional_filters,
+        )
+        if not key_ranges:
+            # there are no keys to partition by, the result is (at most) the rows with null keys
+            self._memory_budget = self._num_partitions = None
+            return super()._generate_offline_vector(
+                entity_rows,
+                entity_timestamp_column,
+                feature_set_objects=feature_set_objects,
+                feature_set_fields=feature_set_fields,
+                start_time=start_time,
+                end_time=end_time,
+                timestamp_for_filtering=timestamp_for_filtering,
+                query=query,
+                additional_filters=additional_filters,
+            )
+        logger.info(
+            "Merging the feature vector in partitions",
+            partition_key=partition_key,
+            num_partitions=len(key_ranges),
+        )
+
+        self._target.set_resource(self.vector)
+        # the chunks of a previous (e.g. larger) merge to the same target would be read with the new ones
+        self._purge_partitioned_target()
+        partitions = [
+            (
+                (partition_key, low, high),
+                [(partition_key, ">=", low), (partition_key, "<=", high)],
+            )
+            for low, high in key_ranges
+        ]
+        if has_null_keys:
+            # the rows with null keys are merged in a partition of their own, as no range filter matches them. a
+            # filter on null values alone can't be typed, so the first key is added to the filter values and its
+            # rows are then dropped by the partition mask
+            partitions.append(
+                (
+                    (partition_key, None, None),
+                    [(partition_key, "in", [None, key_ranges[0][0]])],
+                )
+            )
+        for i, (partition, partition_filters) in enumerate(partitions):
+            self._partition = partition
+            self._chunk_id = i + 1
+            partition_entity_rows = None
+            if entity_rows is not None:
+                partition_entity_rows = entity_rows[self._partition_mask(entity_rows)]
+            super()._generate_offline_vector(
+                partition_entity_rows,
+                entity_timestamp_column,
+                feature_set_objects=feature_set_objects,
+                feature_set_fields=feature_set_fields,
+                start_time=start_time,
+                end_time=end_time,
+                timestamp_for_filtering=timestamp_for_filtering,
+                query=query,
+                additional_filters=(additional_filters or []) + partition_filters,
+            )
+            self._result_df = None
+        self._partition = None
+
+        self._update_partitioned_target_status()
+        return OfflineVectorResponse(self)
+
+    def _validate_partitioned_merge(self, order_by):
+        if order_by:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "order_by is not supported when merging in partitions (memory_budget/num_partitions engine args)"
+            )
+        if self._target is None or self._target.kind != TargetTypes.parquet:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Merging in partitions (memory_budget/num_partitions engine args) requires a ParquetTarget target"
+            )
+        if not self._target.path and self.vector.metadata.name is None:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "target path was not specified"
+            )
+
+    def _get_partition_key(self, join_graph, feature_set_objects, entity_rows_keys):
+        """return an entity which all the feature sets (and the entity rows) are joined on"""
+        candidates = None
+        for feature_set in feature_set_objects.values():
+            entities = list(feature_set.spec.entities.keys())
+            if candidates is None:
+                candidates = entities
+            else:
+                candidates = [key for key in candidates if key in entities]
+        if entity_rows_keys is not None:
+            candidates = [key for key in candidates if key in entity_rows_keys]
+        for i, step in enumerate(join_graph.steps):
+            if i == 0 and entity_rows_keys is None:
+                # the first feature set is not joined to anything
+                continue
+            candidates = [
+                key
+                for key in candidates
+                if key in step.right_keys
+                and len(step.left_keys) == len(step.right_keys)
+                and step.left_keys[step.right_keys.index(key)] == key
+            ]
+        if not candidates:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Merging in partitions requires all the feature sets to be joined on a common entity"
+            )
+        return candidates[0]
+
+    def _get_key_ranges(
+        self,
+        partition_key,
+        entity_rows,
+        join_graph,
+        feature_set_objects,
+        feature_set_fields,
+        additional_filters,
+    ) -> tuple[list[tuple], bool]:
+        """return the (low, high) key ranges of the partitions, and whether there are rows with null keys"""
+        if entity_rows is not None:
+            keys = entity_rows[partition_key]
+            estimated_size = entity_rows.memory_usage(deep=True).sum()
+        else:
+            # only the key column of the first feature set is read to plan the partitions
+            first_feature_set = feature_set_objects[
+                join_graph.steps[0].right_feature_set_name
+            ]
+            df = first_feature_set.to_dataframe(
+                columns=[partition_key], additional_filters=additional_filters
+            )
+            # the feature set entities are always added to the selected columns (and may be the index)
+            df = df.loc[:, ~df.columns.duplicated()]
+            if partition_key in df.columns:
+                keys = df[partition_key]
+            else:
+                keys = pd.Series(df.index.get_level_values(partition_key))
+            del df
+            estimated_size = 0
+
+        num_partitions = self._num_partitions
+        if not num_partitions:
+            for name, feature_set in feature_set_objects.items():
+                columns = [column for column, _ in feature_set_fields[name]]
+                columns += list(feature_set.spec.entities.keys())
+                if feature_set.spec.timestamp_key:
+                    columns.append(feature_set.spec.timestamp_key)
+                target = get_offline_target(feature_set)
+                size = None
+                if target and target.kind == TargetTypes.parquet:
+                    size = _estimate_parquet_size(target.get_target_path(), columns)
+                if size is None:
+                    logger.warning(
+                        "Could not estimate the feature set size, it is not accounted in the memory budget",
+                        feature_set=name,
+                    )
+                estimated_size += size or 0
+            num_partitions = math.ceil(estimated_size / self._memory_budget)
+        return _key_ranges(keys, num_partitions), bool(keys.isna().any())
+
+    def _partition_mask(self, df):
+        key, low, high = self._partition
+        if low is None:
+            return df[key].isna()
+        return df[key].between(low, high)
+
+    def _write_to_offline_target(self, timestamp_key=None):
+        if self._partition is None:
+            return super()._write_to_offline_target(timestamp_key=timestamp_key)
+
+        if self._result_df.empty:
+            return
+        if not self._drop_indexes and timestamp_key not in self._drop_columns:
+            self.vector.status.timestamp_key = timestamp_key
+        size = self._get_chunk_target().write_dataframe(
+            self._result_df, timestamp_key=self.vector.status.timestamp_key
+        )
+        self._written_size += size or 0
+
+    def _get_chunk_target(self):
+        """a copy of the target which writes the current chunk to the chunks directory"""
+        target = copy.copy(self._target)
+        chunks_path = self._get_chunks_path(self._target.get_target_path())
+        if self._target.partitioned or self._target.time_partitioning_granularity:
+            # the chunks are added to the partitions directories
+            target.path = chunks_path
+        else:
+            target.path = f"{chunks_path}/{self._chunk_id:0>4}.parquet"
+        return target
+
+    @staticmethod
+    def _get_chunks_path(target_path: str) -> str:
+        """the path of the directory of the merged partitions (chunks) of the target"""
+        if mlrun.utils.helpers.is_parquet_file(target_path):
+            target_path = os.path.splitext(target_path)[0]
+        return f"{target_path.rstrip('/')}/{_CHUNKS_DIR}"
+
+    def _purge_partitioned_target(self):
+        chunks_path = self._get_chunks_path(self._target.get_target_path())
+        store, path_in_store, _ = mlrun.store_manager.get_or_create_store(chunks_path)
+        if path_in_store not in ["", "/"]:
+            store.rm(path_in_store, recursive=True)
+
+    def _update_partitioned_target_status(self):
+        if self.vector.metadata.name is not None:
+            target_status = self._target.update_resource_status(
+                "ready", size=self._written_size
+            )
+            # the status points to the directory of the chunks, which is read as a parquet dataset
+            target_status.path = self._get_chunks_path(target_status.path)
+            self.vector.status.update_target(target_status)
+            logger.info(f"wrote target: {target_status}")
+        self._partitioned_result_path = self._get_chunks_path(
+            self._target.get_target_path()
+        )
+        self.vector.save()
+
+    def get_status(self):
+        if self._partitioned_result_path:
+            return "completed"
+        return super().get_status()
+
+    def get_df(self, to_pandas=True):
+        if self._partitioned_result_path and self._result_df is None:
+            # the merged partitions were written to the target, read them back
+            self._result_df = mlrun.get_dataitem(self._partitioned_result_path).as_df(
+                format="parquet"
+            )
+        return super().get_df(to_pandas=to_pandas)
+
+    def merge(
+        self,
+        entity_timestamp_column: str,
+        featuresets: list,
+        featureset_dfs: list,
+        keys: list = None,
+        join_types: list = None,
+    ):
+        self._asof_state = None
+        result_timestamp = super().merge(
+            entity_timestamp_column=entity_timestamp_column,
+            featuresets=featuresets,
+            featureset_dfs=featureset_dfs,
+            keys=keys,
+            join_types=join_types,
+        )
+        self._result_df = self._materialize_asof_columns(self._result_df)
+        self._asof_state = None
+        return result_timestamp
 
     def _asof_join(
         self,
@@ -36,17 +531,16 @@ class LocalFeatureMerger(BaseMerger):
         left_keys: list,
         right_keys: list,
     ):
-        index_col_not_in_entity = "index" not in entity_df.columns
-        index_col_not_in_featureset = "index" not in featureset_df.columns
-        entity_df[entity_timestamp_column] = pd.to_datetime(
-            entity_df[entity_timestamp_column]
-        )
-        featureset_df[featureset_timstamp] = pd.to_datetime(
-            featureset_df[featureset_timstamp]
-        )
-        entity_df.sort_values(by=entity_timestamp_column, inplace=True)
-        featureset_df.sort_values(by=featureset_timstamp, inplace=True)
-
+        left_keys = left_keys or []
+        right_keys = right_keys or []
+        if any(key not in entity_df.columns for key in left_keys):
+            # the join keys are features of a previous feature set
+            entity_df = self._materialize_asof_columns(entity_df)
+        entity_df, state = self._get_asof_state(entity_df, entity_timestamp_column)
+        if not is_datetime64_any_dtype(featureset_df[featureset_timstamp]):
+            featureset_df[featureset_timstamp] = pd.to_datetime(
+                featureset_df[featureset_timstamp]
+            )
         featureset_df = self._normalize_timestamp_column(
             entity_timestamp_column,
             entity_df,
@@ -55,30 +549,69 @@ class LocalFeatureMerger(BaseMerger):
             featureset_name,
         )
 
-        merged_df = pd.merge_asof(
-            entity_df,
-            featureset_df,
-            left_on=entity_timestamp_column,
-            right_on=featureset_timstamp,
-            left_by=left_keys or None,
-            right_by=right_keys or None,
-            suffixes=("", f"_{featureset_name}_"),
+        # columns that already exist in the result would have been suffixed with
+        # `_<featureset_name>_` and dropped from it, so we never materialize them
+        feature_columns = [
+            column
+            for column in featureset_df.columns
+            if column not in entity_df.columns and column not in state.pending_columns
+        ]
+
+        positions = state.asof_positions(
+            entity_df, featureset_df, featureset_timstamp, left_keys, right_keys
         )
-        for col in merged_df.columns:
-            if re.findall(f"_{featureset_name}_$", col):
-                self._append_drop_column(col)
-        # Undo indexing tricks for asof merge
-        # to return the correct indexes and not
-        # overload `index` columns
-        if (
-            "index" not in left_keys
-            and "index" not in right_keys
-            and index_col_not_in_entity
-            and index_col_not_in_featureset
-            and "index" in merged_df.columns
-        ):
-            merged_df.drop(columns="index", inplace=True)
-        return merged_df
+        features_df = (
+            featureset_df[feature_columns].reset_index(drop=True).reindex(positions)
+        )
+        features_df.index = entity_df.index
+        state.add_pending(features_df)
+        return entity_df
+
+    def _get_asof_state(self, entity_df, entity_timestamp_column):
+        """
+        return the (sorted) entity df and its as-of join state, the state is computed once and reused by all the
+        as-of joins of the same entity rows, the joined features are only concatenated to the entity df once
+        """
+        if self._asof_state is not None:
+            cached_df, state = self._asof_state
+            if cached_df is entity_df and state.timestamp_column == (
+                entity_timestamp_column
+            ):
+                return entity_df, state
+
+        if not is_datetime64_any_dtype(entity_df[entity_timestamp_column]):
+            entity_df[entity_timestamp_column] = pd.to_datetime(
+                entity_df[entity_timestamp_column]
+            )
+        if not entity_df[entity_timestamp_column].is_monotonic_increasing:
+            entity_df = entity_df.sort_values(
+                by=entity_timestamp_column, kind="mergesort"
+            )
+        state = _AsofJoinState(
+            entity_timestamp_column, _to_int64_times(entity_df[entity_timestamp_column])
+        )
+        self._asof_state = (entity_df, state)
+        return entity_df, state
+
+    def _materialize_asof_columns(self, df):
+        """
+        concatenate the features of the pending as-of joins of `df` to it, the (possibly sorted) entity df gets a
+        range index either way, like the result of pd.merge_asof
+        """
+        if self._asof_state is None:
+            return df
+        cached_df, state = self._asof_state
+        if cached_df is not df:
+            return df
+        if state.pending_dfs:
+            df = pd.concat([df] + state.pending_dfs, axis=1, copy=False)
+            df.index = pd.RangeIndex(len(df))
+            state.clear_pending()
+        elif not df.index.equals(pd.RangeIndex(len(df))):
+            # the entity df may be the caller's, so it is not modified in place
+            df = df.reset_index(drop=True)
+        self._asof_state = (df, state)
+        return df
 
     def _join(
         self,
@@ -90,6 +623,7 @@ class LocalFeatureMerger(BaseMerger):
         left_keys: list,
         right_keys: list,
     ):
+        entity_df = self._materialize_asof_columns(entity_df)
         merged_df = pd.merge(
             entity_df,
             featureset_df,
@@ -98,8 +632,9 @@ class LocalFeatureMerger(BaseMerger):
             right_on=right_keys,
             suffixes=("", f"_{featureset_name}_"),
         )
+        suffix = f"_{featureset_name}_"
         for col in merged_df.columns:
-            if re.findall(f"_{featureset_name}_$", col):
+            if col.endswith(suffix):
                 self._append_drop_column(col)
         return merged_df
 
@@ -125,6 +660,9 @@ class LocalFeatureMerger(BaseMerger):
         )
         if df.index.names[0]:
             df.reset_index(inplace=True)
+        if self._partition is not None:
+            # the key range filter prunes the parquet row groups, make sure no other rows are left
+            df = df[self._partition_mask(df)]
         return df
 
     def _rename_columns_and_select(self, df, rename_col_dict, columns=None):
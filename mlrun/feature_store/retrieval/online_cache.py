@@ -0,0 +1,161 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import collections
+import threading
+import time
+import typing
+
+import mlrun
+
+_online_caches = {}
+_online_caches_lock = threading.Lock()
+
+
+class OnlineFeaturesCache:
+    """In-process, size bounded LRU cache (with ttl) of the features read by the online feature service
+
+    Entries are addressed by the feature set uri and version, the entity key and the requested features, so the
+    entries of a feature set are never served to a service which was initialized with another version of it (and are
+    dropped when a newer version is registered). Missing keys are cached as well (negative caching), with their own ttl.
+    """
+
+    def __init__(
+        self, max_size: int, ttl: float, negative_ttl: typing.Optional[float] = None
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self._lock = threading.Lock()
+        # (feature set uri, version, key, features) -> (expiration time, features), in least recently used order
+        self._entries = collections.OrderedDict()
+        # feature set uri -> the latest registered version
+        self._versions = {}
+        self._stats = collections.Counter()
+        self._load_seconds = 0.0
+
+    @property
+    def stats(self) -> dict:
+        """cache metrics: hits (and negative hits), misses, evictions, expirations, the number of entries, and the
+        number and mean latency (seconds) of the loads of the misses"""
+        with self._lock:
+            stats = {
+                key: self._stats[key]
+                for key in [
+                    "hits",
+                    "negative_hits",
+                    "misses",
+                    "evictions",
+                    "expirations",
+                    "loads",
+                ]
+            }
+            stats["entries"] = len(self._entries)
+            stats["mean_load_seconds"] = (
+                self._load_seconds / stats["loads"] if stats["loads"] else 0.0
+            )
+        return stats
+
+    def register_version(self, feature_set_uri: str, version: str):
+        """register the version of the feature set which is served, drops the entries of its other versions"""
+        with self._lock:
+            if self._versions.get(feature_set_uri) == version:
+                return
+            self._versions[feature_set_uri] = version
+            for entry_key in list(self._entries.keys()):
+                if entry_key[0] == feature_set_uri and entry_key[1] != version:
+                    del self._entries[entry_key]
+
+    def get_many(
+        self, feature_set_uri: str, version: str, keys: list, features: list[str]
+    ) -> tuple[dict, list]:
+        """look up the features of the keys
+
+        :return: the cached features per key (None for cached missing keys), and the keys which are not cached
+        """
+        features = tuple(features)
+        now = time.monotonic()
+        found, missing = {}, []
+        with self._lock:
+            for key in keys:
+                entry_key = (feature_set_uri, version, key, features)
+                entry = self._entries.get(entry_key)
+                if entry is not None and entry[0] <= now:
+                    del self._entries[entry_key]
+                    self._stats["expirations"] += 1
+                    entry = None
+                if entry is None:
+                    missing.append(key)
+                    continue
+                self._entries.move_to_end(entry_key)
+                found[key] = entry[1]
+                self._stats["negative_hits" if entry[1] is None else "hits"] += 1
+            self._stats["misses"] += len(missing)
+        return found, missing
+
+    def set_many(
+        self,
+        feature_set_uri: str,
+        version: str,
+        features_by_key: dict[typing.Any, typing.Optional[dict]],
+        features: list[str],
+        load_seconds: float = 0.0,
+    ):
+        """cache the loaded features per key (None or empty for missing keys), and the latency of their load"""
+        features = tuple(features)
+        now = time.monotonic()
+        with self._lock:
+            self._stats["loads"] += 1
+            self._load_seconds += load_seconds
+            for key, values in features_by_key.items():
+                ttl = self.ttl if values else self.negative_ttl
+                if ttl <= 0:
+                    continue
+                entry_key = (feature_set_uri, version, key, features)
+                self._entries[entry_key] = (now + ttl, values or None)
+                self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self):
+        """remove all the cache entries and reset the metrics"""
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._stats.clear()
+            self._load_seconds = 0.0
+
+
+def get_online_features_cache() -> typing.Optional[OnlineFeaturesCache]:
+    """return the process wide online features cache, None when caching is disabled (see the
+    feature_store.online_cache config)"""
+    config = mlrun.mlconf.feature_store.online_cache
+    ttl = float(config.ttl or 0)
+    if ttl <= 0:
+        return None
+    negative_ttl = config.negative_ttl
+    key = (
+        int(config.max_size),
+        ttl,
+        None if negative_ttl is None else float(negative_ttl),
+    )
+    with _online_caches_lock:
+        if key not in _online_caches:
+            _online_caches[key] = OnlineFeaturesCache(*key)
+        return _online_caches[key]
+
+
+def feature_set_version(feature_set) -> str:
+    """the version of the feature set, changed when it is stored (e.g. by an ingestion which updates its targets)"""
+    return f"{feature_set.metadata.uid}|{feature_set.metadata.updated}"
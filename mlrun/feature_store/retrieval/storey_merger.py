@@ -18,6 +18,9 @@ from mlrun.serving.server import create_graph_server
 
 from ..feature_vector import OnlineVectorService
 from .base import BaseMerger
+from .online_cache import feature_set_version, get_online_features_cache
+
+_batch_query_module = "mlrun.feature_store.retrieval.batch_query"
 
 
 class StoreyFeatureMerger(BaseMerger):
@@ -34,7 +37,24 @@ class StoreyFeatureMerger(BaseMerger):
         feature_set_fields,
         feature_set_objects,
         fixed_window_type,
+        batched=False,
+        features_cache=None,
     ):
+        """
+        :param batched:        generate a graph which gets a batch of entity rows as a single event (a list of rows)
+                               and queries the features of all the rows together, requires that the vector has no
+                               graph and that its feature sets have no aggregations.
+        :param features_cache: read-through cache of the queried features, used for the feature sets without
+                               aggregations (the values of the aggregation windows change with time).
+        """
+        rename_class, drop_columns_class = (
+            (
+                f"{_batch_query_module}.BatchRename",
+                f"{_batch_query_module}.BatchDropColumns",
+            )
+            if batched
+            else ("storey.Rename", "storey.flow.DropColumns")
+        )
         graph = self.vector.spec.graph.copy()
         start_states, default_final_state, responders = graph.check_and_process_graph(
             allow_empty=True
@@ -82,30 +102,50 @@ class StoreyFeatureMerger(BaseMerger):
             mapping = {k: v for k, v in zip(step.left_keys, entity_list) if k != v}
             if mapping:
                 next = next.to(
-                    "storey.Rename",
+                    rename_class,
                     f"rename-{name}",
                     mapping=mapping,
                 )
 
-            next = next.to(
-                "storey.QueryByKey",
-                f"query-{name}",
-                features=column_names,
-                table=feature_set.uri,
-                key_field=entity_list,
-                aliases=aliases,
-                fixed_window_type=fixed_window_type.to_qbk_fixed_window_type(),
-            )
+            cached = features_cache is not None and not feature_set.spec.aggregations
+            if batched or cached:
+                cache_args = (
+                    {
+                        "cache": features_cache,
+                        "cache_version": feature_set_version(feature_set),
+                    }
+                    if cached
+                    else {}
+                )
+                next = next.to(
+                    f"{_batch_query_module}.BatchQueryByKey",
+                    f"query-{name}",
+                    features=column_names,
+                    table=feature_set.uri,
+                    key_field=entity_list,
+                    aliases=aliases,
+                    **cache_args,
+                )
+            else:
+                next = next.to(
+                    "storey.QueryByKey",
+                    f"query-{name}",
+                    features=column_names,
+                    table=feature_set.uri,
+                    key_field=entity_list,
+                    aliases=aliases,
+                    fixed_window_type=fixed_window_type.to_qbk_fixed_window_type(),
+                )
         if end_aliases:
             # run if the user want to save a column that related to another entity
             next = next.to(
-                "storey.Rename",
+                rename_class,
                 "rename-entity-to-features",
                 mapping=end_aliases,
             )
         if del_columns:
             next = next.to(
-                "storey.flow.DropColumns",
+                drop_columns_class,
                 "drop-unnecessary-columns",
                 columns=del_columns,
             )
@@ -137,6 +177,16 @@ class StoreyFeatureMerger(BaseMerger):
             raise mlrun.errors.MLRunRuntimeError(
                 f"No features found for feature vector '{self.vector.metadata.name}'"
             )
+        # the batched queries don't support aggregations, and the steps of the vector graph expect a row per event
+        batched = (
+            mlrun.mlconf.feature_store.online_batch_retrieval
+            and not self.vector.spec.graph.steps
+            and not any(
+                feature_set.spec.aggregations
+                for feature_set in feature_set_objects.values()
+            )
+        )
+        features_cache = get_online_features_cache()
         (
             graph,
             requested_columns,
@@ -146,6 +196,8 @@ class StoreyFeatureMerger(BaseMerger):
             feature_set_fields,
             feature_set_objects,
             fixed_window_type,
+            batched=batched,
+            features_cache=features_cache,
         )
         graph.set_flow_source(SyncEmitSource())
         server = create_graph_server(graph=graph, parameters={})
@@ -168,6 +220,8 @@ class StoreyFeatureMerger(BaseMerger):
             entity_keys,
             impute_policy=self.impute_policy,
             requested_columns=requested_columns,
+            batched=batched,
+            features_cache=features_cache,
         )
         service.initialize()
 
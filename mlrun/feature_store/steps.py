@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import bisect
 import math
 import re
 import uuid
@@ -149,6 +150,87 @@ class FeaturesetValidator(StepToDict, MLRunStep):
         return event
 
 
+# returned by _Ranges.find for values which are not in any of the ranges
+_no_match = object()
+
+
+class _Ranges:
+    """the ranges of a MapValues column, [min, max) per label, matched in their order in the mapping"""
+
+    def __init__(self, ranges: dict):
+        self.ranges = [
+            (
+                -np.inf if val_range[0] == "-inf" else val_range[0],
+                np.inf if val_range[1] == "inf" else val_range[1],
+                label,
+            )
+            for label, val_range in ranges.items()
+        ]
+        self.labels = pd.Index([label for _, _, label in self.ranges]).to_numpy()
+        # disjoint numeric ranges are kept as sorted bin edges, so the range of a value is found by a binary search
+        self.lows = self.highs = self.order = None
+        # python lists of the sorted bin edges and labels, for the binary search of single values (storey)
+        self._low_list = self._high_list = self._label_list = None
+        try:
+            order = sorted(range(len(self.ranges)), key=lambda i: self.ranges[i][0])
+            lows = np.array([self.ranges[i][0] for i in order], dtype=float)
+            highs = np.array([self.ranges[i][1] for i in order], dtype=float)
+        except (TypeError, ValueError):
+            return
+        if (highs[:-1] <= lows[1:]).all():
+            self.lows, self.highs, self.order = lows, highs, np.array(order, dtype=int)
+            self._low_list, self._high_list = lows.tolist(), highs.tolist()
+            self._label_list = [self.ranges[i][2] for i in order]
+
+    def find(self, value):
+        """the label of the range of the value, _no_match if the value is not in any range"""
+        if self._low_list is not None and isinstance(value, (int, float)):
+            index = bisect.bisect_right(self._low_list, value) - 1
+            if index >= 0 and value < self._high_list[index]:
+                return self._label_list[index]
+            return _no_match
+        for min_val, max_val, label in self.ranges:
+            if value >= min_val and value < max_val:
+                return label
+        return _no_match
+
+    def map_series(self, series: pd.Series) -> np.ndarray:
+        """map the values to the labels of their ranges, values which are not in any range are kept"""
+        values = series.to_numpy()
+        if self.lows is None or not np.issubdtype(values.dtype, np.number):
+            return series.map(
+                lambda value: value
+                if (label := self.find(value)) is _no_match
+                else label
+            ).to_numpy()
+        index = np.searchsorted(self.lows, values, side="right") - 1
+        matched = index >= 0
+        matched[matched] = values[matched] < self.highs[index[matched]]
+        labels = self.labels.take(self.order.take(index[matched]))
+        if matched.all():
+            return labels
+        mapped = values.astype(object)
+        mapped[matched] = labels
+        return pd.Series(mapped).infer_objects().to_numpy()
+
+
+class _LookupTable:
+    """the value map of a MapValues column, as an index of the values and the array of their mapped values"""
+
+    def __init__(self, feature_map: dict):
+        # object dtype, so the values are matched by their hash and equality as in the dict (e.g. 1 matches True)
+        self.index = pd.Index(list(feature_map.keys()), dtype=object)
+        # the last item is the mapped value of the values which are not in the map (get_indexer returns -1)
+        self.mapped_values = np.empty(len(feature_map) + 1, dtype=object)
+        self.mapped_values[:-1] = list(feature_map.values())
+        self.mapped_values[-1] = None
+
+    def map_series(self, series: pd.Series) -> np.ndarray:
+        """map the values, values which are not in the map are set to None"""
+        positions = self.index.get_indexer(series.to_numpy(dtype=object))
+        return pd.Series(self.mapped_values.take(positions)).infer_objects().to_numpy()
+
+
 class MapValues(StepToDict, MLRunStep):
     def __init__(
         self,
@@ -168,6 +250,7 @@ class MapValues(StepToDict, MLRunStep):
             graph.to(MapValues(mapping={"not": {0: 1, 1: 0}}))
 
             # replace by range, use -inf and inf for extended range
+            # (a range includes its min and excludes its max, values which are not in any range are kept)
             graph.to(
                 MapValues(
                     mapping={
@@ -185,17 +268,24 @@ class MapValues(StepToDict, MLRunStep):
         self.mapping = mapping
         self.with_original_features = with_original_features
         self.suffix = suffix
+        # the mappings are compiled once: the ranges to bin edges and the value maps to lookup tables
+        self._ranges = {}
+        self._lookup_tables = {}
+        for feature, feature_map in mapping.items():
+            if self.get_ranges_key() in feature_map:
+                self._ranges[feature] = _Ranges(feature_map[self.get_ranges_key()])
+            elif feature_map:
+                self._lookup_tables[feature] = _LookupTable(feature_map)
 
     def _map_value(self, feature: str, value):
         feature_map = self.mapping.get(feature, {})
 
         # Is this a range replacement?
-        if "ranges" in feature_map:
-            for val, val_range in feature_map.get("ranges", {}).items():
-                min_val = val_range[0] if val_range[0] != "-inf" else -np.inf
-                max_val = val_range[1] if val_range[1] != "inf" else np.inf
-                if value >= min_val and value < max_val:
-                    return val
+        ranges = self._ranges.get(feature)
+        if ranges is not None:
+            label = ranges.find(value)
+            if label is not _no_match:
+                return label
 
         # Is it a regular replacement
         return feature_map.get(value, value)
@@ -218,28 +308,16 @@ class MapValues(StepToDict, MLRunStep):
     def _do_pandas(self, event):
         df = pd.DataFrame(index=event.index)
         for feature in event.columns:
-            feature_map = self.mapping.get(feature, {})
-            if "ranges" in feature_map:
-                # create and apply range map
-                for val, val_range in feature_map.get("ranges", {}).items():
-                    min_val = val_range[0] if val_range[0] != "-inf" else -np.inf
-                    max_val = val_range[1] if val_range[1] != "inf" else np.inf
-                    feature_map["ranges"][val] = [min_val, max_val]
-
-                matchdf = pd.DataFrame.from_dict(
-                    feature_map["ranges"], "index"
-                ).reset_index()
-                matchdf.index = pd.IntervalIndex.from_arrays(
-                    left=matchdf[0], right=matchdf[1], closed="both"
-                )
-                df[self._get_feature_name(feature)] = matchdf.loc[event[feature]][
-                    "index"
-                ].values
-            elif feature_map:
-                # create and apply simple map
-                df[self._get_feature_name(feature)] = event[feature].map(
-                    lambda x: feature_map.get(x, None)
+            if feature in self._ranges:
+                # apply the range map, values which are not in any range are kept
+                df[self._get_feature_name(feature)] = self._ranges[feature].map_series(
+                    event[feature]
                 )
+            elif feature in self._lookup_tables:
+                # apply the simple map, values which are not mapped are set to None
+                df[self._get_feature_name(feature)] = self._lookup_tables[
+                    feature
+                ].map_series(event[feature])
 
         if self.with_original_features:
             df = pd.concat([event, df], axis=1)
@@ -395,7 +473,7 @@ class Imputer(StepToDict, MLRunStep):
         self.default_value = default_value
 
     def _impute(self, feature: str, value: Any):
-        if pd.isna(value):
+        if _is_na(value):
             return self.mapping.get(feature, self.default_value)
         return value
 
@@ -449,19 +527,36 @@ class OneHotEncoder(StepToDict, MLRunStep):
                     )
             # Use OrderedDict to dedup without losing the original order
             mapping[key] = list(OrderedDict.fromkeys(values).keys())
+        # the names of the encoded fields are computed once, per category
+        self._encoded_names = {
+            key: {
+                category: f"{key}_{OneHotEncoder._sanitized_category(category)}"
+                for category in values
+            }
+            for key, values in mapping.items()
+            if values
+        }
+        # the pandas engine names the encoded columns by the sanitized "<column>_<category>"
+        self._encoded_columns = {
+            key: [
+                OneHotEncoder._sanitized_category(f"{key}_{category}")
+                for category in values
+            ]
+            for key, values in mapping.items()
+        }
 
     def _encode(self, feature: str, value):
-        encoding = self.mapping.get(feature, [])
+        encoded_names = self._encoded_names.get(feature)
 
-        if encoding:
-            one_hot_encoding = {
-                f"{feature}_{OneHotEncoder._sanitized_category(category)}": 0
-                for category in encoding
-            }
-            if value in encoding:
-                one_hot_encoding[
-                    f"{feature}_{OneHotEncoder._sanitized_category(value)}"
-                ] = 1
+        if encoded_names:
+            one_hot_encoding = dict.fromkeys(encoded_names.values(), 0)
+            try:
+                encoded_name = encoded_names.get(value)
+            except TypeError:
+                # unhashable values are not categories
+                encoded_name = None
+            if encoded_name is not None:
+                one_hot_encoding[encoded_name] = 1
             elif self.logger:
                 self.logger.warn(
                     f"OneHotEncoder does not have an encoding for value '{value}' of feature '{feature}'"
@@ -474,21 +569,34 @@ class OneHotEncoder(StepToDict, MLRunStep):
         encoded_values = {}
 
         for feature, val in event.items():
-            encoded_values.update(self._encode(feature, val))
+            if feature in self._encoded_names:
+                encoded_values.update(self._encode(feature, val))
+            else:
+                encoded_values[feature] = val
         return encoded_values
 
     def _do_pandas(self, event):
+        encoded = {}
         for key, values in self.mapping.items():
-            event[key] = pd.Categorical(event[key], categories=list(values))
-            encoded = pd.get_dummies(event[key], prefix=key, dtype=np.int64)
-            col_rename = {
-                name: OneHotEncoder._sanitized_category(name)
-                for name in encoded.columns
-            }
-            encoded.rename(columns=col_rename, inplace=True)
-            event = pd.concat([event.loc[:, :key], encoded, event.loc[:, key:]], axis=1)
-        event.drop(columns=list(self.mapping.keys()), inplace=True)
-        return event
+            codes = pd.Categorical(event[key], categories=list(values)).codes
+            # a row per category code, and a last row of zeros for the values which are not categories (code -1)
+            encodings = np.eye(len(values) + 1, len(values), dtype=np.int64)
+            encoded[key] = pd.DataFrame(
+                encodings.take(codes, axis=0),
+                columns=self._encoded_columns[key],
+                index=event.index,
+            )
+
+        # replace each encoded column with its encoding columns, with a single concat
+        parts = []
+        start = 0
+        for position, column in enumerate(event.columns):
+            if column in encoded:
+                parts.append(event.iloc[:, start:position])
+                parts.append(encoded[column])
+                start = position + 1
+        parts.append(event.iloc[:, start:])
+        return pd.concat(parts, axis=1)
 
     def _do_spark(self, event):
         from pyspark.sql.functions import lit, when
@@ -603,12 +711,22 @@ class DateExtractor(StepToDict, MLRunStep):
 
     def _do_pandas(self, event):
         timestamp = self._extract_timestamp(event)
+        accessor = (
+            timestamp.dt
+            if pd.api.types.is_datetime64_any_dtype(timestamp.dtype)
+            else None
+        )
         # Extract specified parts
         for part in self.parts:
-            # Extract part and add it to event
-            event[self._get_key_name(part)] = timestamp.map(
-                lambda x: getattr(pd.Timestamp(x), part)
-            )
+            if accessor is not None and part in _datetime_accessor_parts:
+                # the parts of all the timestamps at once (with int64 ints, as the per timestamp map returns)
+                values = getattr(accessor, part)
+                if pd.api.types.is_integer_dtype(values.dtype):
+                    values = values.astype(np.int64)
+            else:
+                values = timestamp.map(lambda x: getattr(pd.Timestamp(x), part))
+            # Add part to event
+            event[self._get_key_name(part)] = values
         return event
 
     def _do_spark(self, event):
@@ -632,6 +750,44 @@ class DateExtractor(StepToDict, MLRunStep):
         return event
 
 
+# the parts which the pandas datetime accessor (Series.dt) returns as the corresponding Timestamp attributes
+_datetime_accessor_parts = {
+    "year",
+    "month",
+    "day",
+    "hour",
+    "minute",
+    "second",
+    "microsecond",
+    "nanosecond",
+    "dayofweek",
+    "day_of_week",
+    "weekday",
+    "dayofyear",
+    "day_of_year",
+    "quarter",
+    "days_in_month",
+    "daysinmonth",
+    "is_leap_year",
+    "is_month_end",
+    "is_month_start",
+    "is_quarter_end",
+    "is_quarter_start",
+    "is_year_end",
+    "is_year_start",
+}
+
+
+def _is_na(value) -> bool:
+    """pd.isna of a scalar, with fast paths for the common python types"""
+    value_type = type(value)
+    if value_type is float:
+        return value != value
+    if value_type is str or value_type is int or value_type is bool:
+        return False
+    return pd.isna(value)
+
+
 class SetEventMetadata(MapClass):
     def __init__(
         self,
@@ -30,8 +30,16 @@ from mlrun.common.model_monitoring.helpers import FeatureStats, pad_features_his
 from mlrun.model_monitoring.helpers import (
     calculate_inputs_statistics,
     get_endpoint_record,
+    get_monitoring_parquet_path,
+    get_monitoring_sketches_path,
 )
 from mlrun.model_monitoring.model_endpoint import ModelEndpoint
+from mlrun.model_monitoring.sketches import (
+    SketchStore,
+    merge_sketches,
+    sketch_values,
+    sketches_to_stats,
+)
 
 
 class MonitoringApplicationContext:
@@ -132,26 +140,31 @@ class MonitoringApplicationContext:
     @property
     def sample_df(self) -> pd.DataFrame:
         if self._sample_df is None:
-            feature_set = fstore.get_feature_set(
-                self.model_endpoint.status.monitoring_feature_set_uri
-            )
-            features = [f"{feature_set.metadata.name}.*"]
-            vector = fstore.FeatureVector(
-                name=f"{self.endpoint_id}_vector",
-                features=features,
-                with_indexes=True,
+            self._sample_df = self._get_offline_df(
+                self.start_infer_time, self.end_infer_time
             )
-            vector.metadata.tag = self.application_name
-            vector.feature_set_objects = {feature_set.metadata.name: feature_set}
-
-            offline_response = vector.get_offline_features(
-                start_time=self.start_infer_time,
-                end_time=self.end_infer_time,
-                timestamp_for_filtering=mm_constants.FeatureSetFeatures.time_stamp(),
-            )
-            self._sample_df = offline_response.to_dataframe().reset_index(drop=True)
         return self._sample_df
 
+    def _get_offline_df(self, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        feature_set = fstore.get_feature_set(
+            self.model_endpoint.status.monitoring_feature_set_uri
+        )
+        features = [f"{feature_set.metadata.name}.*"]
+        vector = fstore.FeatureVector(
+            name=f"{self.endpoint_id}_vector",
+            features=features,
+            with_indexes=True,
+        )
+        vector.metadata.tag = self.application_name
+        vector.feature_set_objects = {feature_set.metadata.name: feature_set}
+
+        offline_response = vector.get_offline_features(
+            start_time=start,
+            end_time=end,
+            timestamp_for_filtering=mm_constants.FeatureSetFeatures.time_stamp(),
+        )
+        return offline_response.to_dataframe().reset_index(drop=True)
+
     @property
     def model_endpoint(self) -> ModelEndpoint:
         if not self._model_endpoint:
@@ -170,12 +183,72 @@ class MonitoringApplicationContext:
     @property
     def sample_df_stats(self) -> FeatureStats:
         """statistics of the sample dataframe"""
+        if not self._sample_df_stats:
+            self._sample_df_stats = self._get_sketches_stats()
         if not self._sample_df_stats:
             self._sample_df_stats = calculate_inputs_statistics(
                 self.feature_stats, self.sample_df
             )
         return self._sample_df_stats
 
+    def _get_sketches_stats(self) -> Optional[FeatureStats]:
+        """
+        Get the statistics of the window by merging the feature sketches which are maintained by the monitoring
+        stream, only the events at the edges of the window, which are not covered by whole sketches buckets, are read.
+        The quantiles are estimated from the histograms. Returns None when the sketches are not available (disabled,
+        not written yet, or sketched over other reference bins), or the sample DataFrame was already read.
+        """
+        if (
+            self._sample_df is not None
+            or not mlrun.mlconf.model_endpoint_monitoring.sketches_bucket_secs
+        ):
+            return None
+        try:
+            store = SketchStore(
+                get_monitoring_sketches_path(get_monitoring_parquet_path(self.project))
+            )
+            window = store.read_window(
+                self.endpoint_id,
+                self.start_infer_time.timestamp(),
+                self.end_infer_time.timestamp(),
+            )
+            if window is None:
+                return None
+            sketches, covered_start, covered_end = window
+            feature_stats = self.feature_stats
+            for feature, sketch in sketches.items():
+                if (
+                    sketch.bins
+                    != feature_stats.get(feature, {}).get("hist", [[], []])[1]
+                ):
+                    return None
+
+            tz = self.start_infer_time.tz
+            for start, end in [
+                (
+                    self.start_infer_time,
+                    pd.Timestamp(covered_start, unit="s", tz=tz)
+                    - pd.Timedelta(microseconds=1),
+                ),
+                (pd.Timestamp(covered_end, unit="s", tz=tz), self.end_infer_time),
+            ]:
+                if start < end:
+                    merge_sketches(
+                        sketches,
+                        sketch_values(feature_stats, self._get_offline_df(start, end)),
+                    )
+        except Exception as exc:
+            self.logger.warning(
+                "Failed to get the window statistics from the feature sketches",
+                endpoint_id=self.endpoint_id,
+                exc=mlrun.errors.err_to_str(exc),
+            )
+            return None
+
+        if not any(sketch.count for sketch in sketches.values()):
+            return None
+        return sketches_to_stats(sketches)
+
     @property
     def feature_names(self) -> list[str]:
         """The feature names of the model"""
@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import concurrent.futures
 import datetime
+import itertools
 import json
 import os
 import re
+import threading
 from collections.abc import Iterator
 from typing import NamedTuple, Optional, Union, cast
 
@@ -117,28 +120,39 @@ class _BatchWindow:
             last_analyzed=last_analyzed,
         )
 
+    @property
+    def last_analyzed(self) -> Optional[int]:
+        """The end time of the last analyzed interval, in seconds since the epoch."""
+        return self._start
+
     def get_intervals(
         self,
     ) -> Iterator[_Interval]:
-        """Generate the batch interval time ranges."""
+        """
+        Generate the batch interval time ranges. The last analyzed time is updated once each interval is consumed.
+        """
+        for interval in self.list_intervals():
+            yield interval
+            self._update_last_analyzed(int(interval.end.timestamp()))
+
+    def list_intervals(self) -> list[_Interval]:
+        """List the batch interval time ranges, without updating the last analyzed time."""
+        intervals = []
         if self._start is not None and self._stop is not None:
-            entered = False
             # Iterate timestamp from start until timestamp <= stop - step
             # so that the last interval will end at (timestamp + step) <= stop.
             # Add 1 to stop - step to get <= and not <.
             for timestamp in range(
                 self._start, self._stop - self._step + 1, self._step
             ):
-                entered = True
                 start_time = datetime.datetime.fromtimestamp(
                     timestamp, tz=datetime.timezone.utc
                 )
                 end_time = datetime.datetime.fromtimestamp(
                     timestamp + self._step, tz=datetime.timezone.utc
                 )
-                yield _Interval(start_time, end_time)
-                self._update_last_analyzed(timestamp + self._step)
-            if not entered:
+                intervals.append(_Interval(start_time, end_time))
+            if not intervals:
                 logger.info(
                     "All the data is set, but no complete intervals were found. "
                     "Wait for last_updated to be updated",
@@ -157,6 +171,12 @@ class _BatchWindow:
                 start=self._start,
                 stop=self._stop,
             )
+        return intervals
+
+    def update_last_analyzed(self, interval: _Interval) -> None:
+        """Mark the interval as analyzed."""
+        self._start = int(interval.end.timestamp())
+        self._update_last_analyzed(self._start)
 
 
 class _BatchWindowGenerator:
@@ -289,6 +309,12 @@ class MonitoringApplicationController:
         self.tsdb_connector = mlrun.model_monitoring.get_tsdb_connector(
             project=self.project
         )
+        self._max_workers = int(
+            mlrun.mlconf.model_endpoint_monitoring.controller_max_workers
+        )
+        # The stream pushers are reused between the pushes of the same application
+        self._stream_pushers = {}
+        self._stream_pushers_lock = threading.Lock()
 
     @staticmethod
     def _get_model_monitoring_access_key() -> Optional[str]:
@@ -298,15 +324,19 @@ class MonitoringApplicationController:
             access_key = mlrun.mlconf.get_v3io_access_key()
         return access_key
 
-    def run(self) -> None:
+    def run(self) -> Optional[dict]:
         """
         Main method for run all the relevant monitoring applications on each endpoint.
         This method handles the following:
         1. List model endpoints
         2. List applications
         3. Check model monitoring windows
-        4. Send data to applications
-        5. Delete old parquets
+        4. Check which windows have data, with a single TSDB query per window for all the endpoints
+        5. Send data to applications, each endpoint and application batch windows are processed by a dedicated task
+
+        :returns: The run statistics - the number of processed batch windows, pushed intervals and failures, and the
+                  controller lag: the maximal time (seconds) between now and the last analyzed time of an endpoint
+                  and application. None if there is nothing to process.
         """
         logger.info("Start running monitoring controller")
         try:
@@ -348,108 +378,188 @@ class MonitoringApplicationController:
                 exc=err_to_str(e),
             )
             return
-        # Initialize a process pool that will be used to run each endpoint applications on a dedicated process
+
+        endpoints = [endpoint for endpoint in endpoints if self._is_monitored(endpoint)]
+        if not endpoints:
+            logger.info("No monitored model endpoints found", project=self.project)
+            return
+
         with concurrent.futures.ThreadPoolExecutor(
-            max_workers=min(len(endpoints), 10),
+            max_workers=self._max_workers
         ) as pool:
-            for endpoint in endpoints:
-                if (
-                    endpoint[mm_constants.EventFieldType.ACTIVE]
-                    and endpoint[mm_constants.EventFieldType.MONITORING_MODE]
-                    == mm_constants.ModelMonitoringMode.enabled.value
-                ):
-                    # Skip router endpoint:
-                    if (
-                        int(endpoint[mm_constants.EventFieldType.ENDPOINT_TYPE])
-                        == mm_constants.EndpointType.ROUTER
-                    ):
-                        # Router endpoint has no feature stats
-                        logger.info(
-                            f"{endpoint[mm_constants.EventFieldType.UID]} is router, skipping"
+            # The last analyzed time of each endpoint and application is read concurrently
+            batch_windows = [
+                batch_window
+                for batch_window in pool.map(
+                    lambda args: self._get_batch_window(*args),
+                    itertools.product(endpoints, applications_names),
+                )
+                if batch_window
+            ]
+
+            # The intervals of endpoints without a stream are always pushed, the rest are checked for data with a
+            # single query per interval for all the endpoints
+            interval_endpoints = collections.defaultdict(set)
+            for endpoint, _, _, intervals in batch_windows:
+                if _has_stream(endpoint):
+                    for interval in intervals:
+                        interval_endpoints[interval].add(
+                            endpoint[mm_constants.EventFieldType.UID]
                         )
-                        continue
-                    pool.submit(
-                        MonitoringApplicationController.model_endpoint_process,
-                        endpoint=endpoint,
-                        applications_names=applications_names,
-                        batch_window_generator=self._batch_window_generator,
-                        project=self.project,
-                        model_monitoring_access_key=self.model_monitoring_access_key,
-                        tsdb_connector=self.tsdb_connector,
-                    )
+            endpoints_with_data = dict(
+                zip(
+                    interval_endpoints.keys(),
+                    pool.map(
+                        lambda args: self._get_endpoints_with_data(*args),
+                        interval_endpoints.items(),
+                    ),
+                )
+            )
 
-    @classmethod
-    def model_endpoint_process(
-        cls,
+            stats = collections.Counter(batch_windows=len(batch_windows))
+            last_analyzed_times = []
+            for last_analyzed, pushed, failed in pool.map(
+                lambda args: self._process_batch_window(
+                    *args, endpoints_with_data=endpoints_with_data
+                ),
+                batch_windows,
+            ):
+                stats["pushed_intervals"] += pushed
+                stats["failed_batch_windows"] += failed
+                if last_analyzed is not None:
+                    last_analyzed_times.append(last_analyzed)
+
+        stats = dict(stats, tsdb_queries=len(interval_endpoints))
+        if last_analyzed_times:
+            stats["lag_seconds"] = int(datetime_now().timestamp()) - min(
+                last_analyzed_times
+            )
+        logger.info("Monitoring controller run completed", **stats)
+        return stats
+
+    @staticmethod
+    def _is_monitored(endpoint: dict) -> bool:
+        if not (
+            endpoint[mm_constants.EventFieldType.ACTIVE]
+            and endpoint[mm_constants.EventFieldType.MONITORING_MODE]
+            == mm_constants.ModelMonitoringMode.enabled.value
+        ):
+            return False
+        # Skip router endpoint:
+        if (
+            int(endpoint[mm_constants.EventFieldType.ENDPOINT_TYPE])
+            == mm_constants.EndpointType.ROUTER
+        ):
+            # Router endpoint has no feature stats
+            logger.info(
+                f"{endpoint[mm_constants.EventFieldType.UID]} is router, skipping"
+            )
+            return False
+        return True
+
+    def _get_batch_window(
+        self, endpoint: dict, application: str
+    ) -> Optional[tuple[dict, str, _BatchWindow, list[_Interval]]]:
+        try:
+            batch_window = self._batch_window_generator.get_batch_window(
+                project=self.project,
+                endpoint=endpoint[mm_constants.EventFieldType.UID],
+                application=application,
+                first_request=endpoint[mm_constants.EventFieldType.FIRST_REQUEST],
+                last_request=endpoint[mm_constants.EventFieldType.LAST_REQUEST],
+                has_stream=_has_stream(endpoint),
+            )
+            return endpoint, application, batch_window, batch_window.list_intervals()
+        except Exception:
+            logger.exception(
+                "Failed to get the batch window",
+                endpoint_id=endpoint[mm_constants.EventFieldType.UID],
+                application=application,
+            )
+
+    def _get_endpoints_with_data(
+        self, interval: _Interval, endpoint_ids: set[str]
+    ) -> Optional[set[str]]:
+        try:
+            return self.tsdb_connector.get_endpoints_with_predictions(
+                endpoint_ids=sorted(endpoint_ids),
+                start=interval.start,
+                end=interval.end,
+            )
+        except Exception:
+            logger.exception(
+                "Failed to check the endpoints data for the given interval",
+                start=interval.start,
+                end=interval.end,
+            )
+
+    def _process_batch_window(
+        self,
         endpoint: dict,
-        applications_names: list[str],
-        batch_window_generator: _BatchWindowGenerator,
-        project: str,
-        model_monitoring_access_key: str,
-        tsdb_connector: mlrun.model_monitoring.db.tsdb.TSDBConnector,
-    ) -> None:
+        application: str,
+        batch_window: _BatchWindow,
+        intervals: list[_Interval],
+        endpoints_with_data: dict[_Interval, Optional[set[str]]],
+    ) -> tuple[Optional[int], int, bool]:
         """
-        Process a model endpoint and trigger the monitoring applications. This function running on different process
-        for each endpoint. In addition, this function will generate a parquet file that includes the relevant data
-        for a specific time range.
-
-        :param endpoint:                    (dict) Model endpoint record.
-        :param applications_names:          (list[str]) List of application names to push results to.
-        :param batch_window_generator:      (_BatchWindowGenerator) An object that generates _BatchWindow objects.
-        :param project:                     (str) Project name.
-        :param model_monitoring_access_key: (str) Access key to apply the model monitoring process.
-        :param tsdb_connector:              (mlrun.model_monitoring.db.tsdb.TSDBConnector) TSDB connector
+        Push the intervals of an endpoint and application batch window to the application, in order.
+
+        :returns: The last analyzed time, the number of pushed intervals and whether the processing failed.
         """
         endpoint_id = endpoint[mm_constants.EventFieldType.UID]
-        # if false the endpoint represent batch infer step.
-        has_stream = endpoint[mm_constants.EventFieldType.STREAM_PATH] != ""
+        has_stream = _has_stream(endpoint)
+        pushed = 0
         try:
-            for application in applications_names:
-                batch_window = batch_window_generator.get_batch_window(
-                    project=project,
-                    endpoint=endpoint_id,
-                    application=application,
-                    first_request=endpoint[mm_constants.EventFieldType.FIRST_REQUEST],
-                    last_request=endpoint[mm_constants.EventFieldType.LAST_REQUEST],
-                    has_stream=has_stream,
-                )
-
-                for start_infer_time, end_infer_time in batch_window.get_intervals():
-                    prediction_metric = tsdb_connector.read_predictions(
-                        endpoint_id=endpoint_id,
-                        start=start_infer_time,
-                        end=end_infer_time,
-                    )
-                    if not prediction_metric.data and has_stream:
+            for interval in intervals:
+                if has_stream:
+                    interval_endpoints = endpoints_with_data.get(interval)
+                    if interval_endpoints is None:
+                        # The data check failed, retry this interval on the next run
+                        return batch_window.last_analyzed, pushed, True
+                    if endpoint_id not in interval_endpoints:
                         logger.info(
                             "No data found for the given interval",
-                            start=start_infer_time,
-                            end=end_infer_time,
-                            endpoint_id=endpoint_id,
-                        )
-                    else:
-                        logger.info(
-                            "Data found for the given interval",
-                            start=start_infer_time,
-                            end=end_infer_time,
-                            endpoint_id=endpoint_id,
-                        )
-                        cls._push_to_applications(
-                            start_infer_time=start_infer_time,
-                            end_infer_time=end_infer_time,
+                            start=interval.start,
+                            end=interval.end,
                             endpoint_id=endpoint_id,
-                            project=project,
-                            applications_names=[application],
-                            model_monitoring_access_key=model_monitoring_access_key,
                         )
+                        batch_window.update_last_analyzed(interval)
+                        continue
+                logger.info(
+                    "Data found for the given interval",
+                    start=interval.start,
+                    end=interval.end,
+                    endpoint_id=endpoint_id,
+                )
+                self._push_to_applications(
+                    start_infer_time=interval.start,
+                    end_infer_time=interval.end,
+                    endpoint_id=endpoint_id,
+                    project=self.project,
+                    applications_names=[application],
+                    model_monitoring_access_key=self.model_monitoring_access_key,
+                )
+                pushed += 1
+                batch_window.update_last_analyzed(interval)
         except Exception:
             logger.exception(
                 "Encountered an exception",
-                endpoint_id=endpoint[mm_constants.EventFieldType.UID],
+                endpoint_id=endpoint_id,
+                application=application,
             )
+            return batch_window.last_analyzed, pushed, True
+        return batch_window.last_analyzed, pushed, False
+
+    def _get_stream_pusher(self, stream_uri: str):
+        with self._stream_pushers_lock:
+            if stream_uri not in self._stream_pushers:
+                self._stream_pushers[stream_uri] = get_stream_pusher(
+                    stream_uri, access_key=self.model_monitoring_access_key
+                )
+            return self._stream_pushers[stream_uri]
 
-    @staticmethod
     def _push_to_applications(
+        self,
         start_infer_time: datetime.datetime,
         end_infer_time: datetime.datetime,
         endpoint_id: str,
@@ -488,9 +598,12 @@ class MonitoringApplicationController:
             logger.info(
                 f"push endpoint_id {endpoint_id} to {app_name} by stream :{stream_uri}"
             )
-            get_stream_pusher(stream_uri, access_key=model_monitoring_access_key).push(
-                [data]
-            )
+            self._get_stream_pusher(stream_uri).push([data])
+
+
+def _has_stream(endpoint: dict) -> bool:
+    # if false the endpoint represent batch infer step.
+    return endpoint[mm_constants.EventFieldType.STREAM_PATH] != ""
 
 
 def handler(context: nuclio.Context, event: nuclio.Event) -> None:
@@ -190,6 +190,29 @@ class TSDBConnector(ABC):
         :return:                   Metric values object or no data object.
         """
 
+    def get_endpoints_with_predictions(
+        self,
+        endpoint_ids: list[str],
+        start: datetime,
+        end: datetime,
+    ) -> set[str]:
+        """
+        Check which of the provided model endpoints were invoked in the given time range. This default implementation
+        reads the predictions of each endpoint, connectors which can check all the endpoints in a single query
+        override it.
+
+        :param endpoint_ids: A list of model endpoint identifiers.
+        :param start:        The start time of the query.
+        :param end:          The end time of the query.
+
+        :return: The identifiers of the endpoints which have predictions in the time range.
+        """
+        return {
+            endpoint_id
+            for endpoint_id in endpoint_ids
+            if self.read_predictions(endpoint_id=endpoint_id, start=start, end=end).data
+        }
+
     @abstractmethod
     def get_last_request(
         self,
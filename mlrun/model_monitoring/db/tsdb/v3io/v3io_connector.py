@@ -697,6 +697,27 @@ class V3IOTSDBConnector(TSDBConnector):
             ),  # pyright: ignore[reportArgumentType]
         )
 
+    def get_endpoints_with_predictions(
+        self,
+        endpoint_ids: list[str],
+        start: datetime,
+        end: datetime,
+    ) -> set[str]:
+        if not endpoint_ids:
+            return set()
+        df = self._get_records(
+            table=mm_schemas.FileTargetKind.PREDICTIONS,
+            start=start,
+            end=end,
+            columns=[mm_schemas.EventFieldType.LATENCY],
+            filter_query=f"endpoint_id IN({str(endpoint_ids)[1:-1]})",
+            agg_funcs=["count"],
+        )
+        if df.empty:
+            return set()
+        df = df[df[f"count({mm_schemas.EventFieldType.LATENCY})"] > 0]
+        return set(df[mm_schemas.EventFieldType.ENDPOINT_ID])
+
     def get_last_request(
         self,
         endpoint_ids: Union[str, list[str]],
@@ -98,6 +98,16 @@ def get_monitoring_parquet_path(
     return parquet_path
 
 
+def get_monitoring_sketches_path(parquet_path: str) -> str:
+    """Get the path of the model endpoints feature sketches, next to the monitoring parquet target path.
+
+    :param parquet_path: The monitoring parquet target path (see `get_monitoring_parquet_path`).
+
+    :return:             Feature sketches path.
+    """
+    return f"{parquet_path.rstrip('/').rsplit('/', 1)[0]}/{mm_constants.FileTargetKind.SKETCHES}"
+
+
 def get_connection_string(secret_provider: typing.Callable[[str], str] = None) -> str:
     """Get endpoint store connection string from the project secret. If wasn't set, take it from the system
     configurations.
@@ -0,0 +1,305 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import json
+import math
+import typing
+import uuid
+
+import numpy as np
+import pandas as pd
+
+import mlrun
+import mlrun.errors
+from mlrun.common.model_monitoring.helpers import FeatureStats
+from mlrun.utils import logger
+
+_WATERMARKS_DIR = "watermarks"
+
+
+class FeatureSketch:
+    """
+    Mergeable summary of the values of a numeric feature: the count, mean and sum of squared deviations from the
+    mean (for the standard deviation), min, max and the counts over fixed histogram bins (the reference data bins).
+    The sketches of disjoint sets of values are merged into the sketch of their union, without the values.
+    """
+
+    def __init__(
+        self,
+        bins: list[float],
+        count: int = 0,
+        mean: float = 0.0,
+        m2: float = 0.0,
+        min: float = math.inf,
+        max: float = -math.inf,
+        hist: typing.Optional[list[int]] = None,
+    ) -> None:
+        self.bins = list(bins)
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.min = min
+        self.max = max
+        self.hist = list(hist) if hist is not None else [0] * (len(self.bins) - 1)
+
+    def update(self, values: typing.Iterable) -> None:
+        """Add values to the sketch, missing and non-numeric values are ignored (like in `DataFrame.describe`)"""
+        values = (
+            pd.to_numeric(pd.Series(values, dtype=object), errors="coerce")
+            .dropna()
+            .to_numpy(dtype=float)
+        )
+        if not len(values):
+            return
+        mean = values.mean()
+        counts, _ = np.histogram(values, bins=self.bins)
+        self.merge(
+            FeatureSketch(
+                self.bins,
+                count=len(values),
+                mean=float(mean),
+                m2=float(np.square(values - mean).sum()),
+                min=float(values.min()),
+                max=float(values.max()),
+                hist=counts.tolist(),
+            )
+        )
+
+    def merge(self, other: "FeatureSketch") -> None:
+        """Merge another sketch of the same feature (and bins) into this sketch"""
+        if other.bins != self.bins:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Cannot merge feature sketches with different histogram bins"
+            )
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta**2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.hist = [a + b for a, b in zip(self.hist, other.hist)]
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by a linear interpolation over the histogram bins, clipped to the min and max"""
+        if not self.count:
+            return math.nan
+        rank = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.hist):
+            if count and cumulative + count >= rank:
+                start = max(self.bins[index], self.min)
+                end = min(self.bins[index + 1], self.max)
+                return float(start + (end - start) * (rank - cumulative) / count)
+            cumulative += count
+        return float(self.max)
+
+    def to_stats(self) -> dict:
+        """The feature statistics, in the format of `DFDataInfer.get_stats` with a histogram"""
+        # a sketch without values has infinite min and max, its statistics are NaN (like in `DataFrame.describe`)
+        stats = {"count": self.count, "mean": self.mean if self.count else math.nan}
+        if self.count > 1:
+            stats["std"] = math.sqrt(self.m2 / (self.count - 1))
+        stats["min"] = self.min if self.count else math.nan
+        for q in [0.25, 0.5, 0.75]:
+            stats[f"{int(q * 100)}%"] = self.quantile(q)
+        stats["max"] = self.max if self.count else math.nan
+        stats["hist"] = [list(self.hist), list(self.bins)]
+        return stats
+
+    def to_dict(self) -> dict:
+        return {
+            "bins": self.bins,
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min,
+            "max": self.max,
+            "hist": self.hist,
+        }
+
+    @classmethod
+    def from_dict(cls, struct: dict) -> "FeatureSketch":
+        return cls(**struct)
+
+
+def sketch_values(
+    feature_stats: FeatureStats, values: dict[str, typing.Iterable]
+) -> dict[str, FeatureSketch]:
+    """
+    Sketch the values of the features which have a histogram in the reference statistics.
+
+    :param feature_stats: The reference statistics, their histograms bins are used for the sketches.
+    :param values:        Feature name to its values, e.g. a DataFrame.
+
+    :returns: Feature name to its sketch.
+    """
+    sketches = {}
+    for feature, feature_values in values.items():
+        if "hist" in feature_stats.get(feature, {}):
+            sketch = FeatureSketch(feature_stats[feature]["hist"][1])
+            sketch.update(feature_values)
+            sketches[feature] = sketch
+    return sketches
+
+
+def merge_sketches(
+    sketches: dict[str, FeatureSketch], other: dict[str, FeatureSketch]
+) -> dict[str, FeatureSketch]:
+    """Merge the feature sketches of other into sketches (in place), and return sketches"""
+    for feature, sketch in other.items():
+        if feature in sketches:
+            sketches[feature].merge(sketch)
+        else:
+            sketches[feature] = FeatureSketch.from_dict(sketch.to_dict())
+    return sketches
+
+
+def sketches_to_stats(sketches: dict[str, FeatureSketch]) -> FeatureStats:
+    """Convert feature sketches to the statistics format of `calculate_inputs_statistics`"""
+    return {feature: sketch.to_stats() for feature, sketch in sketches.items()}
+
+
+class SketchStore:
+    """
+    Feature sketches of model endpoints, in time buckets of a fixed length. Each written bucket file holds the
+    sketches of the values of the bucket which were processed by one writer since its previous write, so the sketches
+    of a bucket are the merge of its files. The watermark of a writer is the time until which it wrote all its buckets
+    of the endpoint, and the watermark of the endpoint is the minimal watermark of its writers: a bucket which ends
+    before it and has no files had no events.
+    A writer whose watermark lags the latest watermark of the endpoint by more than the writer timeout is considered
+    gone (e.g. a restarted stream processing worker), and is ignored.
+
+    Layout: <path>/<endpoint_id>/<yyyy-mm-dd>/<bucket_start>-<writer>-<sequence>.json and
+    <path>/<endpoint_id>/watermarks/<writer>.json
+    """
+
+    def __init__(
+        self, path: str, bucket_seconds: int = 60, writer_timeout: int = 600
+    ) -> None:
+        self.path = path.rstrip("/")
+        self.bucket_seconds = bucket_seconds
+        self.writer_timeout = writer_timeout
+        self._writer = uuid.uuid4().hex[:8]
+        self._sequence = 0
+
+    def bucket_start(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_seconds * self.bucket_seconds)
+
+    def write_bucket(
+        self, endpoint_id: str, bucket_start: int, sketches: dict[str, FeatureSketch]
+    ) -> None:
+        self._sequence += 1
+        path = (
+            f"{self._bucket_dir(endpoint_id, bucket_start)}/"
+            f"{bucket_start}-{self._writer}-{self._sequence}.json"
+        )
+        body = {feature: sketch.to_dict() for feature, sketch in sketches.items()}
+        mlrun.get_dataitem(path).put(json.dumps(body))
+
+    def write_watermark(self, endpoint_id: str, watermark: int) -> None:
+        mlrun.get_dataitem(
+            f"{self.path}/{endpoint_id}/{_WATERMARKS_DIR}/{self._writer}.json"
+        ).put(
+            json.dumps({"watermark": watermark, "bucket_seconds": self.bucket_seconds})
+        )
+
+    def read_watermark(self, endpoint_id: str) -> typing.Optional[tuple[int, int]]:
+        """
+        Read the watermark of an endpoint, the minimal watermark of its (not timed out) writers.
+
+        :returns: The watermark and the bucket length of the endpoint sketches, None if no watermark was written.
+        """
+        watermarks_dir = f"{self.path}/{endpoint_id}/{_WATERMARKS_DIR}"
+        try:
+            files = mlrun.get_dataitem(watermarks_dir).listdir()
+        except (FileNotFoundError, mlrun.errors.MLRunNotFoundError):
+            return None
+        watermarks = []
+        for file in files:
+            try:
+                watermarks.append(
+                    json.loads(mlrun.get_dataitem(f"{watermarks_dir}/{file}").get())
+                )
+            except (FileNotFoundError, mlrun.errors.MLRunNotFoundError):
+                continue
+        if not watermarks:
+            return None
+        latest = max(watermark["watermark"] for watermark in watermarks)
+        watermark = min(
+            watermark["watermark"]
+            for watermark in watermarks
+            if watermark["watermark"] >= latest - self.writer_timeout
+        )
+        return watermark, watermarks[0]["bucket_seconds"]
+
+    def read_window(
+        self, endpoint_id: str, start: float, end: float
+    ) -> typing.Optional[tuple[dict[str, FeatureSketch], int, int]]:
+        """
+        Read and merge the sketches of the whole buckets within a time window.
+
+        :param endpoint_id: The model endpoint identifier.
+        :param start:       The window start time (seconds since the epoch).
+        :param end:         The window end time (seconds since the epoch).
+
+        :returns: The merged sketches and the time range [start, end) they cover, None if the buckets of the window
+                  were not all written yet, or the window does not contain a whole bucket.
+        """
+        endpoint_watermark = self.read_watermark(endpoint_id)
+        if endpoint_watermark is None:
+            return None
+        watermark, bucket_seconds = endpoint_watermark
+        covered_start = math.ceil(start / bucket_seconds) * bucket_seconds
+        covered_end = int(end // bucket_seconds * bucket_seconds)
+        if covered_start >= covered_end or watermark < covered_end:
+            return None
+
+        sketches = {}
+        day = datetime.datetime.fromtimestamp(covered_start, tz=datetime.timezone.utc)
+        last_day = datetime.datetime.fromtimestamp(
+            covered_end - 1, tz=datetime.timezone.utc
+        )
+        while day.date() <= last_day.date():
+            day_dir = f"{self.path}/{endpoint_id}/{day.date().isoformat()}"
+            try:
+                files = mlrun.get_dataitem(day_dir).listdir()
+            except (FileNotFoundError, mlrun.errors.MLRunNotFoundError):
+                files = []
+            for file in files:
+                bucket_start = int(file.rsplit("/", 1)[-1].split("-", 1)[0])
+                if covered_start <= bucket_start < covered_end:
+                    body = json.loads(mlrun.get_dataitem(f"{day_dir}/{file}").get())
+                    merge_sketches(
+                        sketches,
+                        {
+                            feature: FeatureSketch.from_dict(struct)
+                            for feature, struct in body.items()
+                        },
+                    )
+            day += datetime.timedelta(days=1)
+        logger.debug(
+            "Read the feature sketches of the window",
+            endpoint_id=endpoint_id,
+            start=covered_start,
+            end=covered_end,
+        )
+        return sketches, covered_start, covered_end
+
+    def _bucket_dir(self, endpoint_id: str, bucket_start: int) -> str:
+        day = datetime.datetime.fromtimestamp(bucket_start, tz=datetime.timezone.utc)
+        return f"{self.path}/{endpoint_id}/{day.date().isoformat()}"
@@ -18,6 +18,7 @@ import json
 import os
 import typing
 
+import numpy as np
 import storey
 
 import mlrun
@@ -27,6 +28,8 @@ import mlrun.datastore.targets
 import mlrun.feature_store as fstore
 import mlrun.feature_store.steps
 import mlrun.model_monitoring.db
+import mlrun.model_monitoring.helpers
+import mlrun.model_monitoring.sketches
 import mlrun.serving.states
 import mlrun.utils
 from mlrun.common.schemas.model_monitoring.constants import (
@@ -52,6 +55,7 @@ class EventStreamProcessor:
         aggregate_windows: typing.Optional[list[str]] = None,
         aggregate_period: str = "5m",
         model_monitoring_access_key: str = None,
+        sketches_bucket_secs: typing.Optional[int] = None,
     ):
         # General configurations, mainly used for the storey steps in the future serving graph
         self.project = project
@@ -63,6 +67,18 @@ class EventStreamProcessor:
         self.parquet_batching_max_events = parquet_batching_max_events
         self.parquet_batching_timeout_secs = parquet_batching_timeout_secs
 
+        # Feature sketches, next to the parquet target
+        self.sketches_path = (
+            mlrun.model_monitoring.helpers.get_monitoring_sketches_path(
+                self.parquet_path
+            )
+        )
+        self.sketches_bucket_secs = int(
+            mlrun.mlconf.model_endpoint_monitoring.sketches_bucket_secs
+            if sketches_bucket_secs is None
+            else sketches_bucket_secs
+        )
+
         logger.info(
             "Initializing model monitoring event stream processor",
             parquet_path=self.parquet_path,
@@ -234,6 +250,20 @@ class EventStreamProcessor:
 
         apply_map_feature_names()
 
+        # Maintain the feature sketches of each endpoint, used by the monitoring applications for the window statistics
+        def apply_update_feature_sketches():
+            graph.add_step(
+                "UpdateFeatureSketches",
+                name="UpdateFeatureSketches",
+                after="MapFeatureNames",
+                project=self.project,
+                sketches_path=self.sketches_path,
+                bucket_seconds=self.sketches_bucket_secs,
+            )
+
+        if self.sketches_bucket_secs:
+            apply_update_feature_sketches()
+
         # Calculate number of predictions and average latency
         def apply_storey_aggregations():
             # Calculate number of predictions for each window (5 min and 1 hour by default)
@@ -513,6 +543,10 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
             self.error_count[endpoint_id] += 1
             raise mlrun.errors.MLRunInvalidArgumentError(str(error))
 
+        # Columnar batch of requests (see set_tracking(batch=...))
+        if EventFieldType.BATCH in event:
+            return self._do_batch(event, endpoint_id, versioned_model, function_uri)
+
         # Validate event fields
         model_class = event.get("model_class") or event.get("class")
         timestamp = event.get("when")
@@ -635,6 +669,107 @@ class ProcessEndpointEvent(mlrun.feature_store.steps.MapClass):
         storey_event = storey.Event(body=events, key=endpoint_id)
         return storey_event
 
+    def _do_batch(
+        self, event: dict, endpoint_id: str, versioned_model: str, function_uri: str
+    ) -> typing.Optional[storey.Event]:
+        """Split a columnar batch of requests into sub-events, the request level columns (when, microsec, request_id
+        and count) are validated once per batch and expanded to the input rows by the count of each request"""
+        columns = event[EventFieldType.BATCH]
+        for key in ["when", "microsec", "request_id", "count", "inputs", "outputs"]:
+            if not self.is_valid(
+                endpoint_id,
+                is_not_none,
+                columns.get(key),
+                [EventFieldType.BATCH, key],
+            ):
+                return None
+
+        when = columns["when"]
+        counts = np.asarray(columns["count"], dtype=int)
+        features, predictions = columns["inputs"], columns["outputs"]
+        if (
+            not len(when)
+            == len(columns["microsec"])
+            == len(columns["request_id"])
+            == len(counts)
+        ) or not counts.sum() == len(features) == len(predictions):
+            logger.error(
+                "Inconsistent batch columns lengths, skipping the batch",
+                endpoint_id=endpoint_id,
+            )
+            self.error_count[endpoint_id] += len(when)
+            return None
+        if not len(when):
+            return None
+
+        # Requests without inputs or outputs are counted as errors, like in the single request events
+        self.error_count[endpoint_id] += int((counts == 0).sum())
+
+        if endpoint_id not in self.first_request:
+            self.first_request[endpoint_id] = when[0]
+        previous = [self.last_request.get(endpoint_id, when[0])] + when[:-1]
+        if any(last > current for last, current in zip(previous, when)):
+            logger.error(
+                "Batch request times are earlier than the previous request times - write to TSDB will be rejected",
+                endpoint_id=endpoint_id,
+            )
+        self.last_request[endpoint_id] = when[-1]
+
+        # Integer features are converted to floats once for the whole batch
+        try:
+            features_array = np.asarray(features)
+        except ValueError:
+            # rows of different lengths
+            features_array = None
+        if (
+            features_array is not None
+            and features_array.ndim == 2
+            and features_array.dtype.kind in "biu"
+        ):
+            features = features_array.astype(float).tolist()
+
+        common = {
+            EventFieldType.FUNCTION_URI: function_uri,
+            EventFieldType.MODEL: versioned_model,
+            EventFieldType.MODEL_CLASS: event.get("model_class") or event.get("class"),
+            EventFieldType.ENDPOINT_ID: endpoint_id,
+            EventFieldType.FIRST_REQUEST: self.first_request[endpoint_id],
+            EventFieldType.ERROR_COUNT: self.error_count[endpoint_id],
+            EventFieldType.LABELS: event.get(EventFieldType.LABELS, {}),
+            EventFieldType.METRICS: event.get(EventFieldType.METRICS, {}),
+        }
+        entities = columns.get(EventFieldType.ENTITIES) or [{}] * len(when)
+        requests = [
+            {
+                **common,
+                EventFieldType.TIMESTAMP: datetime.datetime.fromisoformat(timestamp),
+                EventFieldType.REQUEST_ID: request_id,
+                EventFieldType.LATENCY: latency,
+                EventFieldType.LAST_REQUEST: timestamp,
+                EventFieldType.LAST_REQUEST_TIMESTAMP: mlrun.utils.enrich_datetime_with_tz_info(
+                    timestamp
+                ).timestamp(),
+                EventFieldType.ENTITIES: request_entities,
+            }
+            for timestamp, request_id, latency, request_entities in zip(
+                when, columns["request_id"], columns["microsec"], entities
+            )
+        ]
+
+        events = [
+            {
+                **requests[request_index],
+                EventFieldType.FEATURES: feature,
+                EventFieldType.PREDICTION: prediction,
+            }
+            for request_index, feature, prediction in zip(
+                np.repeat(np.arange(len(counts)), counts).tolist(),
+                features,
+                predictions,
+            )
+        ]
+        return storey.Event(body=events, key=endpoint_id)
+
     def _validate_last_request_timestamp(self, endpoint_id: str, timestamp: str):
         """Validate that the request time of the current event is later than the previous request time that has
         already been processed.
@@ -895,6 +1030,87 @@ class MapFeatureNames(mlrun.feature_store.steps.MapClass):
             event[mapping_dictionary][name] = value
 
 
+class UpdateFeatureSketches(mlrun.feature_store.steps.MapClass):
+    def __init__(
+        self,
+        project: str,
+        sketches_path: str,
+        bucket_seconds: int = 60,
+        **kwargs,
+    ):
+        """
+        Update the feature sketches (count, moments, min/max and the counts over the reference histogram bins) of each
+        endpoint, in time buckets. The sketches of a bucket are written once an event of a later bucket arrives, and
+        the monitoring applications merge the sketches of the buckets in their window instead of recalculating the
+        statistics over the window events.
+
+        :param project:        Project name.
+        :param sketches_path:  Path of the sketches files.
+        :param bucket_seconds: Length of the time buckets.
+
+        :returns: The event, without any changes.
+        """
+        super().__init__(**kwargs)
+        self.project = project
+        self._store = mlrun.model_monitoring.sketches.SketchStore(
+            sketches_path, bucket_seconds
+        )
+
+        # Reference statistics of each endpoint, empty if the endpoint has no reference histograms
+        self.feature_stats: dict[str, dict] = {}
+        # Values of each endpoint (key) in the open buckets: bucket start -> feature name -> values
+        self.buckets: dict[str, dict[int, dict[str, list]]] = {}
+        self.watermarks: dict[str, int] = {}
+
+    def do(self, event: dict):
+        endpoint_id = event[EventFieldType.ENDPOINT_ID]
+        feature_stats = self._get_feature_stats(endpoint_id)
+        if not feature_stats:
+            return event
+
+        bucket_start = self._store.bucket_start(
+            event[EventFieldType.TIMESTAMP].timestamp()
+        )
+        buckets = self.buckets.setdefault(endpoint_id, {})
+        bucket = buckets.setdefault(bucket_start, collections.defaultdict(list))
+        for name, value in {
+            **(event.get(EventFieldType.NAMED_FEATURES) or {}),
+            **(event.get(EventFieldType.NAMED_PREDICTIONS) or {}),
+        }.items():
+            if name in feature_stats:
+                bucket[name].append(value)
+
+        # Events are mostly ordered, write the buckets before the bucket of the current event
+        for start in sorted(start for start in buckets if start < bucket_start):
+            self._store.write_bucket(
+                endpoint_id,
+                start,
+                mlrun.model_monitoring.sketches.sketch_values(
+                    feature_stats, buckets.pop(start)
+                ),
+            )
+        if bucket_start > self.watermarks.get(endpoint_id, 0):
+            self.watermarks[endpoint_id] = bucket_start
+            self._store.write_watermark(endpoint_id, bucket_start)
+        return event
+
+    def _get_feature_stats(self, endpoint_id: str) -> dict:
+        if endpoint_id not in self.feature_stats:
+            endpoint_record = mlrun.model_monitoring.helpers.get_endpoint_record(
+                project=self.project,
+                endpoint_id=endpoint_id,
+            )
+            feature_stats = endpoint_record.get(EventFieldType.FEATURE_STATS)
+            feature_stats = (
+                json.loads(feature_stats)
+                if isinstance(feature_stats, str)
+                else feature_stats
+            ) or {}
+            mlrun.common.model_monitoring.helpers.pad_features_hist(feature_stats)
+            self.feature_stats[endpoint_id] = feature_stats
+        return self.feature_stats[endpoint_id]
+
+
 class UpdateEndpoint(mlrun.feature_store.steps.MapClass):
     def __init__(self, project: str, **kwargs):
         """
@@ -313,17 +313,21 @@ class ServingRuntime(RemoteRuntime):
         stream_args: Optional[dict] = None,
         tracking_policy: Optional[Union["TrackingPolicy", dict]] = None,
         enable_tracking: bool = True,
+        batch_timeout: Optional[float] = None,
     ) -> None:
         """Apply on your serving function to monitor a deployed model, including real-time dashboards to detect drift
         and analyze performance.
 
         :param stream_path:         Path/url of the tracking stream e.g. v3io:///users/mike/mystream
                                     you can use the "dummy://" path for test/simulation.
-        :param batch:               Micro batch size (send micro batches of N records at a time).
+        :param batch:               Micro batch size (send micro batches of N records at a time). The records of
+                                    a micro batch are sent as a single columnar record, from a background thread.
         :param sample:              Sample size (send only one of N records).
         :param stream_args:         Stream initialization parameters, e.g. shards, retention_in_hours, ..
         :param enable_tracking:     Enabled/Disable model-monitoring tracking.
                                     Default True (tracking enabled).
+        :param batch_timeout:       Maximal time (seconds) to hold records in a micro batch before sending it,
+                                    default 1.
 
         Example::
 
@@ -340,6 +344,8 @@ class ServingRuntime(RemoteRuntime):
             self.spec.parameters["log_stream"] = stream_path
         if batch:
             self.spec.parameters["log_stream_batch"] = batch
+        if batch_timeout:
+            self.spec.parameters["log_stream_batch_timeout"] = batch_timeout
         if sample:
             self.spec.parameters["log_stream_sample"] = sample
         if stream_args:
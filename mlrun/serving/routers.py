@@ -12,14 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import collections
 import concurrent
 import concurrent.futures
 import copy
 import json
+import threading
 import traceback
 import typing
 from enum import Enum
 from io import BytesIO
+from multiprocessing import shared_memory
 from typing import Union
 
 import numpy
@@ -33,12 +37,21 @@ from mlrun.utils import logger, now_date
 
 from ..common.helpers import parse_versioned_object_uri
 from .server import GraphServer
-from .utils import RouterToDict, _extract_input_data, _update_result_body
+from .utils import (
+    RouterToDict,
+    _extract_input_data,
+    _run_sync,
+    _update_result_body,
+)
 from .v2_serving import _ModelLogPusher
 
 # Used by `ParallelRun` in process mode, so it can be accessed from different processes.
 local_routes = {}
 
+# the time (seconds) to wait for the routes of the asyncio executor in sync graphs beyond the child timeout, for their
+# scheduling on the event loop of the server
+_COROUTINE_GRACE_PERIOD = 5
+
 
 class BaseModelRouter(RouterToDict):
     """base model router class"""
@@ -217,6 +230,9 @@ class ParallelRunnerModes(str, Enum):
     array = "array"  # running one by one
     process = "process"  # running in separated processes
     thread = "thread"  # running in separated threads
+    asyncio = "asyncio"  # awaiting the routes concurrently on an event loop
+    # running in a warm process per route, numeric inputs are passed in shared memory
+    shared_memory = "shared_memory"
 
     @staticmethod
     def all():
@@ -224,6 +240,8 @@ class ParallelRunnerModes(str, Enum):
             ParallelRunnerModes.thread,
             ParallelRunnerModes.process,
             ParallelRunnerModes.array,
+            ParallelRunnerModes.asyncio,
+            ParallelRunnerModes.shared_memory,
         ]
 
 
@@ -256,6 +274,7 @@ class ParallelRun(BaseModelRouter):
         health_prefix: str = None,
         extend_event=None,
         executor_type: Union[ParallelRunnerModes, str] = ParallelRunnerModes.thread,
+        child_timeout: float = None,
         **kwargs,
     ):
         """Process multiple steps (child routes) in parallel and merge the results
@@ -288,12 +307,23 @@ class ParallelRun(BaseModelRouter):
         :param protocol:      serving API protocol (default "v2")
         :param url_prefix:    url prefix for the router (default /v2/models)
         :param health_prefix: health api url prefix (default /v2/health)
-        :param executor_type: Parallelism mechanism,  Have 3 option :
+        :param executor_type: Parallelism mechanism,  Have 5 option :
                               * array - running one by one
                               * process - running in separated process
                               * thread - running in separated threads
+                              * asyncio - await the routes concurrently, all the routes must have an async handler
+                                (e.g. `async def do()`, use the thread executor for sync routes). in async flows
+                                (engine="async") the router and its routes are awaited on the event loop of the flow,
+                                in sync graphs (e.g. the router topology) the routes are awaited on an event loop of
+                                the server which runs in a background thread
+                              * shared_memory - running each route in its own process, which is kept for the
+                                function lifetime, numeric "inputs" are passed to the routes as a read-only numpy
+                                array in shared memory (instead of being pickled per route). the shared memory is
+                                reused by the following events, routes which keep the inputs must copy them
                               by default `threads`
         :param extend_event:  True will add the event body to the result
+        :param child_timeout: asyncio executor only, the maximal time (seconds) to wait for each route, the results
+                              are merged from the routes which completed in time
         :param kwargs:        extra arguments
         """
         super().__init__(
@@ -308,12 +338,50 @@ class ParallelRun(BaseModelRouter):
         self.name = name or "ParallelRun"
         self.extend_event = extend_event
         self.executor_type = ParallelRunnerModes(executor_type)
+        self.child_timeout = child_timeout
         self._pool: typing.Optional[
             Union[
                 concurrent.futures.ProcessPoolExecutor,
                 concurrent.futures.ThreadPoolExecutor,
             ]
         ] = None
+        # shared_memory executor, a single worker pool per route
+        self._route_pools: dict[str, concurrent.futures.ProcessPoolExecutor] = {}
+        self._shared_memory_segments = _SharedMemorySegments()
+        self._shutdown_registered = False
+
+    def post_init(self, mode="sync"):
+        super().post_init(mode)
+        self._register_shutdown()
+        self._validate_async_routes()
+
+    def _validate_async_routes(self):
+        if self.executor_type != ParallelRunnerModes.asyncio:
+            return
+        sync_routes = [
+            key
+            for key, route in self.routes.items()
+            if not asyncio.iscoroutinefunction(getattr(route, "_handler", None))
+        ]
+        if sync_routes:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                f"The asyncio executor requires routes with an async handler, {sync_routes} are sync routes, "
+                "use the thread executor for them"
+            )
+
+    @property
+    def async_do_event(self):
+        """the handler which async flows await on their event loop (asyncio executor only)"""
+        if self.executor_type == ParallelRunnerModes.asyncio:
+            return self._async_do_event
+        return None
+
+    def _register_shutdown(self):
+        """shutdown the (warm) pools when the server completes"""
+        server = getattr(self.context, "server", None)
+        if server and not self._shutdown_registered:
+            server.add_completion_callback(self._shutdown_pool)
+            self._shutdown_registered = True
 
     def _apply_logic(self, results: dict, event=None):
         """
@@ -338,6 +406,14 @@ class ParallelRun(BaseModelRouter):
         return body
 
     def do_event(self, event, *args, **kwargs):
+        return _run_sync(self._handle_event(event))
+
+    async def _async_do_event(self, event):
+        return await self._handle_event(event, on_loop=True)
+
+    async def _handle_event(self, event, on_loop=False):
+        """handle the event, the routes are awaited when running on the event loop of an async flow (on_loop),
+        otherwise the handling does not suspend and is run by the sync do_event()"""
         # Handle and verify the request
         original_body = event.body
         event.body = _extract_input_data(self._input_path, event.body)
@@ -349,11 +425,12 @@ class ParallelRun(BaseModelRouter):
             event.body = _update_result_body(
                 self._result_path, original_body, event.body
             )
-            self._shutdown_pool()
+            if self.executor_type != ParallelRunnerModes.shared_memory:
+                self._shutdown_pool()
             return event
 
         response = copy.copy(event)
-        results = self._parallel_run(event)
+        results = await self._run_routes(event, on_loop)
         self._apply_logic(results, response)
         response = self.postprocess(response)
 
@@ -377,22 +454,11 @@ class ParallelRun(BaseModelRouter):
         if self._pool is None:
             if self.executor_type == ParallelRunnerModes.process:
                 # init the context and route on the worker side (cannot be pickeled)
-                server = self.context.server.to_dict()
-                routes = {}
-                for key, route in self.routes.items():
-                    step = copy.copy(route)
-                    step.context = None
-                    step._parent = None
-                    if step._object:
-                        step._object.context = None
-                        if hasattr(step._object, "_kwargs"):
-                            step._object._kwargs["graph_step"] = None
-                    routes[key] = step
                 executor_class = concurrent.futures.ProcessPoolExecutor
                 self._pool = executor_class(
                     max_workers=len(self.routes),
                     initializer=ParallelRun.init_pool,
-                    initargs=(server, routes),
+                    initargs=(self.context.server.to_dict(), self._get_worker_routes()),
                 )
             elif self.executor_type == ParallelRunnerModes.thread:
                 executor_class = concurrent.futures.ThreadPoolExecutor
@@ -400,6 +466,34 @@ class ParallelRun(BaseModelRouter):
 
         return self._pool
 
+    def _get_worker_routes(self, keys=None) -> dict:
+        """copy the routes without their context and parent, which are initialized on the worker side"""
+        routes = {}
+        for key in keys or self.routes.keys():
+            step = copy.copy(self.routes[key])
+            step.context = None
+            step._parent = None
+            if step._object:
+                step._object.context = None
+                if hasattr(step._object, "_kwargs"):
+                    step._object._kwargs["graph_step"] = None
+            routes[key] = step
+        return routes
+
+    def _init_route_pools(self) -> dict[str, concurrent.futures.ProcessPoolExecutor]:
+        """get the warm single worker pool of each route (shared_memory executor)"""
+        if not self._route_pools:
+            server = self.context.server.to_dict()
+            self._route_pools = {
+                key: concurrent.futures.ProcessPoolExecutor(
+                    max_workers=1,
+                    initializer=ParallelRun.init_pool,
+                    initargs=(server, self._get_worker_routes([key])),
+                )
+                for key in self.routes.keys()
+            }
+        return self._route_pools
+
     def _shutdown_pool(self):
         """
         Shutdowns the pool and updated self._pool to None
@@ -410,6 +504,15 @@ class ParallelRun(BaseModelRouter):
                 del local_routes
             self._pool.shutdown()
             self._pool = None
+        for pool in self._route_pools.values():
+            pool.shutdown()
+        self._route_pools = {}
+        self._shared_memory_segments.close()
+
+    async def _run_routes(self, event, on_loop=False) -> dict:
+        if on_loop:
+            return await self._async_parallel_run(event)
+        return self._parallel_run(event)
 
     def _parallel_run(self, event: dict):
         """
@@ -426,9 +529,25 @@ class ParallelRun(BaseModelRouter):
                 for model_name, model in self.routes.items()
             }
             return results
+        if self.executor_type == ParallelRunnerModes.asyncio:
+            # a sync graph, await the routes on the event loop of the server
+            return self._run_coroutine(self._async_parallel_run(event))
+        shm = None
         futures = []
+        if self.executor_type == ParallelRunnerModes.shared_memory:
+            shm, body = _inputs_to_shared_memory(
+                event.body, self._shared_memory_segments
+            )
+            for route, pool in self._init_route_pools().items():
+                route_event = copy.copy(event)
+                route_event.body = copy.copy(body)
+                futures.append(
+                    pool.submit(
+                        ParallelRun._wrap_shared_memory_step, route, route_event
+                    )
+                )
         executor = self._init_pool()
-        for route in self.routes.keys():
+        for route in self.routes.keys() if executor else []:
             if self.executor_type == ParallelRunnerModes.process:
                 future = executor.submit(
                     ParallelRun._wrap_step, route, copy.copy(event)
@@ -444,16 +563,75 @@ class ParallelRun(BaseModelRouter):
 
             futures.append(future)
 
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                key, result = future.result()
-                results[key] = result.body
-            except Exception as exc:
-                logger.error(traceback.format_exc())
-                print(f"child route generated an exception: {exc}")
-        self.context.logger.debug(f"Collected results from children: {results}")
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    key, result = future.result()
+                    results[key] = result.body
+                except Exception as exc:
+                    logger.error(traceback.format_exc())
+                    print(f"child route generated an exception: {exc}")
+        finally:
+            if shm:
+                # all the routes completed, the segment can be reused by the next events
+                self._shared_memory_segments.release(shm)
+        if self.context.verbose:
+            self.context.logger.debug(f"Collected results from children: {results}")
+        return results
+
+    def _run_coroutine(self, coroutine):
+        """run the coroutine on the event loop of the server and wait for its result, the coroutine is cancelled if
+        it did not complete by the child timeout (with a grace period for scheduling it)"""
+        future = asyncio.run_coroutine_threadsafe(
+            coroutine, self.context.server.get_event_loop()
+        )
+        timeout = (
+            self.child_timeout + _COROUTINE_GRACE_PERIOD if self.child_timeout else None
+        )
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    async def _async_parallel_run(self, event):
+        routes = list(self.routes.keys())
+        responses = await asyncio.gather(
+            *[self._run_route_async(route, copy.copy(event)) for route in routes],
+            return_exceptions=True,
+        )
+        results = {}
+        for route, response in zip(routes, responses):
+            if isinstance(response, asyncio.TimeoutError):
+                logger.warning(
+                    "Child route timed out", route=route, timeout=self.child_timeout
+                )
+            elif isinstance(response, Exception):
+                logger.error(
+                    "Child route generated an exception",
+                    route=route,
+                    exc=err_to_str(response),
+                    traceback="".join(traceback.format_tb(response.__traceback__)),
+                )
+            else:
+                results[route] = response.body
         return results
 
+    async def _run_route_async(self, route, event):
+        return await asyncio.wait_for(
+            self._await_step(self.routes[route], event), self.child_timeout
+        )
+
+    @staticmethod
+    async def _await_step(step, event):
+        response = step.run(event)
+        if asyncio.iscoroutine(response):
+            # handlers which are called with the full event return the event
+            return await response
+        if asyncio.iscoroutine(response.body):
+            response.body = await response.body
+        return response
+
     @staticmethod
     def init_pool(server_spec, routes):
         server = mlrun.serving.GraphServer.from_dict(server_spec)
@@ -472,11 +650,123 @@ class ParallelRun(BaseModelRouter):
             return None, None
         return route, local_routes[route].run(event)
 
+    @staticmethod
+    def _wrap_shared_memory_step(route, event):
+        inputs = event.body.get("inputs") if isinstance(event.body, dict) else None
+        if not isinstance(inputs, _SharedArray):
+            return ParallelRun._wrap_step(route, event)
+
+        body = event.body
+        body["inputs"] = inputs.attach()
+        try:
+            route, response = ParallelRun._wrap_step(route, event)
+            # detach the results from the shared memory, which is reused by the parent for the next events
+            response.body = copy.deepcopy(response.body)
+            return route, response
+        finally:
+            body["inputs"] = None
+
     @staticmethod
     def _wrap_method(route, handler, event):
         return route, handler(event)
 
 
+class _SharedArray:
+    """a reference to a numpy array in shared memory, which is passed to the worker processes"""
+
+    def __init__(self, name: str, shape: tuple, dtype: str):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def attach(self) -> np.ndarray:
+        # the segments are reused by the parent, they are kept attached (mapped) in the worker between events
+        shm = _attached_segments.pop(self.name, None)
+        if shm is None:
+            # the worker shares the parent's resource tracker, the memory is released when the parent unlinks it
+            shm = shared_memory.SharedMemory(name=self.name)
+        _attached_segments[self.name] = shm
+        while len(_attached_segments) > _max_attached_segments:
+            _, least_recent = _attached_segments.popitem(last=False)
+            try:
+                least_recent.close()
+            except BufferError:
+                # the route keeps a reference to the inputs, the memory is released once it is collected
+                pass
+        array = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+        array.flags.writeable = False
+        return array
+
+
+# the shared memory segments which are attached in a worker process (shared_memory executor), in lru order
+_attached_segments: "collections.OrderedDict[str, shared_memory.SharedMemory]" = (
+    collections.OrderedDict()
+)
+_max_attached_segments = 8
+
+
+class _SharedMemorySegments:
+    """the shared memory segments of the event inputs (shared_memory executor), a segment is reused by the next
+    events once all the routes completed, instead of creating, mapping and releasing a segment per event"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._free: list[shared_memory.SharedMemory] = []
+
+    def acquire(self, size: int) -> shared_memory.SharedMemory:
+        with self._lock:
+            fitting = [shm for shm in self._free if shm.size >= size]
+            if fitting:
+                shm = min(fitting, key=lambda segment: segment.size)
+                self._free.remove(shm)
+                return shm
+            if self._free:
+                # the inputs grew, replace the smallest segment
+                smallest = min(self._free, key=lambda segment: segment.size)
+                self._free.remove(smallest)
+                _unlink_segment(smallest)
+        # the sizes are rounded up to a power of two, so inputs of similar sizes share the segments
+        return shared_memory.SharedMemory(
+            create=True, size=1 << max(size - 1, 4095).bit_length()
+        )
+
+    def release(self, shm: shared_memory.SharedMemory):
+        with self._lock:
+            self._free.append(shm)
+
+    def close(self):
+        with self._lock:
+            free, self._free = self._free, []
+        for shm in free:
+            _unlink_segment(shm)
+
+
+def _unlink_segment(shm: shared_memory.SharedMemory):
+    shm.close()
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _inputs_to_shared_memory(body, segments: _SharedMemorySegments):
+    """copy numeric inputs to shared memory, returns the memory (or None) and the body with the array reference"""
+    if not isinstance(body, dict) or "inputs" not in body:
+        return None, body
+    try:
+        array = np.asarray(body["inputs"])
+    except (ValueError, TypeError):
+        return None, body
+    if array.dtype.kind not in "biuf" or not array.nbytes:
+        return None, body
+
+    shm = segments.acquire(array.nbytes)
+    shared_array = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    shared_array[...] = array
+    del shared_array
+    return shm, dict(body, inputs=_SharedArray(shm.name, array.shape, array.dtype.str))
+
+
 class VotingEnsemble(ParallelRun):
     def __init__(
         self,
@@ -491,6 +781,7 @@ class VotingEnsemble(ParallelRun):
         executor_type: Union[ParallelRunnerModes, str] = ParallelRunnerModes.thread,
         format_response_with_col_name_flag: bool = False,
         prediction_col_name: str = "prediction",
+        child_timeout: float = None,
         **kwargs,
     ):
         """Voting Ensemble
@@ -569,7 +860,9 @@ class VotingEnsemble(ParallelRun):
         :param weights        A dictionary ({"<model_name>": <model_weight>}) that specified each model weight,
                               if there is a model that didn't appear in the dictionary his
                               weight will be count as a zero. None means that all the models have the same weight.
-        :param executor_type: Parallelism mechanism, out of `ParallelRunnerModes`, by default `threads`
+        :param executor_type: Parallelism mechanism, out of `ParallelRunnerModes`, by default `threads`.
+                              `asyncio` awaits models with an async handler (e.g. models which call remote
+                              endpoints) concurrently, on the event loop of the flow in async flows (see ParallelRun)
         :param format_response_with_col_name_flag: If this flag is True the model's responses output format is
                                                      `{id: <id>, model_name: <name>, outputs:
                                                      {..., prediction: [<predictions>], ...}}`
@@ -580,6 +873,9 @@ class VotingEnsemble(ParallelRun):
                               `{id: <id>, model_name: <name>, outputs: {..., prediction: [<predictions>], ...}}`
                               the prediction_col_name should be `prediction`.
                               by default, `prediction`
+        :param child_timeout: asyncio executor only, the maximal time (seconds) to wait for each model, the vote is
+                              applied on the predictions of the models which responded in time (with their weights
+                              normalized)
         :param kwargs:        extra arguments
         """
         super().__init__(
@@ -590,6 +886,7 @@ class VotingEnsemble(ParallelRun):
             url_prefix=url_prefix,
             health_prefix=health_prefix,
             executor_type=executor_type,
+            child_timeout=child_timeout,
             **kwargs,
         )
         self.name = name or "VotingEnsemble"
@@ -614,6 +911,8 @@ class VotingEnsemble(ParallelRun):
         if not server:
             logger.warn("GraphServer not initialized for VotingEnsemble instance")
             return
+        self._register_shutdown()
+        self._validate_async_routes()
 
         if not self.context.is_mock or self.context.monitoring_mock:
             self.model_endpoint_uid = _init_endpoint_record(server, self)
@@ -778,10 +1077,14 @@ class VotingEnsemble(ParallelRun):
             int_predictions = [
                 list(map(int, sample_predictions)) for sample_predictions in predictions
             ]
-            self.context.logger.debug(f"Applying max logic vote on {predictions}")
+            if self.context.verbose:
+                self.context.logger.debug(f"Applying max logic vote on {predictions}")
             votes = self._majority_vote(int_predictions, weights)
         else:
-            self.context.logger.debug(f"Applying majority logic vote on {predictions}")
+            if self.context.verbose:
+                self.context.logger.debug(
+                    f"Applying majority logic vote on {predictions}"
+                )
             votes = self._mean_vote(predictions, weights)
 
         return votes
@@ -794,6 +1097,10 @@ class VotingEnsemble(ParallelRun):
         :param event: Response event
         :return: List of the resulting voted predictions
         """
+        if not results:
+            raise mlrun.errors.MLRunRuntimeError(
+                f"None of the {self.name} models returned a prediction"
+            )
         flattened_predictions = np.array(
             list(
                 map(
@@ -806,10 +1113,13 @@ class VotingEnsemble(ParallelRun):
                 )
             )
         ).T
-        weights = [self._weights[model_name] for model_name in results.keys()]
-        return self.logic(flattened_predictions, np.array(weights))
+        weights = np.array([self._weights[model_name] for model_name in results.keys()])
+        if len(results) < len(self.routes) and weights.sum() > 0:
+            # vote with the models which returned a prediction
+            weights = weights / weights.sum()
+        return self.logic(flattened_predictions, weights)
 
-    def do_event(self, event, *args, **kwargs):
+    async def _handle_event(self, event, on_loop=False):
         """Handles incoming requests.
 
         Parameters
@@ -836,7 +1146,8 @@ class VotingEnsemble(ParallelRun):
                 self._result_path, original_body, event.body
             )
 
-            self._shutdown_pool()
+            if self.executor_type != ParallelRunnerModes.shared_memory:
+                self._shutdown_pool()
             return event
 
         # Extract route information
@@ -863,7 +1174,7 @@ class VotingEnsemble(ParallelRun):
 
             # If this is a Router Operation
             if name == self.name and event.method != "GET":
-                predictions = self._parallel_run(event)
+                predictions = await self._run_routes(event, on_loop)
                 votes = self._apply_logic(predictions)
                 # Format the prediction response like the regular
                 # model's responses
@@ -1186,8 +1497,19 @@ class EnrichmentModelRouter(ModelRouter):
             impute_policy=self.impute_policy,
         )
 
+    def get_metadata(self):
+        """return the model router/host details, and the metrics of the online features cache (when enabled)"""
+        metadata = super().get_metadata()
+        cache_stats = self._feature_service and self._feature_service.cache_stats
+        if cache_stats:
+            metadata["online_features_cache"] = cache_stats
+        return metadata
+
     def preprocess(self, event):
         """Turn an entity identifier (source) to a Feature Vector"""
+        if event.method == "GET":
+            # health check or metadata request, there are no inputs to enrich
+            return event
         if isinstance(event.body, (str, bytes)):
             event.body = json.loads(event.body)
         event.body["inputs"] = self._feature_service.get(
@@ -1332,8 +1654,19 @@ class EnrichmentVotingEnsemble(VotingEnsemble):
             impute_policy=self.impute_policy,
         )
 
+    def get_metadata(self):
+        """return the model router/host details, and the metrics of the online features cache (when enabled)"""
+        metadata = super().get_metadata()
+        cache_stats = self._feature_service and self._feature_service.cache_stats
+        if cache_stats:
+            metadata["online_features_cache"] = cache_stats
+        return metadata
+
     def preprocess(self, event):
         """Turn an entity identifier (source) to a Feature Vector"""
+        if event.method == "GET":
+            # health check or metadata request, there are no inputs to enrich
+            return event
         if isinstance(event.body, (str, bytes)):
             event.body = json.loads(event.body)
         event.body["inputs"] = self._feature_service.get(
@@ -18,6 +18,7 @@ import asyncio
 import json
 import os
 import socket
+import threading
 import traceback
 import uuid
 from typing import Optional, Union
@@ -123,6 +124,9 @@ class GraphServer(ModelObj):
         self.resource_cache = None
         self.default_content_type = default_content_type
         self.http_trigger = True
+        self._completion_callbacks = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
 
     def set_current_function(self, function):
         """set which child function this server is currently running on"""
@@ -307,9 +311,48 @@ class GraphServer(ModelObj):
             )
         return body
 
+    def get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """get the event loop of the server, which runs in a background thread, the (sync) steps schedule coroutines
+        on it with `asyncio.run_coroutine_threadsafe`, for internal use"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=_run_event_loop,
+                    args=(self._loop,),
+                    name="serving-event-loop",
+                    daemon=True,
+                ).start()
+            return self._loop
+
+    def _stop_event_loop(self):
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+
+    def add_completion_callback(self, callback):
+        """add a callback which is called when the server completes (e.g. on worker shutdown), for internal use"""
+        self._completion_callbacks.append(callback)
+
     def wait_for_completion(self):
         """wait for async operation to complete"""
-        return self.graph.wait_for_completion()
+        try:
+            # router graphs have no async flow to wait for
+            if hasattr(self.graph, "wait_for_completion"):
+                return self.graph.wait_for_completion()
+        finally:
+            for callback in self._completion_callbacks:
+                callback()
+            self._stop_event_loop()
+
+
+def _run_event_loop(loop: asyncio.AbstractEventLoop):
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
 
 
 def v2_serving_init(context, namespace=None):
@@ -351,10 +394,14 @@ def v2_serving_init(context, namespace=None):
 
 
 def _set_callbacks(server, context):
-    if not server.graph.supports_termination() or not hasattr(context, "platform"):
+    if not hasattr(context, "platform"):
         return
+    supports_termination = server.graph.supports_termination()
 
-    if hasattr(context.platform, "set_termination_callback"):
+    # the completion callbacks (e.g. flushing buffered records) are also called on the shutdown of sync graphs
+    if (supports_termination or server._completion_callbacks) and hasattr(
+        context.platform, "set_termination_callback"
+    ):
         context.logger.info(
             "Setting termination callback to terminate graph on worker shutdown"
         )
@@ -366,7 +413,7 @@ def _set_callbacks(server, context):
 
         context.platform.set_termination_callback(termination_callback)
 
-    if hasattr(context.platform, "set_drain_callback"):
+    if supports_termination and hasattr(context.platform, "set_drain_callback"):
         context.logger.info(
             "Setting drain callback to terminate and restart the graph on a drain event (such as rebalancing)"
         )
@@ -20,6 +20,7 @@ __all__ = [
     "MonitoringApplicationStep",
 ]
 
+import asyncio
 import os
 import pathlib
 import traceback
@@ -1676,16 +1677,35 @@ def _init_async_objects(context, steps):
                     step._async_object = storey.Map(lambda x: x)
 
             elif not step.async_object or not hasattr(step.async_object, "_outlets"):
-                # if regular class, wrap with storey Map
-                step._async_object = storey.Map(
-                    step._handler,
-                    full_event=step.full_event or step._call_with_event,
-                    input_path=step.input_path,
-                    result_path=step.result_path,
-                    name=step.name,
-                    context=context,
-                    pass_context=step._inject_context,
-                )
+                handler = step._handler
+                # classes which can be awaited on the loop of the flow (e.g. the asyncio ParallelRun) provide an
+                # async event handler, and the number of events to process concurrently (e.g. a batching model)
+                step_object = getattr(step, "_object", None)
+                async_handler = getattr(step_object, "async_do_event", None)
+                max_in_flight = getattr(step_object, "async_max_in_flight", None)
+                if getattr(step, "_call_with_event", False) and async_handler:
+                    handler = async_handler
+                else:
+                    max_in_flight = None
+                if max_in_flight:
+                    step._async_object = _ConcurrentExecution(
+                        handler,
+                        full_event=True,
+                        max_in_flight=max_in_flight,
+                        name=step.name,
+                        context=context,
+                    )
+                else:
+                    # if regular class, wrap with storey Map
+                    step._async_object = storey.Map(
+                        handler,
+                        full_event=step.full_event or step._call_with_event,
+                        input_path=step.input_path,
+                        result_path=step.result_path,
+                        name=step.name,
+                        context=context,
+                        pass_context=step._inject_context,
+                    )
             if (
                 respond_supported
                 and not step.next
@@ -1708,3 +1728,13 @@ def _init_async_objects(context, steps):
         **source_args,
     )
     return default_source, wait_for_result
+
+
+class _ConcurrentExecution(storey.ConcurrentExecution):
+    """storey ConcurrentExecution which binds its queue to the loop of the flow"""
+
+    async def _worker(self):
+        # the worker peeks at the queue when it is empty, which requires a queue which is bound to the loop (python
+        # >= 3.10 binds the queue lazily, when a put/get first waits)
+        self._q._loop = asyncio.get_running_loop()
+        await super()._worker()
@@ -31,6 +31,18 @@ def _extract_input_data(input_path, body):
     return body
 
 
+def _run_sync(coroutine):
+    """run a coroutine which does not suspend (e.g. the event handling of a step in a sync graph) without a loop"""
+    try:
+        coroutine.send(None)
+    except StopIteration as exc:
+        return exc.value
+    coroutine.close()
+    raise RuntimeError(
+        "The coroutine was suspended, it must be awaited on an event loop"
+    )
+
+
 def _update_result_body(result_path, event_body, result):
     if result_path and event_body:
         if not hasattr(event_body, "__getitem__"):
@@ -12,11 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import copy
+import functools
+import json
 import threading
 import time
 import traceback
 from typing import Optional, Union
 
+import numpy as np
+
 import mlrun.artifacts
 import mlrun.common.model_monitoring.helpers
 import mlrun.common.schemas.model_monitoring
@@ -26,7 +32,7 @@ from mlrun.utils import logger, now_date
 
 from ..common.helpers import parse_versioned_object_uri
 from .server import GraphServer
-from .utils import StepToDict, _extract_input_data, _update_result_body
+from .utils import StepToDict, _extract_input_data, _run_sync, _update_result_body
 
 
 class V2ModelServer(StepToDict):
@@ -91,7 +97,18 @@ class V2ModelServer(StepToDict):
                               this require that the event body will behave like a dict, example:
                               event: {"x": 5} , result_path="resp" means the returned response will be written
                               to event["y"] resulting in {"x": 5, "resp": <result>}
-        :param kwargs:     extra arguments (can be accessed using self.get_param(key))
+        :param kwargs:     extra arguments (can be accessed using self.get_param(key)), the following arguments
+                           (which can also be set as function params) enable batching of the requests of a model
+                           step in an async flow (engine="async"):
+
+                           * max_batch_size - coalesce up to this number of infer requests into a single predict()
+                             call, with their concatenated "inputs" (lists or numpy arrays), and split the outputs
+                             back per request. predict() must return one output per input. the step processes up to
+                             twice this number of events concurrently, and a batch is predicted (in a thread) while
+                             the next one is collected. requests with dict inputs are predicted one by one, and
+                             models in sync graphs or under a router are not batched
+                           * max_batch_wait_ms - the maximal time (ms) a batch waits for more requests before it is
+                             predicted (default 5)
         """
         self.name = name
         self.version = ""
@@ -120,6 +137,7 @@ class V2ModelServer(StepToDict):
             self.model = model
             self.ready = True
         self.model_endpoint_uid = None
+        self._batcher = None
 
     def _load_and_update_state(self):
         try:
@@ -133,6 +151,14 @@ class V2ModelServer(StepToDict):
 
     def post_init(self, mode="sync"):
         """sync/async model loading, for internal use"""
+        max_batch_size = int(self.get_param("max_batch_size", 0) or 0)
+        if max_batch_size > 1:
+            self._batcher = _PredictBatcher(
+                self,
+                max_batch_size,
+                float(self.get_param("max_batch_wait_ms", 5)),
+            )
+
         if not self.ready:
             if mode == "async":
                 t = threading.Thread(target=self._load_and_update_state)
@@ -225,8 +251,26 @@ class V2ModelServer(StepToDict):
         request = self.preprocess(event_body, op)
         return self.validate(request, op)
 
+    @property
+    def async_do_event(self):
+        """the event handler of an async flow, which batches the infer requests (when max_batch_size is set)"""
+        return self._async_do_event if self._batcher else None
+
+    @property
+    def async_max_in_flight(self):
+        """the number of events which the step of an async flow processes concurrently"""
+        return self._batcher.max_in_flight if self._batcher else None
+
     def do_event(self, event, *args, **kwargs):
         """main model event handler method"""
+        return _run_sync(self._handle_event(event))
+
+    async def _async_do_event(self, event):
+        return await self._handle_event(event, on_loop=True)
+
+    async def _handle_event(self, event, on_loop=False):
+        """handle the event, the infer requests are batched when running on the event loop of an async flow
+        (on_loop), otherwise the handling does not suspend"""
         start = now_date()
         original_body = event.body
         event_body = _extract_input_data(self._input_path, event.body)
@@ -247,7 +291,10 @@ class V2ModelServer(StepToDict):
             # predict operation
             request = self._pre_event_processing_actions(event, event_body, op)
             try:
-                outputs = self.predict(request)
+                if on_loop:
+                    outputs = await self._batcher.predict(request)
+                else:
+                    outputs = self.predict(request)
             except Exception as exc:
                 request["id"] = event_id
                 if self._model_logger:
@@ -365,7 +412,8 @@ class V2ModelServer(StepToDict):
             if "inputs" not in request:
                 raise Exception('Expected key "inputs" in request body')
 
-            if not isinstance(request["inputs"], list):
+            # numpy inputs are passed by routers which run the models in other processes (shared memory)
+            if not isinstance(request["inputs"], (list, np.ndarray)):
                 raise Exception('Expected "inputs" to be a list')
 
         return request
@@ -426,6 +474,135 @@ class V2ModelServer(StepToDict):
         return request
 
 
+class _BatchItem:
+    def __init__(self, request: dict, future: asyncio.Future):
+        self.request = request
+        self.future = future
+
+
+class _PredictBatcher:
+    """coalesces the infer requests of the events which are in flight together in an async flow into batches, which
+    are predicted by a single predict() call
+
+    the model step processes up to max_in_flight events concurrently on the loop of the flow, and each event awaits
+    the future of its request. a batch is predicted once it has max_batch_size requests or max_batch_wait_ms after
+    its first request, the prediction runs in a thread and the requests which arrive meanwhile form the next batch.
+    list inputs are concatenated, numpy inputs are concatenated along the first axis (when their dtype and inner
+    shape match), other inputs (e.g. dicts) are not merged
+    """
+
+    def __init__(
+        self, model: V2ModelServer, max_batch_size: int, max_batch_wait_ms: float
+    ):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_batch_wait = max_batch_wait_ms / 1000
+        # a batch is collected while the previous one is predicted
+        self.max_in_flight = 2 * max_batch_size
+        self._pending: list[_BatchItem] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._predicting = False
+
+    async def predict(self, request: dict):
+        """add the request to a batch and return its outputs once the batch is predicted"""
+        loop = asyncio.get_running_loop()
+        item = _BatchItem(request, loop.create_future())
+        self._pending.append(item)
+        if not self._predicting:
+            if len(self._pending) >= self.max_batch_size:
+                self._predict_next()
+            elif not self._timer:
+                self._timer = loop.call_later(self.max_batch_wait, self._predict_next)
+        return await item.future
+
+    def _predict_next(self):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        batch = self._collect_batch()
+        if not batch:
+            return
+        self._predicting = True
+        prediction = asyncio.get_running_loop().run_in_executor(
+            None, self._predict_batch, [item.request for item in batch]
+        )
+        prediction.add_done_callback(functools.partial(self._set_outputs, batch))
+
+    def _collect_batch(self) -> list[_BatchItem]:
+        # requests of events which were cancelled while waiting are dropped
+        self._pending = [item for item in self._pending if not item.future.done()]
+        if not self._pending:
+            return []
+        # only requests with the same parameters (other than the inputs) can share a predict call
+        key = _batch_key(self._pending[0].request)
+        if key is None:
+            batch = self._pending[:1]
+        else:
+            batch = [item for item in self._pending if _batch_key(item.request) == key][
+                : self.max_batch_size
+            ]
+        self._pending = [item for item in self._pending if item not in batch]
+        return batch
+
+    def _predict_batch(self, requests: list[dict]) -> list:
+        """predict the requests in a single call, returns the outputs of each request"""
+        if len(requests) == 1:
+            return [self.model.predict(requests[0])]
+        inputs = _concat_inputs([request["inputs"] for request in requests])
+        outputs = self.model.predict(dict(requests[0], inputs=inputs))
+        if len(outputs) != len(inputs):
+            raise mlrun.errors.MLRunRuntimeError(
+                f"model {self.model.name} returned {len(outputs)} outputs for a batch of {len(inputs)} "
+                "inputs, batching (max_batch_size) requires one output per input"
+            )
+        results = []
+        start = 0
+        for request in requests:
+            size = len(request["inputs"])
+            results.append(outputs[start : start + size])
+            start += size
+        return results
+
+    def _set_outputs(self, batch: list[_BatchItem], prediction: asyncio.Future):
+        self._predicting = False
+        for index, item in enumerate(batch):
+            if item.future.done():
+                continue
+            if prediction.cancelled():
+                item.future.cancel()
+            elif prediction.exception():
+                item.future.set_exception(prediction.exception())
+            else:
+                item.future.set_result(prediction.result()[index])
+        # the requests which arrived during the prediction already waited for it
+        if self._pending:
+            self._predict_next()
+
+
+def _batch_key(request: dict) -> Optional[str]:
+    """the key of the requests which can be merged with this request, None if it can't be merged"""
+    inputs = request.get("inputs")
+    if isinstance(inputs, list):
+        inputs_kind = "list"
+    elif isinstance(inputs, np.ndarray) and inputs.ndim > 0:
+        inputs_kind = f"ndarray:{inputs.dtype}:{inputs.shape[1:]}"
+    else:
+        return None
+    params = {
+        key: value for key, value in request.items() if key not in ["inputs", "id"]
+    }
+    return inputs_kind + json.dumps(params, sort_keys=True, default=str)
+
+
+def _concat_inputs(inputs_list: list) -> Union[list, np.ndarray]:
+    if isinstance(inputs_list[0], np.ndarray):
+        return np.concatenate(inputs_list)
+    inputs = []
+    for item_inputs in inputs_list:
+        inputs.extend(item_inputs)
+    return inputs
+
+
 class _ModelLogPusher:
     def __init__(self, model, context, output_stream=None):
         self.model = model
@@ -435,11 +612,20 @@ class _ModelLogPusher:
         self.stream_path = context.stream.stream_uri
         self.stream_batch = int(context.get_param("log_stream_batch", 1))
         self.stream_sample = int(context.get_param("log_stream_sample", 1))
+        self.stream_batch_timeout = float(
+            context.get_param("log_stream_batch_timeout", 1)
+        )
         self.output_stream = output_stream or context.stream.output_stream
         self._worker = context.worker_id
         self._sample_iter = 0
-        self._batch_iter = 0
         self._batch = []
+        self._batch_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._flusher = None
+        server = getattr(context, "server", None)
+        if self.stream_batch > 1 and server:
+            # the flusher is a daemon thread, the pending records are pushed when the server completes
+            server.add_completion_callback(self.flush)
 
     def base_data(self):
         base_data = {
@@ -455,6 +641,9 @@ class _ModelLogPusher:
         return base_data
 
     def push(self, start, request, resp=None, op=None, error=None):
+        if isinstance(request, dict) and isinstance(request.get("inputs"), np.ndarray):
+            # numpy inputs (e.g. in shared memory, see ParallelRun) are tracked as lists, like the request inputs
+            request = dict(request, inputs=request["inputs"].tolist())
         start_str = start.isoformat(sep=" ", timespec="microseconds")
         if error:
             data = self.base_data()
@@ -473,25 +662,7 @@ class _ModelLogPusher:
             microsec = (now_date() - start).microseconds
 
             if self.stream_batch > 1:
-                if self._batch_iter == 0:
-                    self._batch = []
-                self._batch.append(
-                    [request, op, resp, str(start), microsec, self.model.metrics]
-                )
-                self._batch_iter = (self._batch_iter + 1) % self.stream_batch
-
-                if self._batch_iter == 0:
-                    data = self.base_data()
-                    data["headers"] = [
-                        "request",
-                        "op",
-                        "resp",
-                        "when",
-                        "microsec",
-                        "metrics",
-                    ]
-                    data["values"] = self._batch
-                    self.output_stream.push([data])
+                self._add_to_batch(request, resp, start_str, microsec)
             else:
                 data = self.base_data()
                 data["request"] = request
@@ -503,6 +674,111 @@ class _ModelLogPusher:
                     data["metrics"] = self.model.metrics
                 self.output_stream.push([data])
 
+    def flush(self, full_only: bool = False):
+        """push the pending batched records to the stream
+
+        :param full_only: push only full batches, and keep the remaining records for the next flush
+        """
+        with self._batch_lock:
+            size = len(self._batch)
+            if full_only:
+                size -= size % self.stream_batch
+            batch, self._batch = self._batch[:size], self._batch[size:]
+        for index in range(0, len(batch), self.stream_batch):
+            try:
+                self.output_stream.push(
+                    [self._batch_data(batch[index : index + self.stream_batch])]
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Failed to push the model monitoring batch",
+                    model=self.model.name,
+                    records=len(batch[index : index + self.stream_batch]),
+                    error=err_to_str(exc),
+                )
+
+    def _add_to_batch(self, request, resp, when, microsec):
+        # the batch is serialized later, after the request and response may have been modified by the next steps
+        # of the graph, so the fields of the record are copied
+        request, resp = request or {}, resp or {}
+        record = (
+            {
+                key: copy.deepcopy(request.get(key))
+                for key in ["id", "inputs", "entities"]
+            },
+            {key: copy.deepcopy(resp.get(key)) for key in ["id", "outputs"]},
+            when,
+            microsec,
+        )
+        with self._batch_lock:
+            self._batch.append(record)
+            full = len(self._batch) >= self.stream_batch
+            if not self._flusher:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop,
+                    name=f"{self.model.name}-monitoring-flusher",
+                    daemon=True,
+                )
+                self._flusher.start()
+        if full:
+            self._flush_event.set()
+
+    def _flush_loop(self):
+        # serializing and pushing the batches is done off the request path, a batch is pushed once it is full or
+        # when the batch timeout has passed
+        while True:
+            full = self._flush_event.wait(self.stream_batch_timeout)
+            self._flush_event.clear()
+            self.flush(full_only=full)
+
+    def _batch_data(self, batch: list) -> dict:
+        """convert the batched records to a single columnar record, the inputs and outputs of all the requests are
+        concatenated into rows and the "count" column holds the number of rows of each request"""
+        columns = {
+            "when": [],
+            "microsec": [],
+            "request_id": [],
+            "count": [],
+            "inputs": [],
+            "outputs": [],
+        }
+        entities = []
+        for request, resp, when, microsec in batch:
+            inputs = _to_rows(request.get("inputs"))
+            outputs = _to_rows(resp.get("outputs"), len(inputs))
+            count = min(len(inputs), len(outputs))
+            columns["when"].append(when)
+            columns["microsec"].append(microsec)
+            columns["request_id"].append(request.get("id") or resp.get("id"))
+            columns["count"].append(count)
+            columns["inputs"].extend(inputs[:count])
+            columns["outputs"].extend(outputs[:count])
+            entities.append(request.get("entities") or {})
+        if any(entities):
+            columns["entities"] = entities
+
+        data = self.base_data()
+        data[mlrun.common.schemas.model_monitoring.EventFieldType.BATCH] = columns
+        if getattr(self.model, "metrics", None):
+            data["metrics"] = self.model.metrics
+        return data
+
+
+def _to_rows(values, size: Optional[int] = None) -> list:
+    """normalize model inputs or outputs to a list of rows (lists), when size is given and matches the number of
+    values, each value is a row (e.g. a prediction per input row)"""
+    if values is None:
+        return []
+    if isinstance(values, np.ndarray):
+        values = values.tolist()
+    if not isinstance(values, list):
+        return [[values]]
+    if size is not None and len(values) == size:
+        return [value if isinstance(value, list) else [value] for value in values]
+    if all(isinstance(value, list) for value in values):
+        return values
+    return [values]
+
 
 def _init_endpoint_record(
     graph_server: GraphServer, model: V2ModelServer
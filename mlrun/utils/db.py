@@ -16,6 +16,7 @@ import abc
 import pickle
 from datetime import datetime
 
+import orjson
 from sqlalchemy.orm import class_mapper
 
 
@@ -69,3 +70,44 @@ class HasStruct(BaseModel):
         This method must be implemented by any subclass.
         """
         pass
+
+
+class HasJSONStruct(HasStruct):
+    """
+    The struct is stored in a JSON column (the `_struct` attribute of the subclass) instead of a pickled body, so it
+    can be queried and patched in place by the DB. Records which were stored with a pickled body are read from it until
+    they are stored again (or migrated).
+    """
+
+    @property
+    def struct(self):
+        if self._struct is not None:
+            # return a copy, like unpickling, so changes are stored only when the struct is set
+            return orjson.loads(orjson.dumps(self._struct))
+        if self.body is not None:
+            return pickle.loads(self.body)
+        return None
+
+    @struct.setter
+    def struct(self, value):
+        # non JSON serializable values (e.g. datetime) are stored as strings
+        self._struct = orjson.loads(
+            orjson.dumps(
+                value,
+                default=str,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            )
+        )
+        self.body = None
+
+    def to_dict(self, exclude=None, strip: bool = False):
+        exclude = exclude or []
+        exclude.append("struct")
+        return super().to_dict(exclude, strip=strip)
+
+    @abc.abstractmethod
+    def get_identifier_string(self):
+        """
+        This method must be implemented by any subclass.
+        """
+        pass
@@ -138,6 +138,32 @@ class HTTPSessionWithRetry(requests.Session):
                 retry_count += 1
                 time.sleep(self.retry_backoff_factor)
 
+    def connection_stats(self) -> dict:
+        """
+        Connection pool statistics of the session.
+
+        :returns: A dictionary with the pool size (maximal number of connections kept per host), the number of host
+                  pools, the number of connections which were opened, the number of requests which were sent and the
+                  number of requests which reused an open connection.
+        """
+        stats = {"pool_maxsize": 0, "pools": 0, "connections": 0, "requests": 0}
+        for adapter in {
+            id(adapter): adapter for adapter in self.adapters.values()
+        }.values():
+            stats["pool_maxsize"] = max(
+                stats["pool_maxsize"], getattr(adapter, "_pool_maxsize", 0)
+            )
+            for manager in [adapter.poolmanager, *adapter.proxy_manager.values()]:
+                for key in manager.pools.keys():
+                    pool = manager.pools.get(key)
+                    if pool is None:
+                        continue
+                    stats["pools"] += 1
+                    stats["connections"] += pool.num_connections
+                    stats["requests"] += pool.num_requests
+        stats["reused"] = max(stats["requests"] - stats["connections"], 0)
+        return stats
+
     def _error_is_retryable(self, url, method, exc, retry_count):
         if not self.retry_on_exception:
             self._log_exception(
@@ -158,6 +158,7 @@ async def list_artifacts(
     limit: int = Query(None),
     since: str = None,
     until: str = None,
+    fields: list[str] = Query([], alias="field"),
     auth_info: mlrun.common.schemas.AuthInfo = Depends(deps.authenticate_request),
     db_session: Session = Depends(deps.get_db_session),
 ):
@@ -184,6 +185,7 @@ async def list_artifacts(
         producer_id=tree,
         producer_uri=producer_uri,
         limit=limit,
+        fields=fields,
     )
 
     artifacts = await server.api.utils.auth.verifier.AuthVerifier().filter_project_resources_by_permissions(
@@ -16,7 +16,7 @@ import asyncio
 from http import HTTPStatus
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 from fastapi.concurrency import run_in_threadpool
 from mlrun_pipelines.mounts import v3io_cred
 from sqlalchemy.orm import Session
@@ -27,6 +27,7 @@ import mlrun.errors
 import mlrun.feature_store
 import server.api.crud
 import server.api.utils.auth.verifier
+import server.api.utils.response_cache
 import server.api.utils.singletons.project_member
 from mlrun.data_types import InferOptions
 from mlrun.datastore.targets import get_default_prefix_for_target
@@ -223,6 +224,8 @@ async def delete_feature_set(
     response_model=mlrun.common.schemas.FeatureSetsOutput,
 )
 async def list_feature_sets(
+    request: Request,
+    response: Response,
     project: str,
     name: str = None,
     state: str = None,
@@ -249,10 +252,8 @@ async def list_feature_sets(
         mlrun.common.schemas.AuthorizationAction.read,
         auth_info,
     )
-    feature_sets = await run_in_threadpool(
-        server.api.crud.FeatureStore().list_feature_sets,
-        db_session,
-        project,
+    response_cache = server.api.utils.response_cache.ResponseCache()
+    key = (
         name,
         tag,
         state,
@@ -265,6 +266,24 @@ async def list_feature_sets(
         partition_order,
         format_,
     )
+    if not_modified_response := response_cache.check_etag(
+        request,
+        response,
+        server.api.utils.response_cache.CachedResource.feature_sets,
+        project,
+        auth_info,
+        *key,
+    ):
+        return not_modified_response
+    feature_sets = await response_cache.get_or_compute(
+        server.api.utils.response_cache.CachedResource.feature_sets,
+        project,
+        key,
+        server.api.crud.FeatureStore().list_feature_sets,
+        db_session,
+        project,
+        *key,
+    )
     feature_sets = await server.api.utils.auth.verifier.AuthVerifier().filter_project_resources_by_permissions(
         mlrun.common.schemas.AuthorizationResourceTypes.feature_set,
         feature_sets.feature_sets,
@@ -44,6 +44,7 @@ import server.api.utils.background_tasks
 import server.api.utils.clients.chief
 import server.api.utils.functions
 import server.api.utils.pagination
+import server.api.utils.response_cache
 import server.api.utils.singletons.k8s
 import server.api.utils.singletons.project_member
 from mlrun.common.helpers import parse_versioned_object_uri
@@ -111,6 +112,8 @@ async def store_function(
 
 @router.get("/projects/{project}/functions/{name}")
 async def get_function(
+    request: Request,
+    response: Response,
     project: str,
     name: str,
     tag: str = "",
@@ -119,7 +122,28 @@ async def get_function(
     auth_info: mlrun.common.schemas.AuthInfo = Depends(deps.authenticate_request),
     db_session: Session = Depends(deps.get_db_session),
 ):
-    func = await run_in_threadpool(
+    await server.api.utils.auth.verifier.AuthVerifier().query_project_resource_permissions(
+        mlrun.common.schemas.AuthorizationResourceTypes.function,
+        project,
+        name,
+        mlrun.common.schemas.AuthorizationAction.read,
+        auth_info,
+    )
+    response_cache = server.api.utils.response_cache.ResponseCache()
+    key = (name, tag, hash_key, format_)
+    if not_modified_response := response_cache.check_etag(
+        request,
+        response,
+        server.api.utils.response_cache.CachedResource.functions,
+        project,
+        auth_info,
+        *key,
+    ):
+        return not_modified_response
+    func = await response_cache.get_or_compute(
+        server.api.utils.response_cache.CachedResource.functions,
+        project,
+        key,
         server.api.crud.Functions().get_function,
         db_session,
         name,
@@ -128,13 +152,6 @@ async def get_function(
         hash_key,
         format_,
     )
-    await server.api.utils.auth.verifier.AuthVerifier().query_project_resource_permissions(
-        mlrun.common.schemas.AuthorizationResourceTypes.function,
-        project,
-        name,
-        mlrun.common.schemas.AuthorizationAction.read,
-        auth_info,
-    )
     return {
         "func": func,
     }
@@ -202,6 +219,8 @@ async def delete_function(
 
 @router.get("/projects/{project}/functions")
 async def list_functions(
+    request: Request,
+    response: Response,
     project: str = None,
     name: str = None,
     tag: str = None,
@@ -225,6 +244,22 @@ async def list_functions(
         auth_info,
     )
 
+    # only the unpaginated lists are cached, the pages are listed through the paginator
+    response_cache = server.api.utils.response_cache.ResponseCache()
+    paginated = page is not None or page_size is not None or page_token is not None
+    key = (name, tag, sorted(labels or []), hash_key, since, until, format_)
+    if not paginated and (
+        not_modified_response := response_cache.check_etag(
+            request,
+            response,
+            server.api.utils.response_cache.CachedResource.functions,
+            project,
+            auth_info,
+            *key,
+        )
+    ):
+        return not_modified_response
+
     paginator = server.api.utils.pagination.Paginator()
 
     async def _filter_functions_by_permissions(_functions):
@@ -240,23 +275,38 @@ async def list_functions(
             auth_info,
         )
 
-    functions, page_info = await paginator.paginate_permission_filtered_request(
-        db_session,
-        server.api.crud.Functions().list_functions,
-        _filter_functions_by_permissions,
-        auth_info,
-        token=page_token,
-        page=page,
-        page_size=page_size,
-        project=project,
-        name=name,
-        tag=tag,
-        labels=labels,
-        hash_key=hash_key,
-        format_=format_,
-        since=mlrun.utils.datetime_from_iso(since),
-        until=mlrun.utils.datetime_from_iso(until),
-    )
+    list_functions_kwargs = {
+        "project": project,
+        "name": name,
+        "tag": tag,
+        "labels": labels,
+        "hash_key": hash_key,
+        "format_": format_,
+        "since": mlrun.utils.datetime_from_iso(since),
+        "until": mlrun.utils.datetime_from_iso(until),
+    }
+    if paginated:
+        functions, page_info = await paginator.paginate_permission_filtered_request(
+            db_session,
+            server.api.crud.Functions().list_functions,
+            _filter_functions_by_permissions,
+            auth_info,
+            token=page_token,
+            page=page,
+            page_size=page_size,
+            **list_functions_kwargs,
+        )
+    else:
+        functions = await response_cache.get_or_compute(
+            server.api.utils.response_cache.CachedResource.functions,
+            project,
+            key,
+            server.api.crud.Functions().list_functions,
+            db_session,
+            **list_functions_kwargs,
+        )
+        functions = await _filter_functions_by_permissions(functions)
+        page_info = mlrun.common.schemas.pagination.PaginationInfo().dict(by_alias=True)
 
     return {
         "funcs": functions,
@@ -17,7 +17,7 @@ from fastapi import APIRouter, Depends
 
 import server.api.api.deps
 
-from . import config, memory_reports
+from . import config, memory_reports, project_summaries, response_cache
 
 internal_router = APIRouter(
     prefix="/_internal",
@@ -39,3 +39,21 @@ internal_router.include_router(
         Depends(server.api.api.deps.expose_internal_endpoints),
     ],
 )
+
+internal_router.include_router(
+    response_cache.router,
+    tags=["response-cache"],
+    dependencies=[
+        Depends(server.api.api.deps.authenticate_request),
+        Depends(server.api.api.deps.expose_internal_endpoints),
+    ],
+)
+
+internal_router.include_router(
+    project_summaries.router,
+    tags=["project-summaries"],
+    dependencies=[
+        Depends(server.api.api.deps.authenticate_request),
+        Depends(server.api.api.deps.expose_internal_endpoints),
+    ],
+)
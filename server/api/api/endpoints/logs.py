@@ -72,6 +72,7 @@ async def get_log(
     uid: str,
     size: int = -1,
     offset: int = 0,
+    follow: bool = False,
     auth_info: mlrun.common.schemas.AuthInfo = fastapi.Depends(
         server.api.api.deps.authenticate_request
     ),
@@ -90,12 +91,18 @@ async def get_log(
         mlrun.common.schemas.AuthorizationAction.read,
         auth_info,
     )
-    run_state, log_stream = await server.api.crud.Logs().get_logs(
-        db_session, project, uid, size, offset
-    )
-    headers = {
-        "x-mlrun-run-state": run_state,
-    }
+    headers = {}
+    if follow:
+        run_state, log_stream = await server.api.crud.Logs().follow_logs(
+            db_session, project, uid, offset, size
+        )
+        # older APIs ignore the follow param, the clients poll their logs when the header is missing
+        headers["x-mlrun-log-follow"] = "true"
+    else:
+        run_state, log_stream = await server.api.crud.Logs().get_logs(
+            db_session, project, uid, size, offset
+        )
+    headers["x-mlrun-run-state"] = run_state
     return fastapi.responses.StreamingResponse(
         log_stream,
         media_type="text/plain",
@@ -27,6 +27,7 @@ import server.api.crud
 import server.api.utils.auth.verifier
 import server.api.utils.clients.chief
 import server.api.utils.helpers
+import server.api.utils.response_cache
 from mlrun.utils import logger
 from server.api.utils.singletons.project_member import get_project_member
 
@@ -356,6 +357,8 @@ async def list_projects(
     "/project-summaries", response_model=mlrun.common.schemas.ProjectSummariesOutput
 )
 async def list_project_summaries(
+    request: fastapi.Request,
+    response: fastapi.Response,
     owner: str = None,
     labels: list[str] = fastapi.Query(None, alias="label"),
     state: mlrun.common.schemas.ProjectState = None,
@@ -366,6 +369,19 @@ async def list_project_summaries(
         server.api.api.deps.get_db_session
     ),
 ):
+    response_cache = server.api.utils.response_cache.ResponseCache()
+    # the ETag is bound to the user, whose allowed projects are listed below
+    if not_modified_response := response_cache.check_etag(
+        request,
+        response,
+        server.api.utils.response_cache.CachedResource.project_summaries,
+        None,
+        auth_info,
+        owner,
+        labels,
+        state,
+    ):
+        return not_modified_response
     projects_output = await run_in_threadpool(
         get_project_member().list_projects,
         db_session,
@@ -390,7 +406,11 @@ async def list_project_summaries(
             auth_info=auth_info,
             action=mlrun.common.schemas.AuthorizationAction.read,
         )
-    return await get_project_member().list_project_summaries(
+    return await response_cache.get_or_compute(
+        server.api.utils.response_cache.CachedResource.project_summaries,
+        None,
+        (owner, labels, state, allowed_project_names),
+        get_project_member().list_project_summaries,
         db_session,
         owner,
         labels,
@@ -405,6 +425,8 @@ async def list_project_summaries(
     "/project-summaries/{name}", response_model=mlrun.common.schemas.ProjectSummary
 )
 async def get_project_summary(
+    request: fastapi.Request,
+    response: fastapi.Response,
     name: str,
     db_session: sqlalchemy.orm.Session = fastapi.Depends(
         server.api.api.deps.get_db_session
@@ -413,9 +435,6 @@ async def get_project_summary(
         server.api.api.deps.authenticate_request
     ),
 ):
-    project_summary = await get_project_member().get_project_summary(
-        db_session, name, auth_info.session
-    )
     # skip permission check if it's the leader
     if not server.api.utils.helpers.is_request_from_leader(auth_info.projects_role):
         await server.api.utils.auth.verifier.AuthVerifier().query_project_permissions(
@@ -423,7 +442,24 @@ async def get_project_summary(
             mlrun.common.schemas.AuthorizationAction.read,
             auth_info,
         )
-    return project_summary
+    response_cache = server.api.utils.response_cache.ResponseCache()
+    if not_modified_response := response_cache.check_etag(
+        request,
+        response,
+        server.api.utils.response_cache.CachedResource.project_summaries,
+        name,
+        auth_info,
+    ):
+        return not_modified_response
+    return await response_cache.get_or_compute(
+        server.api.utils.response_cache.CachedResource.project_summaries,
+        name,
+        (),
+        get_project_member().get_project_summary,
+        db_session,
+        name,
+        auth_info.session,
+    )
 
 
 @router.post("/projects/{name}/load")
@@ -217,6 +217,7 @@ async def list_runs(
     ),
     max_partitions: int = Query(0, alias="max-partitions", ge=0),
     with_notifications: bool = Query(False, alias="with-notifications"),
+    fields: list[str] = Query([], alias="field"),
     page: int = Query(None, gt=0),
     page_size: int = Query(None, alias="page-size", gt=0),
     page_token: str = Query(None, alias="page-token"),
@@ -269,6 +270,7 @@ async def list_runs(
         partition_order=partition_order,
         max_partitions=max_partitions,
         with_notifications=with_notifications,
+        fields=fields,
     )
     return {
         "runs": runs,
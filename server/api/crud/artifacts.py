@@ -157,6 +157,7 @@ class Artifacts(
         producer_id: str = None,
         producer_uri: str = None,
         limit: int = None,
+        fields: typing.Optional[list[str]] = None,
     ) -> list:
         project = project or mlrun.mlconf.default_project
         if labels is None:
@@ -177,6 +178,7 @@ class Artifacts(
             producer_uri=producer_uri,
             format_=format_,
             limit=limit,
+            fields=fields,
         )
         return artifacts
 
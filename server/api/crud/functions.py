@@ -14,6 +14,7 @@
 #
 
 import datetime
+import typing
 
 import sqlalchemy.orm
 
@@ -100,6 +101,7 @@ class Functions(
         format_: str = None,
         since: datetime.datetime = None,
         until: datetime.datetime = None,
+        page_cursor: typing.Optional[mlrun.common.schemas.PageCursor] = None,
     ) -> list:
         project = project or mlrun.mlconf.default_project
         if labels is None:
@@ -116,6 +118,7 @@ class Functions(
             until=until,
             page=page,
             page_size=page_size,
+            page_cursor=page_cursor,
         )
 
     def get_function_status(
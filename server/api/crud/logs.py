@@ -12,18 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import os
 import pathlib
 import shutil
+import time
 import typing
 from http import HTTPStatus
 
 from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+import mlrun.common.runtimes.constants
 import mlrun.common.schemas
 import mlrun.utils.singleton
 import server.api.api.utils
+import server.api.db.session
 import server.api.utils.clients.log_collector as log_collector
 import server.api.utils.singletons.k8s
 from mlrun.common.runtimes.constants import PodPhases
@@ -152,6 +156,86 @@ class Logs(
         project = project or mlrun.mlconf.default_project
         run = await self._get_run_for_log(db_session, project, uid)
         run_state = run.get("status", {}).get("state", "")
+        log_stream = self._get_log_stream(
+            db_session, project, uid, size, offset, source, run
+        )
+        return run_state, log_stream
+
+    async def follow_logs(
+        self,
+        db_session: Session,
+        project: str,
+        uid: str,
+        offset: int = 0,
+        size: int = -1,
+    ) -> tuple[str, typing.AsyncIterable[bytes]]:
+        """
+        Follow logs, the new bytes of the log are streamed as they are written, until the run is done and its whole log
+        was read, or until the follow timeout elapsed (the client should then follow again from its offset).
+        :param db_session: db session, used only for reading the run before the log is streamed
+        :param project: project name
+        :param uid: run uid
+        :param offset: number of bytes to skip (default 0)
+        :param size: maximal number of bytes to read from the log at once (default -1, the configured default size)
+        :return: run state and logs
+        """
+        project = project or mlrun.mlconf.default_project
+        run = await self._get_run_for_log(db_session, project, uid)
+        run_state = run.get("status", {}).get("state", "")
+        if size is None or size < 0:
+            size = int(mlrun.mlconf.httpdb.logs.pull_logs_default_size_limit)
+        return run_state, self._follow_log_stream(project, uid, offset, size, run)
+
+    async def _follow_log_stream(
+        self, project: str, uid: str, offset: int, size: int, run: dict
+    ) -> typing.AsyncIterable[bytes]:
+        follow_config = mlrun.mlconf.httpdb.logs.follow
+        deadline = time.monotonic() + float(follow_config.timeout)
+        state_read_time = time.monotonic()
+        while True:
+            # the state is read before the log, so the log of a done run is read after its last bytes were written
+            run_state = run.get("status", {}).get("state", "")
+            read_bytes = 0
+            async for log in self._get_log_stream(
+                None, project, uid, size, offset, LogSources.AUTO, run
+            ):
+                if log:
+                    read_bytes += len(log)
+                    yield log
+            offset += read_bytes
+            if read_bytes:
+                continue
+            if (
+                run_state
+                not in mlrun.common.runtimes.constants.RunStates.watched_log_states()
+            ):
+                return
+            if time.monotonic() >= deadline:
+                return
+            await asyncio.sleep(float(follow_config.interval))
+            # the idle log is checked on every interval, while the run is re-read from the DB on a slower cadence, so
+            # a run which is done is detected within the state interval
+            if time.monotonic() - state_read_time < float(follow_config.state_interval):
+                continue
+            # the db session of the request is closed while the response is streamed
+            run = await run_in_threadpool(
+                server.api.db.session.run_function_with_new_db_session,
+                get_db().read_run,
+                uid,
+                project,
+            )
+            state_read_time = time.monotonic()
+
+    def _get_log_stream(
+        self,
+        db_session: typing.Optional[Session],
+        project: str,
+        uid: str,
+        size: int,
+        offset: int,
+        source: LogSources,
+        run: dict,
+    ) -> typing.AsyncIterable[bytes]:
         log_stream = None
         if (
             mlrun.mlconf.log_collector.mode
@@ -205,7 +289,7 @@ class Logs(
                 source,
                 run,
             )
-        return run_state, log_stream
+        return log_stream
 
     @staticmethod
     async def _get_logs_from_logs_collector(
@@ -43,6 +43,33 @@ class PaginationCache(metaclass=mlrun.utils.singleton.Singleton):
         db = server.api.utils.singletons.db.get_db()
         return db.get_paginated_query_cache_record(session, key)
 
+    @staticmethod
+    def update_pagination_cache_record_cursor(
+        session: sqlalchemy.orm.Session,
+        key: str,
+        page: int,
+        page_cursor: mlrun.common.schemas.PageCursor,
+    ):
+        """Store the sort key of the last row of the page, to read the next page from it"""
+        db = server.api.utils.singletons.db.get_db()
+        db.update_paginated_query_cache_record_cursor(
+            session,
+            key,
+            {"page": page, "last": page_cursor.last}
+            if page_cursor.last is not None
+            else None,
+        )
+
+    @staticmethod
+    def get_page_cursor(
+        pagination_cache_record, page: int
+    ) -> mlrun.common.schemas.PageCursor:
+        """The cursor of the page, read from the last row of the previous page if it is the cached one"""
+        cursor = pagination_cache_record.cursor if pagination_cache_record else None
+        if cursor and page and cursor.get("page") == page - 1:
+            return mlrun.common.schemas.PageCursor(after=cursor["last"])
+        return mlrun.common.schemas.PageCursor()
+
     @staticmethod
     def list_pagination_cache_records(
         session: sqlalchemy.orm.Session,
@@ -15,6 +15,7 @@
 import asyncio
 import collections
 import datetime
+import time
 import typing
 
 import fastapi.concurrency
@@ -33,6 +34,7 @@ import server.api.db.session
 import server.api.utils.background_tasks
 import server.api.utils.clients.nuclio
 import server.api.utils.events.events_factory as events_factory
+import server.api.utils.project_summaries
 import server.api.utils.projects.remotes.follower as project_follower
 import server.api.utils.singletons.db
 import server.api.utils.singletons.scheduler
@@ -360,6 +362,107 @@ class Projects(
     async def refresh_project_resources_counters_cache(
         self, session: sqlalchemy.orm.Session
     ):
+        """
+        Refresh the counters of the project summaries. With the incremental refresh, the counters of all the projects
+        are only recalculated (reconciled) every reconciliation interval, and in between only the pipelines counters
+        (the pipelines are not written through the DB) and the counters of the projects which had their resources
+        written are refreshed.
+        """
+        tracker = server.api.utils.project_summaries.ProjectSummariesTracker()
+        if tracker.is_reconciliation_due():
+            # the reconciliation calculates the counters of the projects which were marked until now
+            tracker.pop_changed()
+            start = time.perf_counter()
+            projects_count = await self._reconcile_project_summaries(session)
+            tracker.record_refresh(
+                server.api.utils.project_summaries.ProjectSummaryRefreshKinds.reconciliation,
+                time.perf_counter() - start,
+                projects_count,
+            )
+            return
+
+        await self._refresh_project_summaries_pipelines_counters(session)
+        await self.refresh_changed_project_summaries(session)
+
+    async def refresh_changed_project_summaries(self, session: sqlalchemy.orm.Session):
+        """Recalculate the counters of the projects which had their resources written since the previous refresh"""
+        tracker = server.api.utils.project_summaries.ProjectSummariesTracker()
+        changed = tracker.pop_changed()
+        if not changed:
+            return
+
+        start = time.perf_counter()
+        try:
+            await fastapi.concurrency.run_in_threadpool(
+                self._refresh_project_summaries_counters, session, changed
+            )
+        except Exception:
+            # marked again, to be refreshed on the next cycle
+            for project, counters in changed.items():
+                tracker.mark_changed(project, *counters)
+            raise
+        tracker.record_refresh(
+            server.api.utils.project_summaries.ProjectSummaryRefreshKinds.incremental,
+            time.perf_counter() - start,
+            len(changed),
+        )
+
+    @staticmethod
+    def _refresh_project_summaries_counters(
+        session: sqlalchemy.orm.Session,
+        changed: dict[
+            str, set[server.api.utils.project_summaries.ProjectSummaryCounters]
+        ],
+    ):
+        db = server.api.utils.singletons.db.get_db()
+        db.patch_project_summaries(
+            session,
+            {
+                project: db.calculate_project_summary_counters(
+                    session, project, counters
+                )
+                for project, counters in changed.items()
+            },
+        )
+
+    async def _refresh_project_summaries_pipelines_counters(
+        self, session: sqlalchemy.orm.Session
+    ):
+        projects_output, pipeline_counters = await asyncio.gather(
+            fastapi.concurrency.run_in_threadpool(
+                self.list_projects,
+                session,
+                format_=mlrun.common.formatters.ProjectFormat.name_only,
+            ),
+            self._calculate_pipelines_counters(),
+        )
+        (
+            project_to_recent_completed_pipelines_count,
+            project_to_recent_failed_pipelines_count,
+            project_to_running_pipelines_count,
+        ) = pipeline_counters
+        await fastapi.concurrency.run_in_threadpool(
+            server.api.utils.singletons.db.get_db().patch_project_summaries,
+            session,
+            {
+                project_name: {
+                    "pipelines_completed_recent_count": project_to_recent_completed_pipelines_count[
+                        project_name
+                    ],
+                    "pipelines_failed_recent_count": project_to_recent_failed_pipelines_count[
+                        project_name
+                    ],
+                    "pipelines_running_count": project_to_running_pipelines_count[
+                        project_name
+                    ],
+                }
+                for project_name in projects_output.projects
+            },
+        )
+
+    async def _reconcile_project_summaries(
+        self, session: sqlalchemy.orm.Session
+    ) -> int:
         projects_output = await fastapi.concurrency.run_in_threadpool(
             self.list_projects,
             session,
@@ -433,6 +536,7 @@ class Projects(
             session,
             project_summaries,
         )
+        return len(project_summaries)
 
     @staticmethod
     def _list_pipelines(
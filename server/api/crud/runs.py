@@ -172,6 +172,8 @@ class Runs(
         with_notifications: bool = False,
         page: typing.Optional[int] = None,
         page_size: typing.Optional[int] = None,
+        page_cursor: typing.Optional[mlrun.common.schemas.PageCursor] = None,
+        fields: typing.Optional[list[str]] = None,
     ) -> mlrun.lists.RunList:
         project = project or mlrun.mlconf.default_project
         if (
@@ -235,6 +237,8 @@ class Runs(
             with_notifications=with_notifications,
             page=page,
             page_size=page_size,
+            page_cursor=page_cursor,
+            fields=fields,
         )
 
     async def delete_run(
@@ -122,6 +122,7 @@ class DBInterface(ABC):
         with_notifications: bool = False,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
+        fields: Optional[list[str]] = None,
     ) -> mlrun.lists.RunList:
         pass
 
@@ -226,6 +227,7 @@ class DBInterface(ABC):
         producer_uri: str = None,
         format_: mlrun.common.formatters.ArtifactFormat = mlrun.common.formatters.ArtifactFormat.full,
         limit: int = None,
+        fields: Optional[list[str]] = None,
     ):
         pass
 
@@ -551,6 +553,16 @@ class DBInterface(ABC):
     ):
         pass
 
+    def calculate_project_summary_counters(
+        self, session, project: str, counters: typing.Iterable[str]
+    ) -> dict[str, int]:
+        pass
+
+    def patch_project_summaries(
+        self, session, project_summaries_fields: dict[str, dict]
+    ):
+        pass
+
     @abstractmethod
     def create_feature_set(
         self,
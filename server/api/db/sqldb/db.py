@@ -16,7 +16,9 @@ import asyncio
 import collections
 import functools
 import hashlib
+import json
 import pathlib
+import pickle
 import re
 import typing
 import urllib.parse
@@ -27,7 +29,18 @@ from typing import Any
 import fastapi.concurrency
 import mergedeep
 import pytz
-from sqlalchemy import MetaData, and_, case, delete, distinct, func, or_, select, text
+from sqlalchemy import (
+    MetaData,
+    and_,
+    case,
+    delete,
+    distinct,
+    false,
+    func,
+    or_,
+    select,
+    text,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import Session, aliased
@@ -44,6 +57,8 @@ import mlrun.model
 import server.api.crud
 import server.api.db.session
 import server.api.utils.helpers
+import server.api.utils.project_summaries
+import server.api.utils.response_cache
 from mlrun.artifacts.base import fill_artifact_object_hash
 from mlrun.common.schemas.feature_store import (
     FeatureSetDigestOutputV2,
@@ -160,6 +175,46 @@ def retry_on_conflict(function):
     return wrapper
 
 
+# the JSON merge patch (RFC 7396) function of each dialect
+_json_merge_patch_functions = {
+    "sqlite": func.json_patch,
+    "mysql": func.json_merge_patch,
+}
+
+
+def _is_patchable_run_updates(updates: dict) -> bool:
+    """
+    Whether run updates can be applied with a JSON merge patch: they update nested status or spec fields (the other
+    fields of the run are mirrored by its columns), none of the updated keys contains another one, and the values have
+    no nulls in objects (a merge patch deletes the keys with null values).
+    """
+
+    def has_null(value) -> bool:
+        if value is None:
+            return True
+        if isinstance(value, dict):
+            return any(has_null(item) for item in value.values())
+        return False
+
+    if not updates:
+        return False
+    keys = list(updates.keys())
+    for key in keys:
+        if not isinstance(key, str) or "\\" in key:
+            return False
+        parts = key.split(".")
+        if len(parts) < 2 or parts[0] not in ["status", "spec"]:
+            return False
+        if any(other != key and other.startswith(f"{key}.") for other in keys):
+            return False
+    return not any(has_null(value) for value in updates.values())
+
+
+def _project_filters(project_column, project: typing.Optional[str]) -> list:
+    """The filters of a query of the resources of all the projects by a single project, if given"""
+    return [project_column == project] if project else []
+
+
 class SQLDB(DBInterface):
     def __init__(self, dsn=""):
         self.dsn = dsn
@@ -216,6 +271,7 @@ class SQLDB(DBInterface):
         )
         # Do not lock run as it may cause deadlocks
         run = self._get_run(session, uid, project, iter)
+        previous_state = run.state if run else None
         now = datetime.now(timezone.utc)
         if not run:
             run = Run(
@@ -241,9 +297,18 @@ class SQLDB(DBInterface):
         self._update_run_updated_time(run, run_data, now=now)
         run.struct = run_data
         self._upsert(session, [run], ignore=True)
+        if run.state != previous_state:
+            self._mark_project_summary_changed(
+                project, server.api.utils.project_summaries.ProjectSummaryCounters.runs
+            )
 
     def update_run(self, session, updates: dict, uid, project="", iter=0):
         project = project or config.default_project
+        struct = self._patch_run_struct(session, updates, uid, project, iter)
+        if struct is not None:
+            self._mark_run_state_update(project, updates)
+            return struct
+
         run = self._get_run(session, uid, project, iter, with_for_update=True)
         if not run:
             run_uri = RunObject.create_uri(project, uid, iter)
@@ -264,8 +329,66 @@ class SQLDB(DBInterface):
         run.struct = struct
         self._upsert(session, [run])
         self._delete_empty_labels(session, Run.Label)
+        self._mark_run_state_update(project, updates)
         return run.struct
 
+    def _mark_run_state_update(self, project: str, updates: dict):
+        if "status.state" in updates:
+            self._mark_project_summary_changed(
+                project, server.api.utils.project_summaries.ProjectSummaryCounters.runs
+            )
+
+    def _patch_run_struct(
+        self, session, updates: dict, uid: str, project: str, iter: int
+    ) -> typing.Optional[dict]:
+        """
+        Apply the run updates in place with the JSON merge patch function of the DB, instead of locking, reading and
+        rewriting the whole run. Only updates of nested status and spec fields are patched, the other updates (e.g.
+        of the run name or labels) require the run record.
+
+        :returns: The updated run struct, None when the updates can't be patched or the run is not stored in the
+                  struct column (not found or not migrated yet), and then the run should be updated by its record.
+        """
+        patch_function = _json_merge_patch_functions.get(
+            session.get_bind().dialect.name
+        )
+        if not patch_function or not _is_patchable_run_updates(updates):
+            return None
+
+        now = datetime.now(timezone.utc)
+        deletions, patch = {}, {}
+        for key, value in updates.items():
+            if isinstance(value, dict):
+                # a merge patch merges the objects into the existing ones, while an update replaces them
+                update_in(deletions, key, None)
+            update_in(patch, key, value)
+        update_in(patch, "status.last_update", now.isoformat())
+
+        struct = Run._struct
+        if deletions:
+            struct = patch_function(struct, json.dumps(deletions))
+        values = {
+            Run._struct: patch_function(struct, json.dumps(patch, default=str)),
+            Run.updated: now,
+        }
+        if "status.state" in updates:
+            values[Run.state] = updates["status.state"]
+        start_time = run_start_time(patch)
+        if start_time:
+            values[Run.start_time] = start_time
+
+        patched = (
+            self._query(session, Run, uid=uid, project=project, iteration=iter)
+            .filter(Run._struct.isnot(None))
+            .update(values, synchronize_session=False)
+        )
+        session.commit()
+        if not patched:
+            return None
+        return self._query(
+            session, Run._struct, uid=uid, project=project, iteration=iter
+        ).scalar()
+
     def list_distinct_runs_uids(
         self,
         session,
@@ -389,8 +512,14 @@ class SQLDB(DBInterface):
         with_notifications: bool = False,
         page: typing.Optional[int] = None,
         page_size: typing.Optional[int] = None,
+        page_cursor: typing.Optional[mlrun.common.schemas.PageCursor] = None,
+        fields: typing.Optional[list[str]] = None,
     ) -> RunList:
         project = project or config.default_project
+        if fields and with_notifications:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Fields cannot be used together with notifications, which are filled into the full runs"
+            )
         query = self._find_runs(session, uid, project, labels)
         if name is not None:
             query = self._add_run_name_query(query, name)
@@ -436,13 +565,40 @@ class SQLDB(DBInterface):
                 max_partitions,
             )
 
-        query = self._paginate_query(query, page, page_size)
+        # the partitioned and limited queries are paginated by offset
+        keyset = None
+        if not partition_by and not last:
+            keyset = (
+                [(Run.start_time, True), (Run.id, True)] if sort else [(Run.id, False)]
+            )
+        query = self._paginate_query(query, page, page_size, keyset, page_cursor)
+
+        projection = None
+        if fields and return_as_run_structs:
+            projection = self._run_fields_projection(fields)
+            query = query.with_entities(
+                Run.id, Run.start_time, Run.body, *projection.values()
+            )
 
+        run_records = query.all()
+        if keyset:
+            self._set_page_cursor_last(
+                page_cursor,
+                [getattr(run_records[-1], column.key) for column, _ in keyset]
+                if run_records
+                else None,
+            )
         if not return_as_run_structs:
-            return query.all()
+            return run_records
+
+        if projection:
+            return RunList(
+                self._projected_run_struct(run_record, projection)
+                for run_record in run_records
+            )
 
         runs = RunList()
-        for run in query:
+        for run in run_records:
             run_struct = run.struct
             if with_notifications:
                 self._fill_run_struct_with_notifications(run.notifications, run_struct)
@@ -450,6 +606,62 @@ class SQLDB(DBInterface):
 
         return runs
 
+    def _run_fields_projection(self, fields: list[str]) -> dict[str, typing.Any]:
+        """
+        The columns to select for the field paths of the run structs. The fields which have a column are read from
+        it, the others are extracted from the struct column by the DB, so the structs are not loaded.
+        The uid and project of the runs are always selected, as the runs are identified (and authorized) by them.
+        """
+        columns = {
+            "metadata.name": Run.name,
+            "metadata.uid": Run.uid,
+            "metadata.project": Run.project,
+            "status.state": Run.state,
+        }
+        projection = {}
+        for index, field in enumerate(
+            self._projection_fields(fields, ["metadata.uid", "metadata.project"])
+        ):
+            column = columns.get(field)
+            if column is None:
+                column = Run._struct[tuple(field.split("."))]
+            projection[field] = column.label(f"field_{index}")
+        return projection
+
+    @staticmethod
+    def _projected_run_struct(run_record, projection: dict[str, typing.Any]) -> dict:
+        run_struct = {}
+        if run_record.body is not None:
+            # stored before the struct column, the fields are taken from the pickled body
+            run_struct = SQLDB._projected_struct(
+                pickle.loads(run_record.body), list(projection)
+            )
+        for field, column in projection.items():
+            value = getattr(run_record, column.name)
+            if value is not None:
+                update_in(run_struct, field, value)
+        return run_struct
+
+    @staticmethod
+    def _projected_struct(struct: dict, fields: list[str]) -> dict:
+        """The fields of the struct, missing fields are omitted"""
+        projected_struct = {}
+        for field in fields:
+            value = get_in(struct, field)
+            if value is not None:
+                update_in(projected_struct, field, value)
+        return projected_struct
+
+    @staticmethod
+    def _projection_fields(fields: list[str], identity_fields: list[str]) -> list[str]:
+        """The validated field paths of a projection, followed by the fields which identify the objects"""
+        for field in fields:
+            if not field or not all(field.split(".")):
+                raise mlrun.errors.MLRunInvalidArgumentError(
+                    f"Invalid field path, expected a dot separated path: {field!r}"
+                )
+        return list(dict.fromkeys([*fields, *identity_fields]))
+
     def _fill_run_struct_with_notifications(self, notifications, run_struct):
         if not notifications:
             return
@@ -469,6 +681,9 @@ class SQLDB(DBInterface):
         project = project or config.default_project
         # We currently delete *all* iterations
         self._delete(session, Run, uid=uid, project=project)
+        self._mark_project_summary_changed(
+            project, server.api.utils.project_summaries.ProjectSummaryCounters.runs
+        )
 
     def del_runs(
         self, session, name=None, project=None, labels=None, state=None, days_ago=0
@@ -485,6 +700,9 @@ class SQLDB(DBInterface):
         for run in query:  # Can not use query.delete with join
             session.delete(run)
         session.commit()
+        self._mark_project_summary_changed(
+            project, server.api.utils.project_summaries.ProjectSummaryCounters.runs
+        )
 
     def _add_run_name_query(self, query, name):
         exact_name = self._escape_characters_for_like_query(name)
@@ -679,6 +897,9 @@ class SQLDB(DBInterface):
         if tag != "latest":
             self.tag_artifacts(session, "latest", [db_artifact], project)
 
+        self._mark_project_summary_changed(
+            project, server.api.utils.project_summaries.ProjectSummaryCounters.artifacts
+        )
         return uid
 
     def list_artifacts(
@@ -701,6 +922,7 @@ class SQLDB(DBInterface):
         most_recent: bool = False,
         format_: mlrun.common.formatters.ArtifactFormat = mlrun.common.formatters.ArtifactFormat.full,
         limit: int = None,
+        fields: typing.Optional[list[str]] = None,
     ):
         project = project or config.default_project
 
@@ -708,6 +930,22 @@ class SQLDB(DBInterface):
             raise mlrun.errors.MLRunInvalidArgumentError(
                 "Best iteration cannot be used when iter is specified"
             )
+        if fields and format_ not in [
+            None,
+            mlrun.common.formatters.ArtifactFormat.full,
+        ]:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "Fields cannot be used together with a format"
+            )
+
+        if fields:
+            fields = self._projection_fields(
+                fields, ["metadata.project", "spec.db_key"]
+            )
+        # the artifacts are not loaded when all the fields have columns (the producer uri is matched on the objects)
+        columns = None
+        if fields and not as_records and not producer_uri:
+            columns = self._artifact_fields_columns(fields)
 
         artifact_records = self._find_artifacts(
             session,
@@ -726,10 +964,21 @@ class SQLDB(DBInterface):
             most_recent=most_recent,
             attach_tags=not as_records,
             limit=limit,
+            with_entities=list(columns.values()) if columns else None,
         )
         if as_records:
             return artifact_records
 
+        if columns:
+            return ArtifactList(
+                self._projected_artifact_struct(
+                    columns,
+                    values,
+                    artifact_tag if "metadata.tag" in fields else None,
+                )
+                for *values, artifact_tag in artifact_records
+            )
+
         artifacts = ArtifactList()
         for artifact, artifact_tag in artifact_records:
             artifact_struct = artifact.full_object
@@ -752,6 +1001,8 @@ class SQLDB(DBInterface):
                     continue
 
             self._set_tag_in_artifact_struct(artifact_struct, artifact_tag)
+            if fields:
+                artifact_struct = self._projected_struct(artifact_struct, fields)
             artifacts.append(
                 mlrun.common.formatters.ArtifactFormat.format_obj(
                     artifact_struct, format_
@@ -760,6 +1011,33 @@ class SQLDB(DBInterface):
 
         return artifacts
 
+    @staticmethod
+    def _artifact_fields_columns(fields: list[str]) -> typing.Optional[dict]:
+        """The columns of the field paths of the artifact structs, None if any of the fields has no column"""
+        columns = {
+            "kind": ArtifactV2.kind,
+            "metadata.project": ArtifactV2.project,
+            "metadata.uid": ArtifactV2.uid,
+            # the artifacts are stored under their db key
+            "spec.db_key": ArtifactV2.key,
+        }
+        # the tag is selected with the artifacts
+        fields = [field for field in fields if field != "metadata.tag"]
+        if not all(field in columns for field in fields):
+            return None
+        return {field: columns[field] for field in fields}
+
+    @staticmethod
+    def _projected_artifact_struct(
+        columns: dict, values: list, artifact_tag: typing.Optional[str]
+    ) -> dict:
+        artifact_struct = {}
+        for field, value in zip(columns, values):
+            update_in(artifact_struct, field, value)
+        if artifact_tag:
+            artifact_struct["metadata"]["tag"] = artifact_tag
+        return artifact_struct
+
     def list_artifacts_for_producer_id(
         self,
         session,
@@ -871,6 +1149,9 @@ class SQLDB(DBInterface):
             producer_id=producer_id,
             iteration=iter,
         )
+        self._mark_project_summary_changed(
+            project, server.api.utils.project_summaries.ProjectSummaryCounters.artifacts
+        )
 
     def del_artifacts(
         self,
@@ -928,6 +1209,9 @@ class SQLDB(DBInterface):
             )
             failed_deletions_count += len(column_values) - deletions_count
 
+        self._mark_project_summary_changed(
+            project, server.api.utils.project_summaries.ProjectSummaryCounters.artifacts
+        )
         if failed_deletions_count:
             raise mlrun.errors.MLRunInternalServerError(
                 f"Failed to delete {failed_deletions_count} artifacts"
@@ -1801,6 +2085,9 @@ class SQLDB(DBInterface):
         fn.struct = function
         self._upsert(session, [fn])
         self.tag_objects_v2(session, [fn], project, tag)
+        self._invalidate_response_cache(
+            server.api.utils.response_cache.CachedResource.functions, project
+        )
         return hash_key
 
     def list_functions(
@@ -1816,9 +2103,11 @@ class SQLDB(DBInterface):
         page_size: typing.Optional[int] = None,
         since: datetime = None,
         until: datetime = None,
+        page_cursor: typing.Optional[mlrun.common.schemas.PageCursor] = None,
     ) -> list[dict]:
         project = project or mlrun.mlconf.default_project
         functions = []
+        last_row_key = None
         for function, function_tag in self._find_functions(
             session=session,
             name=name,
@@ -1830,7 +2119,9 @@ class SQLDB(DBInterface):
             until=until,
             page=page,
             page_size=page_size,
+            page_cursor=page_cursor,
         ):
+            last_row_key = [function.id, function_tag]
             function_dict = function.struct
             if not function_tag:
                 # function status should be added only to tagged functions
@@ -1852,6 +2143,7 @@ class SQLDB(DBInterface):
                     function_dict, format_
                 )
             )
+        self._set_page_cursor_last(page_cursor, last_row_key)
         return functions
 
     def get_function(
@@ -1897,6 +2189,9 @@ class SQLDB(DBInterface):
             session, Function, project=project, name=name, commit=False
         )
         self._delete(session, Function, project=project, name=name)
+        self._invalidate_response_cache(
+            server.api.utils.response_cache.CachedResource.functions, project
+        )
 
     def delete_functions(
         self, session: Session, project: str, names: typing.Union[str, list[str]]
@@ -1911,6 +2206,9 @@ class SQLDB(DBInterface):
             main_table_identifier=Function.name,
             main_table_identifier_values=names,
         )
+        self._invalidate_response_cache(
+            server.api.utils.response_cache.CachedResource.functions, project
+        )
 
     def update_function(
         self,
@@ -1935,6 +2233,9 @@ class SQLDB(DBInterface):
                 update_in(struct, key, val)
             function.struct = struct
             self._upsert(session, [function])
+            self._invalidate_response_cache(
+                server.api.utils.response_cache.CachedResource.functions, project
+            )
             return function.struct
 
     def update_function_external_invocation_url(
@@ -2006,6 +2307,9 @@ class SQLDB(DBInterface):
         if updated:
             function.struct = struct
             self._upsert(session, [function])
+            self._invalidate_response_cache(
+                server.api.utils.response_cache.CachedResource.functions, project
+            )
 
     def _get_function(
         self,
@@ -2201,6 +2505,9 @@ class SQLDB(DBInterface):
             next_run_time=schedule_record.next_run_time,
         )
         self._upsert(session, [schedule_record])
+        self._mark_project_summary_changed(
+            project, server.api.utils.project_summaries.ProjectSummaryCounters.schedules
+        )
 
         schedule = self._transform_schedule_record_to_scheme(schedule_record)
         return schedule
@@ -2273,6 +2580,12 @@ class SQLDB(DBInterface):
             next_run_time=next_run_time,
         )
         self._upsert(session, [schedule])
+        # the pending schedules counters are calculated from the labels and the next run time
+        if labels is not None or next_run_time is not None:
+            self._mark_project_summary_changed(
+                project,
+                server.api.utils.project_summaries.ProjectSummaryCounters.schedules,
+            )
 
     @staticmethod
     def _update_schedule_body(
@@ -2350,6 +2663,9 @@ class SQLDB(DBInterface):
             session, Schedule, project=project, name=name, commit=False
         )
         self._delete(session, Schedule, project=project, name=name)
+        self._mark_project_summary_changed(
+            project, server.api.utils.project_summaries.ProjectSummaryCounters.schedules
+        )
 
     def delete_project_schedules(self, session: Session, project: str):
         logger.debug("Removing schedules from db", project=project)
@@ -2374,6 +2690,9 @@ class SQLDB(DBInterface):
             main_table_identifier=Schedule.name,
             main_table_identifier_values=names,
         )
+        self._mark_project_summary_changed(
+            project, server.api.utils.project_summaries.ProjectSummaryCounters.schedules
+        )
 
     def align_schedule_labels(self, session: Session):
         schedules_update = []
@@ -2585,6 +2904,10 @@ class SQLDB(DBInterface):
         objects_to_store = [project_record]
         self._append_project_summary(project, objects_to_store)
         self._upsert(session, objects_to_store)
+        self._invalidate_response_cache(
+            server.api.utils.response_cache.CachedResource.project_summaries,
+            project.metadata.name,
+        )
 
     @staticmethod
     def _append_project_summary(project, objects_to_store):
@@ -2806,6 +3129,9 @@ class SQLDB(DBInterface):
                 session.delete(summary)
 
         self._commit(session, associated_summaries + orphaned_summaries)
+        self._invalidate_response_cache(
+            server.api.utils.response_cache.CachedResource.project_summaries
+        )
 
     def _delete_project_summary(
         self,
@@ -2814,6 +3140,9 @@ class SQLDB(DBInterface):
     ):
         logger.debug("Deleting project summary from DB", name=name)
         self._delete(session, ProjectSummary, project=name)
+        self._invalidate_response_cache(
+            server.api.utils.response_cache.CachedResource.project_summaries, name
+        )
 
     async def get_project_resources_counters(
         self,
@@ -2877,6 +3206,102 @@ class SQLDB(DBInterface):
             project_to_running_runs_count,
         )
 
+    def calculate_project_summary_counters(
+        self,
+        session: Session,
+        project: str,
+        counters: typing.Iterable[
+            server.api.utils.project_summaries.ProjectSummaryCounters
+        ],
+    ) -> dict[str, int]:
+        """
+        Calculate the summary counters of a single project, with the queries of the counters of all the projects
+        filtered by the project.
+
+        :returns: The counters by their project summary field names.
+        """
+        counters = set(counters)
+        summary_counters = {}
+        if server.api.utils.project_summaries.ProjectSummaryCounters.runs in counters:
+            completed, failed, running = self._calculate_runs_counters(session, project)
+            summary_counters["runs_completed_recent_count"] = completed.get(project, 0)
+            summary_counters["runs_failed_recent_count"] = failed.get(project, 0)
+            summary_counters["runs_running_count"] = running.get(project, 0)
+        if (
+            server.api.utils.project_summaries.ProjectSummaryCounters.artifacts
+            in counters
+        ):
+            summary_counters["files_count"] = self._calculate_files_counters(
+                session, project
+            ).get(project, 0)
+            summary_counters["models_count"] = self._calculate_models_counters(
+                session, project
+            ).get(project, 0)
+        if (
+            server.api.utils.project_summaries.ProjectSummaryCounters.schedules
+            in counters
+        ):
+            schedules, pending_jobs, pending_workflows = (
+                self._calculate_schedules_counters(session, project)
+            )
+            summary_counters["distinct_schedules_count"] = schedules.get(project, 0)
+            summary_counters["distinct_scheduled_jobs_pending_count"] = (
+                pending_jobs.get(project, 0)
+            )
+            summary_counters["distinct_scheduled_pipelines_pending_count"] = (
+                pending_workflows.get(project, 0)
+            )
+        if (
+            server.api.utils.project_summaries.ProjectSummaryCounters.feature_sets
+            in counters
+        ):
+            summary_counters["feature_sets_count"] = (
+                self._calculate_feature_sets_counters(session, project).get(project, 0)
+            )
+        return summary_counters
+
+    def patch_project_summaries(
+        self,
+        session: Session,
+        project_summaries_fields: dict[str, dict],
+    ):
+        """
+        Update the given fields of the summaries of the projects, keeping their other fields.
+
+        :param project_summaries_fields: The fields to update, per project name. Projects without a summary (e.g.
+                                         deleted ones) are skipped.
+        """
+        if not project_summaries_fields:
+            return
+        # locked, so concurrent updates of different fields of the same summary don't override each other
+        project_summaries = (
+            self._query(session, ProjectSummary)
+            .filter(ProjectSummary.project.in_(project_summaries_fields.keys()))
+            .with_for_update()
+            .all()
+        )
+        now = datetime.now(timezone.utc)
+        updated_summaries = []
+        for project_summary in project_summaries:
+            summary = {
+                **project_summary.summary,
+                **project_summaries_fields[project_summary.project],
+            }
+            if summary == project_summary.summary:
+                continue
+            # assigned as a new dict, for the change of the JSON column to be detected
+            project_summary.summary = summary
+            project_summary.updated = now
+            session.add(project_summary)
+            updated_summaries.append(project_summary)
+        # commits also when nothing was updated, to release the locks
+        self._commit(session, updated_summaries)
+        for project_summary in updated_summaries:
+            self._invalidate_response_cache(
+                server.api.utils.response_cache.CachedResource.project_summaries,
+                project_summary.project,
+            )
+
     @staticmethod
     def _calculate_functions_counters(session) -> dict[str, int]:
         functions_count_per_project = (
@@ -2891,10 +3316,11 @@ class SQLDB(DBInterface):
 
     @staticmethod
     def _calculate_schedules_counters(
-        session,
+        session, project: str = None
     ) -> [dict[str, int], dict[str, int], dict[str, int]]:
         schedules_count_per_project = (
             session.query(Schedule.project, func.count(distinct(Schedule.name)))
+            .filter(*_project_filters(Schedule.project, project))
             .group_by(Schedule.project)
             .all()
         )
@@ -2952,6 +3378,7 @@ class SQLDB(DBInterface):
                     ]
                 )
             )
+            .filter(*_project_filters(Schedule.project, project))
             .group_by(Schedule.project, Schedule.name)
             .all()
         )
@@ -2973,9 +3400,12 @@ class SQLDB(DBInterface):
         )
 
     @staticmethod
-    def _calculate_feature_sets_counters(session) -> dict[str, int]:
+    def _calculate_feature_sets_counters(
+        session, project: str = None
+    ) -> dict[str, int]:
         feature_sets_count_per_project = (
             session.query(FeatureSet.project, func.count(distinct(FeatureSet.name)))
+            .filter(*_project_filters(FeatureSet.project, project))
             .group_by(FeatureSet.project)
             .all()
         )
@@ -2984,12 +3414,14 @@ class SQLDB(DBInterface):
         }
         return project_to_feature_set_count
 
-    def _calculate_models_counters(self, session) -> dict[str, int]:
+    def _calculate_models_counters(
+        self, session, project: str = None
+    ) -> dict[str, int]:
         # We're using the "most_recent" which gives us only one version of each artifact key, which is what we want to
         # count (artifact count, not artifact versions count)
         model_artifacts = self._find_artifacts(
             session,
-            None,
+            project,
             kind=mlrun.common.schemas.ArtifactCategories.model,
             most_recent=True,
         )
@@ -2998,12 +3430,12 @@ class SQLDB(DBInterface):
             project_to_models_count[model_artifact.project] += 1
         return project_to_models_count
 
-    def _calculate_files_counters(self, session) -> dict[str, int]:
+    def _calculate_files_counters(self, session, project: str = None) -> dict[str, int]:
         # We're using the "most_recent" flag which gives us only one version of each artifact key, which is what we
         # want to count (artifact count, not artifact versions count)
         file_artifacts = self._find_artifacts(
             session,
-            None,
+            project,
             category=mlrun.common.schemas.ArtifactCategories.other,
             most_recent=True,
         )
@@ -3014,7 +3446,7 @@ class SQLDB(DBInterface):
 
     @staticmethod
     def _calculate_runs_counters(
-        session,
+        session, project: str = None
     ) -> tuple[
         dict[str, int],
         dict[str, int],
@@ -3027,6 +3459,7 @@ class SQLDB(DBInterface):
                     mlrun.common.runtimes.constants.RunStates.non_terminal_states()
                 )
             )
+            .filter(*_project_filters(Run.project, project))
             .group_by(Run.project)
             .all()
         )
@@ -3046,6 +3479,7 @@ class SQLDB(DBInterface):
                 )
             )
             .filter(Run.start_time >= one_day_ago)
+            .filter(*_project_filters(Run.project, project))
             .group_by(Run.project)
             .all()
         )
@@ -3063,6 +3497,7 @@ class SQLDB(DBInterface):
                 )
             )
             .filter(Run.start_time >= one_day_ago)
+            .filter(*_project_filters(Run.project, project))
             .group_by(Run.project)
             .all()
         )
@@ -3095,6 +3530,10 @@ class SQLDB(DBInterface):
         labels = project.metadata.labels or {}
         update_labels(project_record, labels)
         self._upsert(session, [project_record])
+        self._invalidate_response_cache(
+            server.api.utils.response_cache.CachedResource.project_summaries,
+            project_record.name,
+        )
 
     def _patch_project_record_from_project(
         self,
@@ -3257,6 +3696,13 @@ class SQLDB(DBInterface):
 
         self._upsert(session, [db_feature_set])
         self.tag_objects_v2(session, [db_feature_set], project, tag)
+        self._invalidate_response_cache(
+            server.api.utils.response_cache.CachedResource.feature_sets, project
+        )
+        self._mark_project_summary_changed(
+            project,
+            server.api.utils.project_summaries.ProjectSummaryCounters.feature_sets,
+        )
 
         return uid
 
@@ -4009,7 +4455,7 @@ class SQLDB(DBInterface):
         versioned=True,
         always_overwrite=False,
     ) -> str:
-        return self._store_tagged_object(
+        uid = self._store_tagged_object(
             session,
             FeatureSet,
             project,
@@ -4020,6 +4466,14 @@ class SQLDB(DBInterface):
             versioned=versioned,
             always_overwrite=always_overwrite,
         )
+        self._invalidate_response_cache(
+            server.api.utils.response_cache.CachedResource.feature_sets, project
+        )
+        self._mark_project_summary_changed(
+            project,
+            server.api.utils.project_summaries.ProjectSummaryCounters.feature_sets,
+        )
+        return uid
 
     def _store_tagged_object(
         self,
@@ -4199,6 +4653,13 @@ class SQLDB(DBInterface):
             uid=uid,
             name=name,
         )
+        self._invalidate_response_cache(
+            server.api.utils.response_cache.CachedResource.feature_sets, project
+        )
+        self._mark_project_summary_changed(
+            project,
+            server.api.utils.project_summaries.ProjectSummaryCounters.feature_sets,
+        )
 
     # ---- Feature Vectors ----
     def create_feature_vector(
@@ -4586,6 +5047,23 @@ class SQLDB(DBInterface):
         session.query(cls).filter(cls.parent == NULL).delete()
         session.commit()
 
+    @staticmethod
+    def _invalidate_response_cache(
+        resource: server.api.utils.response_cache.CachedResource, project: str = None
+    ):
+        server.api.utils.response_cache.ResponseCache().bump_generation(
+            resource, project
+        )
+
+    @staticmethod
+    def _mark_project_summary_changed(
+        project: str,
+        *counters: server.api.utils.project_summaries.ProjectSummaryCounters,
+    ):
+        server.api.utils.project_summaries.ProjectSummariesTracker().mark_changed(
+            project, *counters
+        )
+
     def _upsert(self, session, objects, ignore=False):
         if not objects:
             return
@@ -4695,6 +5173,7 @@ class SQLDB(DBInterface):
         until: datetime = None,
         page: typing.Optional[int] = None,
         page_size: typing.Optional[int] = None,
+        page_cursor: typing.Optional[mlrun.common.schemas.PageCursor] = None,
     ) -> list[tuple[Function, str]]:
         """
         Query functions from the DB by the given filters.
@@ -4709,6 +5188,7 @@ class SQLDB(DBInterface):
         :param until: Filter functions that were updated before this time
         :param page: The page number to query.
         :param page_size: The page size to query.
+        :param page_cursor: The keyset cursor of the page, the pages are sorted by function id and tag.
         """
         query = session.query(Function, Function.Tag.name)
         query = query.filter(Function.project == project)
@@ -4738,7 +5218,13 @@ class SQLDB(DBInterface):
 
         labels = label_set(labels)
         query = self._add_labels_filter(session, query, Function, labels)
-        query = self._paginate_query(query, page, page_size)
+        query = self._paginate_query(
+            query,
+            page,
+            page_size,
+            keyset=[(Function.id, False), (Function.Tag.name, False)],
+            page_cursor=page_cursor,
+        )
         return query
 
     def _delete(self, session, cls, **kw):
@@ -5953,6 +6439,17 @@ class SQLDB(DBInterface):
     ):
         return self._query(session, PaginationCache, key=key).one_or_none()
 
+    def update_paginated_query_cache_record_cursor(
+        self,
+        session,
+        key: str,
+        cursor: typing.Optional[dict],
+    ):
+        pagination_cache_record = self.get_paginated_query_cache_record(session, key)
+        if pagination_cache_record:
+            pagination_cache_record.cursor = cursor
+            self._upsert(session, [pagination_cache_record])
+
     def list_paginated_query_cache_record(
         self,
         session,
@@ -6086,11 +6583,87 @@ class SQLDB(DBInterface):
         return table_name in metadata.tables.keys()
 
     @staticmethod
-    def _paginate_query(query, page: int = None, page_size: int = None):
+    def _paginate_query(
+        query,
+        page: int = None,
+        page_size: int = None,
+        keyset: typing.Optional[list[tuple[typing.Any, bool]]] = None,
+        page_cursor: typing.Optional[mlrun.common.schemas.PageCursor] = None,
+    ):
+        """
+        :param keyset:      The (column, descending) pairs to sort the pages by, the last one must make the sort key
+                            unique. Pages whose cursor holds the sort key of the last row of the previous page are read
+                            from it (keyset pagination), so their cost does not grow with the page number. Other pages
+                            (e.g. the first one, or a page which is not the next one) are read with an offset.
+        :param page_cursor: The cursor of the page, see :py:class:`~mlrun.common.schemas.PageCursor`.
+        """
         if page is not None:
             page_size = page_size or config.httpdb.pagination.default_page_size
+            if keyset:
+                query = query.order_by(None).order_by(
+                    *[
+                        column.desc() if descending else column.asc()
+                        for column, descending in keyset
+                    ]
+                )
+                if page_cursor and page_cursor.after is not None:
+                    return query.filter(
+                        SQLDB._keyset_after_predicate(keyset, page_cursor.after)
+                    ).limit(page_size)
+
             if query.count() < page_size * (page - 1):
                 raise StopIteration
             query = query.limit(page_size).offset((page - 1) * page_size)
 
         return query
+
+    @staticmethod
+    def _keyset_after_predicate(
+        keyset: list[tuple[typing.Any, bool]], values: list
+    ) -> typing.Any:
+        """
+        The predicate of the rows which come after the given sort key, in the keyset order. Nulls are sorted as the
+        smallest values (as in SQLite and MySQL). The leading column is bounded on its own (e.g. start_time <= x), so
+        the DB seeks its index instead of scanning the rows of the previous pages.
+        """
+        predicate = None
+        for (column, descending), value in reversed(list(zip(keyset, values))):
+            if isinstance(value, str) and column.type.python_type is datetime:
+                value = datetime.fromisoformat(value)
+
+            if value is None:
+                if predicate is None:
+                    predicate = false() if descending else column.is_not(None)
+                elif descending:
+                    predicate = and_(column.is_(None), predicate)
+                else:
+                    predicate = or_(
+                        column.is_not(None), and_(column.is_(None), predicate)
+                    )
+                continue
+
+            if predicate is None:
+                predicate = column < value if descending else column > value
+            elif descending:
+                predicate = and_(column <= value, or_(column < value, predicate))
+            else:
+                predicate = and_(column >= value, or_(column > value, predicate))
+            if descending and column.expression.nullable:
+                predicate = or_(predicate, column.is_(None))
+        return predicate
+
+    @staticmethod
+    def _set_page_cursor_last(
+        page_cursor: typing.Optional[mlrun.common.schemas.PageCursor],
+        values: typing.Optional[list],
+    ):
+        if page_cursor is None:
+            return
+        page_cursor.last = (
+            [
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in values
+            ]
+            if values is not None
+            else None
+        )
@@ -272,6 +272,8 @@ with warnings.catch_warnings():
         __tablename__ = "functions"
         __table_args__ = (
             UniqueConstraint("name", "project", "uid", name="_functions_uc"),
+            # covers the keyset pagination of the project functions
+            Index("idx_functions_project_id", "project", "id"),
         )
 
         Label = make_label(__tablename__)
@@ -303,11 +305,13 @@ with warnings.catch_warnings():
         def get_identifier_string(self) -> str:
             return f"{self.project}/{self.uid}"
 
-    class Run(Base, mlrun.utils.db.HasStruct):
+    class Run(Base, mlrun.utils.db.HasJSONStruct):
         __tablename__ = "runs"
         __table_args__ = (
             UniqueConstraint("uid", "project", "iteration", name="_runs_uc"),
             Index("idx_runs_project_id", "id", "project", unique=True),
+            # covers the keyset pagination of the project runs, sorted by start time
+            Index("idx_runs_project_start_time_id", "project", "start_time", "id"),
         )
 
         Label = make_label(__tablename__)
@@ -322,8 +326,10 @@ with warnings.catch_warnings():
         )
         iteration = Column(Integer)
         state = Column(String(255, collation=SQLTypesUtil.collation()))
-        # TODO: change to JSON, see mlrun/common/schemas/function.py::FunctionState for reasoning
+        # the pickled struct of runs which were stored before the struct column was added, until they are migrated
         body = Column(SQLTypesUtil.blob())
+        # the run struct, patched in place on updates (see SQLDB.update_run)
+        _struct = Column("struct", JSON(none_as_null=True))
         start_time = Column(SQLTypesUtil.timestamp())
         updated = Column(SQLTypesUtil.timestamp(), default=datetime.utcnow)
         # requested logs column indicates whether logs were requested for this run
@@ -651,6 +657,8 @@ with warnings.catch_warnings():
         current_page = Column(Integer)
         page_size = Column(Integer)
         kwargs = Column(JSON)
+        # the page and the keyset of its last row, the next page is read from it (see SQLDB._paginate_query)
+        cursor = Column(JSON)
         last_accessed = Column(
             SQLTypesUtil.timestamp(),  # TODO: change to `datetime`, see ML-6921
             default=datetime.now(timezone.utc),
@@ -140,7 +140,9 @@ def init_data(
 data_version_prior_to_table_addition = 1
 
 # NOTE: Bump this number when adding a new data migration
-latest_data_version = 7
+# The version 8 migration (aligning the schedule labels) was added without bumping this number, so moving to 9 (the
+# runs struct column migration) enables it as well, both run for a data version lower than 8
+latest_data_version = 9
 
 
 def update_default_configuration_data():
@@ -248,6 +250,8 @@ def _perform_data_migrations(db_session: sqlalchemy.orm.Session):
                 _perform_version_7_data_migrations(db, db_session)
             if current_data_version < 8:
                 _perform_version_8_data_migrations(db, db_session)
+            if current_data_version < 9:
+                _perform_version_9_data_migrations(db, db_session)
 
             db.create_data_version(db_session, str(latest_data_version))
 
@@ -886,6 +890,54 @@ def _perform_version_8_data_migrations(
     db.align_schedule_labels(session=db_session)
 
 
+def _perform_version_9_data_migrations(
+    db: server.api.db.sqldb.db.SQLDB, db_session: sqlalchemy.orm.Session
+):
+    _migrate_runs_to_struct_column(db, db_session)
+
+
+def _migrate_runs_to_struct_column(
+    db: server.api.db.sqldb.db.SQLDB, db_session: sqlalchemy.orm.Session
+):
+    """
+    Move the pickled run bodies to the JSON struct column, in batches so the db is not overloaded. The migration is
+    resumable, as every batch is committed and only runs without a struct are migrated.
+    """
+    run_model = server.api.db.sqldb.models.Run
+    batch_size = int(config.httpdb.db.runs_struct_migration_batch_size)
+    last_migrated_run_id = 0
+    migrated_runs_count = 0
+    while True:
+        runs = (
+            db._query(db_session, run_model)
+            .filter(
+                run_model.id > last_migrated_run_id,
+                run_model._struct.is_(None),
+                run_model.body.isnot(None),
+            )
+            .order_by(run_model.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not runs:
+            break
+        for run in runs:
+            # setting the struct clears the pickled body
+            run.struct = run.struct
+        db_session.commit()
+        last_migrated_run_id = runs[-1].id
+        migrated_runs_count += len(runs)
+        logger.debug(
+            "Migrated runs batch to the struct column",
+            migrated_runs_count=migrated_runs_count,
+        )
+
+    logger.info(
+        "Finished migrating runs to the struct column",
+        migrated_runs_count=migrated_runs_count,
+    )
+
+
 def _create_project_summaries(db, db_session):
     # Create a project summary record for all projects.
     # We need to create them manually because a summary record is created only when a new
@@ -43,6 +43,7 @@ import server.api.runtime_handlers
 import server.api.utils.clients.chief
 import server.api.utils.clients.log_collector
 import server.api.utils.notification_pusher
+import server.api.utils.project_summaries
 import server.api.utils.time_window_tracker
 from mlrun.config import config
 from mlrun.errors import err_to_str
@@ -263,6 +264,11 @@ async def move_api_to_online():
             if config.httpdb.clusterization.chief.feature_gates.stop_logs == "enabled":
                 await _start_periodic_stop_logs()
 
+    # the chief refreshes the summaries of the projects whose resources were written through it along with the summaries
+    # of all the projects, the workers refresh the summaries of the projects whose resources were written through them
+    elif get_k8s_helper(silent=True).is_running_inside_kubernetes_cluster():
+        _start_periodic_changed_project_summaries_refresh()
+
 
 async def _start_periodic_logs_collection():
     if config.log_collector.mode == mlrun.common.schemas.LogsCollectorMode.legacy:
@@ -642,6 +648,24 @@ def _start_periodic_project_summaries_calculation():
         )
 
 
+def _start_periodic_changed_project_summaries_refresh():
+    interval = int(config.monitoring.projects.summaries.cache_interval)
+    if (
+        interval > 0
+        and server.api.utils.project_summaries.ProjectSummariesTracker().enabled
+    ):
+        logger.info(
+            "Starting periodic changed project summaries refresh", interval=interval
+        )
+        run_function_periodically(
+            interval,
+            server.api.crud.projects.Projects().refresh_changed_project_summaries.__name__,
+            False,
+            server.api.db.session.run_async_function_with_new_db_session,
+            server.api.crud.projects.Projects().refresh_changed_project_summaries,
+        )
+
+
 async def _start_periodic_stop_logs():
     if config.log_collector.mode == mlrun.common.schemas.LogsCollectorMode.legacy:
         logger.info(
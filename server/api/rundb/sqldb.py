@@ -139,6 +139,7 @@ class SQLRunDB(RunDBInterface):
         ] = mlrun.common.schemas.OrderType.desc,
         max_partitions: int = 0,
         with_notifications: bool = False,
+        fields: Optional[list[str]] = None,
     ):
         return self._transform_db_error(
             server.api.db.session.run_function_with_new_db_session,
@@ -163,6 +164,7 @@ class SQLRunDB(RunDBInterface):
             partition_order=partition_order,
             max_partitions=max_partitions,
             with_notifications=with_notifications,
+            fields=fields,
         )
 
     async def del_run(self, uid, project=None, iter=None):
@@ -239,6 +241,7 @@ class SQLRunDB(RunDBInterface):
         tree: str = None,
         format_: mlrun.common.formatters.ArtifactFormat = mlrun.common.formatters.ArtifactFormat.full,
         limit: int = None,
+        fields: Optional[list[str]] = None,
     ):
         if category and isinstance(category, str):
             category = mlrun.common.schemas.ArtifactCategories(category)
@@ -259,6 +262,7 @@ class SQLRunDB(RunDBInterface):
             producer_id=tree,
             format_=format_,
             limit=limit,
+            fields=fields,
         )
 
     def del_artifact(
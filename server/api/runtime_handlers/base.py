@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import functools
 import traceback
 import typing
 import uuid
@@ -20,6 +21,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional, Union
 
 import humanfriendly
+import kubernetes.watch
 from kubernetes import client as k8s_client
 from kubernetes.client.rest import ApiException
 from sqlalchemy.orm import Session
@@ -45,6 +47,7 @@ from mlrun.runtimes import RuntimeClassMode
 from mlrun.utils import logger, now_date
 from server.api.constants import LogSources
 from server.api.db.base import DBInterface
+from server.api.runtime_handlers.resources_watcher import RuntimeResourcesWatcher
 
 
 class BaseRuntimeHandler(ABC):
@@ -53,6 +56,13 @@ class BaseRuntimeHandler(ABC):
     class_modes: dict[RuntimeClassMode, str] = {}
     wait_for_deletion_interval = 10
 
+    def __init__(self):
+        # runs monitoring state, when watching the runtime resources (see monitoring.runs.watch)
+        self._runtime_resources_watcher = None
+        self._monitored_runs = None
+        self._monitored_runs_list_time = None
+        self._monitored_runs_refresh_time = None
+
     @abstractmethod
     def run(
         self,
@@ -191,17 +201,36 @@ class BaseRuntimeHandler(ABC):
         label_selector = self._get_default_label_selector()
         crd_group, crd_version, crd_plural = self._get_crd_info()
         runtime_resource_is_crd = bool(crd_group and crd_version and crd_plural)
-        project_run_uid_map = self._list_runs_for_monitoring(
-            db,
-            db_session,
-            states=mlrun.common.runtimes.constants.RunStates.non_terminal_states(),
-        )
+
+        runtime_resources_changes = None
+        if config.monitoring.runs.watch.enabled:
+            runtime_resources_changes = self._get_runtime_resources_watcher(
+                namespace, label_selector
+            ).pop_changes()
         # project -> uid -> {"name": <runtime-resource-name>}
         run_runtime_resources_map = {}
+        if runtime_resources_changes is None:
+            # list all the runtime resources and runs (also until the watcher lists the runtime resources)
+            project_run_uid_map = self._list_runs_for_monitoring(
+                db,
+                db_session,
+                states=mlrun.common.runtimes.constants.RunStates.non_terminal_states(),
+            )
+            runtime_resources = self._get_runtime_resources_paginated(
+                namespace, label_selector
+            )
+        else:
+            # process only the runtime resources which changed since the previous cycle
+            all_runtime_resources, runtime_resources = runtime_resources_changes
+            project_run_uid_map = self._refresh_monitored_runs(db, db_session)
+            for runtime_resource in all_runtime_resources:
+                project, uid, name = self._resolve_runtime_resource_run(
+                    runtime_resource
+                )
+                run_runtime_resources_map.setdefault(project, {})[uid] = {"name": name}
+
         stale_runs = []
-        for runtime_resource in self._get_runtime_resources_paginated(
-            namespace, label_selector
-        ):
+        for runtime_resource in runtime_resources:
             project, uid, name = self._resolve_runtime_resource_run(runtime_resource)
             run_runtime_resources_map.setdefault(project, {})
             run_runtime_resources_map.get(project).update({uid: {"name": name}})
@@ -1240,11 +1269,155 @@ class BaseRuntimeHandler(ABC):
 
         return True, last_update
 
+    def _get_runtime_resources_watcher(
+        self, namespace: str, label_selector: str
+    ) -> RuntimeResourcesWatcher:
+        if not self._runtime_resources_watcher:
+            self._runtime_resources_watcher = RuntimeResourcesWatcher(
+                functools.partial(
+                    self._list_runtime_resources_snapshot, namespace, label_selector
+                ),
+                functools.partial(
+                    self._watch_runtime_resources, namespace, label_selector
+                ),
+                resync_interval=float(config.monitoring.runs.watch.resync_interval),
+                name=self.kind,
+            )
+            self._runtime_resources_watcher.start()
+        return self._runtime_resources_watcher
+
+    def _list_runtime_resources_snapshot(
+        self, namespace: str, label_selector: str
+    ) -> tuple[list[dict], Optional[str]]:
+        """
+        List the runtime resources paginated, and return them with the resource version of the list (the pages of a
+        paginated list are a consistent snapshot), to watch the resources from
+        """
+        k8s_helper = server.api.utils.singletons.k8s.get_k8s_helper()
+        crd_group, crd_version, crd_plural = self._get_crd_info()
+        runtime_resource_is_crd = crd_group and crd_version and crd_plural
+        limit = int(
+            config.kubernetes.pagination.list_crd_objects_limit
+            if runtime_resource_is_crd
+            else config.kubernetes.pagination.list_pods_limit
+        )
+        runtime_resources = []
+        resource_version = None
+        _continue = None
+        while True:
+            if runtime_resource_is_crd:
+                try:
+                    crd_objects = k8s_helper.crdapi.list_namespaced_custom_object(
+                        crd_group,
+                        crd_version,
+                        namespace,
+                        crd_plural,
+                        label_selector=label_selector,
+                        limit=limit if limit > 0 else None,
+                        _continue=_continue,
+                    )
+                except ApiException as exc:
+                    # ignore error if crd is not defined
+                    if exc.status != 404:
+                        raise
+                    return [], None
+                runtime_resources.extend(crd_objects["items"])
+                metadata = crd_objects.get("metadata", {})
+                resource_version = metadata.get("resourceVersion")
+                _continue = metadata.get("continue")
+            else:
+                pods = k8s_helper.v1api.list_namespaced_pod(
+                    namespace,
+                    label_selector=label_selector,
+                    limit=limit if limit > 0 else None,
+                    _continue=_continue,
+                )
+                runtime_resources.extend(pod.to_dict() for pod in pods.items)
+                resource_version = pods.metadata.resource_version
+                _continue = pods.metadata._continue
+            if not _continue:
+                return runtime_resources, resource_version
+
+    def _watch_runtime_resources(
+        self,
+        namespace: str,
+        label_selector: str,
+        resource_version: str,
+        timeout_seconds: int,
+    ) -> typing.Iterator[dict]:
+        k8s_helper = server.api.utils.singletons.k8s.get_k8s_helper()
+        crd_group, crd_version, crd_plural = self._get_crd_info()
+        runtime_resource_is_crd = crd_group and crd_version and crd_plural
+        if runtime_resource_is_crd:
+            list_function = functools.partial(
+                k8s_helper.crdapi.list_namespaced_custom_object,
+                crd_group,
+                crd_version,
+                namespace,
+                crd_plural,
+            )
+        else:
+            list_function = functools.partial(
+                k8s_helper.v1api.list_namespaced_pod, namespace
+            )
+        for event in kubernetes.watch.Watch().stream(
+            list_function,
+            label_selector=label_selector,
+            resource_version=resource_version,
+            timeout_seconds=timeout_seconds,
+            allow_watch_bookmarks=True,
+        ):
+            runtime_resource = event["object"]
+            if not isinstance(runtime_resource, dict):
+                runtime_resource = runtime_resource.to_dict()
+            yield {"type": event["type"], "object": runtime_resource}
+
+    def _refresh_monitored_runs(self, db: DBInterface, db_session: Session) -> dict:
+        """
+        Keep the non-terminal runs of the runtime kind (project -> uid -> run) in memory, they are listed on the first
+        call and on every resync interval, and otherwise updated by the runs which were updated since the previous call
+        """
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        resync_interval = timedelta(
+            seconds=float(config.monitoring.runs.watch.resync_interval)
+        )
+        if (
+            self._monitored_runs is None
+            or now - self._monitored_runs_list_time >= resync_interval
+        ):
+            self._monitored_runs = self._list_runs_for_monitoring(
+                db, db_session, states=RunStates.non_terminal_states()
+            )
+            self._monitored_runs_list_time = now
+        else:
+            updated_runs = self._list_runs_for_monitoring(
+                db,
+                db_session,
+                last_update_time_from=self._monitored_runs_refresh_time,
+            )
+            for project, runs in updated_runs.items():
+                for uid, run in runs.items():
+                    if (
+                        run.get("status", {}).get("state")
+                        in RunStates.terminal_states()
+                    ):
+                        self._monitored_runs.get(project, {}).pop(uid, None)
+                    else:
+                        self._monitored_runs.setdefault(project, {})[uid] = run
+        self._monitored_runs_refresh_time = now
+        return {project: dict(runs) for project, runs in self._monitored_runs.items()}
+
     def _list_runs_for_monitoring(
-        self, db: DBInterface, db_session: Session, states: list = None
+        self,
+        db: DBInterface,
+        db_session: Session,
+        states: list = None,
+        last_update_time_from: datetime = None,
     ):
-        last_update_time_from = None
-        if config.monitoring.runs.list_runs_time_period_in_days:
+        if (
+            last_update_time_from is None
+            and config.monitoring.runs.list_runs_time_period_in_days
+        ):
             last_update_time_from = (
                 datetime.now()
                 - timedelta(
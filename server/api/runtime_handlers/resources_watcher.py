@@ -0,0 +1,194 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+import traceback
+import typing
+
+from kubernetes.client.rest import ApiException
+
+from mlrun.errors import err_to_str
+from mlrun.utils import logger
+
+# lists the resources, returns their dicts and the resource version of the list
+ListResourcesFunction = typing.Callable[[], tuple[list[dict], typing.Optional[str]]]
+# watches the resources from a resource version (for up to a timeout in seconds), yields the watch events
+# ({"type": "ADDED" | "MODIFIED" | "DELETED" | "BOOKMARK" | "ERROR", "object": <resource dict>})
+WatchResourcesFunction = typing.Callable[[str, int], typing.Iterable[dict]]
+
+
+class RuntimeResourcesWatcher:
+    """
+    In-memory cache of runtime resources, fed by a k8s watch stream (like a k8s informer). The resources are listed
+    once, then watched from the resource version of the list, and the watch is resumed from the last seen resource
+    version. The resources are listed again when the resource version expired (410 Gone) and periodically (resync), in
+    case events were missed.
+
+    The runs monitoring consumes the resources which changed since its previous cycle with `pop_changes`.
+    """
+
+    def __init__(
+        self,
+        list_resources: ListResourcesFunction,
+        watch_resources: WatchResourcesFunction,
+        resync_interval: float,
+        watch_timeout: int = 300,
+        name: str = "",
+    ):
+        self._list_resources = list_resources
+        self._watch_resources = watch_resources
+        self._resync_interval = resync_interval
+        self._watch_timeout = watch_timeout
+        self._name = name
+
+        self._lock = threading.Lock()
+        # resource name -> resource dict
+        self._resources = {}
+        self._changed_resource_names = set()
+        self._resource_version = None
+        self._last_list_time = None
+        self._synced = False
+
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def synced(self) -> bool:
+        """Whether the resources were listed at least once"""
+        return self._synced
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"runtime-resources-watcher-{self._name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def sync(self):
+        """
+        List the resources if needed (first sync, expired resource version or resync), then watch them until the
+        watch times out or the resync is due.
+        """
+        if self._is_list_needed():
+            self._list()
+        if self._resource_version is None:
+            # nothing to watch from (e.g. the CRD is not installed), list again on the next resync
+            self._stop_event.wait(self._seconds_until_resync())
+            return
+
+        timeout = max(1, min(self._watch_timeout, int(self._seconds_until_resync())))
+        try:
+            for event in self._watch_resources(self._resource_version, timeout):
+                self._handle_event(event)
+                if self._stop_event.is_set() or self._resource_version is None:
+                    break
+        except ApiException as exc:
+            if exc.status != 410:
+                raise
+            self._expire_resource_version()
+
+    def pop_changes(self) -> typing.Optional[tuple[list[dict], list[dict]]]:
+        """
+        :returns: All the cached resources, and the resources which changed (added or modified) since the previous
+                  call, None if the resources were not listed yet.
+        """
+        with self._lock:
+            if not self._synced:
+                return None
+            changed_resources = [
+                self._resources[name]
+                for name in self._changed_resource_names
+                if name in self._resources
+            ]
+            self._changed_resource_names = set()
+            return list(self._resources.values()), changed_resources
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.sync()
+            except Exception as exc:
+                logger.warning(
+                    "Failed watching runtime resources, retrying",
+                    watcher=self._name,
+                    exc=err_to_str(exc),
+                    traceback=traceback.format_exc(),
+                )
+                self._expire_resource_version()
+                self._stop_event.wait(5)
+
+    def _list(self):
+        resources, resource_version = self._list_resources()
+        resources = {
+            resource["metadata"]["name"]: resource for resource in resources or []
+        }
+        with self._lock:
+            # all the resources are processed after a list, the removed ones were deleted while not watched
+            self._changed_resource_names = set(resources.keys())
+            self._resources = resources
+            self._resource_version = resource_version
+            self._last_list_time = time.monotonic()
+            self._synced = True
+        logger.debug(
+            "Listed runtime resources",
+            watcher=self._name,
+            resources=len(resources),
+            resource_version=resource_version,
+        )
+
+    def _handle_event(self, event: dict):
+        event_type, resource = event["type"], event["object"]
+        if event_type == "ERROR":
+            if resource.get("code") == 410:
+                self._expire_resource_version()
+                return
+            raise RuntimeError(f"Runtime resources watch failed: {resource}")
+
+        resource_version = _resource_version(resource)
+        with self._lock:
+            if event_type != "BOOKMARK":
+                name = resource["metadata"]["name"]
+                if event_type == "DELETED":
+                    self._resources.pop(name, None)
+                else:
+                    self._resources[name] = resource
+                    self._changed_resource_names.add(name)
+            if resource_version:
+                self._resource_version = resource_version
+
+    def _expire_resource_version(self):
+        with self._lock:
+            self._resource_version = None
+
+    def _is_list_needed(self) -> bool:
+        return self._resource_version is None or self._seconds_until_resync() <= 0
+
+    def _seconds_until_resync(self) -> float:
+        if self._last_list_time is None:
+            return 0
+        return self._resync_interval - (time.monotonic() - self._last_list_time)
+
+
+def _resource_version(resource: dict) -> typing.Optional[str]:
+    metadata = resource.get("metadata") or {}
+    # pods are serialized by the k8s client models (snake case), custom objects are the raw (camel case) dicts
+    return metadata.get("resource_version") or metadata.get("resourceVersion")
@@ -104,6 +104,17 @@ class LRUCache:
         if not is_cached and len(cache) > self.maxsize:
             cache.popitem(last=False)
 
+    def cache_get(self, *args, **kwargs):
+        """Get a value from cache without calling the function, None if it is not cached"""
+        cache = self.cache
+        key = self._gen_key(args, kwargs)
+        if key not in cache:
+            self._cache_info.misses += 1
+            return None
+        self._cache_info.hits += 1
+        cache.move_to_end(key)
+        return cache[key]
+
     def cached(self, *args, **kwargs) -> bool:
         """Return if argument in cache"""
         key = self._gen_key(args, kwargs)
@@ -66,6 +66,8 @@ class PaginatedMethods:
         method.__name__: {
             "method": method,
             "schema": _generate_pydantic_schema_from_method_signature(method),
+            # methods which accept a page cursor are paginated by keyset (see SQLDB._paginate_query)
+            "keyset": "page_cursor" in inspect.signature(method).parameters,
         }
         for method in _methods
     }
@@ -83,6 +85,10 @@ class PaginatedMethods:
     def get_method_schema(cls, method_name: str) -> pydantic.BaseModel:
         return cls._method_map[method_name]["schema"]
 
+    @classmethod
+    def method_supports_keyset(cls, method_name: str) -> bool:
+        return cls._method_map[method_name].get("keyset", False)
+
 
 class Paginator(metaclass=mlrun.utils.singleton.Singleton):
     def __init__(self):
@@ -175,6 +181,7 @@ class Paginator(metaclass=mlrun.utils.singleton.Singleton):
             page_size,
             method,
             method_kwargs,
+            pagination_cache_record,
         ) = self._create_or_update_pagination_cache_record(
             session,
             method,
@@ -185,16 +192,36 @@ class Paginator(metaclass=mlrun.utils.singleton.Singleton):
             **method_kwargs,
         )
 
+        page_cursor = None
+        if PaginatedMethods.method_supports_keyset(method.__name__):
+            page_cursor = self._pagination_cache.get_page_cursor(
+                pagination_cache_record, page
+            )
+            method_kwargs["page_cursor"] = page_cursor
+
         try:
             self._logger.debug(
                 "Retrieving page",
                 page=page,
                 page_size=page_size,
                 method=method.__name__,
+                from_cursor=page_cursor is not None and page_cursor.after is not None,
             )
-            return await server.api.utils.asyncio.await_or_call_in_threadpool(
+            result = await server.api.utils.asyncio.await_or_call_in_threadpool(
                 method, session, **method_kwargs, page=page, page_size=page_size
-            ), mlrun.common.schemas.pagination.PaginationInfo(
+            )
+            if page_cursor is not None:
+                if not result and page_cursor.after is not None:
+                    # the previous page was the last one
+                    return [], None
+                await server.api.utils.asyncio.await_or_call_in_threadpool(
+                    self._pagination_cache.update_pagination_cache_record_cursor,
+                    session,
+                    token,
+                    page,
+                    page_cursor,
+                )
+            return result, mlrun.common.schemas.pagination.PaginationInfo(
                 page=page, page_size=page_size, page_token=token
             )
         except (RuntimeError, StopIteration) as exc:
@@ -213,7 +240,8 @@ class Paginator(metaclass=mlrun.utils.singleton.Singleton):
         page: typing.Optional[int] = None,
         page_size: typing.Optional[int] = None,
         **method_kwargs,
-    ) -> tuple[str, int, int, typing.Callable, dict]:
+    ) -> tuple[str, int, int, typing.Callable, dict, typing.Any]:
+        pagination_cache_record = None
         if token:
             self._logger.debug(
                 "Token provided, updating pagination cache record", token=token
@@ -241,6 +269,7 @@ class Paginator(metaclass=mlrun.utils.singleton.Singleton):
         serialized_kwargs = method_schema(**method_kwargs).dict()
         del serialized_kwargs["page"]
         del serialized_kwargs["page_size"]
+        serialized_kwargs.pop("page_cursor", None)
         self._logger.debug(
             "Storing pagination cache record",
             method=method.__name__,
@@ -255,4 +284,16 @@ class Paginator(metaclass=mlrun.utils.singleton.Singleton):
             page_size=page_size,
             kwargs=serialized_kwargs,
         )
-        return token, page, page_size, method, serialized_kwargs
+        if pagination_cache_record is None and page and page > 1:
+            # the same query may have been paginated by a previous token, whose last page can be continued
+            pagination_cache_record = (
+                self._pagination_cache.get_pagination_cache_record(session, key=token)
+            )
+        return (
+            token,
+            page,
+            page_size,
+            method,
+            serialized_kwargs,
+            pagination_cache_record,
+        )
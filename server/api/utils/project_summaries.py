@@ -0,0 +1,120 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import collections
+import threading
+import time
+import typing
+
+import mlrun.common.types
+import mlrun.utils.singleton
+from mlrun.config import config
+
+
+class ProjectSummaryCounters(mlrun.common.types.StrEnum):
+    """The groups of project summary counters which are calculated together, by the resources they count"""
+
+    runs = "runs"
+    artifacts = "artifacts"
+    schedules = "schedules"
+    feature_sets = "feature_sets"
+
+
+class ProjectSummaryRefreshKinds(mlrun.common.types.StrEnum):
+    # the counters of the projects whose resources were written since the previous refresh
+    incremental = "incremental"
+    # the counters of all the projects, which fixes the drift of the incremental refreshes (e.g. of the counters of the
+    # recent runs, which change with time and not only with writes)
+    reconciliation = "reconciliation"
+
+
+class ProjectSummariesTracker(metaclass=mlrun.utils.singleton.Singleton):
+    """
+    Tracks the projects whose resources were written (stored or deleted) since their summary counters were calculated,
+    so the periodic refresh recalculates only their counters, and the counters of all the projects are only
+    recalculated by the less frequent reconciliation.
+    The changed projects are tracked per API instance, each instance refreshes the summaries of the writes it made.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # project name -> the counter groups of the written resources
+        self._changed: dict[str, set[ProjectSummaryCounters]] = collections.defaultdict(
+            set
+        )
+        self._last_reconciliation: typing.Optional[float] = None
+        self._timings = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(config.monitoring.projects.summaries.incremental.enabled)
+
+    def mark_changed(self, project: str, *counters: ProjectSummaryCounters):
+        """Mark the counters of the project for recalculation, called by the writes of the counted resources"""
+        if not self.enabled or not project:
+            return
+        with self._lock:
+            self._changed[project].update(counters)
+
+    def pop_changed(self) -> dict[str, set[ProjectSummaryCounters]]:
+        """:returns: The counters which were marked since the previous call, per project"""
+        with self._lock:
+            changed, self._changed = self._changed, collections.defaultdict(set)
+        return dict(changed)
+
+    def is_reconciliation_due(self) -> bool:
+        if not self.enabled or self._last_reconciliation is None:
+            return True
+        interval = float(
+            config.monitoring.projects.summaries.incremental.reconciliation_interval
+        )
+        return time.monotonic() - self._last_reconciliation >= interval
+
+    def record_refresh(
+        self, kind: ProjectSummaryRefreshKinds, duration: float, projects: int
+    ):
+        """Record the duration (in seconds) of a refresh of the summaries, and the number of refreshed projects"""
+        with self._lock:
+            if kind == ProjectSummaryRefreshKinds.reconciliation:
+                self._last_reconciliation = time.monotonic()
+            timing = self._timings.setdefault(
+                kind,
+                {"count": 0, "total_duration": 0.0, "max_duration": 0.0},
+            )
+            timing["count"] += 1
+            timing["total_duration"] += duration
+            timing["max_duration"] = max(timing["max_duration"], duration)
+            timing["last_duration"] = duration
+            timing["last_projects"] = projects
+
+    def stats(self) -> dict[str, dict]:
+        """The number, total, max and last durations (in seconds) of the refreshes, per refresh kind"""
+        with self._lock:
+            return {
+                kind.value: {
+                    "count": 0,
+                    "total_duration": 0.0,
+                    "max_duration": 0.0,
+                    "last_duration": None,
+                    "last_projects": None,
+                    **self._timings.get(kind, {}),
+                }
+                for kind in ProjectSummaryRefreshKinds
+            }
+
+    def clear(self):
+        with self._lock:
+            self._changed = collections.defaultdict(set)
+            self._last_reconciliation = None
+            self._timings = {}
@@ -0,0 +1,203 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import collections
+import hashlib
+import threading
+import time
+import typing
+import uuid
+from http import HTTPStatus
+
+import fastapi
+
+import mlrun.common.schemas
+import mlrun.common.types
+import mlrun.utils.singleton
+import server.api.utils.asyncio
+from mlrun.config import config
+from server.api.utils.lru_cache import LRUCache
+
+
+class CachedResource(mlrun.common.types.StrEnum):
+    functions = "functions"
+    feature_sets = "feature_sets"
+    project_summaries = "project_summaries"
+
+
+class ResponseCache(metaclass=mlrun.utils.singleton.Singleton):
+    """
+    In-process cache of the results of hot read endpoints.
+    The entries are keyed by the generation of their resource type in their project, which is bumped by the DB writes
+    of the resource, so a write invalidates the cached results of its project (and of the cross-project lists) without
+    tracking which entries it affects. The same generation is used for the ETags of the responses, so a client which
+    sends the ETag of its last response in If-None-Match gets a 304 without the resource being read from the DB.
+    The generations are per API instance, the writes made by other instances are seen after the configured ttl.
+    """
+
+    # the generation of the cross-project lists, bumped by the writes to any project
+    all_projects = "*"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # the generations restart with the process, the instance id keeps the ETags of previous processes stale
+        self._instance_id = uuid.uuid4().hex
+        self._generations = collections.Counter()
+        self._caches: dict[str, LRUCache] = {}
+        self._not_modified = collections.Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(config.httpdb.response_cache.enabled)
+
+    def bump_generation(self, resource: CachedResource, project: str = None):
+        """Invalidate the cached results of the resource in the project, or in all the projects if not given"""
+        with self._lock:
+            if project:
+                self._generations[(resource, project)] += 1
+                self._generations[(resource, self.all_projects)] += 1
+            else:
+                self._generations[(resource, None)] += 1
+
+    def generation(self, resource: CachedResource, project: str = None) -> str:
+        """The version of the resources of the project, changed by their writes and when the ttl elapses"""
+        project = project or self.all_projects
+        ttl = int(config.httpdb.response_cache.ttl or 0)
+        ttl_bucket = int(time.time() // ttl) if ttl > 0 else 0
+        with self._lock:
+            return "-".join(
+                [
+                    self._instance_id,
+                    project,
+                    str(self._generations[(resource, None)]),
+                    str(self._generations[(resource, project)]),
+                    str(ttl_bucket),
+                ]
+            )
+
+    async def get_or_compute(
+        self,
+        resource: CachedResource,
+        project: typing.Optional[str],
+        key: tuple,
+        function: typing.Callable,
+        /,
+        *args,
+        **kwargs,
+    ):
+        """
+        Get the cached result of the function, or call (or await) it and cache its result.
+        The cached results are shared between the requests and must not be modified by the callers.
+
+        :param resource: The type of the resource which the function reads.
+        :param project:  The project of the resources, None if the function reads the resources of all the projects.
+        :param key:      The arguments which identify the result of the function (e.g. the list filters).
+        """
+        if not self.enabled:
+            return await server.api.utils.asyncio.await_or_call_in_threadpool(
+                function, *args, **kwargs
+            )
+
+        # taken before the call, so a write which is done during the call is not masked by the cached result
+        generation = self.generation(resource, project)
+        cache = self._get_cache(resource)
+        with self._lock:
+            result = cache.cache_get(generation, key)
+        if result is not None:
+            return result
+
+        result = await server.api.utils.asyncio.await_or_call_in_threadpool(
+            function, *args, **kwargs
+        )
+        with self._lock:
+            cache.cache_set(result, generation, key)
+        return result
+
+    def check_etag(
+        self,
+        request: fastapi.Request,
+        response: fastapi.Response,
+        resource: CachedResource,
+        project: typing.Optional[str],
+        auth_info: mlrun.common.schemas.AuthInfo,
+        *key,
+    ) -> typing.Optional[fastapi.Response]:
+        """
+        Set the ETag of the response, from the generation of the resource, the requesting user and the key.
+        Should be called after the permissions of the request were verified.
+
+        :returns: A 304 (not modified) response if the ETag matches the If-None-Match header of the request, else None.
+        """
+        if not self.enabled:
+            return None
+
+        user = (
+            auth_info.username,
+            auth_info.user_id,
+            sorted(auth_info.user_group_ids or []),
+            auth_info.projects_role,
+        )
+        digest = hashlib.sha256(
+            f"{self.generation(resource, project)}/{user}/{key}".encode()
+        ).hexdigest()
+        # weak, as the permissions of the user may change without the generation being bumped
+        etag = f'W/"{digest}"'
+        response.headers["ETag"] = etag
+
+        if_none_match = request.headers.get("if-none-match")
+        if not if_none_match or etag not in [
+            value.strip() for value in if_none_match.split(",")
+        ]:
+            return None
+        with self._lock:
+            self._not_modified[resource] += 1
+        return fastapi.Response(
+            status_code=HTTPStatus.NOT_MODIFIED.value, headers={"ETag": etag}
+        )
+
+    def stats(self) -> dict[str, dict]:
+        """The hits, misses, hit ratio and size of the cache, and the number of 304 responses, per resource type"""
+        stats = {}
+        with self._lock:
+            for resource in CachedResource:
+                cache = self._caches.get(resource)
+                cache_info = cache.cache_info() if cache else None
+                hits = cache_info.hits if cache_info else 0
+                misses = cache_info.misses if cache_info else 0
+                stats[resource.value] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+                    "size": cache_info.currsize if cache_info else 0,
+                    "not_modified": self._not_modified[resource],
+                }
+        return stats
+
+    def clear(self):
+        """Drop the cached results, statistics and generations (the ETags of the previous responses become stale)"""
+        with self._lock:
+            self._instance_id = uuid.uuid4().hex
+            self._generations.clear()
+            for cache in self._caches.values():
+                cache.cache_clear()
+            self._not_modified.clear()
+
+    def _get_cache(self, resource: CachedResource) -> LRUCache:
+        with self._lock:
+            if resource not in self._caches:
+                self._caches[resource] = LRUCache(
+                    lambda *args: None,
+                    maxsize=int(config.httpdb.response_cache.max_size),
+                )
+            return self._caches[resource]
@@ -39,6 +39,7 @@ import server.api.utils.builder
 import server.api.utils.clients.chief
 import server.api.utils.clients.iguazio
 import server.api.utils.functions
+import server.api.utils.response_cache
 import server.api.utils.singletons.db
 import server.api.utils.singletons.k8s
 import tests.api.api.utils
@@ -1003,6 +1004,68 @@ def test_start_function(
         assert background_task.status.state == expected_status_result
 
 
+def test_get_and_list_functions_not_modified(
+    db: sqlalchemy.orm.Session,
+    client: fastapi.testclient.TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        mlrun.mlconf.httpdb.response_cache, "enabled", True, raising=False
+    )
+    tests.api.api.utils.create_project(client, PROJECT)
+    function_name = "function-name"
+    function = {
+        "kind": "job",
+        "metadata": {"name": function_name, "project": PROJECT},
+        "spec": {"image": "mlrun/mlrun"},
+    }
+    function_endpoint = FUNCTIONS_API.format(project=PROJECT, name=function_name)
+    response = client.post(function_endpoint, data=mlrun.utils.dict_to_json(function))
+    assert response.status_code == HTTPStatus.OK.value
+
+    etags = {}
+    for endpoint, crud_method in [
+        (function_endpoint, "get_function"),
+        (f"projects/{PROJECT}/functions", "list_functions"),
+    ]:
+        response = client.get(endpoint)
+        assert response.status_code == HTTPStatus.OK.value
+        etags[endpoint] = response.headers["ETag"]
+
+        # neither the unchanged response nor the cached result are read from the DB
+        with unittest.mock.patch.object(
+            server.api.crud.Functions, crud_method, side_effect=RuntimeError
+        ):
+            response = client.get(endpoint, headers={"If-None-Match": etags[endpoint]})
+            assert response.status_code == HTTPStatus.NOT_MODIFIED.value
+            assert response.headers["ETag"] == etags[endpoint]
+
+            response = client.get(endpoint)
+            assert response.status_code == HTTPStatus.OK.value
+            assert response.headers["ETag"] == etags[endpoint]
+
+    stats = server.api.utils.response_cache.ResponseCache().stats()["functions"]
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+    assert stats["not_modified"] == 2
+
+    # storing the function invalidates the cached responses of the project
+    function["spec"]["image"] = "mlrun/mlrun:new"
+    response = client.post(function_endpoint, data=mlrun.utils.dict_to_json(function))
+    assert response.status_code == HTTPStatus.OK.value
+    response = client.get(
+        function_endpoint, headers={"If-None-Match": etags[function_endpoint]}
+    )
+    assert response.status_code == HTTPStatus.OK.value
+    assert response.headers["ETag"] != etags[function_endpoint]
+    assert response.json()["func"]["spec"]["image"] == "mlrun/mlrun:new"
+
+    response = client.get(f"projects/{PROJECT}/functions")
+    assert [function["spec"]["image"] for function in response.json()["funcs"]] == [
+        "mlrun/mlrun:new"
+    ]
+
+
 def _generate_function(
     function_name: str,
     project: str = PROJECT,
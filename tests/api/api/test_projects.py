@@ -45,6 +45,7 @@ import server.api.main
 import server.api.utils.auth.verifier
 import server.api.utils.background_tasks
 import server.api.utils.clients.log_collector
+import server.api.utils.project_summaries
 import server.api.utils.singletons.db
 import server.api.utils.singletons.k8s
 import server.api.utils.singletons.project_member
@@ -455,6 +456,72 @@ async def test_list_and_get_project_summaries(
     )
 
 
+@pytest.mark.asyncio
+async def test_refresh_project_summaries_incrementally(
+    db: Session,
+    client: TestClient,
+    project_member_mode: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    other_project_name = "other-project"
+    project_name = "project-with-resources"
+    _create_project(client, other_project_name)
+    _create_project(client, project_name)
+    running_pipelines_count = _mock_pipelines(project_name)
+    tracker = server.api.utils.project_summaries.ProjectSummariesTracker()
+
+    # the first refresh reconciles the summaries of all the projects
+    await server.api.crud.Projects().refresh_project_resources_counters_cache(db)
+    other_project_summary = server.api.utils.singletons.db.get_db().get_project_summary(
+        db, other_project_name
+    )
+
+    # the resources which are written after the reconciliation are counted by the refresh of their project
+    _create_artifacts(client, project_name, 2, mlrun.artifacts.PlotArtifact.kind)
+    _create_feature_sets(client, project_name, 3)
+    _create_runs(
+        client, project_name, 4, mlrun.common.runtimes.constants.RunStates.running
+    )
+    await server.api.crud.Projects().refresh_project_resources_counters_cache(db)
+
+    response = client.get(f"project-summaries/{project_name}")
+    project_summary = mlrun.common.schemas.ProjectSummary(**response.json())
+    _assert_project_summary(
+        project_summary, 2, 3, 0, 0, 0, 4, 0, 0, 0, running_pipelines_count
+    )
+    # the summaries of the projects without writes are not recalculated
+    assert (
+        server.api.utils.singletons.db.get_db()
+        .get_project_summary(db, other_project_name)
+        .updated
+        == other_project_summary.updated
+    )
+    stats = tracker.stats()
+    assert stats["reconciliation"]["count"] == 1
+    assert stats["incremental"]["count"] == 1
+    assert stats["incremental"]["last_projects"] == 1
+
+    # writes which were not tracked (e.g. made by another API instance which did not refresh them yet) are counted by
+    # the reconciliation
+    with unittest.mock.patch.object(tracker, "mark_changed"):
+        _create_runs(
+            client, project_name, 2, mlrun.common.runtimes.constants.RunStates.running
+        )
+    await server.api.crud.Projects().refresh_project_resources_counters_cache(db)
+    response = client.get(f"project-summaries/{project_name}")
+    assert response.json()["runs_running_count"] == 4
+
+    monkeypatch.setattr(
+        mlrun.mlconf.monitoring.projects.summaries.incremental,
+        "reconciliation_interval",
+        0,
+    )
+    await server.api.crud.Projects().refresh_project_resources_counters_cache(db)
+    response = client.get(f"project-summaries/{project_name}")
+    assert response.json()["runs_running_count"] == 6
+    assert tracker.stats()["reconciliation"]["count"] == 2
+
+
 @pytest.mark.asyncio
 async def test_list_project_summaries_different_installation_modes(
     db: Session, client: TestClient, project_member_mode: str
@@ -524,6 +524,42 @@ def test_list_runs_single_and_multiple_uids(db: Session, client: TestClient):
         expected_uids.remove(run["metadata"]["uid"])
 
 
+def test_list_runs_fields(db: Session, client: TestClient):
+    project = "my_project"
+    for counter in range(3):
+        uid = f"uid_{counter}"
+        run = {
+            "metadata": {"name": f"run_{counter}", "uid": uid, "project": project},
+            "spec": {"parameters": {"p": counter}},
+            "status": {"state": "completed", "results": {"loss": counter}},
+        }
+        server.api.crud.Runs().store_run(db, run, uid, project=project)
+
+    runs = _list_and_assert_objects(
+        client,
+        {"field": ["metadata.name", "status.results"]},
+        3,
+        project=project,
+    )
+    assert sorted(runs, key=lambda run: run["metadata"]["uid"]) == [
+        {
+            "metadata": {
+                "name": f"run_{counter}",
+                "uid": f"uid_{counter}",
+                "project": project,
+            },
+            "status": {"results": {"loss": counter}},
+        }
+        for counter in range(3)
+    ]
+
+    response = client.get(
+        f"projects/{project}/runs",
+        params={"field": "status.state", "with-notifications": True},
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST.value
+
+
 def test_list_runs_with_pagination(db: Session, client: TestClient):
     """
     Test list runs with pagination.
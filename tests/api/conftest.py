@@ -36,7 +36,9 @@ import server.api.launcher
 import server.api.rundb.sqldb
 import server.api.runtime_handlers.mpijob
 import server.api.utils.clients.iguazio
+import server.api.utils.project_summaries
 import server.api.utils.projects.remotes.leader as project_leader
+import server.api.utils.response_cache
 import server.api.utils.runtimes.nuclio
 import server.api.utils.singletons.db
 import server.api.utils.singletons.k8s
@@ -62,6 +64,8 @@ def api_config_test():
 
     mlconf.nuclio_version = ""
     server.api.runtime_handlers.mpijob.cached_mpijob_crd_version = None
+    server.api.utils.response_cache.ResponseCache().clear()
+    server.api.utils.project_summaries.ProjectSummariesTracker().clear()
 
     mlrun.config._is_running_as_api = True
     server.api.utils.singletons.k8s.get_k8s_helper().running_inside_kubernetes_cluster = False
@@ -18,10 +18,12 @@ import fastapi.testclient
 import pytest
 import sqlalchemy.orm
 
+import mlrun.common.runtimes.constants
 import mlrun.common.schemas
 import mlrun.errors
 import server.api.crud
 import server.api.utils.clients.log_collector
+import server.api.utils.singletons.db
 from tests.api.utils.clients.test_log_collector import GetLogSizeResponse
 
 
@@ -77,3 +79,74 @@ class TestLogs:
         else:
             log_size = await server.api.crud.Logs().get_log_size(project, uid)
             assert return_value == log_size
+
+    @pytest.mark.asyncio
+    async def test_follow_logs(
+        self,
+        db: sqlalchemy.orm.Session,
+        client: fastapi.testclient.TestClient,
+        monkeypatch,
+    ):
+        monkeypatch.setattr(
+            mlrun.mlconf.log_collector,
+            "mode",
+            mlrun.common.schemas.LogsCollectorMode.legacy,
+        )
+        monkeypatch.setattr(mlrun.mlconf.httpdb.logs.follow, "interval", 0.01)
+        monkeypatch.setattr(mlrun.mlconf.httpdb.logs.follow, "state_interval", 0.01)
+        project = "project-name"
+        uid = "m33"
+        run = {
+            "metadata": {"name": "run-name"},
+            "status": {"state": mlrun.common.runtimes.constants.RunStates.running},
+        }
+        server.api.crud.Runs().store_run(db, run, uid, project=project)
+        server.api.crud.Logs().store_log(b"first", project, uid)
+
+        run_state, log_stream = await server.api.crud.Logs().follow_logs(
+            db, project, uid, offset=2, size=2
+        )
+        assert run_state == mlrun.common.runtimes.constants.RunStates.running
+        logs = []
+        async for log in log_stream:
+            logs.append(log)
+            if b"".join(logs) == b"rst":
+                # the logs which are written while following are streamed, until the run is done
+                server.api.crud.Logs().store_log(b"-second", project, uid)
+                run["status"]["state"] = (
+                    mlrun.common.runtimes.constants.RunStates.completed
+                )
+                server.api.crud.Runs().store_run(db, run, uid, project=project)
+                db.commit()
+        assert logs == [b"rs", b"t", b"-s", b"ec", b"on", b"d"]
+
+        # an idle log of a running run is followed until the follow timeout
+        monkeypatch.setattr(mlrun.mlconf.httpdb.logs.follow, "timeout", 0.05)
+        run["status"]["state"] = mlrun.common.runtimes.constants.RunStates.running
+        server.api.crud.Runs().store_run(db, run, uid, project=project)
+        _, log_stream = await server.api.crud.Logs().follow_logs(
+            db, project, uid, offset=len(b"first-second")
+        )
+        assert [log async for log in log_stream] == []
+
+        # the idle log is checked on every interval, while the run is re-read on the slower state interval
+        monkeypatch.setattr(mlrun.mlconf.httpdb.logs.follow, "timeout", 0.5)
+        monkeypatch.setattr(mlrun.mlconf.httpdb.logs.follow, "state_interval", 0.2)
+        logs = server.api.crud.Logs()
+        with (
+            unittest.mock.patch.object(
+                server.api.utils.singletons.db.get_db(),
+                "read_run",
+                wraps=server.api.utils.singletons.db.get_db().read_run,
+            ) as read_run,
+            unittest.mock.patch.object(
+                logs, "_get_log_stream", wraps=logs._get_log_stream
+            ) as get_log_stream,
+        ):
+            _, log_stream = await logs.follow_logs(
+                db, project, uid, offset=len(b"first-second")
+            )
+            assert [log async for log in log_stream] == []
+        # the run is read once before following
+        assert 2 <= read_run.call_count <= 4
+        assert get_log_stream.call_count > 10
@@ -22,6 +22,7 @@ import pytest
 from sqlalchemy import distinct, select
 from sqlalchemy.orm import Session
 
+import mlrun.common.formatters
 import mlrun.common.schemas
 import mlrun.config
 import mlrun.errors
@@ -1103,6 +1104,70 @@ class TestArtifacts:
                 else:
                     assert not result["metadata"].get("tag")
 
+    def test_list_artifacts_fields(self, db: DBInterface, db_session: Session):
+        project = "artifact_project"
+        for index in range(2):
+            artifact = self._generate_artifact(
+                f"artifact-{index}", kind="model", tree="some-tree"
+            )
+            db.store_artifact(
+                db_session,
+                f"db-key-{index}",
+                artifact,
+                project=project,
+                tag="v1",
+            )
+        full_artifacts = {
+            artifact["spec"]["db_key"]: artifact
+            for artifact in db.list_artifacts(db_session, project=project, tag="v1")
+        }
+
+        # served from the columns, the artifacts are not loaded
+        with unittest.mock.patch.object(
+            server.api.db.sqldb.models.ArtifactV2,
+            "full_object",
+            new_callable=unittest.mock.PropertyMock,
+            side_effect=AssertionError("artifact loaded"),
+        ):
+            artifacts = db.list_artifacts(
+                db_session,
+                project=project,
+                tag="v1",
+                fields=["kind", "metadata.uid", "metadata.tag"],
+            )
+        assert sorted(artifacts, key=lambda artifact: artifact["spec"]["db_key"]) == [
+            {
+                "kind": "model",
+                "metadata": {
+                    "project": project,
+                    "uid": full_artifacts[f"db-key-{index}"]["metadata"]["uid"],
+                    "tag": "v1",
+                },
+                "spec": {"db_key": f"db-key-{index}"},
+            }
+            for index in range(2)
+        ]
+
+        # fields without columns are taken from the artifacts
+        artifacts = db.list_artifacts(
+            db_session, project=project, tag="v1", fields=["metadata.key", "spec"]
+        )
+        assert sorted(artifacts, key=lambda artifact: artifact["spec"]["db_key"]) == [
+            {
+                "metadata": {"key": f"artifact-{index}", "project": project},
+                "spec": full_artifacts[f"db-key-{index}"]["spec"],
+            }
+            for index in range(2)
+        ]
+
+        with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+            db.list_artifacts(
+                db_session,
+                project=project,
+                fields=["kind"],
+                format_=mlrun.common.formatters.ArtifactFormat.minimal,
+            )
+
     def test_list_artifact_for_tagging_fallback(
         self, db: DBInterface, db_session: Session
     ):
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import pickle
 import unittest.mock
 from datetime import datetime, timezone
 
@@ -19,8 +20,10 @@ import pytest
 from sqlalchemy.orm import Session
 
 import mlrun.common.schemas
+import mlrun.errors
 import mlrun.model
 import server.api.db.sqldb.helpers
+import server.api.db.sqldb.models
 import server.api.initial_data
 from server.api.db.base import DBInterface
 
@@ -399,6 +402,106 @@ def test_update_run_labels(db: DBInterface, db_session: Session):
     assert run["metadata"]["labels"] == {"a": "b"}
 
 
+def test_update_run_patched_in_place(db: DBInterface, db_session: Session):
+    project, name, uid, iteration, run = _create_new_run(db, db_session)
+    db.update_run(
+        db_session,
+        {"status.results": {"a": 1, "b": 2}, "spec.parameters": {"p": 1}},
+        uid,
+        project,
+        iteration,
+    )
+    start_time = datetime.now(timezone.utc).isoformat()
+
+    with unittest.mock.patch.object(db, "_get_run") as get_run_mock:
+        updated_run = db.update_run(
+            db_session,
+            {
+                # objects are replaced, like in the update of the run record
+                "status.results": {"c": 3},
+                "status.state": mlrun.common.runtimes.constants.RunStates.running,
+                "status.start_time": start_time,
+                "spec.parameters.q": 2,
+            },
+            uid,
+            project,
+            iteration,
+        )
+        assert get_run_mock.call_count == 0
+
+    assert updated_run["status"]["results"] == {"c": 3}
+    assert updated_run["spec"]["parameters"] == {"p": 1, "q": 2}
+    assert updated_run["metadata"]["name"] == name
+    run = db.read_run(db_session, uid, project, iteration)
+    assert run == updated_run
+
+    runs = db._find_runs(db_session, uid=None, project=project, labels=None).all()
+    assert len(runs) == 1
+    assert runs[0].state == mlrun.common.runtimes.constants.RunStates.running
+    assert db._add_utc_timezone(runs[0].start_time).isoformat() == start_time
+    assert (
+        db._add_utc_timezone(runs[0].updated).isoformat()
+        == run["status"]["last_update"]
+    )
+
+
+def test_update_run_not_patchable(db: DBInterface, db_session: Session):
+    project, name, uid, iteration, run = _create_new_run(db, db_session)
+    db.update_run(
+        db_session, {"status.results": {"a": 1, "b": 2}}, uid, project, iteration
+    )
+
+    # null values and top level keys are updated through the run record
+    db.update_run(
+        db_session,
+        {"status.results.a": None, "status.error": "some error"},
+        uid,
+        project,
+        iteration,
+    )
+    run = db.read_run(db_session, uid, project, iteration)
+    assert run["status"]["results"] == {"a": None, "b": 2}
+    assert run["status"]["error"] == "some error"
+
+    db.update_run(db_session, {"status": {"state": "error"}}, uid, project, iteration)
+    run = db.read_run(db_session, uid, project, iteration)
+    assert run["status"]["state"] == "error"
+    assert "results" not in run["status"]
+
+    with pytest.raises(mlrun.errors.MLRunNotFoundError):
+        db.update_run(db_session, {"status.state": "error"}, "no-such-uid", project)
+
+
+def test_data_migration_runs_struct_column(
+    db: DBInterface, db_session: Session, monkeypatch
+):
+    for index in range(5):
+        _create_new_run(db, db_session, uid=f"uid-{index}")
+
+    # change the records to be as they are before the migration, with pickled bodies
+    runs = db._find_runs(db_session, None, "*", None).all()
+    for run in runs:
+        struct = run.struct
+        run._struct = None
+        run.body = pickle.dumps(struct)
+    db_session.commit()
+
+    # the pickled runs are read, and updated through their record
+    run = db.read_run(db_session, "uid-0", "project")
+    assert run["metadata"]["uid"] == "uid-0"
+    db.update_run(db_session, {"status.state": "running"}, "uid-1", "project")
+
+    monkeypatch.setattr(mlrun.mlconf.httpdb.db, "runs_struct_migration_batch_size", 2)
+    server.api.initial_data._migrate_runs_to_struct_column(db, db_session)
+
+    runs = db._find_runs(db_session, None, "*", None).all()
+    assert len(runs) == 5
+    for run in runs:
+        assert run.body is None
+        assert run._struct["metadata"]["uid"] == run.uid
+    assert db.read_run(db_session, "uid-1", "project")["status"]["state"] == "running"
+
+
 def test_store_and_update_run_update_name_failure(db: DBInterface, db_session: Session):
     project, name, uid, iteration, run = _create_new_run(db, db_session)
 
@@ -466,6 +569,126 @@ def test_list_runs_with_same_names(db: DBInterface, db_session: Session):
     assert len(runs) == 4
 
 
+def test_list_runs_keyset_pagination(db: DBInterface, db_session: Session):
+    project = "project"
+    for index in range(11):
+        uid = f"uid-{index}"
+        run = {
+            "metadata": {"name": "run-name", "uid": uid, "project": project},
+            # runs with the same start time are sorted by their id
+            "status": {
+                "start_time": datetime(
+                    2024, 1, 1, index // 3, tzinfo=timezone.utc
+                ).isoformat()
+            },
+        }
+        db.store_run(db_session, run, uid, project)
+    # runs without a start time are listed last
+    db_session.query(server.api.db.sqldb.models.Run).filter_by(uid="uid-0").update(
+        {"start_time": None}
+    )
+    db_session.commit()
+
+    def _list_pages(new_run_after_first_page=False):
+        uids = []
+        page_cursor = mlrun.common.schemas.PageCursor()
+        for page in range(1, 5):
+            runs = db.list_runs(
+                db_session,
+                project=project,
+                page=page,
+                page_size=3,
+                page_cursor=page_cursor,
+            )
+            uids += [run["metadata"]["uid"] for run in runs]
+            page_cursor = mlrun.common.schemas.PageCursor(after=page_cursor.last)
+            if new_run_after_first_page and page == 1:
+                _create_new_run(db, db_session, project=project, uid="new-uid")
+        return uids
+
+    offset_uids = []
+    for page in range(1, 5):
+        runs = db.list_runs(db_session, project=project, page=page, page_size=3)
+        offset_uids += [run["metadata"]["uid"] for run in runs]
+    assert offset_uids == [
+        "uid-10",
+        "uid-9",
+        "uid-8",
+        "uid-7",
+        "uid-6",
+        "uid-5",
+        "uid-4",
+        "uid-3",
+        "uid-2",
+        "uid-1",
+        "uid-0",
+    ]
+    assert _list_pages() == offset_uids
+
+    # a run which is stored while paginating does not shift the next pages
+    assert _list_pages(new_run_after_first_page=True) == offset_uids
+
+
+def test_list_runs_fields(db: DBInterface, db_session: Session):
+    project = "project"
+    for index in range(3):
+        run = {
+            "metadata": {"name": "run-name", "labels": {"kind": "job"}},
+            "spec": {"parameters": {"p": index}},
+            "status": {"state": "completed", "results": {"accuracy": index / 10}},
+        }
+        db.store_run(db_session, run, f"uid-{index}", project)
+    # a run which was stored before the struct column, with a pickled body
+    run_record = (
+        db_session.query(server.api.db.sqldb.models.Run).filter_by(uid="uid-0").one()
+    )
+    struct = run_record.struct
+    run_record._struct = None
+    run_record.body = pickle.dumps(struct)
+    db_session.commit()
+
+    runs = db.list_runs(
+        db_session,
+        project=project,
+        fields=[
+            "metadata.name",
+            "status.state",
+            "status.results",
+            "spec.no-such-field",
+        ],
+    )
+    assert sorted(runs, key=lambda run: run["metadata"]["uid"]) == [
+        {
+            "metadata": {"name": "run-name", "uid": f"uid-{index}", "project": project},
+            "status": {"state": "completed", "results": {"accuracy": index / 10}},
+        }
+        for index in range(3)
+    ]
+
+    # whole sections, the uid and project are merged into the selected metadata
+    runs = db.list_runs(db_session, project=project, uid="uid-1", fields=["metadata"])
+    assert runs == [
+        {
+            "metadata": {
+                **db.read_run(db_session, "uid-1", project)["metadata"],
+                "uid": "uid-1",
+                "project": project,
+            }
+        }
+    ]
+
+    for fields in [["status..state"], [""]]:
+        with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+            db.list_runs(db_session, project=project, fields=fields)
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        db.list_runs(
+            db_session,
+            project=project,
+            fields=["status.state"],
+            with_notifications=True,
+        )
+
+
 def _change_run_record_to_before_align_runs_migration(run, time_before_creation):
     run_dict = run.struct
 
@@ -32,6 +32,7 @@ from mlrun.config import config
 from mlrun.runtimes import RuntimeKinds
 from mlrun.utils import now_date
 from server.api.runtime_handlers import get_runtime_handler
+from server.api.runtime_handlers.resources_watcher import RuntimeResourcesWatcher
 from server.api.utils.singletons.db import get_db
 from tests.api.runtime_handlers.base import TestRuntimeHandlerBase
 
@@ -721,6 +722,57 @@ class TestKubejobRuntimeHandler(TestRuntimeHandlerBase):
             db, self.project, self.run_uid, RunStates.running
         )
 
+    @pytest.mark.asyncio
+    async def test_monitor_run_watched_pods(self, db: Session, client: TestClient):
+        config.monitoring.runs.watch.enabled = True
+        watch_events = []
+
+        def watch_pods(resource_version, timeout_seconds):
+            yield from watch_events
+            watch_events.clear()
+
+        runtime_handler = type(self.runtime_handler)()
+        runtime_handler._runtime_resources_watcher = RuntimeResourcesWatcher(
+            lambda: ([self.pending_job_pod.to_dict()], "1"),
+            watch_pods,
+            resync_interval=600,
+        )
+        # the monitoring lists the pods until the watcher is synced
+        self._mock_list_namespaced_pods([[self.pending_job_pod]])
+        runtime_handler.monitor_runs(get_db(), db)
+        self._assert_run_reached_state(
+            db, self.project, self.run_uid, RunStates.pending
+        )
+
+        runtime_handler._runtime_resources_watcher.sync()
+        for pod, expected_state in [
+            (self.pending_job_pod, RunStates.pending),
+            (self.running_job_pod, RunStates.running),
+            (None, RunStates.running),
+            (self.completed_job_pod, RunStates.completed),
+        ]:
+            if pod:
+                watch_events.append({"type": "MODIFIED", "object": pod.to_dict()})
+                runtime_handler._runtime_resources_watcher.sync()
+            # for the get_logger_pods
+            self._mock_list_namespaced_pods([[self.completed_job_pod]])
+            self._mock_read_namespaced_pod_log()
+            with unittest.mock.patch.object(
+                runtime_handler,
+                "_monitor_runtime_resource",
+                wraps=runtime_handler._monitor_runtime_resource,
+            ) as monitor_runtime_resource:
+                runtime_handler.monitor_runs(get_db(), db)
+            # only the changed pods are monitored
+            assert monitor_runtime_resource.call_count == (1 if pod else 0)
+            self._assert_run_reached_state(
+                db, self.project, self.run_uid, expected_state
+            )
+
+        # the completed run is removed from the monitored runs by the runs updated since the previous cycle
+        runtime_handler.monitor_runs(get_db(), db)
+        assert runtime_handler._monitored_runs == {self.project: {}}
+
     @pytest.mark.asyncio
     async def test_monitor_no_search_run(self, db: Session, client: TestClient):
         # tests the opposite of test_monitor_stale_run - that the run is listed, and we don't try to read it
@@ -0,0 +1,118 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import time
+
+from kubernetes.client.rest import ApiException
+
+from server.api.runtime_handlers.resources_watcher import RuntimeResourcesWatcher
+
+
+class FakeWatchSource:
+    """a fake k8s source of runtime resources, the watch yields the queued events (or raises the queued error)"""
+
+    def __init__(self, resources: list[dict], resource_version: str):
+        self.resources = resources
+        self.resource_version = resource_version
+        self.events = []
+        self.lists = 0
+        self.watches = []
+
+    def list(self):
+        self.lists += 1
+        return list(self.resources), self.resource_version
+
+    def watch(self, resource_version, timeout_seconds):
+        self.watches.append(resource_version)
+        events, self.events = self.events, []
+        for event in events:
+            if isinstance(event, Exception):
+                raise event
+            yield event
+
+
+def _resource(name, resource_version, phase="Running"):
+    return {
+        "metadata": {"name": name, "resource_version": resource_version},
+        "status": {"phase": phase},
+    }
+
+
+def test_watch_changes():
+    source = FakeWatchSource([_resource("a", "1"), _resource("b", "2")], "2")
+    watcher = RuntimeResourcesWatcher(source.list, source.watch, resync_interval=600)
+    assert watcher.pop_changes() is None
+
+    watcher.sync()
+    resources, changed = watcher.pop_changes()
+    assert sorted(resource["metadata"]["name"] for resource in resources) == ["a", "b"]
+    assert sorted(resource["metadata"]["name"] for resource in changed) == ["a", "b"]
+    assert watcher.pop_changes()[1] == []
+
+    source.events = [
+        {"type": "MODIFIED", "object": _resource("a", "3", "Succeeded")},
+        {"type": "ADDED", "object": _resource("c", "4")},
+        {"type": "DELETED", "object": _resource("b", "5")},
+        {"type": "BOOKMARK", "object": {"metadata": {"resource_version": "7"}}},
+    ]
+    watcher.sync()
+    resources, changed = watcher.pop_changes()
+    assert sorted(resource["metadata"]["name"] for resource in resources) == ["a", "c"]
+    assert {
+        resource["metadata"]["name"]: resource["status"]["phase"]
+        for resource in changed
+    } == {"a": "Succeeded", "c": "Running"}
+
+    # the watch is resumed from the last seen resource version, without listing again
+    watcher.sync()
+    assert source.watches == ["2", "2", "7"]
+    assert source.lists == 1
+
+
+def test_watch_expired_resource_version():
+    source = FakeWatchSource([_resource("a", "1")], "1")
+    watcher = RuntimeResourcesWatcher(source.list, source.watch, resync_interval=600)
+    watcher.sync()
+    watcher.pop_changes()
+
+    for expired_event in [
+        ApiException(status=410, reason="Gone"),
+        {"type": "ERROR", "object": {"code": 410, "message": "too old"}},
+    ]:
+        source.resources = [_resource("b", "10")]
+        source.resource_version = "10"
+        source.events = [expired_event]
+        watcher.sync()
+        # listed again, the resources which were deleted while not watched are dropped
+        watcher.sync()
+        resources, changed = watcher.pop_changes()
+        assert [resource["metadata"]["name"] for resource in resources] == ["b"]
+        assert [resource["metadata"]["name"] for resource in changed] == ["b"]
+    assert source.lists == 3
+    assert source.watches[-1] == "10"
+
+
+def test_watch_resync():
+    source = FakeWatchSource([_resource("a", "1")], "1")
+    watcher = RuntimeResourcesWatcher(source.list, source.watch, resync_interval=0.1)
+    watcher.sync()
+    watcher.pop_changes()
+
+    time.sleep(0.2)
+    watcher.sync()
+    # all the resources are processed again after a resync
+    assert source.lists == 2
+    assert [resource["metadata"]["name"] for resource in watcher.pop_changes()[1]] == [
+        "a"
+    ]
@@ -100,6 +100,11 @@ def test_perform_data_migrations_from_first_version():
     )
     server.api.initial_data._perform_version_8_data_migrations = unittest.mock.Mock()
 
+    original_perform_version_9_data_migrations = (
+        server.api.initial_data._perform_version_9_data_migrations
+    )
+    server.api.initial_data._perform_version_9_data_migrations = unittest.mock.Mock()
+
     # perform migrations
     server.api.initial_data._perform_data_migrations(db_session)
 
@@ -113,6 +118,7 @@ def test_perform_data_migrations_from_first_version():
     server.api.initial_data._perform_version_6_data_migrations.assert_called_once()
     server.api.initial_data._perform_version_7_data_migrations.assert_called_once()
     server.api.initial_data._perform_version_8_data_migrations.assert_called_once()
+    server.api.initial_data._perform_version_9_data_migrations.assert_called_once()
 
     assert db.get_current_data_version(db_session, raise_on_not_found=True) == str(
         server.api.initial_data.latest_data_version
@@ -140,6 +146,9 @@ def test_perform_data_migrations_from_first_version():
     server.api.initial_data._perform_version_8_data_migrations = (
         original_perform_version_8_data_migrations
     )
+    server.api.initial_data._perform_version_9_data_migrations = (
+        original_perform_version_9_data_migrations
+    )
 
 
 def test_resolve_current_data_version_version_exists():
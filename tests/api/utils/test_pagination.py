@@ -14,12 +14,14 @@
 #
 
 import typing
+import unittest.mock
 
 import pytest
 import sqlalchemy.orm
 
 import mlrun.common.schemas
 import server.api.crud
+import server.api.db.sqldb.db
 import server.api.db.sqldb.models
 import server.api.utils.pagination
 from mlrun.utils import logger
@@ -593,6 +595,61 @@ async def test_paginate_permission_filtered_with_token(
     )
 
 
+@pytest.mark.asyncio
+async def test_paginate_request_by_keyset(
+    cleanup_pagination_cache_on_teardown,
+    db: sqlalchemy.orm.Session,
+):
+    """
+    Paginate the runs listing, which supports keyset pagination. The sort key of the last run of each page is stored
+    in the pagination cache record, and the next page is read from it.
+    """
+    project = "project"
+    for index in range(5):
+        server.api.crud.Runs().store_run(
+            db,
+            {
+                "metadata": {"name": "run-name", "uid": f"uid-{index}"},
+                "status": {"state": "created"},
+            },
+            f"uid-{index}",
+            project=project,
+        )
+    auth_info = mlrun.common.schemas.AuthInfo(user_id="user1")
+    paginator = server.api.utils.pagination.Paginator()
+    method = server.api.crud.Runs().list_runs
+    page_size = 2
+
+    response, pagination_info = await paginator.paginate_request(
+        db, method, auth_info, None, 1, page_size, project=project, name="run-name"
+    )
+    uids = [run["metadata"]["uid"] for run in response]
+    cache_record = server.api.crud.PaginationCache().get_pagination_cache_record(
+        db, pagination_info.page_token
+    )
+    _assert_cache_record(cache_record, "user1", method, 1, page_size)
+    assert cache_record.cursor["page"] == 1
+
+    list_runs = server.api.db.sqldb.db.SQLDB.list_runs
+    with unittest.mock.patch.object(
+        server.api.db.sqldb.db.SQLDB,
+        "list_runs",
+        autospec=True,
+        side_effect=list_runs,
+    ) as list_runs_mock:
+        while pagination_info:
+            response, pagination_info = await paginator.paginate_request(
+                db, method, auth_info, pagination_info.page_token
+            )
+            uids += [run["metadata"]["uid"] for run in response]
+
+    assert uids == [f"uid-{index}" for index in reversed(range(5))]
+    page_cursors = [
+        call.kwargs["page_cursor"] for call in list_runs_mock.call_args_list
+    ]
+    assert all(page_cursor.after for page_cursor in page_cursors)
+
+
 def _assert_paginated_response(
     response,
     pagination_info,
@@ -0,0 +1,95 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import unittest.mock
+
+import pytest
+
+import mlrun.config
+from server.api.utils.response_cache import CachedResource, ResponseCache
+
+
+@pytest.fixture(autouse=True)
+def enable_response_cache(monkeypatch):
+    monkeypatch.setattr(
+        mlrun.config.config.httpdb.response_cache, "enabled", True, raising=False
+    )
+
+
+async def test_get_or_compute_invalidation():
+    response_cache = ResponseCache()
+    function = unittest.mock.Mock(side_effect=lambda project: [project])
+
+    async def _list(project):
+        return await response_cache.get_or_compute(
+            CachedResource.functions, project, (), function, project
+        )
+
+    assert await _list("project-a") == ["project-a"]
+    assert await _list("project-b") == ["project-b"]
+    assert await _list(None) == [None]
+    assert await _list("project-a") == ["project-a"]
+    assert function.call_count == 3
+
+    # a write to a project invalidates the project and the cross-project lists only
+    response_cache.bump_generation(CachedResource.functions, "project-a")
+    await _list("project-a")
+    await _list("project-b")
+    await _list(None)
+    assert function.call_count == 5
+
+    # a write without a project invalidates all the lists
+    response_cache.bump_generation(CachedResource.functions)
+    await _list("project-b")
+    assert function.call_count == 6
+
+    # the other resource types are not affected
+    response_cache.bump_generation(CachedResource.feature_sets, "project-b")
+    await _list("project-b")
+    assert function.call_count == 6
+
+    stats = response_cache.stats()[CachedResource.functions]
+    assert stats["hits"] == 3
+    assert stats["misses"] == 6
+    assert stats["hit_ratio"] == 1 / 3
+
+
+async def test_get_or_compute_ttl_and_disabled(monkeypatch):
+    response_cache = ResponseCache()
+    function = unittest.mock.Mock(return_value={"name": "summary"})
+    now = 1000.0
+    monkeypatch.setattr(
+        mlrun.config.config.httpdb.response_cache, "ttl", 30, raising=False
+    )
+    with unittest.mock.patch("time.time", side_effect=lambda: now):
+        for _ in range(2):
+            await response_cache.get_or_compute(
+                CachedResource.project_summaries, None, (), function
+            )
+        assert function.call_count == 1
+
+        # the writes of other API instances are seen after the ttl
+        now += 30
+        await response_cache.get_or_compute(
+            CachedResource.project_summaries, None, (), function
+        )
+        assert function.call_count == 2
+
+    monkeypatch.setattr(
+        mlrun.config.config.httpdb.response_cache, "enabled", False, raising=False
+    )
+    await response_cache.get_or_compute(
+        CachedResource.project_summaries, None, (), function
+    )
+    assert function.call_count == 3
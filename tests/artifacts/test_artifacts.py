@@ -15,6 +15,7 @@
 import os.path
 import pathlib
 import tempfile
+import threading
 import typing
 import unittest.mock
 import uuid
@@ -668,3 +669,108 @@ def test_artifact_producer_parse_uri(uri, expected_parsed_result):
         deepdiff.DeepDiff(parsed_result, expected_parsed_result, ignore_order=True)
         == {}
     )
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_dir_artifact_upload(monkeypatch, tmp_path, workers):
+    monkeypatch.setattr(mlrun.mlconf.artifacts.upload, "workers", workers)
+    src_path = tmp_path / "src"
+    src_path.mkdir()
+    for index in range(10):
+        (src_path / f"file_{index}.txt").write_text(f"content {index}")
+
+    # the stores are resolved on the calling thread, only the uploads run in the pool
+    store_threads = set()
+    get_or_create_store = mlrun.datastore.store_manager.get_or_create_store
+
+    def recording_get_or_create_store(*args, **kwargs):
+        store_threads.add(threading.current_thread())
+        return get_or_create_store(*args, **kwargs)
+
+    monkeypatch.setattr(
+        mlrun.datastore.store_manager,
+        "get_or_create_store",
+        recording_get_or_create_store,
+    )
+
+    artifact = mlrun.artifacts.DirArtifact()
+    artifact.spec.src_path = str(src_path)
+    artifact.spec.target_path = str(tmp_path / "target")
+    artifact.upload()
+
+    assert store_threads == {threading.current_thread()}
+    assert list(artifact.spec.extra_data.keys()) == os.listdir(src_path)
+    for file_name, target_path in artifact.spec.extra_data.items():
+        assert target_path == str(tmp_path / "target" / file_name)
+        assert (
+            pathlib.Path(target_path).read_text() == (src_path / file_name).read_text()
+        )
+
+
+def test_upload_skips_existing_hash_targets(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        mlrun.mlconf.artifacts, "generate_target_path_from_artifact_hash", True
+    )
+    src_path = tmp_path / "src"
+    src_path.mkdir()
+    for index in range(3):
+        (src_path / f"file_{index}.txt").write_text(f"content {index}")
+    artifact_path = str(tmp_path / "artifacts") + "/"
+
+    uploads = []
+    upload = mlrun.datastore.base.DataItem.upload
+
+    def counting_upload(self, src_path):
+        uploads.append(src_path)
+        return upload(self, src_path)
+
+    monkeypatch.setattr(mlrun.datastore.base.DataItem, "upload", counting_upload)
+
+    for _ in range(2):
+        artifact = mlrun.artifacts.DirArtifact()
+        artifact.spec.src_path = str(src_path)
+        artifact.upload(artifact_path=artifact_path)
+    # the files are uploaded once, their hash targets exist when logging them again
+    assert len(uploads) == 3
+
+    # a partially uploaded target (of another size) is uploaded again
+    pathlib.Path(artifact.spec.extra_data["file_0.txt"]).write_text("content")
+    artifact.upload(artifact_path=artifact_path)
+    assert len(uploads) == 4
+    assert (
+        pathlib.Path(artifact.spec.extra_data["file_0.txt"]).read_text() == "content 0"
+    )
+
+    monkeypatch.setattr(
+        mlrun.mlconf.artifacts.upload, "skip_existing_hash_targets", False
+    )
+    artifact.upload(artifact_path=artifact_path)
+    assert len(uploads) == 7
+
+
+def test_upload_extra_data(monkeypatch, tmp_path):
+    monkeypatch.setattr(mlrun.mlconf.artifacts.upload, "workers", 4)
+    (tmp_path / "file.txt").write_text("file content")
+    model = mlrun.artifacts.ModelArtifact(
+        key="model", body="model body", model_file="model.pkl"
+    )
+    model.src_path = str(tmp_path)
+    model.target_path = str(tmp_path / "target")
+
+    mlrun.artifacts.base.upload_extra_data(
+        model,
+        {
+            "body": b"body content",
+            "file": "file.txt",
+            "url": "s3://bucket/file.txt",
+        },
+    )
+    assert model.extra_data == {
+        "body": str(tmp_path / "target" / "body"),
+        "file": str(tmp_path / "target" / "file.txt"),
+    }
+    assert (tmp_path / "target" / "body").read_bytes() == b"body content"
+    assert (tmp_path / "target" / "file.txt").read_text() == "file content"
+
+    with pytest.raises(ValueError, match="Extra data file"):
+        mlrun.artifacts.base.upload_extra_data(model, {"missing": "missing.txt"})
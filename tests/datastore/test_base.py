@@ -267,3 +267,59 @@ def test_as_df_time_filters(start_time_tz, end_time_tz, df_tz):
                 190 - (80 if start_time_tz else 0) - (90 if end_time_tz else 0)
             )
             assert len(resp) == num_row_expected
+
+
+def test_as_df_additional_filters_with_time_partitions(tmp_path):
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=96, freq="h"),
+            "key": list(range(4)) * 24,
+        }
+    )
+    partition_cols = ["year", "month", "day", "hour"]
+    for partition_col in partition_cols:
+        df[partition_col] = getattr(df["timestamp"].dt, partition_col)
+    df.to_parquet(tmp_path / "data", partition_cols=partition_cols)
+    data_item = mlrun.datastore.store_manager.object(f"file://{tmp_path}/data/")
+
+    # the time range spans several partitions, the additional filters must apply to all of them
+    resp = data_item.as_df(
+        format="parquet",
+        time_column="timestamp",
+        start_time=datetime(2024, 1, 1, 12, 30),
+        end_time=datetime(2024, 1, 3, 12, 30),
+        additional_filters=[("key", "=", 1)],
+    )
+    assert len(resp) == 12
+    assert set(resp["key"]) == {1}
+    assert resp["day"].dtype == "category"
+
+
+def test_as_df_prunes_row_groups(tmp_path):
+    df = pd.DataFrame({"key": range(1000), "value": [1.0] * 1000}).set_index("key")
+    df.to_parquet(tmp_path / "data.parquet", row_group_size=100)
+    data_item = mlrun.datastore.store_manager.object(f"file://{tmp_path}/data.parquet")
+
+    resp = data_item.as_df(
+        columns=["value"], additional_filters=[("key", ">=", 250), ("key", "<", 350)]
+    )
+    assert resp.index.tolist() == list(range(250, 350))
+    assert resp.columns.tolist() == ["value"]
+
+    scan_report = resp.attrs["parquet_scan"]
+    assert scan_report["files"] == 1
+    assert scan_report["scanned_row_groups"] == 2
+    assert scan_report["pruned_row_groups"] == 8
+    assert scan_report["pruned_bytes"] > scan_report["scanned_bytes"] > 0
+
+
+def test_as_df_csv_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.storage, "max_concurrent_file_reads", 3)
+    for i in range(5):
+        pd.DataFrame({"x": [i * 10, i * 10 + 1]}).to_csv(
+            tmp_path / f"part-{i}.csv", index=False
+        )
+    data_item = mlrun.datastore.store_manager.object(f"file://{tmp_path}/")
+
+    resp = data_item.as_df(format="csv")
+    assert sorted(resp["x"]) == [i * 10 + j for i in range(5) for j in range(2)]
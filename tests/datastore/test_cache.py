@@ -0,0 +1,217 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+
+import pandas as pd
+import pytest
+
+import mlrun
+from mlrun.datastore.base import DataItem, FileStats
+from mlrun.datastore.cache import DataCache
+from mlrun.datastore.filestore import FileStore
+
+
+class RemoteStore(FileStore):
+    """a local file store which counts its reads, and is cached like a remote store"""
+
+    cacheable = True
+
+    def __init__(self, cache):
+        super().__init__(None, "", "remote")
+        self.kind = "remote"
+        self.cache = cache
+        self.reads = []
+
+    def get(self, key, size=None, offset=0):
+        self.reads.append((size, offset))
+        return super().get(key, size=size, offset=offset)
+
+    def download(self, key, target_path):
+        self.reads.append("download")
+        super().download(key, target_path)
+
+    def _get_parent_secret(self, key):
+        return None
+
+    def _get_data_cache(self):
+        return self.cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DataCache(str(tmp_path / "cache"), max_size=1000, block_size=10)
+
+
+@pytest.fixture
+def remote_file(tmp_path):
+    path = str(tmp_path / "data.bin")
+    with open(path, "wb") as fp:
+        fp.write(bytes(range(100)))
+    return path
+
+
+def test_get_ranges(cache, remote_file):
+    store = RemoteStore(cache)
+    item = DataItem("data", store, remote_file, remote_file)
+
+    assert item.get(size=15, offset=5) == bytes(range(5, 20))
+    assert store.reads == [(10, 0), (10, 10)]
+    # cached blocks are not read again
+    assert item.get(size=10, offset=12) == bytes(range(12, 22))
+    assert store.reads == [(10, 0), (10, 10), (10, 20)]
+    assert item.get(offset=95) == bytes(range(95, 100))
+    assert item.get(size=10, offset=200) == b""
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 4
+    assert cache.stats["miss_bytes"] == 40
+
+    # the whole object is cached separately from its blocks, and then serves the ranges too
+    assert item.get() == bytes(range(100))
+    assert item.get() == bytes(range(100))
+    assert item.get(size=5, offset=50) == bytes(range(50, 55))
+    assert store.reads.count("download") == 1
+    assert len(store.reads) == 5
+
+
+def test_modified_object_is_downloaded_again(cache, remote_file):
+    store = RemoteStore(cache)
+    item = DataItem("data", store, remote_file, remote_file)
+    assert item.get() == bytes(range(100))
+
+    with open(remote_file, "wb") as fp:
+        fp.write(b"modified")
+    assert item.get() == b"modified"
+    assert store.reads == ["download", "download"]
+
+
+def test_lru_eviction(tmp_path, cache):
+    store = RemoteStore(cache)
+    items = []
+    for index in range(3):
+        path = str(tmp_path / f"data{index}.bin")
+        with open(path, "wb") as fp:
+            fp.write(bytes(400))
+        items.append(DataItem("data", store, path, path))
+
+    items[0].get()
+    items[1].get()
+    # touch the first object so the second one is evicted
+    items[0].get()
+    items[2].get()
+    assert cache.stats["evictions"] == 1
+    assert cache.stats["size"] == 800
+
+    store.reads = []
+    items[0].get()
+    items[1].get()
+    assert store.reads == ["download"]
+
+    # another process indexes the existing entries by their access order
+    other_cache = DataCache(cache.path, max_size=1000, block_size=10)
+    store.cache = other_cache
+    store.reads = []
+    items[1].get()
+    items[0].get()
+    assert store.reads == []
+    assert other_cache.stats["hits"] == 2
+    assert other_cache.stats["entries"] == 2
+
+
+def test_size_bound_is_shared_by_processes(tmp_path, cache):
+    store = RemoteStore(cache)
+    # re-index the directory on every added entry
+    other_cache = DataCache(cache.path, max_size=1000, block_size=10, sync_interval=0)
+    other_store = RemoteStore(other_cache)
+    items = []
+    for index in range(3):
+        path = str(tmp_path / f"data{index}.bin")
+        with open(path, "wb") as fp:
+            fp.write(bytes(400))
+        items.append(path)
+
+    DataItem("data", other_store, items[0], items[0]).get()
+    DataItem("data", store, items[1], items[1]).get()
+    DataItem("data", other_store, items[2], items[2]).get()
+
+    # the other process counts the entry which was added by the first process, and evicts its least recently used
+    # entry to keep the size of the directory bounded
+    cached_files = os.listdir(cache.path)
+    assert len(cached_files) == 2
+    assert (
+        sum(os.path.getsize(os.path.join(cache.path, name)) for name in cached_files)
+        == 800
+    )
+    assert other_cache.stats["evictions"] == 1
+
+    other_store.reads = []
+    DataItem("data", other_store, items[1], items[1]).get()
+    DataItem("data", other_store, items[0], items[0]).get()
+    assert other_store.reads == ["download"]
+
+
+def test_directory_is_not_indexed_on_every_entry(cache, remote_file, monkeypatch):
+    sync_calls = []
+    sync = cache._sync
+    monkeypatch.setattr(cache, "_sync", lambda: sync_calls.append(1) or sync())
+    store = RemoteStore(cache)
+    item = DataItem("data", store, remote_file, remote_file)
+
+    # 10 blocks are added, the directory is only indexed for the first one
+    assert item.get(size=100) == bytes(range(100))
+    assert len(store.reads) == 10
+    assert len(sync_calls) == 1
+
+    # exceeding the size bound re-indexes the directory before evicting
+    cache.max_size = 150
+    assert item.get() == bytes(range(100))
+    assert len(sync_calls) == 2
+    assert cache.stats["size"] <= 150
+
+
+def test_local_and_as_df(tmp_path, cache):
+    path = str(tmp_path / "data.csv")
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    df.to_csv(path, index=False)
+    store = RemoteStore(cache)
+    item = DataItem("data", store, path, path)
+
+    local_path = item.local()
+    assert local_path.startswith(cache.path)
+    assert local_path.endswith(".csv")
+    pd.testing.assert_frame_equal(item.as_df(), df)
+    pd.testing.assert_frame_equal(item.as_df(columns=["b"]), df[["b"]])
+    assert store.reads == ["download"]
+
+    # the cached file belongs to the cache
+    item.remove_local()
+    assert os.path.exists(local_path)
+
+
+def test_disabled_by_default():
+    assert mlrun.mlconf.storage.cache.enabled is False
+    assert mlrun.store_manager.cache is None
+
+
+def test_object_larger_than_cache(cache, tmp_path):
+    path = str(tmp_path / "large.bin")
+    with open(path, "wb") as fp:
+        fp.write(bytes(2000))
+    store = RemoteStore(cache)
+    item = DataItem("data", store, path, path)
+
+    assert item.get() == bytes(2000)
+    assert store.reads == [(None, 0)]
+    assert cache.stats["entries"] == 0
+    assert cache.get_path(path, FileStats(2000, 1), store.download) is None
@@ -0,0 +1,176 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from unittest import mock
+
+import storey
+from storey.redis_driver import RedisDriver
+
+from mlrun.feature_store.feature_vector import OnlineVectorService
+from mlrun.feature_store.retrieval.batch_query import (
+    BatchDropColumns,
+    BatchQueryByKey,
+    BatchRename,
+)
+
+stored_features = {
+    "a": {"price": 10.0, "volume": 1},
+    "b": {"price": 20.0, "volume": 2},
+}
+
+
+class KeyCountingDriver(storey.Driver):
+    def __init__(self):
+        self.loaded_keys = []
+
+    async def _load_by_key(self, container, table_path, key, attributes):
+        self.loaded_keys.append(key)
+        features = stored_features.get(key)
+        if features is None:
+            return None
+        return {name: features[name] for name in attributes if name in features}
+
+
+class FakeRedisPipeline:
+    def __init__(self, data):
+        self._data = data
+        self._commands = []
+
+    def hmget(self, name, keys):
+        self._commands.append((name, keys))
+
+    def execute(self):
+        return [
+            [self._data.get(name, {}).get(key) for key in keys]
+            for name, keys in self._commands
+        ]
+
+
+class FakeRedis:
+    def __init__(self, data):
+        self.data = data
+        self.pipelines = 0
+
+    def pipeline(self, transaction=True):
+        self.pipelines += 1
+        return FakeRedisPipeline(self.data)
+
+
+def _run_batch(steps, rows):
+    controller = storey.build_flow(
+        [storey.SyncEmitSource(), *steps, storey.Complete()]
+    ).run()
+    try:
+        return controller.emit(rows, return_awaitable_result=True).await_result()
+    finally:
+        controller.terminate()
+        controller.await_termination()
+
+
+def test_batch_query_by_key():
+    driver = KeyCountingDriver()
+    rows = [{"id": "a"}, {"id": "b"}, {"id": None}, {"id": "a"}, {"id": "c"}]
+    result = _run_batch(
+        [
+            BatchRename({"id": "ticker"}),
+            BatchQueryByKey(
+                ["price", "volume"],
+                storey.Table("/container/path", driver),
+                key_field=["ticker"],
+                aliases={"price": "last_price"},
+            ),
+            BatchDropColumns(["volume"]),
+        ],
+        rows,
+    )
+
+    # a single load per distinct key of the batch
+    assert sorted(driver.loaded_keys) == ["a", "b", "c"]
+    assert result == [
+        {"ticker": "a", "last_price": 10.0},
+        {"ticker": "b", "last_price": 20.0},
+        None,
+        {"ticker": "a", "last_price": 10.0},
+        {"ticker": "c"},
+    ]
+
+
+def test_batch_query_by_key_redis_pipeline():
+    driver = RedisDriver(redis_client=FakeRedis({}), key_prefix="prefix:")
+    table = storey.Table("/container/path", driver)
+    for key, features in stored_features.items():
+        redis_key = driver._static_data_key(
+            driver._make_key(table._container, table._table_path, key)
+        )
+        driver.redis.data[redis_key] = {
+            name: str(value) for name, value in features.items()
+        }
+
+    result = _run_batch(
+        [BatchQueryByKey(["price", "volume"], table, key_field=["id"])],
+        [{"id": "b"}, {"id": "c"}, {"id": "a"}],
+    )
+
+    assert driver.redis.pipelines == 1
+    assert result == [
+        {"id": "b", "price": 20.0, "volume": 2},
+        {"id": "c"},
+        {"id": "a", "price": 10.0, "volume": 1},
+    ]
+
+
+def _online_vector_service(batched, rows_data):
+    vector = mock.Mock()
+    vector.status.label_column = "label"
+    vector.status.index_keys = ["id"]
+    vector.spec.with_indexes = False
+    graph = mock.Mock()
+    if batched:
+        graph.controller.emit.return_value.await_result.return_value.body = rows_data
+    else:
+        graph.controller.emit.side_effect = [
+            mock.Mock(**{"await_result.return_value.body": data}) for data in rows_data
+        ]
+    service = OnlineVectorService(
+        vector,
+        graph,
+        ["id"],
+        requested_columns=["price", "volume", "label"],
+        batched=batched,
+    )
+    service._impute_values = {"volume": 0}
+    return service
+
+
+def test_online_vector_service_get_batched():
+    rows_data = [
+        {"id": "a", "price": 10.0, "volume": float("nan")},
+        {"id": "b"},
+        None,
+    ]
+    expected = [{"price": 10.0, "volume": 0}, None, None]
+    for batched in [False, True]:
+        service = _online_vector_service(
+            batched, [dict(data) if data else data for data in rows_data]
+        )
+        assert service.get([{"id": "a"}, {"id": "b"}, {"id": None}]) == expected
+        # the whole batch is emitted as a single event
+        assert service._controller.emit.call_count == (1 if batched else 3)
+
+    service = _online_vector_service(True, [dict(rows_data[0]), None, None])
+    assert service.get([["a"], ["b"], [None]], as_list=True) == [
+        [10.0, 0],
+        None,
+        None,
+    ]
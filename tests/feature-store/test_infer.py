@@ -14,12 +14,13 @@
 #
 import unittest.mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
 import mlrun
 import mlrun.feature_store as fstore
-from mlrun.data_types import InferOptions
+from mlrun.data_types import InferOptions, infer
 from mlrun.datastore.targets import ParquetTarget
 from mlrun.feature_store import Entity
 from mlrun.feature_store.api import _infer_from_static_df
@@ -158,3 +159,73 @@ def test_check_timestamp_key_is_entity():
         fstore.FeatureSet(
             "imp1", entities=[Entity("time_stamp")], timestamp_key="time_stamp"
         )
+
+
+def _get_describe_stats(df, num_bins=20):
+    """the stats of the columns of df.describe(include="all"), with the histograms of the numeric columns"""
+    stats = {}
+    for column, values in df.describe(include="all").items():
+        stats[column] = {
+            stat: float(value)
+            if isinstance(value, (float, np.floating))
+            else int(value)
+            if isinstance(value, (int, np.integer))
+            else str(value)
+            for stat, value in values.dropna().items()
+        }
+        if pd.api.types.is_numeric_dtype(df[column]):
+            try:
+                hist, bins = np.histogram(df[column], bins=num_bins)
+                stats[column]["hist"] = [hist.tolist(), bins.tolist()]
+            except Exception:
+                pass
+    return stats
+
+
+@pytest.mark.parametrize("parallel_stats_min_values", [10**9, 1])
+def test_get_df_stats(monkeypatch, parallel_stats_min_values):
+    monkeypatch.setattr(infer, "parallel_stats_min_values", parallel_stats_min_values)
+    random = np.random.default_rng(0)
+    size = 1000
+    with_nulls = random.normal(size=size)
+    with_nulls[::7] = np.nan
+    float32_with_nulls = random.normal(size=size).astype("float32")
+    float32_with_nulls[::3] = np.nan
+    df = pd.DataFrame(
+        {
+            "float": random.normal(size=size) * 1000,
+            "float_with_nulls": with_nulls,
+            "float32": random.normal(size=size).astype("float32"),
+            "float32_with_nulls": float32_with_nulls,
+            "float_with_inf": np.where(random.random(size) < 0.01, np.inf, 1.0),
+            "nulls": np.full(size, np.nan),
+            "int": random.integers(-100, 100, size),
+            "uint8": random.integers(0, 5, size).astype("uint8"),
+            "constant": np.full(size, 3),
+            "bool": random.random(size) < 0.5,
+            "str": random.choice(["a", "b", "c"], size),
+            "timestamp": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(random.integers(0, 1000, size), unit="s"),
+            "nullable_int": pd.array(random.integers(0, 9, size), dtype="Int64"),
+        }
+    )
+
+    stats = infer.get_df_stats(df, InferOptions.Histogram)
+    assert list(stats.keys()) == list(df.columns)
+    assert stats == _get_describe_stats(df)
+    # a single row has no standard deviation
+    assert infer.get_df_stats(df.iloc[:1], InferOptions.Histogram) == (
+        _get_describe_stats(df.iloc[:1])
+    )
+
+    # the histogram of values which overflow the bins computation is skipped
+    df = pd.DataFrame(
+        {
+            "float_extremes": [-1.7e308, 1.7e308],
+            "uint64_max": np.array([2**64 - 1, 2**64 - 1], dtype="uint64"),
+        }
+    )
+    stats = infer.get_df_stats(df, InferOptions.Histogram)
+    assert stats == _get_describe_stats(df)
+    assert "hist" not in stats["float_extremes"]
+    assert "hist" not in stats["uint64_max"]
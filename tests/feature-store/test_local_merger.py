@@ -0,0 +1,289 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlrun.errors
+import mlrun.feature_store as fstore
+from mlrun.datastore.targets import CSVTarget, ParquetTarget, get_offline_target
+from mlrun.feature_store.retrieval.local_merger import LocalFeatureMerger, _key_ranges
+
+
+def _generate_featureset_df(rng, num_rows, num_keys, timestamp_key, value_column):
+    return pd.DataFrame(
+        {
+            # some keys don't exist in the entity df and vice versa
+            "id": rng.integers(0, num_keys + 5, num_rows),
+            "name": rng.choice(["a", "b"], num_rows),
+            timestamp_key: pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 3600, num_rows), unit="s"),
+            value_column: rng.normal(size=num_rows),
+        }
+    ).drop_duplicates(subset=[timestamp_key])
+
+
+def _generate_entity_df(rng, num_rows, num_keys):
+    return pd.DataFrame(
+        {
+            "id": rng.integers(0, num_keys, num_rows),
+            "name": rng.choice(["a", "b"], num_rows),
+            "time": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 3600, num_rows), unit="s"),
+        }
+    )
+
+
+def _merge(merger, entity_df, featuresets, featureset_dfs, keys):
+    return merger.merge(
+        entity_timestamp_column="time",
+        featuresets=[None] + featuresets,
+        featureset_dfs=[entity_df] + featureset_dfs,
+        keys=[[[], []]] + [[keys, keys]] * len(featuresets),
+        join_types=[None] + [[merger._default_join_type, True]] * len(featuresets),
+    )
+
+
+@pytest.mark.parametrize("keys", [[], ["id"], ["id", "name"]])
+def test_asof_join_matches_merge_asof(keys):
+    rng = np.random.default_rng(0)
+    entity_df = _generate_entity_df(rng, 500, 20)
+    featuresets = [
+        fstore.FeatureSet(f"fs{i}", entities=["id"], timestamp_key=f"time_{i}")
+        for i in range(3)
+    ]
+    featureset_dfs = [
+        _generate_featureset_df(rng, 1000, 20, f"time_{i}", f"value_{i}")
+        for i in range(3)
+    ]
+
+    expected = entity_df.sort_values("time", kind="mergesort")
+    for i, featureset_df in enumerate(featureset_dfs):
+        expected = pd.merge_asof(
+            expected,
+            featureset_df.sort_values(f"time_{i}"),
+            left_on="time",
+            right_on=f"time_{i}",
+            by=keys or None,
+            suffixes=("", f"_fs{i}_"),
+        )
+    # overlapping columns are never materialized
+    expected = expected.drop(
+        columns=[column for column in expected.columns if column.endswith("_")]
+    )
+
+    merger = LocalFeatureMerger(vector=None)
+    assert _merge(merger, entity_df, featuresets, featureset_dfs, keys) == "time"
+    pd.testing.assert_frame_equal(merger._result_df, expected)
+
+
+def test_asof_join_missing_entity_timestamp():
+    entity_df = pd.DataFrame(
+        {"id": [1, 1, 2], "time": pd.to_datetime(["2024-01-02", None, "2024-01-02"])}
+    )
+    featureset_df = pd.DataFrame(
+        {
+            "id": [1, 2, 2],
+            "fs_time": pd.to_datetime(["2024-01-01", "2024-01-01", "2024-01-03"]),
+            "value": [1.0, 2.0, 3.0],
+        }
+    )
+    featureset = fstore.FeatureSet("fs", entities=["id"], timestamp_key="fs_time")
+
+    merger = LocalFeatureMerger(vector=None)
+    _merge(merger, entity_df, [featureset], [featureset_df], ["id"])
+
+    assert merger._result_df["value"].tolist()[:2] == [1.0, 2.0]
+    assert np.isnan(merger._result_df["value"].iloc[2])
+
+
+def test_asof_join_result_index():
+    entity_df = pd.DataFrame(
+        {
+            "id": [2, 1, 2],
+            "time": pd.to_datetime(["2024-01-03", "2024-01-01", "2024-01-02"]),
+        }
+    )
+    merger = LocalFeatureMerger(vector=None)
+
+    # the sorted entity rows get a range index, with or without pending features
+    sorted_df, _ = merger._get_asof_state(entity_df, "time")
+    assert sorted_df.index.tolist() == [1, 2, 0]
+    result_df = merger._materialize_asof_columns(sorted_df)
+    assert result_df.index.equals(pd.RangeIndex(3))
+    assert result_df["id"].tolist() == [1, 2, 2]
+    # the entity rows of the caller are not modified
+    assert entity_df.index.equals(pd.RangeIndex(3))
+    assert entity_df["id"].tolist() == [2, 1, 2]
+
+    featureset_df = pd.DataFrame(
+        {"id": [1, 2], "fs_time": pd.to_datetime(["2024-01-01", "2024-01-01"])}
+    )
+    featureset = fstore.FeatureSet("fs", entities=["id"], timestamp_key="fs_time")
+    merger = LocalFeatureMerger(vector=None)
+    _merge(merger, entity_df, [featureset], [featureset_df], ["id"])
+    assert merger._result_df.index.equals(pd.RangeIndex(3))
+
+
+@pytest.mark.parametrize(
+    "keys, num_partitions, expected",
+    [
+        ([1, 2, 3, 4], 2, [(1, 2), (3, 4)]),
+        # a key is never split between partitions
+        ([1, 1, 1, 1, 1, 2, 3, 4, None], 3, [(1.0, 1.0), (2.0, 2.0), (3.0, 4.0)]),
+        (["b", "a", "c"], 10, [("a", "a"), ("b", "b"), ("c", "c")]),
+        ([3, 1, 2], 1, [(1, 3)]),
+        ([None, None], 2, []),
+    ],
+)
+def test_key_ranges(keys, num_partitions, expected):
+    assert _key_ranges(pd.Series(keys), num_partitions) == expected
+
+
+def test_partitioned_merge_validation():
+    merger = LocalFeatureMerger(vector=None, num_partitions=2)
+    merger._target = CSVTarget(path="/tmp/out.csv")
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError, match="ParquetTarget"):
+        merger._validate_partitioned_merge(order_by=None)
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError, match="order_by"):
+        merger._validate_partitioned_merge(order_by="id")
+
+
+def test_partition_key():
+    featuresets = {
+        "fs1": fstore.FeatureSet("fs1", entities=["id", "name"]),
+        "fs2": fstore.FeatureSet("fs2", entities=["name", "id"]),
+    }
+    join_graph = fstore.JoinGraph(first_feature_set="fs1").left("fs2", asof_join=True)
+    for step in join_graph.steps:
+        step.left_keys = ["id", "name"]
+        step.right_keys = ["id", "name"]
+
+    merger = LocalFeatureMerger(vector=None, num_partitions=2)
+    assert merger._get_partition_key(join_graph, featuresets, None) == "id"
+    assert merger._get_partition_key(join_graph, featuresets, ["name"]) == "name"
+
+    # the feature sets are joined on differently named columns
+    join_graph.steps[1].left_keys = ["name", "id"]
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError, match="common entity"):
+        merger._get_partition_key(join_graph, featuresets, None)
+
+
+class _FeatureStoreDBMock:
+    """stores the feature sets and vectors of the rundb mock in memory"""
+
+    def __init__(self):
+        self.feature_sets = {}
+        self.feature_vectors = {}
+
+    def store_feature_set(self, feature_set, name=None, project="", tag=None, **kw):
+        feature_set = _to_dict(feature_set)
+        self.feature_sets[feature_set["metadata"]["name"]] = feature_set
+        return feature_set
+
+    def get_feature_set(self, name, project="", tag=None, uid=None):
+        if name not in self.feature_sets:
+            raise mlrun.errors.MLRunNotFoundError(f"feature set {name} not found")
+        return fstore.FeatureSet.from_dict(self.feature_sets[name])
+
+    def store_feature_vector(self, feature_vector, name=None, project="", **kw):
+        feature_vector = _to_dict(feature_vector)
+        self.feature_vectors[feature_vector["metadata"]["name"]] = feature_vector
+        return feature_vector
+
+    def get_feature_vector(self, name, project="", tag=None, uid=None):
+        if name not in self.feature_vectors:
+            raise mlrun.errors.MLRunNotFoundError(f"feature vector {name} not found")
+        return fstore.FeatureVector.from_dict(self.feature_vectors[name])
+
+
+def _to_dict(obj):
+    return obj.to_dict() if hasattr(obj, "to_dict") else obj
+
+
+@pytest.fixture()
+def feature_store_db(rundb_mock, monkeypatch):
+    db = _FeatureStoreDBMock()
+    for method in [
+        "store_feature_set",
+        "get_feature_set",
+        "store_feature_vector",
+        "get_feature_vector",
+    ]:
+        monkeypatch.setattr(rundb_mock, method, getattr(db, method), raising=False)
+    return db
+
+
+@pytest.mark.parametrize("with_entity_rows", [False, True])
+def test_partitioned_merge_matches_merge(feature_store_db, tmp_path, with_entity_rows):
+    rng = np.random.default_rng(0)
+    for i in range(2):
+        df = _generate_featureset_df(rng, 200, 20, "time", f"value_{i}")
+        df = df.drop(columns=["name"])
+        feature_set = fstore.FeatureSet(f"fs{i}", entities=["id"], timestamp_key="time")
+        feature_set.ingest(
+            df, targets=[ParquetTarget(path=str(tmp_path / f"fs{i}.parquet"))]
+        )
+        # ingestion drops rows with a null key, add them to the written data
+        df["id"] = df["id"].astype(float)
+        df.loc[df.index[:5], "id"] = np.nan
+        df.set_index("id").to_parquet(feature_set.get_target_path())
+    entity_rows = None
+    if with_entity_rows:
+        entity_rows = _generate_entity_df(rng, 100, 20).drop(columns=["name"])
+        entity_rows["id"] = entity_rows["id"].astype(float)
+        entity_rows.loc[entity_rows.index[:3], "id"] = np.nan
+
+    def get_offline_features(name, engine_args):
+        vector = fstore.FeatureVector(name, ["fs0.*", "fs1.*"], with_indexes=True)
+        return vector.get_offline_features(
+            entity_rows=entity_rows,
+            entity_timestamp_column="time" if with_entity_rows else None,
+            engine_args=engine_args,
+            target=ParquetTarget(path=str(tmp_path / f"{name}.parquet")),
+        )
+
+    def sort(df):
+        if df.index.names[0]:
+            df = df.reset_index()
+        # the parquet targets store the timestamps in microseconds
+        df["time"] = df["time"].astype("datetime64[ns]")
+        return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+    expected = sort(get_offline_features("vector", {}).to_dataframe())
+    # other files under the target path are not purged with the chunks
+    (tmp_path / "partitioned").mkdir()
+    (tmp_path / "partitioned" / "other.txt").write_text("other")
+    # a previous merge with more partitions leaves chunks which must not be read
+    get_offline_features("partitioned", {"num_partitions": 5})
+    result = get_offline_features("partitioned", {"num_partitions": 3})
+    chunks_path = tmp_path / "partitioned" / "merged-chunks"
+    assert sorted(os.listdir(chunks_path)) == [
+        f"{chunk_id:0>4}.parquet" for chunk_id in range(1, 5)
+    ]
+    assert (tmp_path / "partitioned" / "other.txt").read_text() == "other"
+
+    assert expected["id"].isna().sum() == (3 if with_entity_rows else 5)
+    pd.testing.assert_frame_equal(sort(result.to_dataframe()), expected)
+
+    # the vector target status points to the written chunks
+    vector = fstore.FeatureVector.from_dict(
+        feature_store_db.feature_vectors["partitioned"]
+    )
+    target = get_offline_target(vector)
+    assert target.get_target_path() == str(chunks_path)
+    pd.testing.assert_frame_equal(sort(target.as_df())[expected.columns], expected)
@@ -0,0 +1,129 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from unittest import mock
+
+import storey
+
+import mlrun
+from mlrun.feature_store.retrieval.batch_query import BatchQueryByKey
+from mlrun.feature_store.retrieval.online_cache import (
+    OnlineFeaturesCache,
+    get_online_features_cache,
+)
+
+features = ["price"]
+
+
+def test_online_features_cache():
+    cache = OnlineFeaturesCache(max_size=2, ttl=10, negative_ttl=5)
+    with mock.patch("time.monotonic", return_value=100):
+        cache.register_version("fs", "v1")
+        assert cache.get_many("fs", "v1", ["a", "b"], features) == ({}, ["a", "b"])
+        cache.set_many(
+            "fs", "v1", {"a": {"price": 1}, "b": None}, features, load_seconds=0.5
+        )
+        assert cache.get_many("fs", "v1", ["a", "b", "c"], features) == (
+            {"a": {"price": 1}, "b": None},
+            ["c"],
+        )
+        # other requested features are other entries
+        assert cache.get_many("fs", "v1", ["a"], ["price", "volume"]) == ({}, ["a"])
+
+    # the negative entry expires first
+    with mock.patch("time.monotonic", return_value=106):
+        assert cache.get_many("fs", "v1", ["a", "b"], features) == (
+            {"a": {"price": 1}},
+            ["b"],
+        )
+        # "a" was used more recently than "c", so "c" is evicted by "d"
+        cache.set_many("fs", "v1", {"c": {"price": 3}}, features)
+        cache.get_many("fs", "v1", ["a"], features)
+        cache.set_many("fs", "v1", {"d": {"price": 4}}, features)
+        assert cache.get_many("fs", "v1", ["a", "c", "d"], features) == (
+            {"a": {"price": 1}, "d": {"price": 4}},
+            ["c"],
+        )
+
+    # a new version of the feature set drops the entries of the previous one
+    cache.register_version("fs", "v2")
+    assert cache.stats["entries"] == 0
+
+    assert cache.stats == {
+        "hits": 5,
+        "negative_hits": 1,
+        "misses": 6,
+        "evictions": 1,
+        "expirations": 1,
+        "loads": 3,
+        "entries": 0,
+        "mean_load_seconds": 0.5 / 3,
+    }
+
+
+def test_get_online_features_cache(monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.feature_store.online_cache, "ttl", 0)
+    assert get_online_features_cache() is None
+    monkeypatch.setattr(mlrun.mlconf.feature_store.online_cache, "ttl", 30)
+    cache = get_online_features_cache()
+    assert cache.ttl == cache.negative_ttl == 30
+    assert get_online_features_cache() is cache
+
+
+class KeyCountingDriver(storey.Driver):
+    def __init__(self):
+        self.loaded_keys = []
+
+    async def _load_by_key(self, container, table_path, key, attributes):
+        self.loaded_keys.append(key)
+        return {"price": 10.0} if key == "a" else None
+
+
+def test_batch_query_by_key_cache():
+    driver = KeyCountingDriver()
+    cache = OnlineFeaturesCache(max_size=100, ttl=60)
+    controller = storey.build_flow(
+        [
+            storey.SyncEmitSource(),
+            BatchQueryByKey(
+                features,
+                storey.Table("/container/path", driver),
+                key_field=["id"],
+                cache=cache,
+                cache_version="v1",
+            ),
+            storey.Complete(),
+        ]
+    ).run()
+    try:
+        results = [
+            controller.emit(body, return_awaitable_result=True).await_result()
+            for body in [
+                [{"id": "a"}, {"id": "b"}],
+                {"id": "a"},
+                [{"id": "b"}, {"id": "a"}],
+            ]
+        ]
+    finally:
+        controller.terminate()
+        controller.await_termination()
+
+    assert results == [
+        [{"id": "a", "price": 10.0}, {"id": "b"}],
+        {"id": "a", "price": 10.0},
+        [{"id": "b"}, {"id": "a", "price": 10.0}],
+    ]
+    # the found and the missing keys are loaded once
+    assert driver.loaded_keys == ["a", "b"]
+    assert cache.stats["negative_hits"] == 1
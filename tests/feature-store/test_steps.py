@@ -788,3 +788,58 @@ def test_parquet_source_with_category(rundb_mock, engine):
         source=df,
         targets=[ParquetTarget(path=f"{output_path.name}/temp.parquet")],
     )
+
+
+@pytest.mark.parametrize(
+    "ranges",
+    [
+        # disjoint ranges, searched by their sorted bin edges
+        {"child": ["-inf", 18], "adult": [18, 65], "senior": [65, 120]},
+        # overlapping ranges, the first matching range in the mapping order is used
+        {"child": ["-inf", 18], "adult": [10, 65], "senior": [65, 120]},
+    ],
+)
+def test_mapvalues_ranges_engines(ranges):
+    ages = [-5, 0, 17.5, 18, 64, 65, 120, 130, np.nan]
+    step = MapValues(mapping={"age": {"ranges": ranges}}, with_original_features=True)
+
+    storey_result = [step._do_storey({"age": age})["age_mapped"] for age in ages]
+    pandas_result = step._do_pandas(pd.DataFrame({"age": ages}))["age_mapped"]
+
+    # the ranges are [min, max), values which are not in any of the ranges are kept
+    expected = ["child", "child", "child", "adult", "adult", "senior", 120, 130]
+    assert storey_result[:-1] == expected
+    assert pandas_result.tolist()[:-1] == expected
+    assert np.isnan(storey_result[-1]) and np.isnan(pandas_result.iloc[-1])
+
+
+def test_onehot_encoder_columns_order():
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "category": ["food", "health care", "other"],
+            "amount": [1.5, 2.5, 3.5],
+            "gender": ["male", "female", "male"],
+        }
+    )
+    step = OneHotEncoder(
+        mapping={"category": ["food", "health care"], "gender": ["male", "female"]}
+    )
+
+    encoded = step._do_pandas(df.copy())
+
+    # each encoded column is replaced by its encoding columns, in place
+    expected = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "category_food": [1, 0, 0],
+            "category_health_care": [0, 1, 0],
+            "amount": [1.5, 2.5, 3.5],
+            "gender_male": [1, 0, 1],
+            "gender_female": [0, 1, 0],
+        }
+    )
+    pd.testing.assert_frame_equal(encoded, expected)
+    assert [
+        step._do_storey(row) for row in df.to_dict(orient="records")
+    ] == expected.to_dict(orient="records")
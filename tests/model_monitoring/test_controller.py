@@ -0,0 +1,168 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import json
+from collections.abc import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+
+import mlrun
+import mlrun.common.schemas.model_monitoring.constants as mm_constants
+from mlrun.model_monitoring.controller import MonitoringApplicationController
+
+TEST_PROJECT = "test-controller"
+
+
+def _dt(hour: int) -> datetime.datetime:
+    return datetime.datetime(2024, 5, 1, hour, tzinfo=datetime.timezone.utc)
+
+
+def _endpoint(uid: str, stream_path: str) -> dict:
+    return {
+        mm_constants.EventFieldType.UID: uid,
+        mm_constants.EventFieldType.ACTIVE: True,
+        mm_constants.EventFieldType.MONITORING_MODE: mm_constants.ModelMonitoringMode.enabled.value,
+        mm_constants.EventFieldType.ENDPOINT_TYPE: mm_constants.EndpointType.NODE_EP.value,
+        mm_constants.EventFieldType.STREAM_PATH: stream_path,
+        mm_constants.EventFieldType.FIRST_REQUEST: _dt(10).isoformat(),
+        # the last updated time is a minute before the last request (the parquet batching timeout)
+        mm_constants.EventFieldType.LAST_REQUEST: (
+            _dt(13) + datetime.timedelta(minutes=1)
+        ).isoformat(),
+    }
+
+
+class TestMonitoringApplicationController:
+    @staticmethod
+    @pytest.fixture
+    def store() -> Mock:
+        store = Mock()
+        store.get_last_analyzed.side_effect = mlrun.errors.MLRunNotFoundError()
+        store.list_model_endpoints.return_value = [
+            _endpoint("ep1", "v3io:///stream"),
+            # an endpoint without a stream (batch infer), all its intervals are pushed
+            _endpoint("ep2", ""),
+        ]
+        return store
+
+    @staticmethod
+    @pytest.fixture
+    def tsdb_connector() -> Mock:
+        def get_endpoints_with_predictions(endpoint_ids, start, end):
+            return set(endpoint_ids) if start != _dt(11) else set()
+
+        tsdb_connector = Mock()
+        tsdb_connector.get_endpoints_with_predictions.side_effect = (
+            get_endpoints_with_predictions
+        )
+        return tsdb_connector
+
+    @staticmethod
+    @pytest.fixture
+    def controller(
+        store: Mock, tsdb_connector: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> Iterator[MonitoringApplicationController]:
+        monkeypatch.setenv(
+            mm_constants.EventFieldType.BATCH_INTERVALS_DICT,
+            json.dumps({"minutes": 0, "hours": 1, "days": 0}),
+        )
+        apps = [Mock(), Mock()]
+        apps[0].metadata.name, apps[1].metadata.name = "app1", "app2"
+        project = Mock()
+        project.list_model_monitoring_functions.return_value = apps
+        with (
+            patch("mlrun.load_project", return_value=project),
+            patch("mlrun.model_monitoring.get_store_object", return_value=store),
+            patch(
+                "mlrun.model_monitoring.get_tsdb_connector", return_value=tsdb_connector
+            ),
+        ):
+            yield MonitoringApplicationController()
+
+    @staticmethod
+    def test_run(
+        controller: MonitoringApplicationController,
+        store: Mock,
+        tsdb_connector: Mock,
+    ) -> None:
+        pusher = Mock()
+        with patch(
+            "mlrun.model_monitoring.controller.get_stream_pusher", return_value=pusher
+        ) as get_stream_pusher:
+            stats = controller.run()
+
+        # a single data check per interval, for the endpoints with a stream
+        assert tsdb_connector.get_endpoints_with_predictions.call_count == 3
+        for call in tsdb_connector.get_endpoints_with_predictions.call_args_list:
+            assert call.kwargs["endpoint_ids"] == ["ep1"]
+
+        pushed = sorted(
+            (
+                event[mm_constants.ApplicationEvent.ENDPOINT_ID],
+                event[mm_constants.ApplicationEvent.APPLICATION_NAME],
+                event[mm_constants.ApplicationEvent.START_INFER_TIME],
+            )
+            for (events,), _ in pusher.push.call_args_list
+            for event in events
+        )
+        expected = sorted(
+            (endpoint_id, app, _dt(hour).isoformat(sep=" ", timespec="microseconds"))
+            for endpoint_id, hours in [("ep1", [10, 12]), ("ep2", [10, 11, 12])]
+            for hour in hours
+            for app in ["app1", "app2"]
+        )
+        assert pushed == expected
+        # a stream pusher per application
+        assert get_stream_pusher.call_count == 2
+
+        # all the intervals are analyzed, also the ones without data
+        last_analyzed = {
+            (call.kwargs["endpoint_id"], call.kwargs["application_name"]): call.kwargs[
+                "last_analyzed"
+            ]
+            for call in store.update_last_analyzed.call_args_list
+        }
+        assert last_analyzed == {
+            (endpoint_id, app): int(_dt(13).timestamp())
+            for endpoint_id in ["ep1", "ep2"]
+            for app in ["app1", "app2"]
+        }
+        assert stats["batch_windows"] == 4
+        assert stats["pushed_intervals"] == 10
+        assert stats["failed_batch_windows"] == 0
+        assert stats["tsdb_queries"] == 3
+        assert stats["lag_seconds"] >= 0
+
+    @staticmethod
+    def test_run_data_check_failure(
+        controller: MonitoringApplicationController,
+        store: Mock,
+        tsdb_connector: Mock,
+    ) -> None:
+        tsdb_connector.get_endpoints_with_predictions.side_effect = RuntimeError()
+        with patch("mlrun.model_monitoring.controller.get_stream_pusher"):
+            stats = controller.run()
+
+        # the intervals of the endpoint with a stream are retried on the next run
+        assert stats["failed_batch_windows"] == 2
+        assert stats["pushed_intervals"] == 6
+        assert {
+            call.kwargs["endpoint_id"]
+            for call in store.update_last_analyzed.call_args_list
+        } == {"ep2"}
+        assert stats["lag_seconds"] >= int(
+            (datetime.datetime.now(tz=datetime.timezone.utc) - _dt(10)).total_seconds()
+        )
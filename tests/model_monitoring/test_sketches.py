@@ -0,0 +1,226 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import json
+import math
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlrun.data_types.infer
+import mlrun.model_monitoring.applications.context
+from mlrun.common.model_monitoring.helpers import pad_features_hist
+from mlrun.common.schemas.model_monitoring.constants import EventFieldType
+from mlrun.model_monitoring.applications.context import MonitoringApplicationContext
+from mlrun.model_monitoring.helpers import calculate_inputs_statistics
+from mlrun.model_monitoring.sketches import (
+    FeatureSketch,
+    SketchStore,
+    merge_sketches,
+    sketch_values,
+    sketches_to_stats,
+)
+from mlrun.model_monitoring.stream_processing import UpdateFeatureSketches
+
+
+@pytest.fixture
+def feature_stats() -> dict:
+    reference = pd.DataFrame(
+        {"a": np.random.normal(size=1000), "b": np.random.uniform(size=1000)}
+    )
+    stats = mlrun.data_types.infer.DFDataInfer.get_stats(
+        reference, mlrun.data_types.infer.InferOptions.Histogram
+    )
+    pad_features_hist(stats)
+    return stats
+
+
+def test_merged_sketches_match_the_inputs_statistics(feature_stats: dict) -> None:
+    inputs = pd.DataFrame(
+        {
+            "a": np.random.normal(0.5, size=500),
+            "b": np.random.uniform(size=500),
+            "no_reference": np.arange(500),
+        }
+    )
+    sketches = sketch_values(feature_stats, inputs[:100])
+    merge_sketches(sketches, sketch_values(feature_stats, inputs[100:350]))
+    merge_sketches(sketches, sketch_values(feature_stats, inputs[350:]))
+    stats = sketches_to_stats(sketches)
+
+    expected = calculate_inputs_statistics(feature_stats, inputs)
+    assert stats.keys() == expected.keys() == {"a", "b"}
+    for feature in stats:
+        assert stats[feature]["hist"] == expected[feature]["hist"]
+        for key in ["count", "mean", "std", "min", "max"]:
+            assert stats[feature][key] == pytest.approx(expected[feature][key])
+        # the quantiles are estimated within their histogram bin
+        bin_width = np.diff(expected[feature]["hist"][1][1:-1]).max()
+        for key in ["25%", "50%", "75%"]:
+            assert abs(stats[feature][key] - expected[feature][key]) <= bin_width
+
+
+def test_merge_sketches_with_other_bins() -> None:
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        FeatureSketch([0, 1, 2]).merge(FeatureSketch([0, 2, 4], count=1))
+
+
+def test_sketch_ignores_missing_values() -> None:
+    sketch = FeatureSketch([0, 1, 2])
+    sketch.update([0.5, None, "x", 1.5, np.nan])
+    assert sketch.count == 2
+    assert sketch.hist == [1, 1]
+    assert sketch.to_stats()["mean"] == 1.0
+
+
+def test_sketch_without_values() -> None:
+    stats = FeatureSketch([0, 1, 2]).to_stats()
+    assert stats["count"] == 0
+    assert stats["hist"] == [[0, 0], [0, 1, 2]]
+    for key in ["mean", "min", "25%", "50%", "75%", "max"]:
+        assert math.isnan(stats[key])
+
+
+_START = datetime.datetime(2024, 5, 1, 10, tzinfo=datetime.timezone.utc)
+
+
+def _sketch_events(path: str, feature_stats: dict, values: np.ndarray) -> None:
+    """sketch the values of events at a second interval from _START"""
+    step = UpdateFeatureSketches(
+        project="test-sketches", sketches_path=path, bucket_seconds=60
+    )
+    with patch(
+        "mlrun.model_monitoring.helpers.get_endpoint_record",
+        return_value={EventFieldType.FEATURE_STATS: json.dumps(feature_stats)},
+    ):
+        for index in range(len(values)):
+            step.do(
+                {
+                    EventFieldType.ENDPOINT_ID: "ep1",
+                    EventFieldType.TIMESTAMP: _START
+                    + datetime.timedelta(seconds=index),
+                    EventFieldType.NAMED_FEATURES: {"a": values[index][0]},
+                    EventFieldType.NAMED_PREDICTIONS: {"b": values[index][1]},
+                }
+            )
+
+
+def test_update_feature_sketches(tmp_path, feature_stats: dict) -> None:
+    start = _START
+    values = np.random.normal(size=(200, 2))
+    _sketch_events(str(tmp_path), feature_stats, values)
+
+    store = SketchStore(str(tmp_path))
+    window_start = start.timestamp()
+    # the fourth minute is not complete yet
+    assert store.read_window("ep1", window_start, window_start + 240) is None
+
+    sketches, covered_start, covered_end = store.read_window(
+        "ep1", window_start - 30, window_start + 150
+    )
+    assert (covered_start, covered_end) == (window_start, window_start + 120)
+    assert sketches["a"].count == sketches["b"].count == 120
+    step_stats = sketches_to_stats(sketches)
+    expected = calculate_inputs_statistics(
+        feature_stats, pd.DataFrame(values[:120], columns=["a", "b"])
+    )
+    assert step_stats["a"]["hist"] == expected["a"]["hist"]
+    assert step_stats["b"]["mean"] == pytest.approx(expected["b"]["mean"])
+
+    # a window which does not contain a whole bucket
+    assert store.read_window("ep1", window_start + 10, window_start + 70) is None
+
+
+def test_watermark_of_multiple_writers(tmp_path) -> None:
+    writers = [SketchStore(str(tmp_path), writer_timeout=600) for _ in range(3)]
+    writers[0].write_watermark("ep1", 1200)
+    writers[1].write_watermark("ep1", 1080)
+    assert SketchStore(str(tmp_path)).read_watermark("ep1") == (1080, 60)
+
+    # the buckets of the slower writer are not all written yet
+    assert SketchStore(str(tmp_path)).read_window("ep1", 1020, 1140) is None
+    writers[1].write_watermark("ep1", 1200)
+    assert SketchStore(str(tmp_path)).read_window("ep1", 1020, 1140) == (
+        {},
+        1020,
+        1140,
+    )
+
+    # a writer which lags by more than the timeout is gone
+    writers[2].write_watermark("ep1", 540)
+    assert SketchStore(str(tmp_path)).read_watermark("ep1") == (1200, 60)
+    assert SketchStore(str(tmp_path)).read_watermark("ep2") is None
+
+
+def test_get_sketches_stats(tmp_path, feature_stats: dict, monkeypatch) -> None:
+    values = np.random.normal(size=(200, 2))
+    _sketch_events(str(tmp_path), feature_stats, values)
+    events = pd.DataFrame(values, columns=["a", "b"])
+    events["timestamp"] = pd.date_range(_START, periods=len(values), freq="s")
+
+    offline_requests = []
+
+    def get_offline_df(start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        offline_requests.append((start, end))
+        return events[events["timestamp"].between(start, end)]
+
+    context = MonitoringApplicationContext.__new__(MonitoringApplicationContext)
+    context.project = "test-sketches"
+    context.endpoint_id = "ep1"
+    context.logger = mlrun.utils.logger
+    context.start_infer_time = pd.Timestamp(_START) + pd.Timedelta(seconds=15)
+    context.end_infer_time = pd.Timestamp(_START) + pd.Timedelta(seconds=150)
+    context._sample_df = None
+    context._feature_stats = feature_stats
+    context._get_offline_df = get_offline_df
+    monkeypatch.setattr(
+        mlrun.model_monitoring.applications.context,
+        "get_monitoring_sketches_path",
+        lambda parquet_path: str(tmp_path),
+    )
+    monkeypatch.setattr(
+        mlrun.model_monitoring.applications.context,
+        "get_monitoring_parquet_path",
+        lambda project: "",
+    )
+
+    stats = context._get_sketches_stats()
+
+    # only the events at the edges of the window, out of the whole buckets, are read
+    assert offline_requests == [
+        (
+            context.start_infer_time,
+            pd.Timestamp(_START)
+            + pd.Timedelta(seconds=60)
+            - pd.Timedelta(microseconds=1),
+        ),
+        (pd.Timestamp(_START) + pd.Timedelta(seconds=120), context.end_infer_time),
+    ]
+    expected = calculate_inputs_statistics(
+        feature_stats,
+        events[
+            events["timestamp"].between(
+                context.start_infer_time, context.end_infer_time
+            )
+        ][["a", "b"]],
+    )
+    assert stats.keys() == {"a", "b"}
+    for feature in stats:
+        assert stats[feature]["count"] == expected[feature]["count"] == 136
+        assert stats[feature]["hist"] == expected[feature]["hist"]
+        for key in ["mean", "std", "min", "max"]:
+            assert stats[feature][key] == pytest.approx(expected[feature][key])
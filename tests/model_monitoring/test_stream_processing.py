@@ -13,9 +13,14 @@
 # limitations under the License.
 
 import pytest
+import storey
 
 import mlrun
-from mlrun.model_monitoring.stream_processing import EventStreamProcessor
+from mlrun.common.schemas.model_monitoring.constants import EventFieldType
+from mlrun.model_monitoring.stream_processing import (
+    EventStreamProcessor,
+    ProcessEndpointEvent,
+)
 
 
 @pytest.mark.parametrize("tsdb_connector", ["v3io", "taosws"])
@@ -55,3 +60,93 @@ def test_plot_monitoring_serving_graph(tsdb_connector, endpoint_store):
     print("Feed this to graphviz, or to https://dreampuf.github.io/GraphvizOnline")
     print()
     print(graph)
+
+
+def _process_endpoint_event_step():
+    step = ProcessEndpointEvent(project="test-stream-processing")
+    # skip resuming the endpoint state from the db
+    step.endpoints.add("ep1")
+    return step
+
+
+def test_process_endpoint_event_batch():
+    base = {
+        "class": "MyModel",
+        "function_uri": "proj/func",
+        "endpoint_id": "ep1",
+        "versioned_model": "my:latest",
+        "labels": {"a": "b"},
+    }
+    requests = [
+        ("2024-05-01 10:00:00.000000", "r1", 10, [[1.5, 2.0]], [3]),
+        ("2024-05-01 10:00:01.000000", "r2", 20, [[1.0, 2.0], [3.0, 4.0]], [5, 6]),
+    ]
+    step = _process_endpoint_event_step()
+    single_events = []
+    for when, request_id, microsec, inputs, outputs in requests:
+        single_events.extend(
+            step.do(
+                storey.Event(
+                    body={
+                        **base,
+                        "when": when,
+                        "microsec": microsec,
+                        "request": {"id": request_id, "inputs": inputs},
+                        "resp": {"outputs": outputs},
+                    }
+                )
+            ).body
+        )
+
+    batch_events = (
+        _process_endpoint_event_step()
+        .do(
+            storey.Event(
+                body={
+                    **base,
+                    EventFieldType.BATCH: {
+                        "when": [request[0] for request in requests],
+                        "request_id": ["r1", "r2"],
+                        "microsec": [10, 20],
+                        "count": [1, 2],
+                        "inputs": [[1.5, 2.0], [1.0, 2.0], [3.0, 4.0]],
+                        "outputs": [[3], [5], [6]],
+                    },
+                }
+            )
+        )
+        .body
+    )
+    assert batch_events == single_events
+    assert [event[EventFieldType.REQUEST_ID] for event in batch_events] == [
+        "r1",
+        "r2",
+        "r2",
+    ]
+
+
+def test_process_endpoint_event_batch_errors():
+    body = {
+        "class": "MyModel",
+        "function_uri": "proj/func",
+        "endpoint_id": "ep1",
+        "versioned_model": "my:latest",
+        EventFieldType.BATCH: {
+            "when": ["2024-05-01 10:00:00.000000", "2024-05-01 10:00:01.000000"],
+            "request_id": ["r1", "r2"],
+            "microsec": [10, 20],
+            "count": [0, 1],
+            "inputs": [[1, 2]],
+            "outputs": [[3]],
+        },
+    }
+    step = _process_endpoint_event_step()
+    events = step.do(storey.Event(body=body)).body
+    assert len(events) == 1
+    # integer features are converted to floats, the request without rows is counted as an error
+    assert events[0][EventFieldType.FEATURES] == [1.0, 2.0]
+    assert events[0][EventFieldType.ERROR_COUNT] == 1
+
+    body[EventFieldType.BATCH]["count"] = [1, 1]
+    assert step.do(storey.Event(body=body)) is None
+    assert step.error_count["ep1"] == 3
@@ -0,0 +1,169 @@
+# Copyright 2024 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import http.server
+import json
+import threading
+import time
+import urllib.parse
+
+import pytest
+
+import mlrun.config
+import mlrun.db.async_httpdb
+import mlrun.db.httpdb
+import mlrun.errors
+
+num_runs = 53
+page_size = 5
+
+
+class StandInAPIHandler(http.server.BaseHTTPRequestHandler):
+    """a stand-in of the runs and artifacts endpoints, page 3 of the runs overflows into page 4 (like a page of
+    permission filtered runs)"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # noqa: N802
+        url = urllib.parse.urlparse(self.path)
+        query = urllib.parse.parse_qs(url.query)
+        self._request(("GET", url.path, query))
+        page = int(query["page"][0])
+        last_page = page + 1 if page == 3 else page
+        start, end = (page - 1) * page_size, last_page * page_size
+        runs = [{"metadata": {"uid": str(index)}} for index in range(num_runs)]
+        self._respond(
+            200,
+            {
+                "runs": runs[start:end],
+                "pagination": {
+                    "page": last_page,
+                    "page-size": page_size,
+                    "page-token": "token" if end < num_runs else None,
+                },
+            },
+        )
+
+    def do_PUT(self):  # noqa: N802
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        url = urllib.parse.urlparse(self.path)
+        self._request((self.command, url.path, json.loads(body)))
+        if url.path.endswith("/bad"):
+            self._respond(400, {"detail": "bad artifact"})
+        else:
+            self._respond(200, {})
+
+    def do_PATCH(self):  # noqa: N802
+        self.do_PUT()
+
+    def _request(self, request):
+        server = self.server
+        with server.lock:
+            server.requests.append(request)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(0.05)
+        with server.lock:
+            server.in_flight -= 1
+
+    def _respond(self, status, body):
+        body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(
+        mlrun.config.config.httpdb.pagination, "default_page_size", page_size
+    )
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandInAPIHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.in_flight = server.max_in_flight = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+async def test_list_runs_prefetches_pages(server):
+    async with mlrun.db.async_httpdb.AsyncHTTPRunDB(server.url, prefetch_pages=4) as db:
+        runs = await db.list_runs(project="some-project", name="some-run")
+
+    # the runs of the overflowing page are not repeated
+    assert [run["metadata"]["uid"] for run in runs] == [
+        str(index) for index in range(num_runs)
+    ]
+    assert server.max_in_flight > 1
+    _, path, query = server.requests[0]
+    assert path == "/api/v1/projects/some-project/runs"
+    assert query["name"] == ["some-run"]
+    assert query["page"] == ["1"]
+    assert all(query["page-token"] == ["token"] for _, _, query in server.requests[1:])
+
+
+async def test_list_runs_unknown_filter(server):
+    async with mlrun.db.async_httpdb.AsyncHTTPRunDB(server.url) as db:
+        with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+            await db.list_runs(project="some-project", nmae="some-run")
+
+
+def test_sync_bulk_calls(server, monkeypatch):
+    monkeypatch.setattr(mlrun.config.config.httpdb.async_client, "enabled", True)
+    db = mlrun.db.httpdb.HTTPRunDB(server.url)
+    artifacts = {
+        f"artifact-{index}": {"metadata": {"key": f"artifact-{index}"}}
+        for index in range(10)
+    }
+    db.store_artifacts(artifacts, project="some-project", tag="latest")
+    assert server.max_in_flight > 1
+    assert sorted(path for _, path, _ in server.requests) == sorted(
+        f"/api/v2/projects/some-project/artifacts/{key}" for key in artifacts
+    )
+
+    server.requests = []
+    db.update_runs(
+        {"uid-1": {"status.state": "completed"}, "uid-2": {"status.state": "error"}},
+        project="some-project",
+    )
+    assert sorted(server.requests) == [
+        (
+            "PATCH",
+            "/api/v1/projects/some-project/runs/uid-1",
+            {"status.state": "completed"},
+        ),
+        (
+            "PATCH",
+            "/api/v1/projects/some-project/runs/uid-2",
+            {"status.state": "error"},
+        ),
+    ]
+
+    runs = db.list_runs(project="some-project", name="some-run")
+    assert len(runs) == num_runs
+
+    # all the requests are sent, and the failures are raised with their details
+    server.requests = []
+    with pytest.raises(mlrun.errors.MLRunRuntimeError, match="bad artifact"):
+        db.store_artifacts({"bad": {}, "good": {}}, project="some-project")
+    assert len(server.requests) == 2
@@ -15,7 +15,9 @@
 # test_httpdb.py actually holds integration tests (that should be migrated to tests/integration/sdk_api/httpdb)
 # currently we are running it in the integration tests CI step so adding this file for unit tests for the httpdb
 import enum
+import http.server
 import io
+import threading
 import unittest.mock
 
 import pytest
@@ -255,6 +257,57 @@ def test_retriable_post_requests(path, call_amount):
     requests.Session.request = original_request
 
 
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_PUT(self):  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._respond()
+
+    def do_POST(self):  # noqa: N802
+        self.do_PUT()
+
+    def do_GET(self):  # noqa: N802
+        self._respond()
+
+    def _respond(self):
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_sessions_reuse_connections():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        db = mlrun.db.httpdb.HTTPRunDB(f"http://127.0.0.1:{server.server_port}")
+        for index in range(5):
+            db.api_call("POST", f"run/default/uid-{index}", json={})
+            db.api_call("POST", "not/retriable", json={})
+            db.api_call("GET", "some-path")
+        session = db.session
+        db.api_call("POST", "run/default/uid", json={})
+        assert db.session is session
+
+        # a session for each retry policy, and a single connection per session
+        stats = db.connection_stats
+        assert stats["sessions"] == 2
+        assert stats["pool_maxsize"] == int(mlrun.mlconf.httpdb.max_workers)
+        assert stats["requests"] == 16
+        assert stats["connections"] == 2
+        assert stats["reused"] == 14
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 def test_watch_logs_continue():
     mlrun.mlconf.httpdb.logs.decode.errors = "replace"
 
@@ -313,3 +366,72 @@ def test_watch_logs_continue():
     assert (
         adapter.call_count == len(log_lines) + 1
     ), "should have called the adapter once per log line, and one more time at the end of log"
+
+
+def test_watch_logs_follow(capsys, monkeypatch):
+    # a multibyte character is split between the streamed chunks
+    log_contents = "Firstrow\nSmiley😆\nLastRow\n".encode()
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    run_uid = "some-uid"
+    project = "some-project"
+    adapter = requests_mock.Adapter()
+    requests_offsets = []
+
+    def callback(request, context):
+        # the follow requests end after 10 bytes (like on the follow timeout), the other requests return 5 bytes
+        offset = int(request.qs["offset"][0])
+        follow = "follow" in request.qs
+        requests_offsets.append((offset, follow))
+        end = offset + (10 if follow else 5)
+        context.status_code = 200
+        context.headers["x-mlrun-run-state"] = (
+            "running" if end < len(log_contents) else "completed"
+        )
+        if follow:
+            context.headers["x-mlrun-log-follow"] = "true"
+        return log_contents[offset:end]
+
+    adapter.register_uri(
+        "GET",
+        f"https://wherever.com/api/v1/projects/{project}/logs/{run_uid}",
+        content=callback,
+    )
+    db.session = db._init_session()
+    db.session.mount("https://", adapter)
+    state, offset = db.watch_log(run_uid, project=project)
+
+    assert capsys.readouterr().out.endswith(log_contents.decode())
+    assert state == "completed"
+    assert offset == len(log_contents)
+    # the log is followed again from the offset while the run is running, and checked once the stream ended
+    assert requests_offsets == [
+        (0, True),
+        (10, False),
+        (15, True),
+        (25, False),
+        (28, True),
+        (28, False),
+    ]
+
+
+def test_watch_logs_follow_not_supported(capsys, monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.httpdb.logs, "pull_logs_default_interval", 0)
+    db = mlrun.db.httpdb.HTTPRunDB("https://wherever.com")
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        "GET",
+        "https://wherever.com/api/v1/projects/some-project/logs/some-uid",
+        [
+            # older APIs ignore the follow param, the log is polled
+            {"content": b"first", "headers": {"x-mlrun-run-state": "running"}},
+            {"content": b"-last", "headers": {"x-mlrun-run-state": "completed"}},
+            {"content": b"", "headers": {"x-mlrun-run-state": "completed"}},
+        ],
+    )
+    db.session = db._init_session()
+    db.session.mount("https://", adapter)
+    state, offset = db.watch_log("some-uid", project="some-project")
+
+    assert capsys.readouterr().out.endswith("first\n-last")
+    assert (state, offset) == ("completed", len("first-last"))
+    assert adapter.call_count == 3
@@ -12,6 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
+import collections
+import json
+import os
+import threading
+import time
+
+import numpy as np
 import pytest
 
 import mlrun
@@ -36,7 +44,20 @@ def my_hnd(event):
     return {"mul": event["x"] * 2}
 
 
-@pytest.mark.parametrize("executor", mlrun.serving.routers.ParallelRunnerModes.all())
+async def my_async_hnd(event):
+    """example async handler"""
+    return {"mul": event["x"] * 2}
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [
+        mode
+        for mode in mlrun.serving.routers.ParallelRunnerModes.all()
+        # requires async routes
+        if mode != mlrun.serving.routers.ParallelRunnerModes.asyncio
+    ],
+)
 def test_parallel(executor):
     fn = mlrun.new_function("tests", kind="serving")
     graph = fn.set_topology(
@@ -54,3 +75,266 @@ def test_parallel(executor):
 
     resp = server.test("", {"x": 9})
     assert resp == {"x": 9, "a": 1, "b": 2, "c": 7, "mul": 18}
+
+
+class AsyncEcho(Echo):
+    def __init__(self, context, name=None, data=None, delay=0.3):
+        super().__init__(context, name, data)
+        self.delay = delay
+
+    async def do(self, x):
+        await asyncio.sleep(self.delay)
+        return self.data
+
+
+def test_parallel_asyncio():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology(
+        "router",
+        mlrun.serving.routers.ParallelRun(
+            extend_event=True, executor_type="asyncio", child_timeout=1
+        ),
+    )
+    graph.add_route("c1", class_name="AsyncEcho", data={"a": 1})
+    graph.add_route("c2", class_name="AsyncEcho", data={"b": 2})
+    graph.add_route("c3", class_name="AsyncEcho", data={"c": 3})
+    graph.add_route("c4", handler="my_async_hnd")
+    # exceeds the timeout, merged without it
+    graph.add_route("c5", class_name="AsyncEcho", data={"d": 4}, delay=3)
+
+    server = fn.to_mock_server()
+    start = time.monotonic()
+    resp = server.test(body={"x": 8})
+    assert resp == {"x": 8, "a": 1, "b": 2, "c": 3, "mul": 16}
+    # the async routes are awaited concurrently
+    assert time.monotonic() - start < 2
+
+
+class ThreadEcho(AsyncEcho):
+    cancelled = []
+
+    async def do(self, x):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            ThreadEcho.cancelled.append(self.name)
+            raise
+        return {self.name: threading.get_ident()}
+
+
+def test_parallel_asyncio_on_server_loop():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology(
+        "router",
+        mlrun.serving.routers.ParallelRun(
+            extend_event=True, executor_type="asyncio", child_timeout=0.5
+        ),
+    )
+    graph.add_route("c1", class_name="ThreadEcho", delay=0)
+    # exceeds the timeout, and is cancelled
+    graph.add_route("c2", class_name="ThreadEcho", delay=3)
+    server = fn.to_mock_server()
+
+    resp = server.test(body={"x": 8})
+    assert resp.keys() == {"x", "c1"}
+    assert resp["c1"] != threading.get_ident()
+    time.sleep(0.1)
+    assert ThreadEcho.cancelled == ["c2"]
+
+    # the router is also called from a running loop (e.g. in an async flow)
+    async def test_in_loop():
+        return server.test(body={"x": 9})
+
+    # the routes of all the events run on the event loop of the server
+    assert asyncio.run(test_in_loop())["c1"] == resp["c1"]
+    server.wait_for_completion()
+
+
+def loop_thread(body):
+    body["loop"] = threading.get_ident()
+    return body
+
+
+def test_parallel_asyncio_on_flow_loop():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine="async")
+    router = graph.to(handler="loop_thread", name="s1").to(
+        mlrun.serving.routers.ParallelRun(
+            extend_event=True, executor_type="asyncio", child_timeout=0.5
+        ),
+        name="router",
+    )
+    router.add_route("c1", class_name="ThreadEcho", delay=0)
+    # exceeds the timeout
+    router.add_route("c2", class_name="ThreadEcho", delay=3)
+    router.respond()
+    server = fn.to_mock_server()
+
+    resp = server.test(body={"x": 8})
+    server.wait_for_completion()
+    assert resp.keys() == {"x", "loop", "c1"}
+    # the routes are awaited on the event loop of the flow, without a thread of their own
+    assert resp["c1"] == resp["loop"]
+    assert server._loop is None
+
+
+def test_parallel_asyncio_requires_async_routes():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology(
+        "router", mlrun.serving.routers.ParallelRun(executor_type="asyncio")
+    )
+    graph.add_route("c1", class_name="AsyncEcho")
+    graph.add_route("c2", handler="my_hnd")
+    with pytest.raises(
+        mlrun.errors.MLRunInvalidArgumentError, match=r"\['c2'\] are sync routes"
+    ):
+        fn.to_mock_server()
+
+
+class Predictor(mlrun.serving.V2ModelServer):
+    def load(self):
+        pass
+
+    def predict(self, request):
+        if self.get_param("fail", False):
+            raise ValueError("failed")
+        return [self.get_param("prediction")] * len(request["inputs"])
+
+
+class AsyncPredictor:
+    def __init__(self, context, name=None, prediction=None, fail=False):
+        self.name = name
+        self.prediction = prediction
+        self.fail = fail
+
+    async def do(self, body):
+        await asyncio.sleep(0)
+        if self.fail:
+            raise ValueError("failed")
+        return {"outputs": [self.prediction] * len(body["inputs"])}
+
+
+def test_voting_with_partial_results():
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.set_topology(
+        "router",
+        mlrun.serving.routers.VotingEnsemble(
+            vote_type="regression",
+            executor_type="asyncio",
+            weights={"m1": 0.25, "m2": 0.25, "m3": 0.5},
+        ),
+    )
+    graph = fn.spec.graph
+    graph.add_route("m1", class_name="AsyncPredictor", prediction=1.0)
+    graph.add_route("m2", class_name="AsyncPredictor", prediction=3.0)
+    graph.add_route("m3", class_name="AsyncPredictor", prediction=5.0, fail=True)
+
+    server = fn.to_mock_server()
+    resp = server.test("/v2/models/infer", body={"inputs": [[1], [2]]})
+    # the weights of the models which returned predictions are normalized
+    assert resp["outputs"] == [2.0, 2.0]
+
+
+class ArrayStats:
+    def __init__(self, context, name=None, power=1):
+        self.context = context
+        self.name = name
+        self.power = power
+
+    def do(self, body):
+        inputs = body["inputs"]
+        return {
+            f"{self.name}_type": type(inputs).__name__,
+            f"{self.name}_pid": os.getpid(),
+            self.name: (inputs**self.power).sum(axis=1).tolist(),
+        }
+
+
+def test_parallel_shared_memory():
+    fn = mlrun.new_function("tests", kind="serving")
+    router = mlrun.serving.routers.ParallelRun(executor_type="shared_memory")
+    graph = fn.set_topology("router", router)
+    graph.add_route("c1", class_name="ArrayStats")
+    graph.add_route("c2", class_name="ArrayStats", power=2)
+
+    server = fn.to_mock_server()
+    router = server.graph._object
+    resp = server.test(body={"inputs": [[1, 2], [3, 4]]})
+    assert resp["c1_type"] == resp["c2_type"] == "ndarray"
+    assert resp["c1"] == [3, 7]
+    assert resp["c2"] == [5, 25]
+    # each route has a dedicated worker process
+    assert len({resp["c1_pid"], resp["c2_pid"], os.getpid()}) == 3
+
+    # the workers are kept warm between events, also after events which terminate early
+    segments = [shm.name for shm in router._shared_memory_segments._free]
+    server.test("/", method="GET")
+    second_resp = server.test(body={"inputs": [[1.5, 0.5]]})
+    assert second_resp["c1"] == [2.0]
+    assert second_resp["c1_pid"] == resp["c1_pid"]
+    assert second_resp["c2_pid"] == resp["c2_pid"]
+    # the shared memory segment of the inputs is reused
+    assert len(segments) == 1
+    assert [shm.name for shm in router._shared_memory_segments._free] == segments
+
+    # larger inputs replace the segment
+    third_resp = server.test(body={"inputs": np.ones((1000, 10)).tolist()})
+    assert third_resp["c1"] == [10.0] * 1000
+    assert len(router._shared_memory_segments._free) == 1
+    assert router._shared_memory_segments._free[0].name != segments[0]
+
+    # the warm pools and the segments are released when the server completes
+    pools = list(router._route_pools.values())
+    server.wait_for_completion()
+    assert router._route_pools == {}
+    assert router._shared_memory_segments._free == []
+    for pool in pools:
+        with pytest.raises(RuntimeError):
+            pool.submit(print)
+
+
+def test_parallel_shared_memory_tracking(monkeypatch):
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.set_topology(
+        "router", mlrun.serving.routers.ParallelRun(executor_type="shared_memory")
+    )
+    fn.add_model("m1", ".", class_name="Predictor", prediction=1.0)
+    fn.set_tracking(
+        "v3io://fake",
+        batch=2,
+        batch_timeout=60,
+        stream_args={"mock": True, "access_key": "x"},
+    )
+    server = fn.to_mock_server()
+
+    # run the route as in its worker process, with the inputs in shared memory
+    monkeypatch.setattr(mlrun.serving.routers, "local_routes", None)
+    mlrun.serving.routers.ParallelRun.init_pool(
+        server.to_dict(), server.graph._object._get_worker_routes(["m1"])
+    )
+    monkeypatch.setattr(
+        mlrun.serving.routers, "_attached_segments", collections.OrderedDict()
+    )
+    segments = mlrun.serving.routers._SharedMemorySegments()
+    shm, body = mlrun.serving.routers._inputs_to_shared_memory(
+        {"inputs": [[1, 2], [3, 4]]}, segments
+    )
+    try:
+        route, response = mlrun.serving.routers.ParallelRun._wrap_shared_memory_step(
+            "m1", mlrun.serving.server.MockEvent(body=body)
+        )
+    finally:
+        mlrun.serving.routers._attached_segments[shm.name].close()
+        segments.release(shm)
+        segments.close()
+    assert response.body["outputs"] == [1.0, 1.0]
+
+    # the tracked record holds the inputs as a list, not the (released) shared memory array
+    model_logger = mlrun.serving.routers.local_routes[route]._object._model_logger
+    request = model_logger._batch[0][0]
+    assert request["inputs"] == [[1, 2], [3, 4]]
+    assert isinstance(request["inputs"], list)
+    model_logger.flush()
+    record = json.loads(model_logger.output_stream._mock_queue[0]["data"])
+    assert record["batch"]["inputs"] == [[1, 2], [3, 4]]
+    assert record["batch"]["outputs"] == [[1.0], [1.0]]
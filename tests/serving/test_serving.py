@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import json
 import os
 import pathlib
+import threading
 import time
 
+import numpy as np
 import pandas as pd
 import pytest
 from nuclio_sdk import Context as NuclioContext
@@ -33,6 +36,7 @@ from mlrun.serving.server import (
     create_graph_server,
 )
 from mlrun.serving.states import RouterStep, TaskStep
+from mlrun.serving.v2_serving import _PredictBatcher
 from mlrun.utils import logger
 
 
@@ -215,6 +219,18 @@ class AsyncModelTestingClass(V2ModelServer):
         return resp
 
 
+class BatchingTestingClass(V2ModelServer):
+    def load(self):
+        self.batches = []
+        self.release = threading.Event()
+
+    def predict(self, request):
+        self.batches.append(list(request["inputs"]))
+        # block the prediction until the test releases it
+        self.release.wait(timeout=10)
+        return [value * 10 for value in request["inputs"]]
+
+
 def init_ctx(
     spec=spec, context=None, extra_class_args=None, extra_class_args_names=None
 ):
@@ -284,6 +300,31 @@ def test_ensemble_get_metadata_of_models():
     assert resp == expected, f"wrong get models response {resp}"
 
 
+@pytest.mark.parametrize(
+    "router_class",
+    [
+        mlrun.serving.routers.EnrichmentModelRouter,
+        mlrun.serving.routers.EnrichmentVotingEnsemble,
+    ],
+)
+def test_enrichment_router_metadata(router_class):
+    class FeatureServiceStub:
+        cache_stats = {"hits": 3, "misses": 1}
+
+    context = GraphContext()
+    context.stream = mlrun.serving.server._StreamContext(False, {}, "")
+    router = router_class(context=context, name="router", routes={})
+    router._feature_service = FeatureServiceStub()
+
+    # a health check has no inputs to enrich
+    event = router.do_event(MockEvent(method="GET", path="/"))
+    assert event.body["online_features_cache"] == {"hits": 3, "misses": 1}
+
+    FeatureServiceStub.cache_stats = None
+    event = router.do_event(MockEvent(method="GET", path="/"))
+    assert "online_features_cache" not in event.body
+
+
 def test_ensemble_change_weights():
     models = ["m1", "m2", "m3:v1", "m3:v2"]
     weights = [1, 1, 1, 1]
@@ -353,7 +394,15 @@ def test_ensemble_infer():
     run_model("", 1250.0)
 
 
-@pytest.mark.parametrize("executor", mlrun.serving.routers.ParallelRunnerModes.all())
+@pytest.mark.parametrize(
+    "executor",
+    [
+        mode
+        for mode in mlrun.serving.routers.ParallelRunnerModes.all()
+        # the models are sync routes, which the asyncio executor doesn't run
+        if mode != mlrun.serving.routers.ParallelRunnerModes.asyncio
+    ],
+)
 def test_ensemble_infer_classification(executor):
     def run_model(url, expected):
         url = f"/v2/models/{url}/infer" if url else "/v2/models/infer"
@@ -392,7 +441,15 @@ def test_ensemble_infer_classification(executor):
     "ensemble_spec_parm",
     [ensemble_spec, ensemble_spec_classification],
 )
-@pytest.mark.parametrize("executor", mlrun.serving.routers.ParallelRunnerModes.all())
+@pytest.mark.parametrize(
+    "executor",
+    [
+        mode
+        for mode in mlrun.serving.routers.ParallelRunnerModes.all()
+        # the models are sync routes, which the asyncio executor doesn't run
+        if mode != mlrun.serving.routers.ParallelRunnerModes.asyncio
+    ],
+)
 def test_ensemble_infer_with_weights(ensemble_spec_parm, executor):
     def run_model(url, expected):
         url = f"/v2/models/{url}/infer" if url else "/v2/models/infer"
@@ -637,6 +694,117 @@ def test_function():
     assert len(dummy_stream.event_list) == 1, "expected stream to get one message"
 
 
+def test_v2_batching():
+    fn = mlrun.new_function("tests", kind="serving")
+    graph = fn.set_topology("flow", engine="async")
+    # a long batch wait, the batches are predicted when they are full or when the previous prediction completes
+    graph.to(
+        class_name="BatchingTestingClass",
+        name="my",
+        model_path=".",
+        max_batch_size=4,
+        max_batch_wait_ms=10000,
+    ).respond()
+    fn.set_tracking("dummy://")
+    server = fn.to_mock_server(globals())
+    model = server.graph["my"]._object
+    batcher = model._batcher
+
+    responses = {}
+
+    def infer(index):
+        responses[index] = server.test(
+            body={"inputs": [index, -index], "id": str(index)}
+        )
+
+    def wait_for(condition):
+        # wait for the batcher state rather than for the time it takes to reach it
+        deadline = time.monotonic() + 10
+        while not condition():
+            assert time.monotonic() < deadline, "timed out waiting for the batcher"
+            time.sleep(0.01)
+
+    threads = []
+    for index in range(1, 8):
+        thread = threading.Thread(target=infer, args=(index,))
+        thread.start()
+        threads.append(thread)
+        if index == 4:
+            # the events which arrive during the prediction of the first batch form the next batch
+            wait_for(lambda: len(model.batches) == 1)
+    wait_for(lambda: len(batcher._pending) == 3)
+    model.release.set()
+    for thread in threads:
+        thread.join(timeout=10)
+    server.wait_for_completion()
+
+    assert [len(batch) for batch in model.batches] == [8, 6]
+    for index in range(1, 8):
+        assert responses[index]["id"] == str(index)
+        assert responses[index]["outputs"] == [index * 10, -index * 10]
+
+    # the model monitoring gets every request
+    dummy_stream = server.context.stream.output_stream
+    assert len(dummy_stream.event_list) == 7
+
+
+def test_v2_batching_sync_graph():
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.set_topology("router")
+    fn.add_model(
+        "my", ".", class_name="ModelTestingClass", multiplier=2, max_batch_size=4
+    )
+    server = fn.to_mock_server(globals())
+    model = server.graph.routes["my"]._object
+
+    # models in sync graphs are not batched
+    assert model.async_do_event
+    resp = server.test("/v2/models/my/infer", {"inputs": [5]})
+    assert resp["outputs"] == 10
+
+
+class _EchoModel:
+    name = "echo"
+
+    def __init__(self):
+        self.batches = []
+
+    def predict(self, request):
+        self.batches.append(request["inputs"])
+        return request["inputs"]
+
+
+def test_v2_batching_inputs_types():
+    model = _EchoModel()
+    batcher = _PredictBatcher(model, max_batch_size=4, max_batch_wait_ms=10000)
+    requests = [
+        {"inputs": np.array([[1, 2], [3, 4]])},
+        {"inputs": {"x": 1}},
+        {"inputs": [7]},
+        {"inputs": np.array([[5, 6]])},
+        # a different dtype can't be concatenated with the other arrays
+        {"inputs": np.array([[0.5, 1.5]])},
+        {"inputs": [8, 9]},
+    ]
+
+    async def predict_all():
+        return await asyncio.gather(*[batcher.predict(request) for request in requests])
+
+    outputs = asyncio.run(predict_all())
+
+    assert len(model.batches) == 4
+    np.testing.assert_array_equal(model.batches[0], [[1, 2], [3, 4], [5, 6]])
+    assert model.batches[1] == {"x": 1}
+    assert model.batches[2] == [7, 8, 9]
+    np.testing.assert_array_equal(model.batches[3], [[0.5, 1.5]])
+    np.testing.assert_array_equal(outputs[0], [[1, 2], [3, 4]])
+    np.testing.assert_array_equal(outputs[3], [[5, 6]])
+    assert outputs[1] == {"x": 1}
+    assert outputs[2] == [7]
+    np.testing.assert_array_equal(outputs[4], [[0.5, 1.5]])
+    assert outputs[5] == [8, 9]
+
+
 def test_serving_no_router():
     fn = mlrun.new_function("tests", kind="serving")
     graph = fn.set_topology("flow", engine="sync")
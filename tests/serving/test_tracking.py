@@ -13,6 +13,7 @@
 # limitations under the License.
 #
 import json
+import time
 from pprint import pprint
 from unittest.mock import patch
 
@@ -97,6 +98,46 @@ def test_ensemble_tracking():
     }
 
 
+def test_batched_tracking():
+    # test that the tracked requests are pushed as columnar micro batches
+    fn = mlrun.new_function("tests", kind="serving")
+    fn.add_model("my", ".", class_name=ModelTestingClass(multiplier=2))
+    fn.set_tracking(
+        "v3io://fake",
+        batch=2,
+        batch_timeout=60,
+        stream_args={"mock": True, "access_key": "x"},
+    )
+
+    server = fn.to_mock_server()
+    server.test("/v2/models/my/infer", testdata)
+    server.test("/v2/models/my/infer", '{"inputs": [[1, 2], [3, 4]]}')
+    resp = server.test("/v2/models/my/infer", '{"id": "last", "inputs": [[7, 8]]}')
+    # the pending record is a copy of the response, which may be modified after it is returned
+    resp["outputs"][0] = 0
+
+    fake_stream = server.context.stream.output_stream._mock_queue
+    # the full batch is pushed from the background thread
+    for _ in range(50):
+        if fake_stream:
+            break
+        time.sleep(0.1)
+    assert len(fake_stream) == 1
+    batch = json.loads(fake_stream[0]["data"])["batch"]
+    assert batch["count"] == [1, 2]
+    assert batch["inputs"] == [[5, 6], [1, 2], [3, 4]]
+    assert batch["outputs"] == [[10], [2], [6]]
+    assert len(batch["when"]) == len(batch["microsec"]) == 2
+
+    # the pending records are pushed when the server completes
+    server.wait_for_completion()
+    assert len(fake_stream) == 2
+    batch = json.loads(fake_stream[1]["data"])["batch"]
+    assert batch["request_id"] == ["last"]
+    assert batch["inputs"] == [[7, 8]]
+    assert batch["outputs"] == [[14]]
+
+
 @pytest.mark.parametrize("enable_tracking", [True, False])
 def test_tracked_function(rundb_mock, enable_tracking):
     with patch("mlrun.get_run_db", return_value=rundb_mock):
@@ -11,7 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
 import datetime
+import threading
+import time
 import unittest.mock
 
 import numpy as np
@@ -23,6 +26,8 @@ import mlrun
 import mlrun.artifacts
 import mlrun.common.constants as mlrun_constants
 import mlrun.errors
+import mlrun.execution
+import mlrun.utils
 from mlrun import new_task
 from tests.conftest import out_path, tag_test, verify_state
 
@@ -123,6 +128,80 @@ def test_local_context(rundb_mock):
     assert run["spec"]["inputs"]["input-key"] == "input-url", "input not updated"
 
 
+def test_coalesced_run_updates(rundb_mock, monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.execution_context, "updates_flush_interval", 60)
+    mlrun.mlconf.artifact_path = out_path
+    context = mlrun.get_or_create_ctx("xx", project="coalesced", upload_artifacts=True)
+    context.log_artifact("xx", body="123", local_path="a.txt")
+    sent_updates = _record_sent_updates(context, monkeypatch)
+
+    for epoch in range(100):
+        context.log_result("epoch", epoch)
+    # the updates are coalesced until the flush interval passes or the context is committed
+    assert sent_updates == []
+
+    context.commit()
+    assert len(sent_updates) == 1
+    # only the changed fields are sent
+    assert f"status.{mlrun.utils.RunKeys.artifacts}" not in sent_updates[0]
+    assert sent_updates[0]["status.results"] == {"epoch": 99}
+    run = rundb_mock.read_run(context._uid, project="coalesced")
+    assert len(run["status"]["artifacts"]) == 1
+
+    # the artifact, the results and the commit
+    stats = context.updates_stats
+    assert stats["requests"] == 102
+    assert stats["calls"] == 2
+    assert stats["calls_saved"] == 100
+    assert 0 < stats["bytes_sent"] < stats["bytes_saved"]
+
+    # only the last update time changed since the last flush
+    context.commit()
+    assert list(sent_updates[-1].keys()) == ["status.last_update"]
+
+
+def test_coalesced_run_updates_flushed_in_background(rundb_mock, monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.execution_context, "updates_flush_interval", 0.2)
+    context = mlrun.get_or_create_ctx("xx", project="coalesced")
+    sent_updates = _record_sent_updates(context, monkeypatch)
+    context.log_result("epoch", 0)
+    context.log_result("epoch", 1)
+    assert [updates["status.results"] for updates in sent_updates] == [{"epoch": 0}]
+
+    # the trailing updates are flushed by the timer
+    time.sleep(0.5)
+    assert sent_updates[-1]["status.results"] == {"epoch": 1}
+
+    # and at exit
+    monkeypatch.setattr(mlrun.mlconf.execution_context, "updates_flush_interval", 60)
+    context.log_result("epoch", 2)
+    assert len(sent_updates) == 2
+    mlrun.execution._flush_pending_updates()
+    assert sent_updates[-1]["status.results"] == {"epoch": 2}
+
+
+def test_run_updates_are_not_mutated_during_a_flush(rundb_mock, monkeypatch):
+    monkeypatch.setattr(mlrun.mlconf.execution_context, "updates_flush_interval", 60)
+    context = mlrun.get_or_create_ctx("xx", project="coalesced")
+
+    # a flush (e.g. by the background timer) holds the updates lock while it reads the run fields
+    with context._updates_lock:
+        thread = threading.Thread(
+            target=lambda: (
+                context.log_result("epoch", 0),
+                context.log_results({"loss": 0.5}),
+                context.set_label("stage", "train"),
+            )
+        )
+        thread.start()
+        thread.join(0.2)
+        assert thread.is_alive()
+        assert context._results == {}
+    thread.join()
+    assert context._results == {"epoch": 0, "loss": 0.5}
+    assert context.labels["stage"] == "train"
+
+
 def test_context_from_dict_when_start_time_is_string():
     context = mlrun.get_or_create_ctx("ctx")
     context_dict = context.to_dict()
@@ -254,6 +333,18 @@ def test_artifact_owner(rundb_mock, owner):
     assert artifact.producer.get("owner") == owner
 
 
+def _record_sent_updates(context, monkeypatch) -> list[dict]:
+    sent_updates = []
+    update_run = context._rundb.update_run
+
+    def record_update_run(updates, *args, **kwargs):
+        sent_updates.append(copy.deepcopy(updates))
+        update_run(updates, *args, **kwargs)
+
+    monkeypatch.setattr(context._rundb, "update_run", record_update_run)
+    return sent_updates
+
+
 def _generate_run_dict():
     return {
         "metadata": {
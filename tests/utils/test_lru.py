@@ -81,6 +81,22 @@ class LRUTest(unittest.TestCase):
         self.assertTrue(lru.cached("not_at_all_important", 1))
         self.assertFalse(lru.cached("not_important", 2))
 
+    def test_lru_cache_get(self):
+        lru = server.api.utils.lru_cache.LRUCache(self._func_getter, maxsize=2)
+        self.assertIsNone(lru.cache_get("1"))
+        lru.cache_set(1, "1")
+        lru.cache_set(2, "2")
+        self.assertEqual(lru.cache_get("1"), 1)
+
+        # the got value is the most recently used
+        lru.cache_set(3, "3")
+        self.assertTrue(lru.cached("1"))
+        self.assertFalse(lru.cached("2"))
+
+        cache_info = lru.cache_info()
+        self.assertEqual(cache_info.hits, 1)
+        self.assertEqual(cache_info.misses, 1)
+
     def _func_getter(self, arg, increment=False, decrement=False):
         result = int(arg)
         if increment: